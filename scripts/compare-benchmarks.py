@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files.
+
+Reads JSON files written by the suite in tests/performance/benchmarks and
+reports the change in median time per benchmark. Exits with status 1 when any
+benchmark got slower than the allowed threshold, so it can gate CI.
+
+Usage:
+    scripts/compare-benchmarks.py BASELINE.json CURRENT.json [--threshold 0.10]
+    scripts/compare-benchmarks.py --latest [DIRECTORY]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+Key = Tuple[str, str, str]
+
+
+def load_results(path: Path) -> Dict[Key, dict]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        (record["group"], record["name"], record["scale"]): record
+        for record in data["benchmarks"]
+    }
+
+
+def describe(path: Path) -> str:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    commit = (data.get("commit") or "unknown")[:10]
+    return f"{path.name} ({commit}, {data.get('timestamp', '?')})"
+
+
+def compare(baseline: Dict[Key, dict], current: Dict[Key, dict],
+            threshold: float) -> Tuple[List[str], List[Key]]:
+    """Return report lines and the keys that regressed beyond ``threshold``."""
+    lines = [f"{'benchmark':<56} {'baseline':>12} {'current':>12} {'change':>9}"]
+    regressions = []
+
+    for key in sorted(set(baseline) | set(current)):
+        name = "/".join(key[:2]) + f"[{key[2]}]"
+        if key not in baseline:
+            lines.append(f"{name:<56} {'-':>12} {current[key]['median'] * 1000:>10.2f}ms {'new':>9}")
+            continue
+        if key not in current:
+            lines.append(f"{name:<56} {baseline[key]['median'] * 1000:>10.2f}ms {'-':>12} {'missing':>9}")
+            continue
+
+        before = baseline[key]["median"]
+        after = current[key]["median"]
+        change = (after - before) / before if before else 0.0
+        marker = ""
+        if change > threshold:
+            marker = "  << slower"
+            regressions.append(key)
+        elif change < -threshold:
+            marker = "  faster"
+        lines.append(f"{name:<56} {before * 1000:>10.2f}ms {after * 1000:>10.2f}ms "
+                     f"{change:>+8.1%}{marker}")
+
+    return lines, regressions
+
+
+def latest_two(directory: Path) -> Tuple[Path, Path]:
+    files = sorted(directory.glob("*.json"))
+    if len(files) < 2:
+        raise SystemExit(f"Need at least two result files in {directory}")
+    return files[-2], files[-1]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="baseline and current result files")
+    parser.add_argument("--latest", nargs="?", const=Path("benchmark-results"), type=Path,
+                        help="compare the two most recent files in a directory")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative slowdown reported as a regression (default 0.10)")
+    args = parser.parse_args()
+
+    if args.latest:
+        baseline_path, current_path = latest_two(args.latest)
+    elif len(args.files) == 2:
+        baseline_path, current_path = args.files
+    else:
+        parser.error("pass BASELINE and CURRENT files, or --latest")
+
+    print(f"baseline: {describe(baseline_path)}")
+    print(f"current:  {describe(current_path)}\n")
+
+    lines, regressions = compare(load_results(baseline_path), load_results(current_path),
+                                 args.threshold)
+    print("\n".join(lines))
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower by more than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ document processing. Integrates with Agent 2's event bus and progress tracker.
 """
 
 from fastapi import WebSocket, WebSocketDisconnect, Depends, Query
-from typing import Dict, Set, Optional, Any
+from typing import Dict, List, Set, Optional, Any
 import asyncio
 import json
 import logging
@@ -15,11 +15,19 @@ from collections import defaultdict
 
 # Import dependencies from other agents
 from ...core.auth import verify_websocket_token  # Will be implemented
-from ...core.events import EventBus, ProcessingEvent  # From Agent 2
+from ...core.events import BatchConfig, EventBus, ProcessingEvent  # From Agent 2
 from ...ingestion.progress import ProgressTracker, SessionProgress  # From Agent 2
 
 logger = logging.getLogger(__name__)
 
+# Progress events are coalesced per file so a burst of updates becomes a
+# single broadcast per session carrying only the latest value for each file.
+PROGRESS_BATCH_CONFIG = BatchConfig(
+    max_batch_size=500,
+    max_wait_time=0.25,
+    coalesce=True
+)
+
 
 class ConnectionManager:
     """
@@ -151,9 +159,10 @@ class ProgressWebSocket:
         """Start listening for events from the event bus."""
         if not self._subscribed:
             # Subscribe to all relevant events from Agent 2
-            self.event_bus.subscribe(
+            self.event_bus.subscribe_batch(
                 "progress_updated",
-                self._handle_progress_event
+                self._handle_progress_batch,
+                PROGRESS_BATCH_CONFIG
             )
             self.event_bus.subscribe(
                 "job_enqueued",
@@ -259,6 +268,35 @@ class ProgressWebSocket:
         except Exception as e:
             logger.error(f"Error handling progress event: {e}")
     
+    async def _handle_progress_batch(self, events: List[ProcessingEvent]):
+        """Handle a coalesced window of progress events from Agent 2."""
+        try:
+            session_updates: Dict[str, List[ProcessingEvent]] = defaultdict(list)
+            for event in events:
+                file_metadata = await self._get_file_session(event.file_id)
+                if file_metadata:
+                    session_updates[file_metadata["session_id"]].append(event)
+            
+            for session_id, session_events in session_updates.items():
+                if len(session_events) == 1:
+                    await self._handle_progress_event(session_events[0])
+                    continue
+                
+                # Session progress is fetched once for the whole window
+                progress = await self.progress_tracker.get_session_progress(session_id)
+                await manager.broadcast_to_session(session_id, {
+                    "type": "progress_batch",
+                    "updates": [
+                        {"file_id": event.file_id, "data": event.data}
+                        for event in session_events
+                    ],
+                    "session_progress": self._serialize_progress(progress) if progress else None,
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+            
+        except Exception as e:
+            logger.error(f"Error handling progress batch: {e}")
+    
     async def _handle_job_event(self, event: ProcessingEvent):
         """Handle job enqueued events."""
         try:
@@ -1,4 +1,6 @@
 from .event_bus import EventBus
+from .backpressure import BoundedEventQueue, OverflowPolicy, QueueConfig
+from .batching import BatchConfig, BatchMetrics, EventBatcher, default_coalesce_key
 from .event_types import (
     Event, EventPriority, DocumentEventTypes, ProcessingEventTypes,
     DocumentEvent, ValidationEvent, ErrorEvent, ProcessingEvent
@@ -11,6 +13,13 @@ from .middleware import (
 
 __all__ = [
     'EventBus',
+    'BoundedEventQueue',
+    'OverflowPolicy',
+    'QueueConfig',
+    'BatchConfig',
+    'BatchMetrics',
+    'EventBatcher',
+    'default_coalesce_key',
     'Event',
     'EventPriority',
     'DocumentEventTypes',
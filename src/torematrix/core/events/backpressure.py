@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import os
+import pickle
+import tempfile
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Deque, Dict, Optional, Tuple
+
+from .event_types import Event, EventPriority
+from .monitoring import PerformanceMonitor
+
+logger = logging.getLogger(__name__)
+
+# Dequeue order: higher priorities are always served first
+PRIORITY_ORDER = (EventPriority.IMMEDIATE, EventPriority.NORMAL, EventPriority.DEFERRED)
+
+
+class OverflowPolicy(Enum):
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    DROP_LOW_PRIORITY = "drop_low_priority"
+    SPILL_TO_DISK = "spill_to_disk"
+
+
+@dataclass
+class QueueConfig:
+    """Bounds and overflow behaviour for the event bus queue.
+
+    A size of 0 means unbounded. ``max_total_size`` caps all priorities
+    together on top of the per-priority bounds.
+    """
+    max_sizes: Dict[EventPriority, int] = field(default_factory=lambda: {
+        EventPriority.IMMEDIATE: 0,
+        EventPriority.NORMAL: 0,
+        EventPriority.DEFERRED: 0,
+    })
+    max_total_size: int = 0
+    policy: OverflowPolicy = OverflowPolicy.BLOCK
+    spill_directory: Optional[Path] = None
+
+    def __post_init__(self):
+        if any(size < 0 for size in self.max_sizes.values()) or self.max_total_size < 0:
+            raise ValueError("Queue sizes must not be negative")
+
+    @classmethod
+    def bounded(
+        cls,
+        max_size: int,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        spill_directory: Optional[Path] = None
+    ) -> "QueueConfig":
+        """Same bound for every priority."""
+        return cls(
+            max_sizes={priority: max_size for priority in PRIORITY_ORDER},
+            policy=policy,
+            spill_directory=spill_directory,
+        )
+
+
+class _SpillFile:
+    """Append-only pickle log of overflowed events, read back in FIFO order."""
+
+    def __init__(self, directory: Optional[Path], priority: EventPriority):
+        fd, path = tempfile.mkstemp(
+            prefix=f"eventbus-{priority.value}-", suffix=".spill",
+            dir=str(directory) if directory else None
+        )
+        self.path = Path(path)
+        self._writer: BinaryIO = os.fdopen(fd, "wb")
+        self._reader: BinaryIO = open(self.path, "rb")
+        self.count = 0
+
+    def append(self, item: Tuple[float, Event]) -> None:
+        # Serialise first so a failure never leaves a partial record behind
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        self._writer.write(data)
+        self._writer.flush()
+        self.count += 1
+
+    def pop(self) -> Tuple[float, Event]:
+        item = pickle.load(self._reader)
+        self.count -= 1
+        if self.count == 0:
+            # Drained: start over to keep the file from growing forever
+            self._writer.seek(0)
+            self._writer.truncate()
+            self._reader.seek(0)
+        return item
+
+    def close(self) -> None:
+        self._writer.close()
+        self._reader.close()
+        try:
+            self.path.unlink()
+        except OSError:
+            pass
+
+
+class BoundedEventQueue:
+    """Priority-aware event queue with bounded capacity and overflow policies.
+
+    Drop-in replacement for the ``asyncio.Queue`` used by ``EventBus``:
+    ``put`` applies backpressure according to the configured policy and
+    returns whether the event was accepted, ``get`` serves higher priorities
+    first and records how long each event waited in the queue.
+    """
+
+    def __init__(
+        self,
+        config: Optional[QueueConfig] = None,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
+        self.config = config or QueueConfig()
+        self._monitor = monitor or PerformanceMonitor()
+        self._queues: Dict[EventPriority, Deque[Tuple[float, Event]]] = {
+            priority: deque() for priority in PRIORITY_ORDER
+        }
+        self._spills: Dict[EventPriority, _SpillFile] = {}
+        self._sentinels = 0
+        self._condition = asyncio.Condition()
+
+    def qsize(self) -> int:
+        return sum(len(q) for q in self._queues.values()) + self.spilled_count()
+
+    def spilled_count(self) -> int:
+        return sum(spill.count for spill in self._spills.values())
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def depth(self, priority: EventPriority) -> int:
+        spill = self._spills.get(priority)
+        return len(self._queues[priority]) + (spill.count if spill else 0)
+
+    def task_done(self) -> None:
+        """Kept for ``asyncio.Queue`` compatibility; nothing to track."""
+
+    async def put(self, event: Optional[Event]) -> bool:
+        async with self._condition:
+            if event is None:
+                # Sentinel used by EventBus.stop(); never bounded
+                self._sentinels += 1
+                self._condition.notify_all()
+                return True
+
+            priority = self._priority_of(event)
+            blocked_time = 0.0
+
+            if self._is_full(priority):
+                policy = self.config.policy
+                if policy == OverflowPolicy.BLOCK:
+                    start = time.monotonic()
+                    await self._condition.wait_for(lambda: not self._is_full(priority))
+                    blocked_time = time.monotonic() - start
+                elif policy == OverflowPolicy.DROP_OLDEST:
+                    if not self._evict(priority, oldest_first=True):
+                        self._monitor.record_drop(priority.value, self.depth(priority))
+                        return False
+                elif policy == OverflowPolicy.DROP_LOW_PRIORITY:
+                    if not self._evict(priority, oldest_first=False):
+                        self._monitor.record_drop(priority.value, self.depth(priority))
+                        return False
+                elif policy == OverflowPolicy.SPILL_TO_DISK:
+                    if self._spill(priority, (time.monotonic(), event)):
+                        self._condition.notify_all()
+                        return True
+                    # Unpicklable event: fall back to waiting for space
+                    await self._condition.wait_for(lambda: not self._is_full(priority))
+
+            if priority in self._spills and self._spills[priority].count:
+                # Keep FIFO order while older events of this priority are on disk
+                if self._spill(priority, (time.monotonic(), event)):
+                    self._condition.notify_all()
+                    return True
+
+            self._queues[priority].append((time.monotonic(), event))
+            self._monitor.record_enqueue(priority.value, self.depth(priority), blocked_time)
+            self._condition.notify_all()
+            return True
+
+    async def get(self) -> Optional[Event]:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.qsize() > 0 or self._sentinels > 0)
+
+            for priority in PRIORITY_ORDER:
+                queue = self._queues[priority]
+                spill = self._spills.get(priority)
+                if not queue and spill is not None and spill.count:
+                    # Spilled while other priorities held the total bound
+                    queue.append(spill.pop())
+                if not queue:
+                    continue
+                enqueued_at, event = queue.popleft()
+                self._refill_from_spill(priority)
+                self._monitor.record_dequeue(
+                    priority.value, time.monotonic() - enqueued_at, self.depth(priority)
+                )
+                self._condition.notify_all()
+                return event
+
+            self._sentinels -= 1
+            return None
+
+    def close(self) -> None:
+        for spill in self._spills.values():
+            spill.close()
+        self._spills.clear()
+
+    def _priority_of(self, event: Event) -> EventPriority:
+        priority = getattr(event, "priority", EventPriority.NORMAL)
+        return priority if priority in self._queues else EventPriority.NORMAL
+
+    def _is_full(self, priority: EventPriority) -> bool:
+        limit = self.config.max_sizes.get(priority, 0)
+        if limit and len(self._queues[priority]) >= limit:
+            return True
+        total = self.config.max_total_size
+        return bool(total) and sum(len(q) for q in self._queues.values()) >= total
+
+    def _evict(self, priority: EventPriority, oldest_first: bool) -> bool:
+        """Make room for an event of ``priority``; return False to reject it.
+
+        ``oldest_first`` evicts the oldest event of the same priority (or of
+        the lowest non-empty priority when only the total bound is hit).
+        Otherwise only strictly lower priorities are evicted.
+        """
+        limit = self.config.max_sizes.get(priority, 0)
+        own_full = bool(limit) and len(self._queues[priority]) >= limit
+        rank = PRIORITY_ORDER.index(priority)
+
+        if own_full:
+            if not oldest_first:
+                return False
+            victim = priority
+        else:
+            candidates = PRIORITY_ORDER[rank + 1:] if not oldest_first else PRIORITY_ORDER
+            victim = next(
+                (p for p in reversed(candidates) if self._queues[p]), None
+            )
+            if victim is None:
+                return False
+
+        self._queues[victim].popleft()
+        self._refill_from_spill(victim)
+        self._monitor.record_drop(victim.value, self.depth(victim))
+        return True
+
+    def _spill(self, priority: EventPriority, item: Tuple[float, Event]) -> bool:
+        try:
+            if priority not in self._spills:
+                self._spills[priority] = _SpillFile(self.config.spill_directory, priority)
+            self._spills[priority].append(item)
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            logger.error(f"Failed to spill event to disk: {e}")
+            return False
+        self._monitor.record_spill(priority.value)
+        self._monitor.record_enqueue(priority.value, self.depth(priority))
+        return True
+
+    def _refill_from_spill(self, priority: EventPriority) -> None:
+        spill = self._spills.get(priority)
+        if spill is None:
+            return
+        while spill.count and not self._is_full(priority):
+            self._queues[priority].append(spill.pop())
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from .event_types import Event
+
+logger = logging.getLogger(__name__)
+
+# Attributes inspected (in order) to find the entity an event refers to
+ENTITY_ID_FIELDS = ("file_id", "document_id", "job_id", "batch_id", "session_id")
+ENTITY_ID_PAYLOAD_KEYS = ("entity_id", "element_id", "file_id", "document_id", "id")
+
+
+def default_coalesce_key(event: Event) -> Hashable:
+    """Key events by (event_type, entity id) for latest-value coalescing."""
+    for name in ENTITY_ID_FIELDS:
+        value = getattr(event, name, None)
+        if value:
+            return (event.event_type, value)
+    for name in ENTITY_ID_PAYLOAD_KEYS:
+        value = event.payload.get(name)
+        if value is not None:
+            return (event.event_type, value)
+    return (event.event_type, None)
+
+
+@dataclass
+class BatchConfig:
+    """Delivery options for a batch subscription.
+
+    A batch is flushed once ``max_batch_size`` distinct events have been
+    collected or ``max_wait_time`` seconds have passed since the first event
+    of the batch arrived, whichever comes first. With ``coalesce`` enabled
+    only the latest event per coalescing key is kept inside a window.
+    """
+    max_batch_size: int = 100
+    max_wait_time: float = 0.05
+    coalesce: bool = False
+    key_func: Callable[[Event], Hashable] = default_coalesce_key
+
+    def __post_init__(self):
+        if self.max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if self.max_wait_time < 0:
+            raise ValueError("max_wait_time must not be negative")
+
+
+@dataclass
+class BatchMetrics:
+    batches_delivered: int = 0
+    events_received: int = 0
+    events_delivered: int = 0
+    events_coalesced: int = 0
+    max_batch_size: int = 0
+
+    @property
+    def coalescing_ratio(self) -> float:
+        if self.events_received == 0:
+            return 0.0
+        return self.events_coalesced / self.events_received
+
+
+class EventBatcher:
+    """Accumulates events for one batch subscription and flushes them together."""
+
+    def __init__(
+        self,
+        handler: Callable[[List[Event]], Any],
+        config: BatchConfig,
+        deliver: Callable[[Callable, List[Event]], Awaitable[None]],
+    ):
+        self.handler = handler
+        self.config = config
+        self.metrics = BatchMetrics()
+        self._deliver = deliver
+        self._pending: Dict[Hashable, Event] = {}
+        self._sequence = 0
+        self._window_started: Optional[float] = None
+        self._timer: Optional[asyncio.Task] = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, event: Event) -> None:
+        self.metrics.events_received += 1
+        if self.config.coalesce:
+            key = self.config.key_func(event)
+            if key in self._pending:
+                # Re-insert so the batch keeps latest-arrival order
+                del self._pending[key]
+                self.metrics.events_coalesced += 1
+        else:
+            key = self._sequence
+            self._sequence += 1
+        self._pending[key] = event
+
+        if len(self._pending) >= self.config.max_batch_size:
+            await self.flush()
+        elif self._window_started is None:
+            self._window_started = time.monotonic()
+            if self.config.max_wait_time == 0:
+                await self.flush()
+            else:
+                self._timer = asyncio.create_task(self._flush_after(self.config.max_wait_time))
+
+    async def flush(self) -> None:
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+        self._timer = None
+        self._window_started = None
+        if not self._pending:
+            return
+
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self.metrics.batches_delivered += 1
+        self.metrics.events_delivered += len(batch)
+        self.metrics.max_batch_size = max(self.metrics.max_batch_size, len(batch))
+        await self._deliver(self.handler, batch)
+
+    async def close(self) -> None:
+        await self.flush()
+
+    async def _flush_after(self, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+            await self.flush()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Batch flush error: {e}")
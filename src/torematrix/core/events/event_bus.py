@@ -4,19 +4,23 @@ import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from .backpressure import BoundedEventQueue, QueueConfig
+from .batching import BatchConfig, EventBatcher
 from .event_types import Event, EventPriority
 from .monitoring import PerformanceMonitor
 
 logger = logging.getLogger(__name__)
 
 class EventBus:
-    def __init__(self):
+    def __init__(self, queue_config: Optional[QueueConfig] = None):
         self._handlers: Dict[str, Set[Callable]] = defaultdict(set)
+        self._batchers: Dict[str, List[EventBatcher]] = defaultdict(list)
         self._middlewares: List[Callable] = []
-        self._event_queue: asyncio.Queue = asyncio.Queue()
         self._running = False
         self._process_task: Optional[asyncio.Task] = None
         self._monitor = PerformanceMonitor()
+        # Unbounded unless configured; bounds apply per EventPriority
+        self._event_queue = BoundedEventQueue(queue_config, self._monitor)
         self._monitor_task: Optional[asyncio.Task] = None
     
     def subscribe(self, event_type: str, handler: Callable) -> None:
@@ -28,9 +32,73 @@ class EventBus:
             if not self._handlers[event_type]:
                 del self._handlers[event_type]
     
+    def subscribe_batch(
+        self,
+        event_type: str,
+        handler: Callable[[List[Event]], Any],
+        config: Optional[BatchConfig] = None
+    ) -> EventBatcher:
+        """Subscribe a handler that receives lists of events.
+
+        Events are collected per subscription and delivered in size- and
+        time-windowed batches, optionally coalesced to the latest value per
+        (event_type, entity id).
+        """
+        self.unsubscribe_batch(event_type, handler)
+        batcher = EventBatcher(handler, config or BatchConfig(), self._deliver_batch)
+        self._batchers[event_type].append(batcher)
+        return batcher
+    
+    def unsubscribe_batch(self, event_type: str, handler: Callable) -> None:
+        if event_type in self._batchers:
+            self._batchers[event_type] = [
+                b for b in self._batchers[event_type] if b.handler != handler
+            ]
+            if not self._batchers[event_type]:
+                del self._batchers[event_type]
+    
     def add_middleware(self, middleware: Callable) -> None:
         self._middlewares.append(middleware)
     
+    async def publish_many(self, events: List[Event]) -> None:
+        """Publish several events, running each middleware once for the batch.
+
+        Middlewares exposing ``process_batch`` see the whole list in one call;
+        plain callables are applied per event.
+        """
+        if not events:
+            return
+        
+        start_time = time.time()
+        success = True
+        original_events = list(events)
+        
+        try:
+            for middleware in self._middlewares:
+                try:
+                    events = await self._apply_middleware_batch(middleware, events)
+                except Exception as e:
+                    logger.error(f"Middleware error: {e}")
+                    success = False
+                    return
+                if not events:
+                    logger.debug("Batch dropped by middleware")
+                    return
+            
+            for event in events:
+                if not await self._event_queue.put(event):
+                    logger.debug(f"Event dropped by queue backpressure: {event.event_type}")
+        
+        except Exception as e:
+            logger.error(f"Error publishing events: {e}")
+            success = False
+            raise
+        
+        finally:
+            processing_time = (time.time() - start_time) / len(original_events)
+            for original_event in original_events:
+                self._monitor.record_event_processing(original_event, processing_time, success)
+    
     async def publish(self, event: Event) -> None:
         start_time = time.time()
         success = True
@@ -48,7 +116,8 @@ class EventBus:
                     success = False
                     return
             
-            await self._event_queue.put(event)
+            if not await self._event_queue.put(event):
+                logger.debug(f"Event dropped by queue backpressure: {event.event_type}")
             
         except Exception as e:
             logger.error(f"Error publishing event: {e}")
@@ -80,6 +149,12 @@ class EventBus:
             await self._process_task
             self._process_task = None
         
+        # Deliver whatever is still waiting in open batch windows
+        for batchers in list(self._batchers.values()):
+            for batcher in batchers:
+                await batcher.close()
+        self._event_queue.close()
+        
         if self._monitor_task:
             self._monitor_task.cancel()
             try:
@@ -93,7 +168,13 @@ class EventBus:
             "events": self._monitor.get_event_metrics(),
             "handlers": self._monitor.get_handler_metrics(),
             "total": self._monitor.get_total_metrics(),
-            "queue_size": self._event_queue.qsize()
+            "batches": {
+                event_type: [batcher.metrics for batcher in batchers]
+                for event_type, batchers in self._batchers.items()
+            },
+            "queues": self._monitor.get_queue_metrics(),
+            "queue_size": self._event_queue.qsize(),
+            "spilled_events": self._event_queue.spilled_count()
         }
     
     async def _process_events(self) -> None:
@@ -102,13 +183,52 @@ class EventBus:
             if event is None:  # Sentinel value
                 break
                 
-            if event.event_type not in self._handlers:
+            if event.event_type not in self._handlers and event.event_type not in self._batchers:
                 logger.warning(f"No handlers for event type: {event.event_type}")
                 continue
                 
-            await self._process_handlers(event)
+            if event.event_type in self._handlers:
+                await self._process_handlers(event)
+            for batcher in list(self._batchers.get(event.event_type, ())):
+                await batcher.add(event)
             self._event_queue.task_done()
     
+    async def _apply_middleware_batch(
+        self,
+        middleware: Callable,
+        events: List[Event]
+    ) -> List[Event]:
+        process_batch = getattr(middleware, "process_batch", None)
+        if process_batch is not None:
+            return list(await process_batch(events))
+        
+        processed = []
+        for event in events:
+            result = await middleware(event)
+            if result is not None:
+                processed.append(result)
+        return processed
+    
+    async def _deliver_batch(self, handler: Callable, batch: List[Event]) -> None:
+        handler_name = getattr(handler, "__name__", str(handler))
+        start_time = time.time()
+        success = True
+        
+        try:
+            if asyncio.iscoroutinefunction(handler):
+                await handler(batch)
+            else:
+                handler(batch)
+        except Exception as e:
+            logger.error(f"Batch handler error: {e}")
+            success = False
+        finally:
+            self._monitor.record_handler_execution(
+                handler_name,
+                time.time() - start_time,
+                success
+            )
+    
     async def _process_handlers(self, event: Event) -> None:
         for handler in self._handlers[event.event_type]:
             handler_name = getattr(handler, "__name__", str(handler))
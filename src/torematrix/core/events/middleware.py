@@ -15,6 +15,15 @@ class BaseMiddleware:
     async def process(self, event: Event) -> Optional[Event]:
         raise NotImplementedError
 
+    async def process_batch(self, events: List[Event]) -> List[Event]:
+        """Run the middleware once over a batch; dropped events are omitted."""
+        processed = []
+        for event in events:
+            result = await self(event)
+            if result is not None:
+                processed.append(result)
+        return processed
+
 class ValidationMiddleware(BaseMiddleware):
     async def process(self, event: Event) -> Optional[Event]:
         if not event.event_type:
@@ -33,6 +42,15 @@ class LoggingMiddleware(BaseMiddleware):
         logger.log(self.log_level, f"Processing event: {event.event_type}")
         return event
 
+    async def process_batch(self, events: List[Event]) -> List[Event]:
+        if events:
+            event_types = sorted({event.event_type for event in events})
+            logger.log(
+                self.log_level,
+                f"Processing batch of {len(events)} events: {', '.join(event_types)}"
+            )
+        return events
+
 class MetricsMiddleware(BaseMiddleware):
     def __init__(self):
         self.event_counts: Dict[str, int] = {}
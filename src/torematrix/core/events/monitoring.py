@@ -36,6 +36,25 @@ class HandlerMetrics:
         total_count = self.success_count + self.error_count
         return self.total_execution_time / total_count if total_count > 0 else 0.0
 
+@dataclass
+class QueueMetrics:
+    priority: str
+    enqueued: int = 0
+    dequeued: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    blocked_count: int = 0
+    total_blocked_time: float = 0.0
+    total_lag: float = 0.0
+    max_lag: float = 0.0
+    last_lag: float = 0.0
+    depth: int = 0
+    max_depth: int = 0
+    
+    @property
+    def average_lag(self) -> float:
+        return self.total_lag / self.dequeued if self.dequeued > 0 else 0.0
+
 @dataclass
 class PerformanceSnapshot:
     timestamp: datetime = field(default_factory=datetime.now)
@@ -43,6 +62,8 @@ class PerformanceSnapshot:
     total_processing_time: float = 0.0
     error_count: int = 0
     queue_size: int = 0
+    max_queue_lag: float = 0.0
+    dropped_events: int = 0
     memory_usage_mb: float = 0.0
 
 class PerformanceMonitor:
@@ -53,6 +74,7 @@ class PerformanceMonitor:
         self.handler_metrics: Dict[str, HandlerMetrics] = defaultdict(
             lambda: HandlerMetrics(handler_name="unknown")
         )
+        self.queue_metrics: Dict[str, QueueMetrics] = {}
         self.snapshots: List[PerformanceSnapshot] = []
         self._snapshot_interval = timedelta(minutes=1)
         self._last_snapshot = datetime.now()
@@ -88,6 +110,41 @@ class PerformanceMonitor:
         metrics.total_execution_time += execution_time
         metrics.max_execution_time = max(metrics.max_execution_time, execution_time)
     
+    def _queue_metrics(self, priority: str) -> QueueMetrics:
+        if priority not in self.queue_metrics:
+            self.queue_metrics[priority] = QueueMetrics(priority=priority)
+        return self.queue_metrics[priority]
+    
+    def record_enqueue(self, priority: str, depth: int, blocked_time: float = 0.0) -> None:
+        metrics = self._queue_metrics(priority)
+        metrics.enqueued += 1
+        metrics.depth = depth
+        metrics.max_depth = max(metrics.max_depth, depth)
+        if blocked_time > 0:
+            metrics.blocked_count += 1
+            metrics.total_blocked_time += blocked_time
+    
+    def record_dequeue(self, priority: str, lag: float, depth: int) -> None:
+        metrics = self._queue_metrics(priority)
+        metrics.dequeued += 1
+        metrics.depth = depth
+        metrics.last_lag = lag
+        metrics.total_lag += lag
+        metrics.max_lag = max(metrics.max_lag, lag)
+    
+    def record_drop(self, priority: str, depth: int) -> None:
+        metrics = self._queue_metrics(priority)
+        metrics.dropped += 1
+        metrics.depth = depth
+    
+    def record_spill(self, priority: str) -> None:
+        self._queue_metrics(priority).spilled += 1
+    
+    def get_queue_metrics(self, priority: Optional[str] = None) -> Dict[str, QueueMetrics]:
+        if priority:
+            return {priority: self._queue_metrics(priority)}
+        return dict(self.queue_metrics)
+    
     def get_event_metrics(self, event_type: Optional[str] = None) -> Dict[str, EventMetrics]:
         if event_type:
             return {event_type: self.event_metrics[event_type]}
@@ -134,6 +191,8 @@ class PerformanceMonitor:
                 total_processing_time=sum(m.total_processing_time for m in self.event_metrics.values()),
                 error_count=sum(m.error_count for m in self.event_metrics.values()),
                 queue_size=event_queue.qsize(),
+                max_queue_lag=max((m.last_lag for m in self.queue_metrics.values()), default=0.0),
+                dropped_events=sum(m.dropped for m in self.queue_metrics.values()),
                 memory_usage_mb=memory_mb
             )
             
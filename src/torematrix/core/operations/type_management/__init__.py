@@ -11,7 +11,7 @@ This package provides comprehensive type management operations including:
 
 from .bulk_operations import (
     BulkTypeOperationEngine, BulkOperationOptions, BulkOperationResult,
-    BulkChangePreview, ElementChange, OperationStatus, ConflictResolution
+    BulkChangePreview, ElementChange, TypeChangeSet, OperationStatus, ConflictResolution
 )
 from .conversions import TypeConversionEngine, ConversionResult, ConversionAnalysis
 from .progress import (
@@ -32,6 +32,7 @@ __all__ = [
     'BulkOperationResult',
     'BulkChangePreview',
     'ElementChange',
+    'TypeChangeSet',
     'ConversionResult',
     'ConversionAnalysis',
     'OperationProgress',
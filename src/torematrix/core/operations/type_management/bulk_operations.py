@@ -6,11 +6,12 @@ Provides thread-safe, memory-efficient processing with progress tracking.
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Set, Callable, Any, Union
+from typing import Dict, Iterator, List, Optional, Set, Callable, Any, Tuple, Union
 import threading
 import time
 
@@ -53,6 +54,7 @@ class BulkOperationOptions:
     rollback_on_error: bool = True
     dry_run: bool = False
     progress_callback: Optional[Callable[[int, int], None]] = None
+    set_based: bool = True
 
 
 @dataclass
@@ -67,6 +69,35 @@ class ElementChange:
     warnings: List[str] = field(default_factory=list)
 
 
+@dataclass
+class TypeChangeSet:
+    """Compact record of elements moved from one type to another in one step
+
+    Stores a single (old_type, new_type) pair for all affected elements
+    instead of one ElementChange per element. Metadata is only kept for
+    elements that actually had something preserved.
+    """
+    old_type: str
+    new_type: str
+    element_ids: List[str]
+    timestamp: datetime
+    metadata_changes: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    
+    def __len__(self) -> int:
+        return len(self.element_ids)
+    
+    def iter_changes(self) -> Iterator[ElementChange]:
+        """Expand into per-element change records"""
+        for element_id in self.element_ids:
+            yield ElementChange(
+                element_id=element_id,
+                old_type=self.old_type,
+                new_type=self.new_type,
+                timestamp=self.timestamp,
+                metadata_changes=self.metadata_changes.get(element_id, {})
+            )
+
+
 @dataclass
 class BulkOperationResult:
     """Result of a bulk type operation"""
@@ -83,6 +114,7 @@ class BulkOperationResult:
     start_time: datetime
     end_time: Optional[datetime] = None
     duration_seconds: Optional[float] = None
+    change_sets: List[TypeChangeSet] = field(default_factory=list)
     
     @property
     def success_rate(self) -> float:
@@ -95,6 +127,12 @@ class BulkOperationResult:
     def is_complete(self) -> bool:
         """Check if operation completed successfully"""
         return self.status == OperationStatus.COMPLETED and self.failed_changes == 0
+    
+    def iter_changes(self) -> Iterator[ElementChange]:
+        """Iterate over all element changes, expanding compact change sets"""
+        yield from self.changes
+        for change_set in self.change_sets:
+            yield from change_set.iter_changes()
 
 
 @dataclass 
@@ -147,6 +185,7 @@ class BulkTypeOperationEngine:
         self._operations: Dict[str, BulkOperationResult] = {}
         self._cancel_events: Dict[str, threading.Event] = {}
         self._lock = threading.RLock()
+        self._background_executor: Optional[ThreadPoolExecutor] = None
         
         logger.info(f"BulkTypeOperationEngine initialized with {max_workers} workers")
     
@@ -168,6 +207,61 @@ class BulkTypeOperationEngine:
             ValueError: If target_type is invalid or elements list is empty
             RuntimeError: If operation fails to start
         """
+        result, options = self._create_operation(element_ids, target_type, options)
+        return self._run_operation(element_ids, target_type, options, result)
+    
+    def submit_bulk_change_types(self, 
+                                 element_ids: List[str], 
+                                 target_type: str,
+                                 options: Optional[BulkOperationOptions] = None
+                                 ) -> Tuple[str, "Future[BulkOperationResult]"]:
+        """Run bulk type changes on a background executor
+        
+        Validation happens immediately so invalid requests fail fast; the
+        operation itself runs off the calling (UI) thread and can be
+        cancelled with cancel_operation().
+        
+        Args:
+            element_ids: List of element IDs to modify
+            target_type: Target type to change elements to
+            options: Operation options and configuration
+            
+        Returns:
+            Tuple of (operation_id, future resolving to BulkOperationResult)
+            
+        Raises:
+            ValueError: If target_type is invalid or elements list is empty
+        """
+        result, options = self._create_operation(element_ids, target_type, options)
+        
+        with self._lock:
+            if self._background_executor is None:
+                self._background_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="bulk-type-ops"
+                )
+            future = self._background_executor.submit(
+                self._run_operation, element_ids, target_type, options, result
+            )
+        
+        return result.operation_id, future
+    
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel running operations and stop the background executor"""
+        with self._lock:
+            for cancel_event in self._cancel_events.values():
+                cancel_event.set()
+            executor, self._background_executor = self._background_executor, None
+        
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+    
+    def _create_operation(self, 
+                          element_ids: List[str], 
+                          target_type: str,
+                          options: Optional[BulkOperationOptions]
+                          ) -> Tuple[BulkOperationResult, BulkOperationOptions]:
+        """Validate arguments and register a pending operation"""
         if not element_ids:
             raise ValueError("Element IDs list cannot be empty")
         
@@ -199,7 +293,22 @@ class BulkTypeOperationEngine:
             self._operations[operation_id] = result
             self._cancel_events[operation_id] = threading.Event()
         
+        return result, options
+    
+    def _run_operation(self, 
+                       element_ids: List[str], 
+                       target_type: str,
+                       options: BulkOperationOptions,
+                       result: BulkOperationResult) -> BulkOperationResult:
+        """Execute a registered operation to completion"""
+        operation_id = result.operation_id
+        
         try:
+            # Cancelled while still queued on the background executor
+            if self._is_cancelled(operation_id):
+                result.status = OperationStatus.CANCELLED
+                return result
+            
             # Validate operation if requested
             if options.validate_before:
                 validation_result = self.validate_bulk_operation(element_ids, target_type)
@@ -218,7 +327,10 @@ class BulkTypeOperationEngine:
             
             # Execute bulk operation
             result.status = OperationStatus.RUNNING
-            self._execute_bulk_changes(element_ids, target_type, options, result)
+            if options.set_based:
+                self._execute_set_based_changes(element_ids, target_type, options, result)
+            else:
+                self._execute_bulk_changes(element_ids, target_type, options, result)
             
         except Exception as e:
             logger.error(f"Bulk operation {operation_id} failed: {e}")
@@ -226,9 +338,12 @@ class BulkTypeOperationEngine:
             result.errors.append(str(e))
             
             # Attempt rollback if enabled
-            if options.rollback_on_error and result.changes:
+            if options.rollback_on_error and (result.changes or result.change_sets):
                 try:
-                    self._rollback_changes(result.changes)
+                    if result.change_sets:
+                        self._rollback_change_sets(result.change_sets)
+                    if result.changes:
+                        self._rollback_changes(result.changes)
                     result.warnings.append("Changes rolled back due to error")
                 except Exception as rollback_error:
                     result.errors.append(f"Rollback failed: {rollback_error}")
@@ -469,6 +584,146 @@ class BulkTypeOperationEngine:
             else:
                 result.status = OperationStatus.FAILED
     
+    def _execute_set_based_changes(self, 
+                                   element_ids: List[str], 
+                                   target_type: str,
+                                   options: BulkOperationOptions,
+                                   result: BulkOperationResult) -> None:
+        """Execute bulk changes grouped by conversion instead of per element
+        
+        Elements are grouped by their current type, each (from, to) conversion
+        is checked once per group, and every batch of a group is applied with
+        a single bulk update. Changes are logged as compact TypeChangeSets.
+        """
+        groups = self._group_by_source_type(element_ids, target_type, result)
+        
+        batches: List[Tuple[str, List[str]]] = []
+        for from_type, group_ids in groups.items():
+            if not self._is_conversion_valid(from_type, target_type):
+                result.processed_elements += len(group_ids)
+                result.failed_changes += len(group_ids)
+                result.errors.append(
+                    f"Invalid conversion from {from_type} to {target_type} "
+                    f"for {len(group_ids)} elements"
+                )
+                continue
+            if self._has_data_loss_risk(from_type, target_type):
+                result.warnings.append(
+                    f"Data loss risk converting {len(group_ids)} elements "
+                    f"from {from_type} to {target_type}"
+                )
+            batches.extend(
+                (from_type, group_ids[i:i + options.batch_size])
+                for i in range(0, len(group_ids), options.batch_size)
+            )
+        
+        logger.debug(f"Processing {len(groups)} conversion groups in {len(batches)} batches "
+                    f"with {options.max_workers} workers")
+        
+        if options.progress_callback and result.processed_elements:
+            options.progress_callback(result.processed_elements, result.total_elements)
+        
+        executor = ThreadPoolExecutor(max_workers=options.max_workers)
+        future_to_batch: Dict[Future, Tuple[str, List[str]]] = {}
+        recorded: Set[Future] = set()
+        try:
+            future_to_batch = {
+                executor.submit(self._apply_change_set, batch_ids, from_type, target_type,
+                                options, result.operation_id): (from_type, batch_ids)
+                for from_type, batch_ids in batches
+            }
+            
+            for future in as_completed(future_to_batch):
+                if self._is_cancelled(result.operation_id):
+                    result.status = OperationStatus.CANCELLED
+                    break
+                
+                self._record_change_set(future, future_to_batch[future], target_type,
+                                        options, result)
+                recorded.add(future)
+        finally:
+            # Drop batches that have not started yet when cancelled
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        # Batches that were running when cancelled have been applied, so they
+        # must be recorded to be counted and rolled back
+        for future, batch in future_to_batch.items():
+            if future not in recorded and not future.cancelled():
+                self._record_change_set(future, batch, target_type, options, result)
+        
+        # Finalize result
+        if result.status != OperationStatus.CANCELLED:
+            if result.failed_changes == 0:
+                result.status = OperationStatus.COMPLETED
+            elif result.successful_changes > 0:
+                result.status = OperationStatus.PARTIAL
+            else:
+                result.status = OperationStatus.FAILED
+    
+    def _record_change_set(self, 
+                           future: Future,
+                           batch: Tuple[str, List[str]],
+                           target_type: str,
+                           options: BulkOperationOptions,
+                           result: BulkOperationResult) -> None:
+        """Record the outcome of a finished change set batch"""
+        from_type, batch_ids = batch
+        try:
+            change_set = future.result()
+            if change_set is None:
+                return  # Cancelled before the batch started
+            result.change_sets.append(change_set)
+            result.successful_changes += len(change_set)
+        except Exception as e:
+            logger.error(f"Batch {from_type} -> {target_type} failed: {e}")
+            result.errors.append(f"Batch {from_type} -> {target_type} failed: {e}")
+            result.failed_changes += len(batch_ids)
+        result.processed_elements += len(batch_ids)
+        
+        if options.progress_callback:
+            options.progress_callback(result.processed_elements, result.total_elements)
+    
+    def _group_by_source_type(self, 
+                              element_ids: List[str], 
+                              target_type: str,
+                              result: BulkOperationResult) -> Dict[str, List[str]]:
+        """Group element IDs by current type, counting no-op elements as skipped"""
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for element_id, current_type in self._get_element_types(element_ids).items():
+            if current_type == target_type:
+                result.skipped_elements += 1
+                result.processed_elements += 1
+            else:
+                groups[current_type].append(element_id)
+        return dict(groups)
+    
+    def _apply_change_set(self, 
+                          element_ids: List[str], 
+                          from_type: str,
+                          to_type: str,
+                          options: BulkOperationOptions,
+                          operation_id: str) -> Optional[TypeChangeSet]:
+        """Apply one batch of a conversion group as a single bulk update"""
+        if self._is_cancelled(operation_id):
+            return None
+        
+        metadata_changes = {}
+        if options.preserve_metadata:
+            metadata_changes = self._preserve_bulk_metadata(element_ids)
+        
+        if not self._perform_bulk_type_change(element_ids, from_type, to_type, options):
+            raise RuntimeError(
+                f"Bulk type change failed for {len(element_ids)} elements"
+            )
+        
+        return TypeChangeSet(
+            old_type=from_type,
+            new_type=to_type,
+            element_ids=element_ids,
+            timestamp=datetime.now(),
+            metadata_changes=metadata_changes
+        )
+    
     def _process_batch(self, 
                       element_ids: List[str], 
                       target_type: str,
@@ -543,6 +798,13 @@ class BulkTypeOperationEngine:
         # In real implementation, would query element storage
         return "text"  # Default mock type
     
+    def _get_element_types(self, element_ids: List[str]) -> Dict[str, str]:
+        """Get current types of many elements in one lookup
+        
+        Storage-backed engines should override this with a single query.
+        """
+        return {element_id: self._get_element_type(element_id) for element_id in element_ids}
+    
     def _get_element_relationships(self, element_id: str) -> Set[str]:
         """Get relationships for element (mock)"""
         return set()  # Mock empty relationships
@@ -578,6 +840,30 @@ class BulkTypeOperationEngine:
         # Mock implementation - would update element storage
         return True
     
+    def _perform_bulk_type_change(self, 
+                                  element_ids: List[str], 
+                                  from_type: str, 
+                                  to_type: str,
+                                  options: BulkOperationOptions) -> bool:
+        """Change the type of many elements in one update
+        
+        Storage-backed engines should override this with a single
+        transaction; the default falls back to per-element changes.
+        """
+        return all(
+            self._perform_type_change(element_id, from_type, to_type, options)
+            for element_id in element_ids
+        )
+    
+    def _preserve_bulk_metadata(self, element_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Preserve metadata for many elements, keeping only non-empty entries"""
+        preserved = {}
+        for element_id in element_ids:
+            metadata = self._preserve_element_metadata(element_id)
+            if metadata:
+                preserved[element_id] = metadata
+        return preserved
+    
     def _preserve_element_metadata(self, element_id: str) -> Dict[str, Any]:
         """Preserve element metadata during type change (mock)"""
         return {}  # Mock empty metadata
@@ -613,4 +899,18 @@ class BulkTypeOperationEngine:
                            f"{change.new_type} -> {change.old_type}")
             except Exception as e:
                 logger.error(f"Failed to rollback element {change.element_id}: {e}")
-                raise
\ No newline at end of file
+                raise
+    
+    def _rollback_change_sets(self, change_sets: List[TypeChangeSet]) -> None:
+        """Rollback compact change sets, one bulk update per set"""
+        logger.info(f"Rolling back {sum(len(cs) for cs in change_sets)} changes "
+                   f"in {len(change_sets)} change sets")
+        
+        restore_options = BulkOperationOptions(preserve_metadata=False)
+        for change_set in reversed(change_sets):
+            if not self._perform_bulk_type_change(change_set.element_ids, change_set.new_type,
+                                                  change_set.old_type, restore_options):
+                raise RuntimeError(
+                    f"Failed to rollback {len(change_set)} elements "
+                    f"{change_set.new_type} -> {change_set.old_type}"
+                )
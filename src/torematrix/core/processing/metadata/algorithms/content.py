@@ -6,15 +6,56 @@ based on their text content, semantic similarity, and structural patterns.
 
 import logging
 import re
-from typing import List, Optional, Set, Dict, Any
+from typing import List, Optional, Set, Dict, Any, Iterator, Tuple
 from collections import Counter
+from dataclasses import dataclass
 import math
 
+import numpy as np
+
 from ....models.element import Element as UnifiedElement
 from ..models.relationship import Relationship, RelationshipType
 
 logger = logging.getLogger(__name__)
 
+# Patterns of references to figures, tables, sections, etc.
+REFERENCE_PATTERNS = [
+    r'\b(?:figure|fig\.?)\s*(\d+)',
+    r'\b(?:table|tab\.?)\s*(\d+)',
+    r'\b(?:section|sec\.?)\s*(\d+)',
+    r'\b(?:equation|eq\.?)\s*(\d+)',
+    r'\b(?:page|p\.?)\s*(\d+)'
+]
+
+# Patterns marking a caption
+CAPTION_PATTERNS = [
+    r'\b(?:figure|fig\.?)\s*\d+',
+    r'\b(?:table|tab\.?)\s*\d+',
+    r'\b(?:image|img\.?)\s*\d+',
+    r'\b(?:chart|graph)\s*\d+',
+    r'\b(?:diagram|diag\.?)\s*\d+'
+]
+
+REFERENCE_TARGET_TYPES = ['Figure', 'Image', 'Table', 'Formula']
+CAPTION_TARGET_TYPES = ['Figure', 'Image', 'Table', 'Formula', 'Chart']
+
+# Minimum keyword overlap (Jaccard) for a semantic group
+SEMANTIC_OVERLAP_THRESHOLD = 0.3
+
+# Co-occurring term pairs expanded per batch
+PAIR_BATCH_SIZE = 1 << 20
+
+
+@dataclass
+class TextProfile:
+    """Text features of one element, computed once and reused for every pair."""
+    text: str
+    term_counts: Counter
+    keywords: Set[str]
+    references: List[Tuple[str, List[str]]]  # (pattern, matched texts) for patterns found in the text
+    caption_match: bool  # Text matches a caption pattern
+    row: Optional[int] = None  # Row in the prepared document's term matrix
+
 
 class ContentAnalyzer:
     """Analyzer for content-based relationships between elements."""
@@ -29,6 +70,114 @@ class ContentAnalyzer:
         self.similarity_threshold = getattr(config, 'content_similarity_threshold', 0.7)
         self.min_word_length = 3
         self.stop_words = self._get_stop_words()
+        # Weight terms by inverse document frequency for prepared documents
+        self.use_idf = getattr(config, 'content_use_idf', False)
+        
+        self._profiles: Dict[str, TextProfile] = {}
+        self._similarities: Dict[Tuple[int, int], float] = {}
+    
+    def prepare(self, elements: List[UnifiedElement]) -> List[Optional[TextProfile]]:
+        """Profile the elements of a document for pairwise analysis.
+        
+        Every element is tokenized once. Cosine similarities of all element
+        pairs that share a term are then computed in batches from a sparse
+        term matrix; the pairs reaching ``similarity_threshold`` are kept
+        for analyze_relationship(). Replaces any previously prepared document;
+        call release() once its pairs are analyzed.
+        
+        Args:
+            elements: Elements of one document
+        
+        Returns:
+            Profile per element, None for elements without text
+        """
+        self._profiles = {}
+        self._similarities = {}
+        
+        profiles: List[Optional[TextProfile]] = []
+        for element in elements:
+            text = self._get_text_content(element)
+            if not text:
+                profiles.append(None)
+                continue
+            profile = self._profiles[element.id] = self._get_profile(element, text)
+            profiles.append(profile)
+        
+        rows = [profile for profile in profiles if profile is not None]
+        for row, profile in enumerate(rows):
+            profile.row = row
+        
+        rows_of, cols, weights = _term_entries([profile.term_counts for profile in rows])
+        if self.use_idf and len(cols):
+            document_frequency = np.bincount(cols)
+            weights = weights * (np.log((1 + len(rows)) / (1 + document_frequency)) + 1)[cols]
+        norms = np.sqrt(np.bincount(rows_of, weights * weights, minlength=len(rows)))
+        
+        for first, second, dots in _co_occurring_pairs(rows_of, cols, weights):
+            scores = dots / (norms[first] * norms[second])
+            similar = scores >= self.similarity_threshold
+            self._similarities.update(zip(
+                zip(first[similar].tolist(), second[similar].tolist()),
+                scores[similar].tolist()
+            ))
+        
+        return profiles
+    
+    def candidate_pairs(self, elements: List[UnifiedElement]) -> List[Tuple[int, int]]:
+        """Find element pairs that can have a content relationship.
+        
+        Prepares the document, then keeps the pairs that are similar enough,
+        share enough keywords, or pair a reference or caption with a possible
+        target. analyze_relationship() returns nothing for every other pair.
+        
+        Args:
+            elements: Elements to pair
+        
+        Returns:
+            Sorted index pairs ``(i, j)`` with ``i < j``
+        """
+        profiles = self.prepare(elements)
+        positions = np.array([i for i, profile in enumerate(profiles) if profile is not None], dtype=np.int64)
+        count = len(positions)
+        if count < 2:
+            return []
+        
+        rows = [profiles[i] for i in positions]
+        keys = [np.array([first * count + second for first, second in self._similarities], dtype=np.int64)]
+        
+        # Keyword overlap from co-occurring keywords
+        rows_of, cols, weights = _term_entries([dict.fromkeys(profile.keywords, 1) for profile in rows])
+        sizes = np.array([len(profile.keywords) for profile in rows], dtype=np.float64)
+        for first, second, common in _co_occurring_pairs(rows_of, cols, weights):
+            overlap = common / (sizes[first] + sizes[second] - common)
+            grouped = overlap >= SEMANTIC_OVERLAP_THRESHOLD
+            keys.append(first[grouped] * count + second[grouped])
+        
+        # References point from the earlier element to the later one
+        elements_at = [elements[i] for i in positions]
+        has_references = np.array([bool(profile.references) for profile in rows])
+        reference_target = np.array([
+            element.type in REFERENCE_TARGET_TYPES or bool(getattr(element, 'title', None))
+            for element in elements_at
+        ])
+        keys.append(_ordered_pairs(has_references, reference_target, count))
+        
+        # Captions go either way
+        caption = np.array([
+            self._could_be_caption(element, profile)
+            for element, profile in zip(elements_at, rows)
+        ])
+        caption_target = np.array([self._could_be_caption_target(element) for element in elements_at])
+        keys.append(_ordered_pairs(caption, caption_target, count))
+        keys.append(_ordered_pairs(caption_target, caption, count))
+        
+        first, second = np.divmod(np.unique(np.concatenate(keys)), count)
+        return list(zip(positions[first].tolist(), positions[second].tolist()))
+    
+    def release(self) -> None:
+        """Drop the profiles and similarities of the prepared document."""
+        self._profiles = {}
+        self._similarities = {}
         
     async def analyze_relationship(
         self, 
@@ -111,8 +260,15 @@ class ContentAnalyzer:
         Returns:
             Similarity relationship if detected
         """
+        profile1 = self._get_profile(element1, text1)
+        profile2 = self._get_profile(element2, text2)
+        
         # Calculate cosine similarity using word vectors
-        similarity = self._calculate_cosine_similarity(text1, text2)
+        if profile1.row is not None and profile2.row is not None:
+            rows = (min(profile1.row, profile2.row), max(profile1.row, profile2.row))
+            similarity = self._similarities.get(rows, 0.0)
+        else:
+            similarity = _cosine(profile1.term_counts, profile2.term_counts)
         
         if similarity >= self.similarity_threshold:
             return Relationship(
@@ -123,7 +279,7 @@ class ContentAnalyzer:
                 metadata={
                     "similarity_score": similarity,
                     "analysis_method": "cosine_similarity",
-                    "common_words": len(self._get_common_words(text1, text2))
+                    "common_words": len(profile1.term_counts.keys() & profile2.term_counts.keys())
                 }
             )
         
@@ -149,22 +305,10 @@ class ContentAnalyzer:
         """
         relationships = []
         
-        # Look for references to figures, tables, sections, etc.
-        ref_patterns = [
-            r'\b(?:figure|fig\.?)\s*(\d+)',
-            r'\b(?:table|tab\.?)\s*(\d+)',
-            r'\b(?:section|sec\.?)\s*(\d+)',
-            r'\b(?:equation|eq\.?)\s*(\d+)',
-            r'\b(?:page|p\.?)\s*(\d+)'
-        ]
-        
         # Check if element1 references element2
-        for pattern in ref_patterns:
-            matches1 = re.finditer(pattern, text1, re.IGNORECASE)
-            matches2 = re.finditer(pattern, text2, re.IGNORECASE)
-            
+        for pattern, reference_text in self._get_profile(element1, text1).references:
             # If element1 contains references and element2 might be the target
-            if list(matches1) and self._could_be_reference_target(element2, pattern):
+            if self._could_be_reference_target(element2, pattern):
                 confidence = 0.8
                 relationships.append(Relationship(
                     source_id=element1.id,
@@ -173,7 +317,7 @@ class ContentAnalyzer:
                     confidence=confidence,
                     metadata={
                         "reference_pattern": pattern,
-                        "reference_text": [m.group() for m in re.finditer(pattern, text1, re.IGNORECASE)]
+                        "reference_text": list(reference_text)
                     }
                 ))
         
@@ -198,8 +342,8 @@ class ContentAnalyzer:
             Semantic grouping relationship if detected
         """
         # Check if elements belong to the same semantic group
-        keywords1 = self._extract_keywords(text1)
-        keywords2 = self._extract_keywords(text2)
+        keywords1 = self._get_profile(element1, text1).keywords
+        keywords2 = self._get_profile(element2, text2).keywords
         
         if not keywords1 or not keywords2:
             return None
@@ -211,7 +355,7 @@ class ContentAnalyzer:
         if total_keywords:
             overlap_ratio = len(common_keywords) / len(total_keywords)
             
-            if overlap_ratio >= 0.3:  # 30% keyword overlap
+            if overlap_ratio >= SEMANTIC_OVERLAP_THRESHOLD:
                 confidence = min(0.9, overlap_ratio * 1.5)
                 
                 return Relationship(
@@ -246,17 +390,8 @@ class ContentAnalyzer:
         Returns:
             Caption relationship if detected
         """
-        # Check if one element is a caption for another
-        caption_indicators = [
-            r'\b(?:figure|fig\.?)\s*\d+',
-            r'\b(?:table|tab\.?)\s*\d+',
-            r'\b(?:image|img\.?)\s*\d+',
-            r'\b(?:chart|graph)\s*\d+',
-            r'\b(?:diagram|diag\.?)\s*\d+'
-        ]
-        
         # Check if element1 could be a caption for element2
-        if self._could_be_caption(element1, text1, caption_indicators):
+        if self._could_be_caption(element1, self._get_profile(element1, text1)):
             if self._could_be_caption_target(element2):
                 confidence = 0.85
                 return Relationship(
@@ -271,7 +406,7 @@ class ContentAnalyzer:
                 )
         
         # Check if element2 could be a caption for element1
-        if self._could_be_caption(element2, text2, caption_indicators):
+        if self._could_be_caption(element2, self._get_profile(element2, text2)):
             if self._could_be_caption_target(element1):
                 confidence = 0.85
                 return Relationship(
@@ -287,36 +422,34 @@ class ContentAnalyzer:
         
         return None
     
-    def _calculate_cosine_similarity(self, text1: str, text2: str) -> float:
-        """Calculate cosine similarity between two texts.
+    def _get_profile(self, element: UnifiedElement, text: str) -> TextProfile:
+        """Get the prepared text profile of an element, building it if needed.
+        
+        Only prepare() caches profiles, so elements analyzed outside a
+        prepared document do not accumulate in the analyzer.
         
         Args:
-            text1: First text
-            text2: Second text
-            
+            element: Element to profile
+            text: Text content of the element
+        
         Returns:
-            Cosine similarity score between 0 and 1
+            Text profile
         """
-        words1 = self._tokenize_text(text1)
-        words2 = self._tokenize_text(text2)
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        # Create word frequency vectors
-        all_words = set(words1 + words2)
-        vector1 = [words1.count(word) for word in all_words]
-        vector2 = [words2.count(word) for word in all_words]
-        
-        # Calculate cosine similarity
-        dot_product = sum(a * b for a, b in zip(vector1, vector2))
-        magnitude1 = math.sqrt(sum(a * a for a in vector1))
-        magnitude2 = math.sqrt(sum(b * b for b in vector2))
-        
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-        
-        return dot_product / (magnitude1 * magnitude2)
+        profile = self._profiles.get(element.id)
+        if profile is None or profile.text != text:
+            words = self._tokenize_text(text)
+            profile = TextProfile(
+                text=text,
+                term_counts=Counter(words),
+                keywords=self._keywords_from_words(words),
+                references=[
+                    (pattern, [m.group() for m in re.finditer(pattern, text, re.IGNORECASE)])
+                    for pattern in REFERENCE_PATTERNS
+                    if re.search(pattern, text, re.IGNORECASE)
+                ],
+                caption_match=any(re.search(pattern, text, re.IGNORECASE) for pattern in CAPTION_PATTERNS)
+            )
+        return profile
     
     def _tokenize_text(self, text: str) -> List[str]:
         """Tokenize text into words.
@@ -338,17 +471,15 @@ class ContentAnalyzer:
         
         return filtered_words
     
-    def _extract_keywords(self, text: str) -> Set[str]:
-        """Extract keywords from text.
+    def _keywords_from_words(self, words: List[str]) -> Set[str]:
+        """Select keywords from tokenized words.
         
         Args:
-            text: Text to extract keywords from
-            
+            words: Tokenized words
+        
         Returns:
             Set of keywords
         """
-        words = self._tokenize_text(text)
-        
         # Use word frequency to identify keywords
         word_freq = Counter(words)
         
@@ -362,21 +493,6 @@ class ContentAnalyzer:
         
         return keywords
     
-    def _get_common_words(self, text1: str, text2: str) -> Set[str]:
-        """Get common words between two texts.
-        
-        Args:
-            text1: First text
-            text2: Second text
-            
-        Returns:
-            Set of common words
-        """
-        words1 = set(self._tokenize_text(text1))
-        words2 = set(self._tokenize_text(text2))
-        
-        return words1.intersection(words2)
-    
     def _could_be_reference_target(self, element: UnifiedElement, pattern: str) -> bool:
         """Check if element could be a reference target.
         
@@ -388,7 +504,7 @@ class ContentAnalyzer:
             True if element could be referenced
         """
         # Check element type
-        if element.type in ['Figure', 'Image', 'Table', 'Formula']:
+        if element.type in REFERENCE_TARGET_TYPES:
             return True
         
         # Check if element has title or caption that matches pattern
@@ -398,24 +514,22 @@ class ContentAnalyzer:
         
         return False
     
-    def _could_be_caption(self, element: UnifiedElement, text: str, patterns: List[str]) -> bool:
+    def _could_be_caption(self, element: UnifiedElement, profile: TextProfile) -> bool:
         """Check if element could be a caption.
         
         Args:
             element: Element to check
-            text: Element text
-            patterns: Caption patterns to match
+            profile: Text profile of the element
             
         Returns:
             True if element could be a caption
         """
         # Check if text matches caption patterns
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        if profile.caption_match:
+            return True
         
         # Check element type and length
-        if element.type in ['Text', 'Title'] and len(text) < 500:  # Captions are usually short
+        if element.type in ['Text', 'Title'] and len(profile.text) < 500:  # Captions are usually short
             return True
         
         return False
@@ -429,7 +543,7 @@ class ContentAnalyzer:
         Returns:
             True if element could have a caption
         """
-        return element.type in ['Figure', 'Image', 'Table', 'Formula', 'Chart']
+        return element.type in CAPTION_TARGET_TYPES
     
     def _get_stop_words(self) -> Set[str]:
         """Get common stop words.
@@ -453,4 +567,87 @@ class ContentAnalyzer:
             'above', 'below', 'between', 'through', 'during', 'before', 'after',
             'while', 'since', 'until', 'because', 'although', 'however',
             'therefore', 'thus', 'hence', 'moreover', 'furthermore', 'nevertheless'
-        }
\ No newline at end of file
+        }
+
+def _cosine(counts1: Counter, counts2: Counter) -> float:
+    """Cosine similarity of two term frequency vectors."""
+    if not counts1 or not counts2:
+        return 0.0
+    
+    if len(counts2) < len(counts1):
+        counts1, counts2 = counts2, counts1
+    dot_product = sum(count * counts2[word] for word, count in counts1.items() if word in counts2)
+    magnitude1 = math.sqrt(sum(count * count for count in counts1.values()))
+    magnitude2 = math.sqrt(sum(count * count for count in counts2.values()))
+    
+    return dot_product / (magnitude1 * magnitude2)
+
+
+def _term_entries(rows: List[Dict[str, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten term counts into sparse (row, column, weight) entries in row order."""
+    vocabulary: Dict[str, int] = {}
+    cols = [vocabulary.setdefault(term, len(vocabulary)) for counts in rows for term in counts]
+    weights = [count for counts in rows for count in counts.values()]
+    rows_of = np.repeat(np.arange(len(rows)), [len(counts) for counts in rows])
+    return rows_of, np.asarray(cols, dtype=np.int64), np.asarray(weights, dtype=np.float64)
+
+
+def _co_occurring_pairs(
+    rows: np.ndarray,
+    cols: np.ndarray,
+    weights: np.ndarray
+) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Dot products of all row pairs that share a column.
+    
+    Each entry is paired with the later rows in its column (CSC order),
+    and the products are summed per row pair. Batches end at row
+    boundaries, so every pair is complete within one batch.
+    
+    Yields:
+        ``(first, second, dots)`` arrays with ``first < second``
+    """
+    if not len(cols):
+        return
+    
+    # Column-major copy of the entries; rows stay ascending within a column
+    order = np.argsort(cols, kind='stable')
+    col_rows = rows[order]
+    col_weights = weights[order]
+    col_end = np.cumsum(np.bincount(cols))[cols[order]]
+    position = np.empty_like(order)
+    position[order] = np.arange(len(order))
+    
+    # Later rows in the same column for each entry, in row order
+    spans = col_end[position] - position - 1
+    row_starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]])
+    work = np.cumsum(np.add.reduceat(spans, row_starts))
+    count = int(rows[-1]) + 1
+    
+    start = 0
+    while start < len(row_starts):
+        done = work[start - 1] if start else 0
+        stop = max(int(np.searchsorted(work, done + PAIR_BATCH_SIZE, side='right')), start + 1)
+        lo = row_starts[start]
+        hi = row_starts[stop] if stop < len(row_starts) else len(rows)
+        start = stop
+        
+        batch_spans = spans[lo:hi]
+        total = int(batch_spans.sum())
+        if not total:
+            continue
+        low = np.repeat(position[lo:hi], batch_spans)
+        high = low + 1 + np.arange(total) - np.repeat(np.cumsum(batch_spans) - batch_spans, batch_spans)
+        
+        keys, inverse = np.unique(col_rows[low] * count + col_rows[high], return_inverse=True)
+        dots = np.bincount(inverse, weights=col_weights[low] * col_weights[high])
+        first, second = np.divmod(keys, count)
+        yield first, second, dots
+
+
+def _ordered_pairs(sources: np.ndarray, targets: np.ndarray, count: int) -> np.ndarray:
+    """Pair keys ``i * count + j`` with ``i < j``, ``sources[i]`` and ``targets[j]``."""
+    first = np.flatnonzero(sources)
+    second = np.flatnonzero(targets)
+    first, second = np.repeat(first, len(second)), np.tile(second, len(first))
+    later = first < second
+    return first[later] * count + second[later]
@@ -10,6 +10,9 @@ from typing import List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+from .....utils.rtree import PackedRTree
 from ....models.element import Element as UnifiedElement
 from ..models.relationship import Relationship, RelationshipType
 
@@ -174,6 +177,69 @@ class SpatialAnalyzer:
         
         return relationships
     
+    def candidate_pairs(self, elements: List[UnifiedElement]) -> List[Tuple[int, int]]:
+        """Find element pairs that can have a spatial relationship.
+        
+        Containment, overlap and adjacency need boxes within
+        ``spatial_threshold`` of each other; those pairs come from one batched
+        R-tree query. Alignment only needs one edge or center coordinate
+        within ``alignment_threshold``; those pairs come from a sorted sweep
+        per coordinate. Every other pair would yield no relationship.
+        
+        Args:
+            elements: Elements to pair
+            
+        Returns:
+            Sorted index pairs ``(i, j)`` with ``i < j``
+        """
+        positions = []
+        coordinates = []
+        for position, element in enumerate(elements):
+            bbox = self._get_bounding_box(element)
+            if bbox:
+                positions.append(position)
+                coordinates.append((bbox.left, bbox.top, bbox.right, bbox.bottom))
+        
+        if len(positions) < 2:
+            return []
+        
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        left, top, right, bottom = coordinates.T
+        count = len(coordinates)
+        
+        # Proximity: boxes expanded by the threshold must intersect
+        boxes = np.column_stack((np.minimum(left, right), np.minimum(top, bottom),
+                                 np.maximum(left, right), np.maximum(top, bottom)))
+        tree = PackedRTree()
+        tree.load(range(count), boxes)
+        margin = self.spatial_threshold
+        neighbours = tree.search_many(boxes + (-margin, -margin, margin, margin))
+        first = np.repeat(np.arange(count), [len(near) for near in neighbours])
+        second = np.fromiter((index for near in neighbours for index in near), dtype=np.int64, count=len(first))
+        keys = [first * count + second]
+        
+        # Alignment: some coordinate differs by at most the threshold
+        threshold = self.alignment_threshold
+        for values in (left, right, (left + right) / 2, top, bottom, (top + bottom) / 2):
+            order = np.argsort(values, kind="stable")
+            ordered = values[order]
+            # Widen the search bound slightly and filter exactly below
+            upper = np.searchsorted(ordered, ordered + threshold + abs(threshold) * 1e-9 + 1e-9, side="right")
+            spans = upper - np.arange(count) - 1
+            low = np.repeat(np.arange(count), spans)
+            high = low + 1 + (np.arange(spans.sum()) - np.repeat(np.cumsum(spans) - spans, spans))
+            exact = ordered[high] - ordered[low] <= threshold
+            keys.append(order[low[exact]] * count + order[high[exact]])
+        
+        keys = np.concatenate(keys)
+        first, second = np.divmod(keys, count)
+        first, second = np.minimum(first, second), np.maximum(first, second)
+        keys = np.unique(first[first != second] * count + second[first != second])
+        
+        index = np.asarray(positions)
+        first, second = np.divmod(keys, count)
+        return list(zip(index[first].tolist(), index[second].tolist()))
+    
     def _get_bounding_box(self, element: UnifiedElement) -> Optional[BoundingBox]:
         """Extract bounding box from element.
         
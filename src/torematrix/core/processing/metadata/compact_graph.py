@@ -0,0 +1,614 @@
+"""Compact array-backed graph for element relationships.
+
+This module provides CompactRelationshipGraph, a drop-in alternative to
+ElementRelationshipGraph for large documents. Elements get integer node
+ids and relationships are stored column by column in arrays instead of
+as Relationship objects on NetworkX edges. Adjacency is kept in CSR
+(outgoing) and CSC (incoming) form, so neighbor lookups, breadth-first
+search and connected components run as NumPy operations.
+"""
+
+import logging
+from array import array
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Any, Iterator, Tuple
+
+import networkx as nx
+import numpy as np
+
+from ...models.element import Element as UnifiedElement
+from .models.relationship import Relationship, RelationshipType
+
+logger = logging.getLogger(__name__)
+
+
+class _Adjacency:
+    """CSR/CSC index over the edge arrays, rebuilt after edges are added."""
+    
+    def __init__(self, node_count: int, src: np.ndarray, dst: np.ndarray, types: np.ndarray):
+        self.src = src
+        self.dst = dst
+        self.types = types
+        
+        # Edge numbers grouped by source (CSR) and by target (CSC), each
+        # group in insertion order
+        self.out_order = np.argsort(src, kind='stable')
+        self.out_ptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=node_count), out=self.out_ptr[1:])
+        
+        self.in_order = np.argsort(dst, kind='stable')
+        self.in_ptr = np.zeros(node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=node_count), out=self.in_ptr[1:])
+    
+    def out_edges(self, node: int) -> np.ndarray:
+        return self.out_order[self.out_ptr[node]:self.out_ptr[node + 1]]
+    
+    def in_edges(self, node: int) -> np.ndarray:
+        return self.in_order[self.in_ptr[node]:self.in_ptr[node + 1]]
+    
+    def expand(self, frontier: np.ndarray, directed: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbors of all frontier nodes at once, with the node each was reached from."""
+        edges, parents = _gather(self.out_ptr, self.out_order, frontier)
+        neighbors = self.dst[edges]
+        if directed:
+            return neighbors, parents
+        
+        edges, in_parents = _gather(self.in_ptr, self.in_order, frontier)
+        return np.concatenate((neighbors, self.src[edges])), np.concatenate((parents, in_parents))
+
+
+def _gather(ptr: np.ndarray, order: np.ndarray, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Concatenate the edge groups of ``nodes``; also return each edge's node."""
+    starts = ptr[nodes]
+    lengths = ptr[nodes + 1] - starts
+    total = int(lengths.sum())
+    if not total:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    
+    # Position of every edge within the flat CSR arrays
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    positions = offsets + np.arange(total)
+    return order[positions], np.repeat(nodes, lengths)
+
+
+class CompactRelationshipGraph:
+    """Graph structure for element relationships backed by NumPy arrays.
+    
+    Has the public API of ElementRelationshipGraph. Relationship objects
+    are rebuilt from the columns when they are returned. The ``graph`` and
+    ``relationship_index`` attributes of ElementRelationshipGraph are
+    available for compatibility but are built on every access, which is
+    expensive for large graphs.
+    """
+    
+    def __init__(self):
+        """Initialize the relationship graph."""
+        self.element_index: Dict[str, UnifiedElement] = {}
+        self._node_ids: List[str] = []
+        self._node_index: Dict[str, int] = {}
+        
+        # Relationship columns
+        self._src = array('l')
+        self._dst = array('l')
+        self._type = array('B')
+        self._confidence = array('d')
+        self._created_at = array('d')
+        self._edge_ids: List[str] = []
+        self._metadata: List[Optional[Dict[str, Any]]] = []  # None for empty metadata
+        
+        self._type_codes: Dict[RelationshipType, int] = {}
+        self._types: List[RelationshipType] = []
+        
+        self._adjacency: Optional[_Adjacency] = None
+    
+    @classmethod
+    def from_graph(cls, graph) -> 'CompactRelationshipGraph':
+        """Convert an ElementRelationshipGraph."""
+        compact = cls()
+        for element in graph.element_index.values():
+            compact.add_element(element)
+        compact.add_relationships(graph.iter_relationships())
+        return compact
+    
+    def add_element(self, element: UnifiedElement):
+        """Add element as graph node.
+        
+        Args:
+            element: Element to add to graph
+        """
+        if element.id in self.element_index:
+            logger.warning(f"Element {element.id} already exists in graph")
+            return
+        
+        self._node_index[element.id] = len(self._node_ids)
+        self._node_ids.append(element.id)
+        self.element_index[element.id] = element
+        self._adjacency = None
+        
+        logger.debug(f"Added element {element.id} to graph")
+    
+    def add_relationship(
+        self,
+        source_id: str,
+        target_id: str,
+        relationship: Relationship
+    ):
+        """Add relationship as graph edge.
+        
+        Args:
+            source_id: Source element ID
+            target_id: Target element ID
+            relationship: Relationship object
+        """
+        if source_id not in self._node_index:
+            logger.error(f"Source element {source_id} not found in graph")
+            raise ValueError(f"Source element {source_id} not in graph")
+        
+        if target_id not in self._node_index:
+            logger.error(f"Target element {target_id} not found in graph")
+            raise ValueError(f"Target element {target_id} not in graph")
+        
+        self._append_edge(self._node_index[source_id], self._node_index[target_id], relationship)
+        self._adjacency = None
+        
+        logger.debug(f"Added relationship {relationship.id} between {source_id} and {target_id}")
+    
+    def add_relationships(self, relationships) -> int:
+        """Add many relationships, using their own source and target ids.
+        
+        Returns:
+            Number of relationships added
+        """
+        count = 0
+        for relationship in relationships:
+            source = self._node_index.get(relationship.source_id)
+            target = self._node_index.get(relationship.target_id)
+            if source is None or target is None:
+                missing = relationship.source_id if source is None else relationship.target_id
+                raise ValueError(f"Element {missing} not in graph")
+            self._append_edge(source, target, relationship)
+            count += 1
+        
+        self._adjacency = None
+        return count
+    
+    def get_element(self, element_id: str) -> Optional[UnifiedElement]:
+        """Get element by ID.
+        
+        Args:
+            element_id: Element ID to retrieve
+        
+        Returns:
+            Element if found, None otherwise
+        """
+        return self.element_index.get(element_id)
+    
+    def get_relationships(
+        self,
+        element_id: str,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> List[Relationship]:
+        """Get all relationships for an element.
+        
+        Args:
+            element_id: Element ID
+            relationship_type: Optional filter by relationship type
+        
+        Returns:
+            List of relationships involving the element
+        """
+        node = self._node_index.get(element_id)
+        if node is None:
+            return []
+        
+        adjacency = self._get_adjacency()
+        edges = np.union1d(adjacency.out_edges(node), adjacency.in_edges(node))
+        return self._relationships(self._filter_type(edges, relationship_type))
+    
+    def get_outgoing_relationships(
+        self,
+        element_id: str,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> List[Relationship]:
+        """Get outgoing relationships from an element.
+        
+        Args:
+            element_id: Source element ID
+            relationship_type: Optional filter by relationship type
+        
+        Returns:
+            List of outgoing relationships
+        """
+        node = self._node_index.get(element_id)
+        if node is None:
+            return []
+        
+        edges = self._get_adjacency().out_edges(node)
+        return self._relationships(self._filter_type(edges, relationship_type))
+    
+    def get_incoming_relationships(
+        self,
+        element_id: str,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> List[Relationship]:
+        """Get incoming relationships to an element.
+        
+        Args:
+            element_id: Target element ID
+            relationship_type: Optional filter by relationship type
+        
+        Returns:
+            List of incoming relationships
+        """
+        node = self._node_index.get(element_id)
+        if node is None:
+            return []
+        
+        edges = self._get_adjacency().in_edges(node)
+        return self._relationships(self._filter_type(edges, relationship_type))
+    
+    def get_neighbors(
+        self,
+        element_id: str,
+        relationship_type: Optional[RelationshipType] = None
+    ) -> List[str]:
+        """Get neighboring element IDs.
+        
+        Args:
+            element_id: Element ID
+            relationship_type: Optional filter by relationship type
+        
+        Returns:
+            List of neighbor element IDs
+        """
+        node = self._node_index.get(element_id)
+        if node is None:
+            return []
+        
+        adjacency = self._get_adjacency()
+        outgoing = self._filter_type(adjacency.out_edges(node), relationship_type)
+        incoming = self._filter_type(adjacency.in_edges(node), relationship_type)
+        neighbors = np.union1d(adjacency.dst[outgoing], adjacency.src[incoming])
+        return [self._node_ids[i] for i in neighbors]
+    
+    def find_path(
+        self,
+        source_id: str,
+        target_id: str,
+        max_length: int = 5
+    ) -> Optional[List[str]]:
+        """Find path between elements.
+        
+        Breadth-first search over the undirected graph, one vectorized
+        step per path length.
+        
+        Args:
+            source_id: Source element ID
+            target_id: Target element ID
+            max_length: Maximum path length
+        
+        Returns:
+            Path as list of element IDs, or None if no path found
+        """
+        source = self._node_index.get(source_id)
+        target = self._node_index.get(target_id)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return [source_id]
+        
+        adjacency = self._get_adjacency()
+        parent = np.full(len(self._node_ids), -1, dtype=np.int64)
+        parent[source] = source
+        frontier = np.array([source], dtype=np.int64)
+        
+        for _ in range(max_length):
+            neighbors, parents = adjacency.expand(frontier)
+            unseen = parent[neighbors] == -1
+            neighbors, first = np.unique(neighbors[unseen], return_index=True)
+            if not len(neighbors):
+                return None
+            parent[neighbors] = parents[unseen][first]
+            
+            if parent[target] != -1:
+                path = [target]
+                while path[-1] != source:
+                    path.append(int(parent[path[-1]]))
+                return [self._node_ids[i] for i in reversed(path)]
+            
+            frontier = neighbors
+        
+        return None
+    
+    def get_connected_components(self) -> List[Set[str]]:
+        """Get connected component groups.
+        
+        Returns:
+            List of sets, each containing element IDs in a connected component
+        """
+        labels = self._component_labels()
+        if not len(labels):
+            return []
+        
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        return [
+            {self._node_ids[i] for i in group}
+            for group in np.split(order, boundaries)
+        ]
+    
+    def get_subgraph(
+        self,
+        element_ids: List[str]
+    ) -> 'CompactRelationshipGraph':
+        """Get subgraph containing only specified elements.
+        
+        Args:
+            element_ids: List of element IDs to include
+        
+        Returns:
+            New graph containing only specified elements and their relationships
+        """
+        subgraph = CompactRelationshipGraph()
+        for element_id in element_ids:
+            if element_id in self.element_index:
+                subgraph.add_element(self.element_index[element_id])
+        
+        keep = np.zeros(len(self._node_ids), dtype=bool)
+        keep[[self._node_index[i] for i in subgraph._node_ids]] = True
+        
+        adjacency = self._get_adjacency()
+        edges = np.flatnonzero(keep[adjacency.src] & keep[adjacency.dst])
+        subgraph._copy_edges(self, edges)
+        return subgraph
+    
+    def filter_by_relationship_type(
+        self,
+        relationship_type: RelationshipType
+    ) -> 'CompactRelationshipGraph':
+        """Create new graph with only specified relationship type.
+        
+        Args:
+            relationship_type: Type of relationships to include
+        
+        Returns:
+            New graph with filtered relationships
+        """
+        filtered_graph = CompactRelationshipGraph()
+        for element in self.element_index.values():
+            filtered_graph.add_element(element)
+        
+        edges = self._filter_type(np.arange(len(self._edge_ids)), relationship_type)
+        filtered_graph._copy_edges(self, edges)
+        return filtered_graph
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get graph statistics.
+        
+        Returns:
+            Dictionary containing graph statistics
+        """
+        adjacency = self._get_adjacency()
+        counts = np.bincount(adjacency.types, minlength=len(self._types))
+        confidence = np.array(self._confidence, dtype=np.float64)
+        
+        return {
+            "num_elements": len(self.element_index),
+            "num_relationships": len(self._edge_ids),
+            "relationship_types": {
+                rel_type.value: int(count) for rel_type, count in zip(self._types, counts) if count
+            },
+            "average_confidence": float(confidence.mean()) if len(confidence) else 0,
+            "connected_components": len(np.unique(self._component_labels())),
+            "is_dag": self._is_dag()
+        }
+    
+    def memory_usage(self) -> Dict[str, int]:
+        """Approximate bytes used by the node and relationship columns."""
+        columns = (self._src, self._dst, self._type, self._confidence, self._created_at)
+        usage = {
+            "edge_columns": sum(column.itemsize * len(column) for column in columns),
+            "edge_ids": sum(len(edge_id) + 49 for edge_id in self._edge_ids),
+            "node_ids": sum(len(node_id) + 49 for node_id in self._node_ids)
+        }
+        if self._adjacency is not None:
+            usage["adjacency"] = sum(
+                getattr(self._adjacency, name).nbytes
+                for name in ('src', 'dst', 'types', 'out_order', 'out_ptr', 'in_order', 'in_ptr')
+            )
+        return usage
+    
+    def clear(self):
+        """Clear all elements and relationships from graph."""
+        self.__init__()
+        logger.debug("Cleared relationship graph")
+    
+    def iter_relationships(self) -> Iterator[Relationship]:
+        """Iterate over all relationships in insertion order."""
+        for edge in range(len(self._edge_ids)):
+            yield self._relationship(edge)
+    
+    @property
+    def graph(self) -> nx.MultiDiGraph:
+        """NetworkX view of the graph, built on every access."""
+        nx_graph = nx.MultiDiGraph()
+        for element_id, element in self.element_index.items():
+            nx_graph.add_node(element_id, element=element)
+        for relationship in self.iter_relationships():
+            nx_graph.add_edge(
+                relationship.source_id,
+                relationship.target_id,
+                key=relationship.id,
+                relationship=relationship
+            )
+        return nx_graph
+    
+    @property
+    def relationship_index(self) -> Dict[str, List[Relationship]]:
+        """Relationships per element, built on every access."""
+        index: Dict[str, List[Relationship]] = {element_id: [] for element_id in self._node_ids}
+        for relationship in self.iter_relationships():
+            index[relationship.source_id].append(relationship)
+            if relationship.target_id != relationship.source_id:
+                index[relationship.target_id].append(relationship)
+        return index
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize graph to dictionary.
+        
+        Returns:
+            Dictionary representation of the graph
+        """
+        return {
+            "elements": {
+                element_id: element.to_dict()
+                for element_id, element in self.element_index.items()
+            },
+            "relationships": [asdict(relationship) for relationship in self.iter_relationships()],
+            "statistics": self.get_statistics()
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CompactRelationshipGraph':
+        """Deserialize graph from dictionary.
+        
+        Args:
+            data: Dictionary representation of graph
+        
+        Returns:
+            Reconstructed graph
+        """
+        graph = cls()
+        
+        for element_data in data.get("elements", {}).values():
+            graph.add_element(UnifiedElement.from_dict(element_data))
+        
+        graph.add_relationships(Relationship(**rel_data) for rel_data in data.get("relationships", []))
+        return graph
+    
+    def __len__(self) -> int:
+        """Get number of elements in graph."""
+        return len(self.element_index)
+    
+    def __contains__(self, element_id: str) -> bool:
+        """Check if element exists in graph."""
+        return element_id in self.element_index
+    
+    def __iter__(self) -> Iterator[UnifiedElement]:
+        """Iterate over elements in graph."""
+        return iter(self.element_index.values())
+    
+    def _type_code(self, relationship_type: RelationshipType) -> int:
+        """Get the small integer code of a relationship type."""
+        code = self._type_codes.get(relationship_type)
+        if code is None:
+            code = self._type_codes[relationship_type] = len(self._types)
+            self._types.append(relationship_type)
+        return code
+    
+    def _append_edge(self, source: int, target: int, relationship: Relationship):
+        """Append one relationship to the columns."""
+        self._src.append(source)
+        self._dst.append(target)
+        self._type.append(self._type_code(relationship.relationship_type))
+        self._confidence.append(relationship.confidence)
+        self._created_at.append(relationship.created_at.timestamp() if relationship.created_at else 0.0)
+        self._edge_ids.append(relationship.id)
+        self._metadata.append(relationship.metadata or None)
+    
+    def _copy_edges(self, other: 'CompactRelationshipGraph', edges: np.ndarray):
+        """Copy edges of ``other`` whose endpoints exist in this graph."""
+        adjacency = other._get_adjacency()
+        remap = np.array([self._node_index.get(node_id, -1) for node_id in other._node_ids], dtype=np.int64)
+        type_remap = np.array([self._type_code(rel_type) for rel_type in other._types], dtype=np.uint8)
+        
+        self._src.extend(remap[adjacency.src[edges]].tolist())
+        self._dst.extend(remap[adjacency.dst[edges]].tolist())
+        self._type.extend(type_remap[adjacency.types[edges]].tolist() if len(type_remap) else [])
+        self._confidence.extend(np.array(other._confidence, dtype=np.float64)[edges].tolist())
+        self._created_at.extend(np.array(other._created_at, dtype=np.float64)[edges].tolist())
+        self._edge_ids.extend(other._edge_ids[i] for i in edges)
+        self._metadata.extend(other._metadata[i] for i in edges)
+        self._adjacency = None
+    
+    def _get_adjacency(self) -> _Adjacency:
+        """Get the CSR/CSC index, rebuilding it after changes."""
+        if self._adjacency is None:
+            self._adjacency = _Adjacency(
+                len(self._node_ids),
+                np.array(self._src, dtype=np.int64),
+                np.array(self._dst, dtype=np.int64),
+                np.array(self._type, dtype=np.uint8)
+            )
+        return self._adjacency
+    
+    def _filter_type(self, edges: np.ndarray, relationship_type: Optional[RelationshipType]) -> np.ndarray:
+        """Keep the edges of one relationship type."""
+        if not relationship_type:
+            return edges
+        code = self._type_codes.get(relationship_type)
+        if code is None:
+            return edges[:0]
+        return edges[self._get_adjacency().types[edges] == code]
+    
+    def _relationship(self, edge: int) -> Relationship:
+        """Rebuild the Relationship object of an edge."""
+        created_at = self._created_at[edge]
+        return Relationship(
+            id=self._edge_ids[edge],
+            source_id=self._node_ids[self._src[edge]],
+            target_id=self._node_ids[self._dst[edge]],
+            relationship_type=self._types[self._type[edge]],
+            confidence=self._confidence[edge],
+            created_at=datetime.fromtimestamp(created_at) if created_at else None,
+            metadata=dict(self._metadata[edge] or {})
+        )
+    
+    def _relationships(self, edges: np.ndarray) -> List[Relationship]:
+        return [self._relationship(int(edge)) for edge in edges]
+    
+    def _component_labels(self) -> np.ndarray:
+        """Label every node with the smallest node id of its weak component.
+        
+        Min-label hooking with pointer jumping; each round is a handful of
+        array operations and the number of rounds grows with log(n).
+        """
+        adjacency = self._get_adjacency()
+        labels = np.arange(len(self._node_ids), dtype=np.int64)
+        src, dst = adjacency.src, adjacency.dst
+        
+        while True:
+            src_labels, dst_labels = labels[src], labels[dst]
+            pending = src_labels != dst_labels
+            if not pending.any():
+                return labels
+            
+            # Hook the larger root under the smaller one
+            low = np.minimum(src_labels[pending], dst_labels[pending])
+            high = np.maximum(src_labels[pending], dst_labels[pending])
+            np.minimum.at(labels, high, low)
+            
+            # Point every node straight at its root
+            while True:
+                jumped = labels[labels]
+                if np.array_equal(jumped, labels):
+                    break
+                labels = jumped
+    
+    def _is_dag(self) -> bool:
+        """Check for cycles by peeling nodes without incoming edges."""
+        adjacency = self._get_adjacency()
+        node_count = len(self._node_ids)
+        in_degree = np.diff(adjacency.in_ptr)
+        frontier = np.flatnonzero(in_degree == 0)
+        removed = 0
+        
+        while len(frontier):
+            removed += len(frontier)
+            targets, _ = adjacency.expand(frontier, directed=True)
+            np.subtract.at(in_degree, targets, 1)
+            frontier = np.unique(targets[in_degree[targets] == 0])
+        
+        return removed == node_count
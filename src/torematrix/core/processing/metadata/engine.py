@@ -1,8 +1,10 @@
 """Core metadata extraction engine with async processing and pluggable extractors."""
 
 from typing import Dict, List, Optional, Any, Set, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor
 import asyncio
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -21,6 +23,22 @@ from .extractors.base import BaseExtractor, ExtractorRegistry
 logger = logging.getLogger(__name__)
 
 
+def _run_page_shard(
+    extractor: BaseExtractor,
+    page: Any,
+    page_number: int,
+    context: ExtractionContext
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Extract one page in a worker process.
+    
+    Returns the result and the statistics of this extraction alone, which
+    the parent merges into its own copy of the extractor.
+    """
+    extractor.reset_statistics()
+    result = asyncio.run(extractor.extract_page_with_validation(page, page_number, context))
+    return result, extractor._extraction_stats
+
+
 class MetadataExtractionEngine:
     """Core metadata extraction engine with pluggable extractors."""
     
@@ -48,6 +66,10 @@ class MetadataExtractionEngine:
         # Simple in-memory cache for demonstration
         self._metadata_cache: Dict[str, MetadataSchema] = {}
         
+        # Worker processes for page shards, created on first use
+        self._page_executor: Optional[Executor] = None
+        self._page_executor_failed = False
+        
         self.logger.info("MetadataExtractionEngine initialized")
     
     async def extract_metadata(
@@ -89,8 +111,12 @@ class MetadataExtractionEngine:
             # Determine which extractors to run
             target_extractors = self._select_extractors(extraction_types)
             
-            # Run extractors in parallel if enabled
-            if self.config.enable_parallel_extraction:
+            # Run extractors per page shard, or in parallel if enabled
+            if self.config.enable_page_sharding:
+                metadata_results = await self._extract_page_sharded(
+                    document, context, target_extractors
+                )
+            elif self.config.enable_parallel_extraction:
                 metadata_results = await self._extract_parallel(
                     document, context, target_extractors
                 )
@@ -180,10 +206,17 @@ class MetadataExtractionEngine:
         
         # Run only necessary extractors
         if required_extractors:
-            # Extract metadata for changed components
-            new_results = await self._extract_parallel(
-                document, context, required_extractors
-            )
+            # Extract metadata for changed components; page-scoped
+            # extractors only re-run the changed pages
+            if self.config.enable_page_sharding:
+                new_results = await self._extract_page_sharded(
+                    document, context, required_extractors,
+                    pages=self._changed_pages(changes)
+                )
+            else:
+                new_results = await self._extract_parallel(
+                    document, context, required_extractors
+                )
             
             # Merge with previous metadata
             updated_schema = self._merge_metadata_schemas(
@@ -197,6 +230,12 @@ class MetadataExtractionEngine:
         self.logger.info("Incremental metadata extraction completed")
         return updated_schema
     
+    def close(self) -> None:
+        """Shut down the page shard worker processes."""
+        if self._page_executor is not None:
+            self._page_executor.shutdown(wait=False, cancel_futures=True)
+            self._page_executor = None
+    
     def register_extractor(self, name: str, extractor: BaseExtractor) -> None:
         """Register a metadata extractor.
         
@@ -300,6 +339,143 @@ class MetadataExtractionEngine:
         
         return extraction_results
     
+    async def _extract_page_sharded(
+        self,
+        document: Any,
+        context: ExtractionContext,
+        extractors: Dict[str, BaseExtractor],
+        pages: Optional[Set[int]] = None
+    ) -> Dict[str, Any]:
+        """Run page-scoped extractors per page, then the others.
+        
+        Page shards fan out across worker processes; extractors that need
+        the whole document run afterwards as the reduce step.
+        
+        Args:
+            document: Document to process
+            context: Extraction context
+            extractors: Dictionary of extractors to run
+            pages: Page numbers to extract (None for all pages)
+            
+        Returns:
+            Dictionary mapping extractor names to results; page-scoped
+            extractors map to a list of per-page results
+        """
+        page_extractors = {
+            name: extractor for name, extractor in extractors.items()
+            if getattr(extractor, 'page_scoped', False) is True
+        }
+        other_extractors = {
+            name: extractor for name, extractor in extractors.items()
+            if name not in page_extractors
+        }
+        
+        extraction_results: Dict[str, Any] = {}
+        if page_extractors:
+            shards = [
+                (page_number, page) for page_number, page in self._document_pages(document)
+                if pages is None or page_number in pages
+            ]
+            extraction_results.update(
+                await self._extract_page_shards(shards, context, page_extractors)
+            )
+        
+        if other_extractors:
+            if self.config.enable_parallel_extraction:
+                extraction_results.update(
+                    await self._extract_parallel(document, context, other_extractors)
+                )
+            else:
+                extraction_results.update(
+                    await self._extract_sequential(document, context, other_extractors)
+                )
+        
+        return extraction_results
+    
+    async def _extract_page_shards(
+        self,
+        shards: List[Tuple[int, Any]],
+        context: ExtractionContext,
+        extractors: Dict[str, BaseExtractor]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Run page-scoped extractors on every shard.
+        
+        Args:
+            shards: Page numbers and page objects
+            context: Extraction context
+            extractors: Page-scoped extractors
+            
+        Returns:
+            Dictionary mapping extractor names to per-page results in page order
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_page_executor() if len(shards) >= self.config.page_shard_min_pages else None
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        
+        async def extract_shard(name: str, extractor: BaseExtractor, page_number: int, page: Any):
+            if executor is not None:
+                try:
+                    result, stats = await loop.run_in_executor(
+                        executor, _run_page_shard, extractor, page, page_number, context
+                    )
+                    extractor.merge_statistics(stats)
+                    return name, result
+                except Exception as e:
+                    # Usually a page that cannot be pickled; extract it here
+                    self.logger.warning(f"Page {page_number} shard failed in worker process: {e}")
+            
+            async with semaphore:
+                return name, await extractor.extract_page_with_validation(page, page_number, context)
+        
+        tasks = [
+            extract_shard(name, extractor, page_number, page)
+            for name, extractor in extractors.items()
+            for page_number, page in shards
+        ]
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        extraction_results: Dict[str, List[Dict[str, Any]]] = {}
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Page extractor failed: {result}")
+                continue
+            
+            name, extraction_result = result
+            extraction_results.setdefault(name, []).append(extraction_result)
+        
+        return extraction_results
+    
+    def _document_pages(self, document: Any) -> List[Tuple[int, Any]]:
+        """Get page numbers and page objects; a document without pages is one page."""
+        pages = getattr(document, 'pages', None)
+        if pages:
+            return list(enumerate(pages, start=1))
+        return [(1, document)]
+    
+    def _changed_pages(self, changes: Optional[Dict[str, Any]]) -> Optional[Set[int]]:
+        """Get the changed page numbers from incremental changes, None if unknown."""
+        pages = (changes or {}).get("pages")
+        if not isinstance(pages, (list, tuple, set)):
+            return None
+        
+        page_numbers = {page for page in pages if isinstance(page, int) and not isinstance(page, bool)}
+        return page_numbers or None
+    
+    def _get_page_executor(self) -> Optional[Executor]:
+        """Get the page shard process pool, or None to extract on the event loop."""
+        workers = self.config.page_workers
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if self._page_executor is None and workers > 1 and not self._page_executor_failed:
+            try:
+                self._page_executor = ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                self.logger.warning(f"Process pool unavailable, extracting pages on the event loop: {e}")
+                self._page_executor_failed = True
+        return self._page_executor
+    
     async def _extract_sequential(
         self,
         document: Any,
@@ -369,38 +545,43 @@ class MetadataExtractionEngine:
         """
         schema = MetadataSchema(extraction_context=context)
         
-        for extractor_name, result in results.items():
-            if not result.get("extraction_info", {}).get("success", False):
-                continue
+        for extractor_name, extractor_results in results.items():
+            # Page-sharded extractors have one result per page
+            if not isinstance(extractor_results, list):
+                extractor_results = [extractor_results]
             
-            metadata = result.get("metadata", {})
-            validation = result.get("validation")
+            for result in extractor_results:
+                if not result.get("extraction_info", {}).get("success", False):
+                    continue
             
-            # Process based on metadata type
-            metadata_type = metadata.get("metadata_type")
+                metadata = result.get("metadata", {})
+                validation = result.get("validation")
             
-            if metadata_type == "document":
-                schema.document_metadata = self._create_document_metadata(
-                    metadata, validation, extractor_name, context
-                )
-            elif metadata_type == "page":
-                page_metadata = self._create_page_metadata(
-                    metadata, validation, extractor_name, context
-                )
-                if page_metadata:
-                    schema.page_metadata.append(page_metadata)
-            elif metadata_type == "element":
-                element_metadata = self._create_element_metadata(
-                    metadata, validation, extractor_name, context
-                )
-                if element_metadata:
-                    schema.element_metadata.append(element_metadata)
-            elif metadata_type == "relationship":
-                relationship_metadata = self._create_relationship_metadata(
-                    metadata, validation, extractor_name, context
-                )
-                if relationship_metadata:
-                    schema.relationship_metadata.append(relationship_metadata)
+                # Process based on metadata type
+                metadata_type = metadata.get("metadata_type")
+                
+                if metadata_type == "document":
+                    schema.document_metadata = self._create_document_metadata(
+                        metadata, validation, extractor_name, context
+                    )
+                elif metadata_type == "page":
+                    page_metadata = self._create_page_metadata(
+                        metadata, validation, extractor_name, context
+                    )
+                    if page_metadata:
+                        schema.page_metadata.append(page_metadata)
+                elif metadata_type == "element":
+                    element_metadata = self._create_element_metadata(
+                        metadata, validation, extractor_name, context
+                    )
+                    if element_metadata:
+                        schema.element_metadata.append(element_metadata)
+                elif metadata_type == "relationship":
+                    relationship_metadata = self._create_relationship_metadata(
+                        metadata, validation, extractor_name, context
+                    )
+                    if relationship_metadata:
+                        schema.relationship_metadata.append(relationship_metadata)
         
         return schema
     
@@ -430,7 +611,7 @@ class MetadataExtractionEngine:
                 source_extractor=extractor_name,
                 extraction_method=metadata.get("extraction_method", "direct_parsing"),
                 validation_result=validation,
-                **{k: v for k, v in metadata.items() if k != "metadata_type"}
+                **{k: v for k, v in metadata.items() if k not in ["metadata_type", "extraction_method"]}
             )
         except Exception as e:
             self.logger.error(f"Failed to create document metadata: {e}")
@@ -462,7 +643,7 @@ class MetadataExtractionEngine:
                 extraction_method=metadata.get("extraction_method", "direct_parsing"),
                 validation_result=validation,
                 document_id=context.document_id,
-                **{k: v for k, v in metadata.items() if k not in ["metadata_type", "document_id"]}
+                **{k: v for k, v in metadata.items() if k not in ["metadata_type", "extraction_method", "document_id"]}
             )
         except Exception as e:
             self.logger.error(f"Failed to create page metadata: {e}")
@@ -494,7 +675,7 @@ class MetadataExtractionEngine:
                 extraction_method=metadata.get("extraction_method", "direct_parsing"),
                 validation_result=validation,
                 document_id=context.document_id,
-                **{k: v for k, v in metadata.items() if k not in ["metadata_type", "document_id"]}
+                **{k: v for k, v in metadata.items() if k not in ["metadata_type", "extraction_method", "document_id"]}
             )
         except Exception as e:
             self.logger.error(f"Failed to create element metadata: {e}")
@@ -525,7 +706,7 @@ class MetadataExtractionEngine:
                 source_extractor=extractor_name,
                 extraction_method=metadata.get("extraction_method", "direct_parsing"),
                 validation_result=validation,
-                **{k: v for k, v in metadata.items() if k != "metadata_type"}
+                **{k: v for k, v in metadata.items() if k not in ["metadata_type", "extraction_method"]}
             )
         except Exception as e:
             self.logger.error(f"Failed to create relationship metadata: {e}")
@@ -603,8 +784,19 @@ class MetadataExtractionEngine:
         if not updated_schema.document_metadata and previous.document_metadata:
             updated_schema.document_metadata = previous.document_metadata
         
-        # For page/element metadata, this would be more complex in practice
-        if not updated_schema.page_metadata:
+        # Re-extracted pages replace their previous metadata; other pages are kept
+        if updated_schema.page_metadata:
+            replaced = {
+                (page.page_number, page.source_extractor) for page in updated_schema.page_metadata
+            }
+            kept = [
+                page for page in previous.page_metadata
+                if (page.page_number, page.source_extractor) not in replaced
+            ]
+            updated_schema.page_metadata = sorted(
+                kept + updated_schema.page_metadata, key=lambda page: page.page_number
+            )
+        else:
             updated_schema.page_metadata = previous.page_metadata
         
         if not updated_schema.element_metadata:
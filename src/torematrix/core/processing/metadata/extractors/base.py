@@ -1,7 +1,7 @@
 """Base extractor interface and framework for metadata extraction."""
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Type, Set
+from typing import Dict, List, Any, Optional, Type, Set, Callable, Awaitable
 import asyncio
 import logging
 from datetime import datetime
@@ -34,6 +34,10 @@ class ValidationError(ExtractorError):
 class BaseExtractor(ABC):
     """Base interface for all metadata extractors."""
     
+    # Extractors that work on one page at a time set this and implement
+    # extract_page(); the engine then runs them once per page shard
+    page_scoped: bool = False
+    
     def __init__(self, config: ExtractorConfig):
         """Initialize base extractor.
         
@@ -72,6 +76,27 @@ class BaseExtractor(ABC):
         """
         pass
     
+    async def extract_page(
+        self,
+        page: Any,
+        page_number: int,
+        context: ExtractionContext
+    ) -> ExtractorResult:
+        """Extract metadata from a single page.
+        
+        Only called for extractors with ``page_scoped`` set. May run in a
+        worker process, so it must not rely on state outside the extractor.
+        
+        Args:
+            page: The page to extract metadata from
+            page_number: Page number (1-indexed)
+            context: Extraction context with processing hints
+            
+        Returns:
+            Dictionary containing extracted metadata
+        """
+        raise NotImplementedError(f"{self.name} does not support page extraction")
+    
     @abstractmethod
     def validate_metadata(self, metadata: MetadataDict) -> MetadataValidationResult:
         """Validate extracted metadata.
@@ -120,6 +145,31 @@ class BaseExtractor(ABC):
         Returns:
             Dictionary with extracted metadata and validation results
         """
+        return await self._extract_validated(lambda: self.extract(document, context))
+    
+    async def extract_page_with_validation(
+        self,
+        page: Any,
+        page_number: int,
+        context: ExtractionContext
+    ) -> Dict[str, Any]:
+        """Extract metadata from one page with validation and error handling.
+        
+        Args:
+            page: Page to process
+            page_number: Page number (1-indexed)
+            context: Extraction context
+            
+        Returns:
+            Dictionary with extracted metadata and validation results
+        """
+        return await self._extract_validated(lambda: self.extract_page(page, page_number, context))
+    
+    async def _extract_validated(
+        self,
+        extraction: Callable[[], Awaitable[ExtractorResult]]
+    ) -> Dict[str, Any]:
+        """Run an extraction with timeout, validation and statistics."""
         start_time = datetime.utcnow()
         
         try:
@@ -127,9 +177,7 @@ class BaseExtractor(ABC):
             self._extraction_stats["total_extractions"] += 1
             
             # Perform extraction with timeout
-            extraction_task = asyncio.create_task(
-                self.extract(document, context)
-            )
+            extraction_task = asyncio.create_task(extraction())
             
             if self.config.timeout_seconds:
                 try:
@@ -282,6 +330,22 @@ class BaseExtractor(ABC):
             "configuration": self.config.dict()
         }
     
+    def merge_statistics(self, stats: Dict[str, Any]) -> None:
+        """Add statistics recorded by a copy of this extractor.
+        
+        Args:
+            stats: Raw statistics of the copy, e.g. from a worker process
+        """
+        total = self._extraction_stats["total_extractions"] + stats["total_extractions"]
+        if total:
+            self._extraction_stats["average_duration"] = (
+                self._extraction_stats["average_duration"] * self._extraction_stats["total_extractions"]
+                + stats["average_duration"] * stats["total_extractions"]
+            ) / total
+        
+        for key in ("total_extractions", "successful_extractions", "failed_extractions"):
+            self._extraction_stats[key] += stats[key]
+    
     def reset_statistics(self) -> None:
         """Reset extraction statistics."""
         self._extraction_stats = {
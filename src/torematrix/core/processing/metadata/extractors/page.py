@@ -14,6 +14,8 @@ from .base import BaseExtractor
 class PageMetadataExtractor(BaseExtractor):
     """Extract page-level metadata including layout and content properties."""
     
+    page_scoped = True
+    
     def get_supported_extraction_methods(self) -> List[ExtractionMethod]:
         """Return supported extraction methods."""
         return [
@@ -49,6 +51,29 @@ class PageMetadataExtractor(BaseExtractor):
         
         return page_metadata
     
+    async def extract_page(
+        self,
+        page: Any,
+        page_number: int,
+        context: ExtractionContext
+    ) -> ExtractorResult:
+        """Extract metadata for one page shard.
+        
+        Args:
+            page: Page object
+            page_number: Page number (1-indexed)
+            context: Extraction context
+            
+        Returns:
+            Dictionary containing the page's metadata
+        """
+        page_metadata = await self._extract_page_object_metadata(page, page_number, context)
+        
+        page_metadata["metadata_type"] = "page"
+        page_metadata["extraction_method"] = ExtractionMethod.HYBRID
+        
+        return page_metadata
+    
     async def _extract_single_page_metadata(
         self,
         document: Any,
@@ -62,6 +87,32 @@ class PageMetadataExtractor(BaseExtractor):
             page_number: Page number to extract (1-indexed)
             context: Extraction context
             
+        Returns:
+            Dictionary containing page metadata
+        """
+        # Get page object
+        page = self._get_page(document, page_number)
+        if not page:
+            return {
+                "page_number": page_number,
+                "document_id": context.document_id
+            }
+        
+        return await self._extract_page_object_metadata(page, page_number, context)
+    
+    async def _extract_page_object_metadata(
+        self,
+        page: Any,
+        page_number: int,
+        context: ExtractionContext
+    ) -> Dict[str, Any]:
+        """Extract metadata from a page object.
+        
+        Args:
+            page: Page object
+            page_number: Page number (1-indexed)
+            context: Extraction context
+            
         Returns:
             Dictionary containing page metadata
         """
@@ -70,11 +121,6 @@ class PageMetadataExtractor(BaseExtractor):
             "document_id": context.document_id
         }
         
-        # Get page object
-        page = self._get_page(document, page_number)
-        if not page:
-            return metadata
-        
         # Extract page dimensions
         metadata.update(self._extract_page_dimensions(page))
         
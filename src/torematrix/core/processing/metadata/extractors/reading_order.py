@@ -2,14 +2,18 @@
 
 This module provides algorithms to determine the reading order of elements
 in a document, including column detection and multi-language support.
+Element positions are read once per page into coordinate arrays, so column
+detection and ordering are array operations rather than element scans.
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Sequence
 from dataclasses import dataclass
 from enum import Enum
 import statistics
 
+import numpy as np
+
 from ....models.element import Element as UnifiedElement
 from ..algorithms.spatial import BoundingBox
 
@@ -79,6 +83,51 @@ class ReadingOrderConfig:
     alignment_tolerance: float = 5.0
 
 
+@dataclass
+class PageBoxes:
+    """Layout boxes of a page's elements as coordinate arrays.
+    
+    Row ``i`` describes ``ids[i]``. Elements without a usable layout bbox
+    are NaN in every coordinate and False in ``valid``.
+    """
+    ids: List[str]
+    left: np.ndarray
+    top: np.ndarray
+    right: np.ndarray
+    bottom: np.ndarray
+    valid: np.ndarray
+    
+    @classmethod
+    def from_elements(cls, elements: Sequence[UnifiedElement]) -> 'PageBoxes':
+        """Read the layout bbox of every element."""
+        coords = np.full((len(elements), 4), np.nan)
+        for row, element in enumerate(elements):
+            if not (element.metadata and element.metadata.coordinates):
+                continue
+            bbox = element.metadata.coordinates.layout_bbox
+            if bbox and len(bbox) >= 4:
+                coords[row] = bbox[:4]
+        
+        return cls(
+            ids=[element.id for element in elements],
+            left=coords[:, 0],
+            top=coords[:, 1],
+            right=coords[:, 2],
+            bottom=coords[:, 3],
+            valid=~np.isnan(coords).any(axis=1)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def rows_by_id(self) -> Dict[str, List[int]]:
+        """Map element IDs to their rows (IDs may repeat)."""
+        rows: Dict[str, List[int]] = {}
+        for row, element_id in enumerate(self.ids):
+            rows.setdefault(element_id, []).append(row)
+        return rows
+
+
 class ColumnDetector:
     """Detects column structure in document layout."""
     
@@ -101,55 +150,65 @@ class ColumnDetector:
         """
         if not elements:
             return []
+        return self.detect_columns_from_boxes(elements, PageBoxes.from_elements(elements))
         
-        # Get bounding boxes for text elements only
-        text_elements = [e for e in elements if self._is_text_element(e)]
-        if not text_elements:
-            return []
-        
-        bboxes = []
-        element_ids = []
-        
-        for element in text_elements:
-            bbox = self._get_bounding_box(element)
-            if bbox:
-                bboxes.append(bbox)
-                element_ids.append(element.id)
+    def detect_columns_from_boxes(
+        self,
+        elements: Sequence[UnifiedElement],
+        boxes: PageBoxes
+    ) -> List[Column]:
+        """Detect columns using precomputed boxes of ``elements``.
         
-        if not bboxes:
+        Args:
+            elements: Elements to analyze
+            boxes: Layout boxes of ``elements``, row by row
+            
+        Returns:
+            List of detected columns
+        """
+        # Only text elements with a bounding box take part
+        is_text = np.fromiter((self._is_text_element(e) for e in elements), dtype=bool, count=len(elements))
+        rows = np.flatnonzero(is_text & boxes.valid)
+        if not len(rows):
             return []
         
-        # Find column boundaries using X-coordinate clustering
-        x_starts = [bbox.left for bbox in bboxes]
-        x_ends = [bbox.right for bbox in bboxes]
+        lefts = boxes.left[rows]
         
         # Cluster starting positions to find column starts
-        column_starts = self._cluster_coordinates(x_starts)
+        column_starts = self._cluster_coordinates(lefts)
+        
+        # Elements within the alignment tolerance of a start belong to its
+        # column. Search the sorted lefts for the window around each start,
+        # widened a little so the exact test below decides the boundary.
+        by_left = np.argsort(lefts, kind='stable')
+        sorted_lefts = lefts[by_left]
+        starts = np.asarray(column_starts, dtype=float)
+        tolerance = self.config.alignment_tolerance
+        slack = 1e-9 * (np.abs(starts) + tolerance + 1.0)
+        lower = np.searchsorted(sorted_lefts, starts - tolerance - slack, side='left')
+        upper = np.searchsorted(sorted_lefts, starts + tolerance + slack, side='right')
         
-        # Create columns based on clustered starts
         columns = []
-        for i, start in enumerate(column_starts):
-            # Find elements that start near this column start
-            column_elements = []
-            for j, bbox in enumerate(bboxes):
-                if abs(bbox.left - start) <= self.config.alignment_tolerance:
-                    column_elements.append(element_ids[j])
+        for start, lo, hi in zip(starts, lower, upper):
+            window = by_left[lo:hi]
+            members = np.sort(window[np.abs(lefts[window] - start) <= tolerance])
+            if not len(members):
+                continue
             
-            if column_elements:
-                # Determine column boundaries
-                column_bboxes = [bboxes[element_ids.index(eid)] for eid in column_elements]
-                left = min(bbox.left for bbox in column_bboxes)
-                right = max(bbox.right for bbox in column_bboxes)
+            member_rows = rows[members]
+            left = float(boxes.left[member_rows].min())
+            right = float(boxes.right[member_rows].max())
                 
-                # Only create column if it meets minimum width requirement
-                if right - left >= self.config.min_column_width:
-                    confidence = self._calculate_column_confidence(column_bboxes)
-                    columns.append(Column(
-                        left=left,
-                        right=right,
-                        elements=column_elements,
-                        confidence=confidence
-                    ))
+            # Only create column if it meets minimum width requirement
+            if right - left >= self.config.min_column_width:
+                columns.append(Column(
+                    left=left,
+                    right=right,
+                    elements=[boxes.ids[row] for row in member_rows],
+                    confidence=self._column_confidence(
+                        boxes.left[member_rows].tolist(), boxes.top[member_rows].tolist()
+                    )
+                ))
         
         # Sort columns by left position
         columns.sort(key=lambda c: c.left)
@@ -194,40 +253,24 @@ class ColumnDetector:
             bottom=bbox[3]
         )
     
-    def _cluster_coordinates(self, coordinates: List[float]) -> List[float]:
+    def _cluster_coordinates(self, coordinates: Sequence[float]) -> List[float]:
         """Cluster coordinates to find distinct positions.
         
         Args:
-            coordinates: List of coordinates to cluster
+            coordinates: Coordinates to cluster
             
         Returns:
             List of cluster centers
         """
-        if not coordinates:
+        if not len(coordinates):
             return []
         
-        # Sort coordinates
-        sorted_coords = sorted(set(coordinates))
-        
-        if len(sorted_coords) == 1:
-            return sorted_coords
-        
-        # Simple clustering based on gaps
-        clusters = []
-        current_cluster = [sorted_coords[0]]
-        
-        for coord in sorted_coords[1:]:
-            if coord - current_cluster[-1] <= self.config.column_gap_threshold:
-                current_cluster.append(coord)
-            else:
-                # Finish current cluster and start new one
-                clusters.append(statistics.mean(current_cluster))
-                current_cluster = [coord]
+        # Distinct positions in order; a gap above the threshold starts a new cluster
+        distinct = np.unique(np.asarray(coordinates, dtype=float))
+        breaks = np.flatnonzero(np.diff(distinct) > self.config.column_gap_threshold) + 1
         
-        # Add final cluster
-        clusters.append(statistics.mean(current_cluster))
-        
-        return clusters
+        # statistics.mean is exact, so centers do not depend on summation order
+        return [statistics.mean(cluster.tolist()) for cluster in np.split(distinct, breaks)]
     
     def _calculate_column_confidence(self, bboxes: List[BoundingBox]) -> float:
         """Calculate confidence score for column detection.
@@ -238,19 +281,23 @@ class ColumnDetector:
         Returns:
             Confidence score between 0 and 1
         """
-        if len(bboxes) < 2:
+        return self._column_confidence(
+            [bbox.left for bbox in bboxes], [bbox.top for bbox in bboxes]
+        )
+    
+    def _column_confidence(self, left_positions: List[float], y_positions: List[float]) -> float:
+        """Column confidence from the left and top edges of its elements."""
+        if len(left_positions) < 2:
             return 0.5
         
         # Check alignment consistency
-        left_positions = [bbox.left for bbox in bboxes]
         alignment_variance = statistics.variance(left_positions) if len(left_positions) > 1 else 0
         
         # Lower variance means better alignment
         alignment_score = max(0, 1.0 - alignment_variance / 100.0)
         
         # Check for reasonable spacing between elements
-        y_positions = [bbox.top for bbox in bboxes]
-        y_positions.sort()
+        y_positions = sorted(y_positions)
         
         spacing_score = 1.0
         if len(y_positions) > 1:
@@ -334,29 +381,34 @@ class ReadingOrderExtractor:
         """
         logger.debug(f"Extracting reading order for {len(elements)} elements")
         
-        # Detect columns
-        columns = self.column_detector.detect_columns(elements)
+        boxes = PageBoxes.from_elements(elements)
         
-        # Order elements within each column
-        ordered_elements = []
+        # Detect columns
+        columns = self.column_detector.detect_columns_from_boxes(elements, boxes) if elements else []
         
+        # Order elements within each column, columns one after another
         if columns:
             # Multi-column layout
-            for column in columns:
-                column_elements = [e for e in elements if e.id in column.elements]
-                ordered_column = self.order_within_column(column_elements, reading_direction)
-                ordered_elements.extend(ordered_column)
+            rows_by_id = boxes.rows_by_id()
+            groups = [
+                np.unique(np.fromiter(
+                    (row for element_id in set(column.elements) for row in rows_by_id[element_id]),
+                    dtype=np.intp
+                ))
+                for column in columns
+            ]
         else:
             # Single column layout
-            ordered_elements = self.order_within_column(elements, reading_direction)
+            groups = [np.arange(len(elements))]
+        order = self._order_rows(boxes, groups, reading_direction)
         
         # Calculate overall confidence
         confidence = self._calculate_reading_order_confidence(
-            elements, ordered_elements, columns
+            elements, order, columns, boxes
         )
         
         reading_order = ReadingOrder(
-            ordered_elements=[e.id for e in ordered_elements],
+            ordered_elements=[boxes.ids[row] for row in order],
             columns=columns,
             reading_direction=reading_direction,
             confidence=confidence,
@@ -369,7 +421,7 @@ class ReadingOrderExtractor:
         )
         
         # Validate reading order
-        validation_result = self.validate_reading_order(reading_order, elements)
+        validation_result = self.validate_reading_order(reading_order, elements, boxes)
         reading_order.metadata["validation"] = validation_result
         
         logger.debug(f"Reading order confidence: {confidence:.2f}")
@@ -392,61 +444,70 @@ class ReadingOrderExtractor:
         if not elements:
             return []
         
-        # Filter elements with valid coordinates
-        valid_elements = []
-        for element in elements:
-            bbox = self._get_bounding_box(element)
-            if bbox:
-                valid_elements.append((element, bbox))
-        
-        if not valid_elements:
+        boxes = PageBoxes.from_elements(elements)
+        if not boxes.valid.any():
             return elements
         
-        # Sort based on reading direction
+        order = self._order_rows(boxes, [np.arange(len(elements))], direction)
+        return [elements[row] for row in order]
+    
+    def _order_rows(
+        self,
+        boxes: PageBoxes,
+        groups: List[np.ndarray],
+        direction: ReadingDirection
+    ) -> np.ndarray:
+        """Order the rows of each group by reading direction, groups in sequence.
+        
+        One stable lexsort over (group, has coordinates, primary, secondary)
+        orders every group at once. Rows without coordinates keep their
+        order at the end of their group.
+        
+        Args:
+            boxes: Layout boxes of the page
+            groups: Row indices of each group (column), in element order
+            direction: Reading direction
+            
+        Returns:
+            Row indices in reading order
+        """
+        if not groups:
+            return np.empty(0, dtype=np.intp)
+        
+        rows = np.concatenate(groups).astype(np.intp)
+        group = np.repeat(np.arange(len(groups)), [len(g) for g in groups])
+        
         if direction == ReadingDirection.LEFT_TO_RIGHT:
-            # Sort by top-to-bottom, then left-to-right
-            sorted_elements = sorted(
-                valid_elements,
-                key=lambda x: (x[1].top, x[1].left)
-            )
+            # Top-to-bottom, then left-to-right
+            primary, secondary = boxes.top[rows], boxes.left[rows]
         elif direction == ReadingDirection.RIGHT_TO_LEFT:
-            # Sort by top-to-bottom, then right-to-left
-            sorted_elements = sorted(
-                valid_elements,
-                key=lambda x: (x[1].top, -x[1].right)
-            )
+            # Top-to-bottom, then right-to-left
+            primary, secondary = boxes.top[rows], -boxes.right[rows]
         elif direction == ReadingDirection.TOP_TO_BOTTOM:
-            # Sort by left-to-right, then top-to-bottom
-            sorted_elements = sorted(
-                valid_elements,
-                key=lambda x: (x[1].left, x[1].top)
-            )
+            # Left-to-right, then top-to-bottom
+            primary, secondary = boxes.left[rows], boxes.top[rows]
         else:  # BOTTOM_TO_TOP
-            # Sort by left-to-right, then bottom-to-top
-            sorted_elements = sorted(
-                valid_elements,
-                key=lambda x: (x[1].left, -x[1].bottom)
-            )
-        
-        # Return just the elements
-        ordered = [element for element, _ in sorted_elements]
+            # Left-to-right, then bottom-to-top
+            primary, secondary = boxes.left[rows], -boxes.bottom[rows]
         
-        # Add elements without coordinates at the end
-        elements_without_coords = [e for e in elements if e not in [elem for elem, _ in valid_elements]]
-        ordered.extend(elements_without_coords)
+        missing = ~boxes.valid[rows]
+        primary = np.where(missing, 0.0, primary)
+        secondary = np.where(missing, 0.0, secondary)
         
-        return ordered
+        return rows[np.lexsort((secondary, primary, missing, group))]
     
     def validate_reading_order(
         self, 
         order: ReadingOrder,
-        elements: List[UnifiedElement]
+        elements: List[UnifiedElement],
+        boxes: Optional[PageBoxes] = None
     ) -> Dict:
         """Validate reading order makes sense.
         
         Args:
             order: Reading order to validate
             elements: Original elements
+            boxes: Layout boxes of ``elements``, read from them if omitted
             
         Returns:
             Validation result dictionary
@@ -474,7 +535,7 @@ class ReadingOrderExtractor:
                 validation["is_valid"] = False
         
         # Check for reasonable spatial progression
-        spatial_score = self._validate_spatial_progression(order, elements)
+        spatial_score = self._validate_spatial_progression(order, elements, boxes)
         validation["spatial_score"] = spatial_score
         
         if spatial_score < 0.5:
@@ -511,15 +572,17 @@ class ReadingOrderExtractor:
     def _calculate_reading_order_confidence(
         self,
         elements: List[UnifiedElement],
-        ordered_elements: List[UnifiedElement],
-        columns: List[Column]
+        order: np.ndarray,
+        columns: List[Column],
+        boxes: PageBoxes
     ) -> float:
         """Calculate confidence in reading order.
         
         Args:
             elements: Original elements
-            ordered_elements: Ordered elements
+            order: Rows of ``boxes`` in reading order
             columns: Detected columns
+            boxes: Layout boxes of ``elements``
             
         Returns:
             Confidence score between 0 and 1
@@ -532,7 +595,7 @@ class ReadingOrderExtractor:
             base_confidence += 0.2 * avg_column_confidence
         
         # Check spatial consistency
-        spatial_consistency = self._check_spatial_consistency(ordered_elements)
+        spatial_consistency = self._spatial_consistency(boxes, order)
         base_confidence *= spatial_consistency
         
         return min(0.95, base_confidence)
@@ -549,72 +612,80 @@ class ReadingOrderExtractor:
         if len(ordered_elements) < 2:
             return 1.0
         
-        violations = 0
-        total_checks = 0
+        return self._spatial_consistency(
+            PageBoxes.from_elements(ordered_elements), np.arange(len(ordered_elements))
+        )
         
-        for i in range(len(ordered_elements) - 1):
-            bbox1 = self._get_bounding_box(ordered_elements[i])
-            bbox2 = self._get_bounding_box(ordered_elements[i + 1])
+    def _spatial_consistency(self, boxes: PageBoxes, order: np.ndarray) -> float:
+        """Spatial consistency of the rows of ``boxes`` taken in ``order``."""
+        if len(order) < 2:
+            return 1.0
             
-            if bbox1 and bbox2:
-                total_checks += 1
-                
-                # Check if elements progress naturally
-                # Element 2 should be to the right or below element 1
-                if not (bbox2.left >= bbox1.left - 20 or bbox2.top >= bbox1.top - 10):
-                    violations += 1
-        
+        # Consecutive pairs where both elements have coordinates
+        first, second = order[:-1], order[1:]
+        checked = boxes.valid[first] & boxes.valid[second]
+        total_checks = int(checked.sum())
         if total_checks == 0:
             return 1.0
         
+        # Element 2 should be to the right or below element 1
+        first, second = first[checked], second[checked]
+        natural = (
+            (boxes.left[second] >= boxes.left[first] - 20) |
+            (boxes.top[second] >= boxes.top[first] - 10)
+        )
+        violations = total_checks - int(natural.sum())
+        
         consistency = 1.0 - (violations / total_checks)
         return max(0.0, consistency)
     
     def _validate_spatial_progression(
         self, 
         order: ReadingOrder, 
-        elements: List[UnifiedElement]
+        elements: List[UnifiedElement],
+        boxes: Optional[PageBoxes] = None
     ) -> float:
         """Validate spatial progression of reading order.
         
         Args:
             order: Reading order to validate
             elements: Original elements
+            boxes: Layout boxes of ``elements``, read from them if omitted
             
         Returns:
             Spatial progression score
         """
-        element_dict = {e.id: e for e in elements}
-        
-        valid_progressions = 0
-        total_progressions = 0
+        if boxes is None:
+            boxes = PageBoxes.from_elements(elements)
+        if len(order.ordered_elements) < 2 or not len(boxes):
+            return 1.0
         
-        for i in range(len(order.ordered_elements) - 1):
-            elem1_id = order.ordered_elements[i]
-            elem2_id = order.ordered_elements[i + 1]
-            
-            if elem1_id in element_dict and elem2_id in element_dict:
-                elem1 = element_dict[elem1_id]
-                elem2 = element_dict[elem2_id]
-                
-                bbox1 = self._get_bounding_box(elem1)
-                bbox2 = self._get_bounding_box(elem2)
-                
-                if bbox1 and bbox2:
-                    total_progressions += 1
-                    
-                    # Check if progression makes sense for reading direction
-                    if order.reading_direction == ReadingDirection.LEFT_TO_RIGHT:
-                        if bbox2.top >= bbox1.top - 5 and bbox2.left >= bbox1.left - 10:
-                            valid_progressions += 1
-                    elif order.reading_direction == ReadingDirection.RIGHT_TO_LEFT:
-                        if bbox2.top >= bbox1.top - 5 and bbox2.right <= bbox1.right + 10:
-                            valid_progressions += 1
+        # Rows of the ordered IDs; the last element wins for repeated IDs
+        row_of = {element_id: row for row, element_id in enumerate(boxes.ids)}
+        rows = np.fromiter(
+            (row_of.get(element_id, -1) for element_id in order.ordered_elements),
+            dtype=np.intp, count=len(order.ordered_elements)
+        )
+        known = rows >= 0
+        has_bbox = known & boxes.valid[np.where(known, rows, 0)]
         
+        checked = has_bbox[:-1] & has_bbox[1:]
+        total_progressions = int(checked.sum())
         if total_progressions == 0:
             return 1.0
         
-        return valid_progressions / total_progressions
+        first, second = rows[:-1][checked], rows[1:][checked]
+        
+        # Check if progression makes sense for reading direction
+        below = boxes.top[second] >= boxes.top[first] - 5
+        if order.reading_direction == ReadingDirection.LEFT_TO_RIGHT:
+            valid = below & (boxes.left[second] >= boxes.left[first] - 10)
+        elif order.reading_direction == ReadingDirection.RIGHT_TO_LEFT:
+            valid = below & (boxes.right[second] <= boxes.right[first] + 10)
+        else:
+            valid = np.zeros(total_progressions, dtype=bool)
+        
+        return int(valid.sum()) / total_progressions
     
     def _validate_column_consistency(self, order: ReadingOrder) -> float:
         """Validate column consistency.
@@ -631,15 +702,17 @@ class ReadingOrderExtractor:
         # Check if elements in each column are contiguous in reading order
         total_score = 0.0
         
+        # First position of each element in the reading order
+        position_of: Dict[str, int] = {}
+        for position, elem_id in enumerate(order.ordered_elements):
+            position_of.setdefault(elem_id, position)
+        
         for column in order.columns:
             if not column.elements:
                 continue
             
             # Find positions of column elements in reading order
-            positions = []
-            for elem_id in column.elements:
-                if elem_id in order.ordered_elements:
-                    positions.append(order.ordered_elements.index(elem_id))
+            positions = [position_of[elem_id] for elem_id in column.elements if elem_id in position_of]
             
             if len(positions) < 2:
                 total_score += 1.0
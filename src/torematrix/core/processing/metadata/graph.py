@@ -337,6 +337,12 @@ class ElementRelationshipGraph:
         self.relationship_index.clear()
         logger.debug("Cleared relationship graph")
         
+    def iter_relationships(self) -> Iterator[Relationship]:
+        """Iterate over all relationships in the graph."""
+        for _, _, edge_data in self.graph.edges(data=True):
+            if 'relationship' in edge_data:
+                yield edge_data['relationship']
+        
     def to_dict(self) -> Dict[str, Any]:
         """Serialize graph to dictionary.
         
@@ -26,6 +26,7 @@ class RelationshipConfig:
     """Configuration for relationship detection."""
     spatial_threshold: float = 10.0
     content_similarity_threshold: float = 0.7
+    content_use_idf: bool = False
     reading_order_confidence_threshold: float = 0.8
     max_relationship_distance: int = 5
     enable_ml_classification: bool = True
@@ -132,13 +133,13 @@ class RelationshipDetectionEngine:
         
         relationships = []
         
-        # Check each pair of elements for spatial relationships
-        for i, element1 in enumerate(elements):
-            for element2 in elements[i+1:]:
-                spatial_rels = await self.spatial_analyzer.analyze_relationship(
-                    element1, element2
-                )
-                relationships.extend(spatial_rels)
+        # Check each pair of elements that can be spatially related;
+        # pairs that are neither near nor aligned are skipped
+        for i, j in self.spatial_analyzer.candidate_pairs(elements):
+            spatial_rels = await self.spatial_analyzer.analyze_relationship(
+                elements[i], elements[j]
+            )
+            relationships.extend(spatial_rels)
         
         logger.debug(f"Found {len(relationships)} spatial relationships")
         return relationships
@@ -159,13 +160,16 @@ class RelationshipDetectionEngine:
         
         relationships = []
         
-        # Analyze content similarity and semantic connections
-        for i, element1 in enumerate(elements):
-            for element2 in elements[i+1:]:
+        # Analyze content similarity and semantic connections; the analyzer
+        # profiles every element once and skips pairs that cannot relate
+        try:
+            for i, j in self.content_analyzer.candidate_pairs(elements):
                 content_rels = await self.content_analyzer.analyze_relationship(
-                    element1, element2
+                    elements[i], elements[j]
                 )
                 relationships.extend(content_rels)
+        finally:
+            self.content_analyzer.release()
         
         logger.debug(f"Found {len(relationships)} content relationships")
         return relationships
@@ -2,13 +2,21 @@
 
 This module provides storage capabilities for relationship graphs including
 saving, loading, querying, and updating graph data.
+
+The SQLite database is the source of truth. Saves only write the elements
+and relationships that changed since the last save, and loads can be
+limited to a few pages of a document. Pickle and JSON snapshots of whole
+graphs are kept alongside for fast full loads.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import sqlite3
 import pickle
-from typing import Dict, List, Optional, Any, Set
+import threading
+from typing import Dict, Iterable, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
@@ -16,9 +24,15 @@ import networkx as nx
 
 from ..graph import ElementRelationshipGraph
 from ..models.relationship import Relationship, RelationshipType
+from ....models.element import Element as UnifiedElement
 
 logger = logging.getLogger(__name__)
 
+_RELATIONSHIP_COLUMNS = "id, source_id, target_id, relationship_type, confidence, created_at, metadata"
+
+# Indexes replaced by the covering indexes below
+_SUPERSEDED_INDEXES = ("idx_rel_document", "idx_rel_source", "idx_rel_target")
+
 
 @dataclass
 class RelationshipQuery:
@@ -34,14 +48,29 @@ class RelationshipQuery:
     order_desc: bool = True
 
 
+@dataclass
+class SaveResult:
+    """Rows written and deleted by a graph save."""
+    elements_written: int = 0
+    elements_deleted: int = 0
+    relationships_written: int = 0
+    relationships_deleted: int = 0
+    
+    @property
+    def unchanged(self) -> bool:
+        return not (self.elements_written or self.elements_deleted
+                    or self.relationships_written or self.relationships_deleted)
+
+
 class GraphStorage:
     """Persistent storage for relationship graphs."""
     
-    def __init__(self, storage_path: Path):
+    def __init__(self, storage_path: Path, write_snapshots: bool = True):
         """Initialize graph storage.
         
         Args:
             storage_path: Directory for storage files
+            write_snapshots: Also write pickle/JSON snapshots of saved graphs
         """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
@@ -49,14 +78,28 @@ class GraphStorage:
         self.db_path = self.storage_path / "relationships.db"
         self.graphs_path = self.storage_path / "graphs"
         self.graphs_path.mkdir(exist_ok=True)
+        self.write_snapshots = write_snapshots
+        
+        # SQLite allows one writer at a time; queue ours instead of retrying
+        self._write_lock = threading.Lock()
         
         self._init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a database connection configured for concurrent access."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+    
     def _init_database(self):
         """Initialize SQLite database for relationship metadata."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
+            # Readers don't block the writer (and vice versa) in WAL mode
+            cursor.execute("PRAGMA journal_mode = WAL")
+            
             # Create tables
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS documents (
@@ -78,6 +121,7 @@ class GraphStorage:
                     confidence REAL NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     metadata TEXT,
+                    content_hash TEXT,
                     FOREIGN KEY (document_id) REFERENCES documents (id)
                 )
             """)
@@ -94,66 +138,117 @@ class GraphStorage:
                     bbox_bottom REAL,
                     page_number INTEGER,
                     metadata TEXT,
+                    data TEXT,
+                    content_hash TEXT,
                     FOREIGN KEY (document_id) REFERENCES documents (id)
                 )
             """)
             
-            # Create indexes for better performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_rel_document ON relationships (document_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_rel_source ON relationships (source_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_rel_target ON relationships (target_id)")
+            # Columns added after the first schema version
+            self._add_missing_columns(cursor, "relationships", {"content_hash": "TEXT"})
+            self._add_missing_columns(cursor, "elements", {"data": "TEXT", "content_hash": "TEXT"})
+            
+            # Covering indexes: relationship queries pick ids from the index
+            # alone, saves diff against (id, content_hash) without touching rows
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_rel_source_cover ON relationships
+                (source_id, relationship_type, confidence, target_id, document_id, created_at, id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_rel_target_cover ON relationships
+                (target_id, relationship_type, confidence, source_id, document_id, created_at, id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_rel_document_cover ON relationships
+                (document_id, relationship_type, confidence, source_id, target_id, created_at, id)
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_rel_document_hash ON relationships (document_id, id, content_hash)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_rel_type ON relationships (relationship_type)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_rel_confidence ON relationships (confidence)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_elem_document ON elements (document_id)")
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_elem_type ON elements (element_type)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_elem_page ON elements (document_id, page_number, id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_elem_document_hash ON elements (document_id, id, content_hash)")
+            
+            for index in _SUPERSEDED_INDEXES:
+                cursor.execute(f"DROP INDEX IF EXISTS {index}")
             
             conn.commit()
     
+    def _add_missing_columns(self, cursor: sqlite3.Cursor, table: str, columns: Dict[str, str]):
+        """Add columns that an older database lacks."""
+        existing = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        for name, column_type in columns.items():
+            if name not in existing:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {column_type}")
+    
     async def save_graph(
         self, 
         document_id: str,
         graph: ElementRelationshipGraph,
         document_metadata: Optional[Dict[str, Any]] = None
-    ):
+    ) -> SaveResult:
         """Save relationship graph to storage.
         
+        Only elements and relationships that changed since the last save
+        are written; ones no longer in the graph are deleted.
+        
         Args:
             document_id: Document identifier
             graph: Relationship graph to save
             document_metadata: Optional document metadata
+        
+        Returns:
+            Counts of the rows written and deleted
         """
         logger.info(f"Saving graph for document {document_id}")
         
-        # Save to database
-        await self._save_to_database(document_id, graph, document_metadata)
+        # Serialize on the event loop so the graph isn't read while it changes
+        element_rows = [self._element_row(document_id, element) for element in graph.element_index.values()]
+        relationship_rows = [
+            self._relationship_row(document_id, relationship)
+            for relationship in graph.iter_relationships()
+        ]
         
-        # Save NetworkX graph as pickle for fast loading
-        graph_file = self.graphs_path / f"{document_id}_graph.pkl"
-        with open(graph_file, 'wb') as f:
-            pickle.dump(graph.graph, f)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, self._save_to_database, document_id, element_rows, relationship_rows, document_metadata
+        )
         
-        # Save graph as JSON for human readability
-        json_file = self.graphs_path / f"{document_id}_graph.json"
-        graph_data = graph.to_dict()
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, indent=2, ensure_ascii=False, default=str)
+        if self.write_snapshots:
+            await loop.run_in_executor(
+                None, self._write_snapshots, document_id, graph.graph, graph.to_dict()
+            )
+        else:
+            # Snapshots from earlier saves no longer match the database
+            await loop.run_in_executor(None, self._remove_snapshots, document_id)
         
-        logger.info(f"Saved graph with {len(graph.element_index)} elements and {graph.graph.number_of_edges()} relationships")
+        logger.info(
+            f"Saved graph with {len(element_rows)} elements and {len(relationship_rows)} relationships "
+            f"({result.elements_written + result.relationships_written} rows written, "
+            f"{result.elements_deleted + result.relationships_deleted} deleted)"
+        )
+        return result
     
     async def load_graph(
         self, 
-        document_id: str
+        document_id: str,
+        pages: Optional[Iterable[int]] = None
     ) -> Optional[ElementRelationshipGraph]:
         """Load relationship graph from storage.
         
         Args:
             document_id: Document identifier
+            pages: Only load elements on these pages (and relationships between them)
             
         Returns:
             Loaded relationship graph or None if not found
         """
         logger.info(f"Loading graph for document {document_id}")
         
+        if pages is not None:
+            return await self.load_subgraph(document_id, pages=pages)
+        
         # Try loading from pickle first (fastest)
         graph_file = self.graphs_path / f"{document_id}_graph.pkl"
         if graph_file.exists():
@@ -201,6 +296,36 @@ class GraphStorage:
         # Fallback to database reconstruction
         return await self._load_from_database(document_id)
     
+    async def load_subgraph(
+        self,
+        document_id: str,
+        pages: Optional[Iterable[int]] = None,
+        element_ids: Optional[Iterable[str]] = None,
+        include_boundary: bool = False
+    ) -> Optional[ElementRelationshipGraph]:
+        """Reconstruct part of a stored graph from the database.
+        
+        Args:
+            document_id: Document identifier
+            pages: Load elements on these pages
+            element_ids: Load these elements
+            include_boundary: Also load relationships leaving the selection,
+                together with the elements at their other end
+        
+        Returns:
+            Graph of the selected elements, or None if the document is unknown.
+            Without ``pages`` and ``element_ids`` the whole graph is loaded.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self._load_subgraph_sync,
+            document_id,
+            list(pages) if pages is not None else None,
+            list(element_ids) if element_ids is not None else None,
+            include_boundary
+        )
+    
     async def update_relationships(
         self, 
         document_id: str,
@@ -214,39 +339,9 @@ class GraphStorage:
         """
         logger.info(f"Updating {len(relationships)} relationships for document {document_id}")
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            for rel in relationships:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO relationships 
-                    (id, document_id, source_id, target_id, relationship_type, confidence, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    rel.id,
-                    document_id,
-                    rel.source_id,
-                    rel.target_id,
-                    rel.relationship_type.value,
-                    rel.confidence,
-                    json.dumps(rel.metadata)
-                ))
-            
-            # Update document timestamp
-            cursor.execute("""
-                UPDATE documents SET updated_at = CURRENT_TIMESTAMP WHERE id = ?
-            """, (document_id,))
-            
-            conn.commit()
-        
-        # Invalidate cached graph files to force reload
-        graph_file = self.graphs_path / f"{document_id}_graph.pkl"
-        json_file = self.graphs_path / f"{document_id}_graph.json"
-        
-        if graph_file.exists():
-            graph_file.unlink()
-        if json_file.exists():
-            json_file.unlink()
+        rows = [self._relationship_row(document_id, rel) for rel in relationships]
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._update_relationships_sync, document_id, rows)
     
     def query_relationships(
         self, 
@@ -255,6 +350,9 @@ class GraphStorage:
     ) -> List[Relationship]:
         """Query relationships with filters.
         
+        Matching ids are selected from a covering index, then only the
+        rows of the requested page of results are read.
+        
         Args:
             query: Query parameters
             document_id: Optional document filter
@@ -262,11 +360,11 @@ class GraphStorage:
         Returns:
             List of matching relationships
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Build SQL query
-            sql_parts = ["SELECT * FROM relationships WHERE 1=1"]
+            sql_parts = ["SELECT id FROM relationships WHERE 1=1"]
             params = []
             
             if document_id:
@@ -299,7 +397,7 @@ class GraphStorage:
                 order_column = 'confidence'
             
             direction = "DESC" if query.order_desc else "ASC"
-            sql_parts.append(f"ORDER BY {order_column} {direction}")
+            sql_parts.append(f"ORDER BY {order_column} {direction}, id {direction}")
             
             # Add limit and offset
             if query.limit:
@@ -307,30 +405,27 @@ class GraphStorage:
                 params.append(query.limit)
             
             if query.offset > 0:
+                if not query.limit:
+                    sql_parts.append("LIMIT -1")
                 sql_parts.append("OFFSET ?")
                 params.append(query.offset)
             
             sql = " ".join(sql_parts)
             
             cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            
-            # Convert rows to Relationship objects
-            relationships = []
-            for row in rows:
-                metadata = json.loads(row[7]) if row[7] else {}
-                rel = Relationship(
-                    id=row[0],
-                    source_id=row[2],
-                    target_id=row[3],
-                    relationship_type=RelationshipType(row[4]),
-                    confidence=row[5],
-                    created_at=datetime.fromisoformat(row[6]) if row[6] else datetime.now(),
-                    metadata=metadata
+            ids = [row[0] for row in cursor.fetchall()]
+            
+            rows = {}
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                cursor.execute(
+                    f"SELECT {_RELATIONSHIP_COLUMNS} FROM relationships WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk
                 )
-                relationships.append(rel)
+                rows.update((row[0], row) for row in cursor.fetchall())
             
-            return relationships
+            # Convert rows to Relationship objects, keeping the index order
+            return [self._row_to_relationship(rows[rel_id]) for rel_id in ids if rel_id in rows]
     
     def get_document_list(self) -> List[Dict[str, Any]]:
         """Get list of stored documents.
@@ -338,7 +433,7 @@ class GraphStorage:
         Returns:
             List of document metadata
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT id, title, created_at, updated_at FROM documents ORDER BY updated_at DESC")
             
@@ -361,7 +456,7 @@ class GraphStorage:
         """
         logger.info(f"Deleting document {document_id}")
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._write_lock, self._connect() as conn:
             cursor = conn.cursor()
             
             # Delete relationships
@@ -375,14 +470,7 @@ class GraphStorage:
             
             conn.commit()
         
-        # Delete graph files
-        graph_file = self.graphs_path / f"{document_id}_graph.pkl"
-        json_file = self.graphs_path / f"{document_id}_graph.json"
-        
-        if graph_file.exists():
-            graph_file.unlink()
-        if json_file.exists():
-            json_file.unlink()
+        self._remove_snapshots(document_id)
     
     def get_statistics(self, document_id: Optional[str] = None) -> Dict[str, Any]:
         """Get storage statistics.
@@ -393,7 +481,7 @@ class GraphStorage:
         Returns:
             Statistics dictionary
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             stats = {}
@@ -413,8 +501,8 @@ class GraphStorage:
                 
                 # Relationship type distribution
                 cursor.execute("""
-                    SELECT relationship_type, COUNT(*) 
-                    FROM relationships 
+                    SELECT relationship_type, COUNT(*)
+                    FROM relationships
                     WHERE document_id = ?
                     GROUP BY relationship_type
                 """, (document_id,))
@@ -433,8 +521,8 @@ class GraphStorage:
                 
                 # Relationship type distribution
                 cursor.execute("""
-                    SELECT relationship_type, COUNT(*) 
-                    FROM relationships 
+                    SELECT relationship_type, COUNT(*)
+                    FROM relationships
                     GROUP BY relationship_type
                 """)
                 stats['relationship_types'] = dict(cursor.fetchall())
@@ -446,20 +534,77 @@ class GraphStorage:
             
             return stats
     
-    async def _save_to_database(
+    def _element_row(self, document_id: str, element: UnifiedElement) -> Tuple:
+        """Build the database row of an element, ending with its content hash."""
+        bbox = None
+        page_num = None
+        
+        if element.metadata and element.metadata.coordinates:
+            bbox = element.metadata.coordinates.layout_bbox
+            page_num = element.metadata.page_number
+        
+        row = (
+            element.id,
+            document_id,
+            element.type,
+            element.text,
+            bbox[0] if bbox and len(bbox) > 0 else None,
+            bbox[1] if bbox and len(bbox) > 1 else None,
+            bbox[2] if bbox and len(bbox) > 2 else None,
+            bbox[3] if bbox and len(bbox) > 3 else None,
+            page_num,
+            json.dumps(element.metadata.to_dict() if element.metadata else {}, default=str),
+            json.dumps(element.to_dict(), default=str)
+        )
+        return row + (_content_hash(row),)
+    
+    def _relationship_row(self, document_id: str, rel: Relationship) -> Tuple:
+        """Build the database row of a relationship, ending with its content hash."""
+        row = (
+            rel.id,
+            document_id,
+            rel.source_id,
+            rel.target_id,
+            rel.relationship_type.value,
+            rel.confidence,
+            # NULL rather than the current time, so the content hash stays stable
+            rel.created_at.isoformat() if rel.created_at else None,
+            json.dumps(rel.metadata, default=str)
+        )
+        return row + (_content_hash(row),)
+    
+    def _row_to_relationship(self, row: Tuple) -> Relationship:
+        """Convert a row selected with _RELATIONSHIP_COLUMNS."""
+        return Relationship(
+            id=row[0],
+            source_id=row[1],
+            target_id=row[2],
+            relationship_type=RelationshipType(row[3]),
+            confidence=row[4],
+            created_at=datetime.fromisoformat(row[5]) if row[5] else None,
+            metadata=json.loads(row[6]) if row[6] else {}
+        )
+    
+    def _save_to_database(
         self, 
-        document_id: str, 
-        graph: ElementRelationshipGraph,
+        document_id: str,
+        element_rows: List[Tuple],
+        relationship_rows: List[Tuple],
         document_metadata: Optional[Dict[str, Any]]
-    ):
-        """Save graph data to database."""
-        with sqlite3.connect(self.db_path) as conn:
+    ) -> SaveResult:
+        """Write the difference between the rows and the stored document."""
+        result = SaveResult()
+        
+        with self._write_lock, self._connect() as conn:
             cursor = conn.cursor()
             
-            # Save document
+            # Save document, keeping its creation time
             cursor.execute("""
-                INSERT OR REPLACE INTO documents (id, title, metadata)
-                VALUES (?, ?, ?)
+                INSERT INTO documents (id, title, metadata) VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title = excluded.title,
+                    metadata = excluded.metadata,
+                    updated_at = CURRENT_TIMESTAMP
             """, (
                 document_id,
                 document_metadata.get('title', document_id) if document_metadata else document_id,
@@ -467,56 +612,108 @@ class GraphStorage:
             ))
             
             # Save elements
-            cursor.execute("DELETE FROM elements WHERE document_id = ?", (document_id,))
-            for element in graph.element_index.values():
-                bbox = None
-                page_num = None
-                
-                if element.metadata and element.metadata.coordinates:
-                    bbox = element.metadata.coordinates.layout_bbox
-                    page_num = element.metadata.page_number
-                
-                cursor.execute("""
-                    INSERT INTO elements 
-                    (id, document_id, element_type, text_content, bbox_left, bbox_top, bbox_right, bbox_bottom, page_number, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    element.id,
-                    document_id,
-                    element.type,
-                    element.text,
-                    bbox[0] if bbox and len(bbox) > 0 else None,
-                    bbox[1] if bbox and len(bbox) > 1 else None,
-                    bbox[2] if bbox and len(bbox) > 2 else None,
-                    bbox[3] if bbox and len(bbox) > 3 else None,
-                    page_num,
-                    json.dumps(element.metadata.to_dict() if element.metadata else {})
-                ))
+            changed, removed = self._diff(cursor, "elements", document_id, element_rows)
+            if removed:
+                cursor.executemany("DELETE FROM elements WHERE id = ?", [(i,) for i in removed])
+            if changed:
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO elements
+                    (id, document_id, element_type, text_content, bbox_left, bbox_top, bbox_right, bbox_bottom,
+                     page_number, metadata, data, content_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, changed)
+            result.elements_written, result.elements_deleted = len(changed), len(removed)
             
             # Save relationships
-            cursor.execute("DELETE FROM relationships WHERE document_id = ?", (document_id,))
-            for _, _, edge_data in graph.graph.edges(data=True):
-                if 'relationship' in edge_data:
-                    rel = edge_data['relationship']
-                    cursor.execute("""
-                        INSERT INTO relationships 
-                        (id, document_id, source_id, target_id, relationship_type, confidence, metadata)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        rel.id,
-                        document_id,
-                        rel.source_id,
-                        rel.target_id,
-                        rel.relationship_type.value,
-                        rel.confidence,
-                        json.dumps(rel.metadata)
-                    ))
+            changed, removed = self._diff(cursor, "relationships", document_id, relationship_rows)
+            if removed:
+                cursor.executemany("DELETE FROM relationships WHERE id = ?", [(i,) for i in removed])
+            if changed:
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO relationships
+                    (id, document_id, source_id, target_id, relationship_type, confidence, created_at,
+                     metadata, content_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, changed)
+            result.relationships_written, result.relationships_deleted = len(changed), len(removed)
             
             conn.commit()
     
+        return result
+    
+    def _diff(
+        self,
+        cursor: sqlite3.Cursor,
+        table: str,
+        document_id: str,
+        rows: List[Tuple]
+    ) -> Tuple[List[Tuple], List[str]]:
+        """Split rows into new/changed ones and the ids of stored rows to delete.
+        
+        Rows start with their id and end with their content hash.
+        """
+        cursor.execute(f"SELECT id, content_hash FROM {table} WHERE document_id = ?", (document_id,))
+        stored = dict(cursor.fetchall())
+        
+        changed = [row for row in rows if stored.get(row[0]) != row[-1]]
+        current = {row[0] for row in rows}
+        removed = [row_id for row_id in stored if row_id not in current]
+        return changed, removed
+    
+    def _update_relationships_sync(self, document_id: str, rows: List[Tuple]):
+        """Upsert relationship rows and drop the now stale snapshots."""
+        with self._write_lock, self._connect() as conn:
+            cursor = conn.cursor()
+            
+            cursor.executemany("""
+                INSERT OR REPLACE INTO relationships
+                (id, document_id, source_id, target_id, relationship_type, confidence, created_at,
+                 metadata, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            
+            # Update document timestamp
+            cursor.execute("""
+                UPDATE documents SET updated_at = CURRENT_TIMESTAMP WHERE id = ?
+            """, (document_id,))
+            
+            conn.commit()
+        
+        # Invalidate cached graph files to force reload
+        self._remove_snapshots(document_id)
+    
+    def _write_snapshots(self, document_id: str, nx_graph: nx.MultiDiGraph, graph_data: Dict[str, Any]):
+        """Write pickle and JSON snapshots of a whole graph."""
+        # Save NetworkX graph as pickle for fast loading
+        graph_file = self.graphs_path / f"{document_id}_graph.pkl"
+        with open(graph_file, 'wb') as f:
+            pickle.dump(nx_graph, f)
+        
+        # Save graph as JSON for human readability
+        json_file = self.graphs_path / f"{document_id}_graph.json"
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(graph_data, f, indent=2, ensure_ascii=False, default=str)
+    
+    def _remove_snapshots(self, document_id: str):
+        """Delete the snapshot files of a document."""
+        for path in (self.graphs_path / f"{document_id}_graph.pkl",
+                     self.graphs_path / f"{document_id}_graph.json"):
+            if path.exists():
+                path.unlink()
+    
     async def _load_from_database(self, document_id: str) -> Optional[ElementRelationshipGraph]:
         """Load graph from database."""
-        with sqlite3.connect(self.db_path) as conn:
+        return await self.load_subgraph(document_id)
+    
+    def _load_subgraph_sync(
+        self,
+        document_id: str,
+        pages: Optional[List[int]],
+        element_ids: Optional[List[str]],
+        include_boundary: bool
+    ) -> Optional[ElementRelationshipGraph]:
+        """Reconstruct the selected elements and their relationships."""
+        with self._connect() as conn:
             cursor = conn.cursor()
             
             # Check if document exists
@@ -524,19 +721,72 @@ class GraphStorage:
             if cursor.fetchone()[0] == 0:
                 return None
             
-            # Load elements (simplified - would need full UnifiedElement reconstruction)
-            cursor.execute("SELECT * FROM elements WHERE document_id = ?", (document_id,))
-            element_rows = cursor.fetchall()
-            
-            # Load relationships
-            cursor.execute("SELECT * FROM relationships WHERE document_id = ?", (document_id,))
-            rel_rows = cursor.fetchall()
-            
-            # Reconstruct graph (simplified version)
-            graph = ElementRelationshipGraph()
+            whole_document = pages is None and element_ids is None
+            if whole_document:
+                cursor.execute("SELECT id, data FROM elements WHERE document_id = ?", (document_id,))
+                element_rows = cursor.fetchall()
+                cursor.execute(
+                    f"SELECT {_RELATIONSHIP_COLUMNS} FROM relationships WHERE document_id = ?", (document_id,)
+                )
+                rel_rows = cursor.fetchall()
+            else:
+                # Selected ids go to a temp table so any number of them can be joined
+                cursor.execute("CREATE TEMP TABLE IF NOT EXISTS graph_scope (id TEXT PRIMARY KEY)")
+                cursor.execute("DELETE FROM graph_scope")
+                if pages:
+                    cursor.executemany("""
+                        INSERT OR IGNORE INTO graph_scope
+                        SELECT id FROM elements WHERE document_id = ? AND page_number = ?
+                    """, [(document_id, page) for page in pages])
+                if element_ids:
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO graph_scope VALUES (?)", [(i,) for i in element_ids]
+                    )
+            
+                join = "OR" if include_boundary else "AND"
+                cursor.execute(f"""
+                    SELECT {_RELATIONSHIP_COLUMNS} FROM relationships
+                    WHERE document_id = ?
+                      AND (source_id IN (SELECT id FROM graph_scope)
+                           {join} target_id IN (SELECT id FROM graph_scope))
+                """, (document_id,))
+                rel_rows = cursor.fetchall()
             
-            # Note: This is a simplified reconstruction
-            # In a full implementation, you'd need to properly reconstruct UnifiedElement objects
-            logger.info(f"Loaded {len(element_rows)} elements and {len(rel_rows)} relationships from database")
+                if include_boundary:
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO graph_scope VALUES (?)",
+                        [(row[1],) for row in rel_rows] + [(row[2],) for row in rel_rows]
+                    )
             
-            return graph
\ No newline at end of file
+                cursor.execute("""
+                    SELECT e.id, e.data FROM elements e JOIN graph_scope s ON e.id = s.id
+                    WHERE e.document_id = ?
+                """, (document_id,))
+                element_rows = cursor.fetchall()
+                cursor.execute("DROP TABLE graph_scope")
+            
+        graph = ElementRelationshipGraph()
+        for element_id, data in element_rows:
+            if not data:
+                logger.warning(f"Element {element_id} was stored without its data and cannot be loaded")
+                continue
+            graph.add_element(UnifiedElement.from_dict(json.loads(data)))
+        
+        skipped = 0
+        for row in rel_rows:
+            rel = self._row_to_relationship(row)
+            if rel.source_id in graph.element_index and rel.target_id in graph.element_index:
+                graph.add_relationship(rel.source_id, rel.target_id, rel)
+            else:
+                skipped += 1
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} relationships with unloadable elements")
+        logger.info(f"Loaded {len(element_rows)} elements and {len(rel_rows) - skipped} relationships from database")
+        
+        return graph
+
+
+def _content_hash(row: Tuple) -> str:
+    """Stable hash of a row's values, used to detect changes between saves."""
+    return hashlib.sha1(json.dumps(row, default=str).encode('utf-8')).hexdigest()
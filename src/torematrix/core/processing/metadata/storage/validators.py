@@ -209,10 +209,8 @@ class RelationshipValidator:
         issues = []
         
         # Check if all elements in relationships exist in graph
-        for _, _, edge_data in graph.graph.edges(data=True):
-            if 'relationship' in edge_data:
-                rel = edge_data['relationship']
-                issues.extend(self.validate_relationship(rel, graph))
+        for rel in graph.iter_relationships():
+            issues.extend(self.validate_relationship(rel, graph))
         
         # Cross-validate with provided elements if available
         if elements:
@@ -355,14 +353,12 @@ class RelationshipValidator:
         # Group relationships by source-target-type
         relationship_groups = {}
         
-        for _, _, edge_data in graph.graph.edges(data=True):
-            if 'relationship' in edge_data:
-                rel = edge_data['relationship']
-                key = (rel.source_id, rel.target_id, rel.relationship_type)
-                
-                if key not in relationship_groups:
-                    relationship_groups[key] = []
-                relationship_groups[key].append(rel)
+        for rel in graph.iter_relationships():
+            key = (rel.source_id, rel.target_id, rel.relationship_type)
+            
+            if key not in relationship_groups:
+                relationship_groups[key] = []
+            relationship_groups[key].append(rel)
         
         # Find groups with multiple relationships
         for key, rels in relationship_groups.items():
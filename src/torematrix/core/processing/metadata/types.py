@@ -104,6 +104,12 @@ class MetadataConfig(BaseModel):
     """Configuration for the metadata extraction engine."""
     enable_parallel_extraction: bool = True
     max_workers: int = Field(default=4, ge=1)
+    # Page-scoped extractors run once per page; with page_workers set, in
+    # worker processes for documents with at least page_shard_min_pages pages
+    # (call MetadataExtractionEngine.close() when done)
+    enable_page_sharding: bool = True
+    page_workers: Optional[int] = Field(default=0, ge=0)  # 0: no processes, None: one per CPU
+    page_shard_min_pages: int = Field(default=8, ge=1)
     cache_enabled: bool = True
     cache_ttl_seconds: int = Field(default=3600, ge=0)
     default_language: LanguageCode = LanguageCode.ENGLISH
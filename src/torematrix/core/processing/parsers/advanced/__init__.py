@@ -10,12 +10,15 @@ from .language_detector import LanguageDetector
 # Import OCR engine optionally (requires pytesseract/PIL)
 try:
     from .ocr_engine import OCREngine, OCRResult, OCRConfiguration
+    from .text_regions import TextRegion, TextRegionDetector
     OCR_AVAILABLE = True
 except (ImportError, ValueError) as e:
     # ImportError for missing packages, ValueError for numpy compatibility issues
     OCREngine = None
     OCRResult = None
     OCRConfiguration = None
+    TextRegion = None
+    TextRegionDetector = None
     OCR_AVAILABLE = False
 
 __all__ = [
@@ -28,4 +31,4 @@ __all__ = [
 ]
 
 if OCR_AVAILABLE:
-    __all__.extend(['OCREngine', 'OCRResult', 'OCRConfiguration'])
\ No newline at end of file
+    __all__.extend(['OCREngine', 'OCRResult', 'OCRConfiguration', 'TextRegion', 'TextRegionDetector'])
\ No newline at end of file
@@ -2,9 +2,9 @@
 
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
-from collections import Counter
+from collections import Counter, OrderedDict
 
 try:
     import langdetect
@@ -25,6 +25,16 @@ class LanguageResult:
     detection_method: str
 
 
+@dataclass
+class DocumentLanguageProfile:
+    """Dominant languages of a document, estimated from a sample of its texts."""
+    primary_language: str
+    languages: Dict[str, float]  # Dominant language -> share of the sampled texts
+    confidences: Dict[str, float]  # Dominant language -> mean detection confidence
+    script_type: str
+    sample_size: int
+
+
 class LanguageDetector:
     """Multi-language text detection with script analysis."""
     
@@ -78,11 +88,23 @@ class LanguageDetector:
             'it': [r'\b(che|di|la|il|un|è|per|una|in|del|da|non|le|si|con)\b'],
             'pt': [r'\b(que|de|não|o|a|do|da|em|um|para|é|com|uma|os|no)\b'],
             'ru': [r'\b(в|и|не|на|я|с|что|он|как|это|по|но|они|все|так)\b'],
-            'zh': [r'[的是了我不人在他有这个上们来到时大地为子中你说生国年着就那和要她出也得里后自以会家可下而过天去能对小多然于心学么之都好看起发当没成只如事把还用第样道想作种开要来得了就你会没有什么'],
+            'zh': [r'[的是了我不人在他有这个上们来到时大地为子中你说生国年着就那和要她出也得里后自以会家可下而过天去能对小多然于心学么之都好看起发当没成只如事把还用第样道想作种开要来得了就你会没有什么]'],
             'ja': [r'[のはがでにをとかしたこれそれあれどこいつだったです]'],
             'ko': [r'[이그저것하다있다되다없다같다많다크다작다좋다나쁘다새다오래다빠르다느리다]'],
             'ar': [r'[فيمنعلىإلىهذهذلكأنكلذيالتيليسكانتكونقدلاماإذاحتىبعدقبلعندعبر]']
         }
+        
+        # Batch detection: texts sampled for the document profile, share a
+        # language needs in the sample to count as dominant, and an LRU of
+        # full detections for short strings (headers, labels, cell values)
+        self.prior_sample_size = self.config.get('prior_sample_size', 32)
+        self.prior_min_share = self.config.get('prior_min_share', 0.2)
+        self.prior_min_chars = self.config.get('prior_min_chars', 20)
+        self.cache_size = self.config.get('cache_size', 1024)
+        self.cache_max_length = self.config.get('cache_max_length', 64)
+        self._cache: OrderedDict[str, LanguageResult] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def detect_language(self, text: str) -> LanguageResult:
         """Detect language of text.
@@ -141,6 +163,128 @@ class LanguageDetector:
         
         return final_result
 
+    def detect_many(self, texts: Sequence[str],
+                    profile: Optional[DocumentLanguageProfile] = None) -> List[LanguageResult]:
+        """Detect the language of many texts from the same document.
+        
+        The document's dominant languages are detected once from a sample
+        of the texts. Each text then only gets a script and stopword check;
+        texts in the document's script whose stopwords point to a dominant
+        language (or to none) take that language with detection method
+        ``document_prior``. The rest get full detection.
+        
+        Args:
+            texts: Texts to analyze, e.g. one per element
+            profile: Document profile to use instead of sampling ``texts``
+            
+        Returns:
+            LanguageResult for each text, in order
+        """
+        if profile is None:
+            profile = self.detect_document_languages(texts)
+        return [self._detect_with_profile(text, profile) for text in texts]
+
+    def detect_document_languages(self, texts: Sequence[str]) -> Optional[DocumentLanguageProfile]:
+        """Estimate a document's dominant languages from an even sample of its texts.
+        
+        Args:
+            texts: Texts of the document
+            
+        Returns:
+            DocumentLanguageProfile, or None if no text is long enough to sample
+        """
+        candidates = [text for text in texts if text and len(text.strip()) >= self.prior_min_chars]
+        if not candidates:
+            return None
+        
+        step = max(1, len(candidates) // self.prior_sample_size)
+        sample = [self._detect_cached(text) for text in candidates[::step][:self.prior_sample_size]]
+        detected = [result for result in sample if result.primary_language != 'unknown']
+        if not detected:
+            return None
+        
+        language_counts = Counter(result.primary_language for result in detected)
+        languages = {
+            language: count / len(detected)
+            for language, count in language_counts.most_common()
+            if count / len(detected) >= self.prior_min_share
+        }
+        if not languages:
+            return None
+        
+        confidences = {
+            language: sum(r.confidence for r in detected if r.primary_language == language) / count
+            for language, count in language_counts.items() if language in languages
+        }
+        script_type = Counter(result.script_type for result in detected).most_common(1)[0][0]
+        
+        return DocumentLanguageProfile(
+            primary_language=next(iter(languages)),
+            languages=languages,
+            confidences=confidences,
+            script_type=script_type,
+            sample_size=len(sample)
+        )
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get statistics of the short text detection cache."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "cached_texts": len(self._cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0
+        }
+
+    def _detect_with_profile(self, text: str,
+                             profile: Optional[DocumentLanguageProfile]) -> LanguageResult:
+        """Detect a text's language, taking the document profile where it agrees."""
+        if profile is None or not text or not text.strip():
+            return self._detect_cached(text)
+        
+        cleaned_text = self._clean_text(text)
+        if not cleaned_text:
+            return self._detect_cached(text)
+        
+        # Cheap checks: the script must match, stopwords must not point elsewhere
+        script_type = self._detect_script_type(cleaned_text)
+        if script_type != profile.script_type:
+            return self._detect_cached(text)
+        
+        language = profile.primary_language
+        pattern_result = self._detect_with_patterns(cleaned_text)
+        if pattern_result:
+            language = max(pattern_result, key=pattern_result.get)
+            if language not in profile.languages:
+                return self._detect_cached(text)
+        
+        return LanguageResult(
+            primary_language=language,
+            confidence=profile.confidences[language],
+            all_languages=dict(profile.languages),
+            script_type=script_type,
+            text_statistics=self._calculate_text_statistics(cleaned_text),
+            detection_method='document_prior'
+        )
+
+    def _detect_cached(self, text: str) -> LanguageResult:
+        """Full detection, remembering results for short texts."""
+        if not text or len(text) > self.cache_max_length or self.cache_size <= 0:
+            return self.detect_language(text)
+        
+        cached = self._cache.get(text)
+        if cached is not None:
+            self.cache_hits += 1
+            self._cache.move_to_end(text)
+            return cached
+        
+        self.cache_misses += 1
+        result = self.detect_language(text)
+        self._cache[text] = result
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
     def _clean_text(self, text: str) -> str:
         """Clean text for language detection."""
         # Remove URLs, emails, numbers, and special characters
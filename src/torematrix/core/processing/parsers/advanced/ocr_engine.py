@@ -2,15 +2,22 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Tuple, Union
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
+import hashlib
 import io
 import base64
 
+from PIL import Image, ImageFilter, ImageOps
+
+from .text_regions import Box, TextRegion, TextRegionDetector, contrast_range, speckle_ratio
+
 try:
     import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter
     TESSERACT_AVAILABLE = True
 except ImportError:
     TESSERACT_AVAILABLE = False
@@ -41,6 +48,10 @@ class OCRConfiguration:
     oem: int = 3  # Tesseract OCR Engine Mode
     enhance_contrast: bool = True
     denoise: bool = True
+    max_workers: Optional[int] = None  # Tesseract processes (default: CPU count)
+    cache_size: int = 256  # Pages kept in the result cache
+    layout_analysis: bool = False  # OCR only detected text regions
+    target_line_height: int = 32  # Pixel height regions are scaled to per text line
     
     def __post_init__(self):
         if self.languages is None:
@@ -58,13 +69,64 @@ class OCRResult:
     character_count: int = 0
     word_count: int = 0
     line_count: int = 0
+    regions: List[Tuple[int, int, int, int]] = None  # Regions OCRed in layout mode
     
     def __post_init__(self):
+        if self.regions is None:
+            self.regions = []
         self.character_count = len(self.text)
         self.word_count = len(self.text.split()) if self.text else 0
         self.line_count = len(self.text.splitlines()) if self.text else 0
 
 
+def _tesseract_text(data: Dict[str, List[Any]]) -> str:
+    """Rebuild page text from ``image_to_data`` output.
+    
+    Words are joined per line, lines per paragraph and paragraphs are
+    separated by a blank line, like ``image_to_string`` does.
+    """
+    paragraphs: List[List[List[str]]] = []
+    current_paragraph = current_line = None
+    
+    for i, word in enumerate(data['text']):
+        if not str(word).strip():
+            continue
+        paragraph = tuple(data[key][i] for key in ('page_num', 'block_num', 'par_num') if key in data)
+        line = data['line_num'][i] if 'line_num' in data else 0
+        
+        if paragraph != current_paragraph:
+            paragraphs.append([])
+            current_paragraph, current_line = paragraph, None
+        if line != current_line:
+            paragraphs[-1].append([])
+            current_line = line
+        paragraphs[-1][-1].append(str(word).strip())
+    
+    return '\n\n'.join('\n'.join(' '.join(words) for words in lines) for lines in paragraphs)
+
+
+def _tesseract_page(image: 'Image.Image', lang: str, config: str) -> Tuple[str, List[float], List[Tuple[int, int, int, int]]]:
+    """OCR one page with a single Tesseract pass.
+    
+    Runs in a worker process; returns text, word confidences and word boxes.
+    """
+    data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT, lang=lang, config=config)
+    
+    word_confidences = []
+    bounding_boxes = []
+    for i, conf in enumerate(data['conf']):
+        if float(conf) > 0:  # Valid confidence
+            word_confidences.append(float(conf) / 100.0)
+            bounding_boxes.append((
+                data['left'][i],
+                data['top'][i],
+                data['left'][i] + data['width'][i],
+                data['top'][i] + data['height'][i]
+            ))
+    
+    return _tesseract_text(data), word_confidences, bounding_boxes
+
+
 class OCREngine:
     """Multi-engine OCR wrapper with optimization and fallback support."""
     
@@ -90,6 +152,18 @@ class OCREngine:
             except Exception as e:
                 self.logger.warning(f"Failed to initialize EasyOCR: {e}")
         
+        # Tesseract runs in worker processes, created on first use
+        self.max_workers = self.config.max_workers or os.cpu_count() or 1
+        self._executor: Optional[Executor] = None
+        
+        # Page results keyed by image hash
+        self._cache: OrderedDict[str, OCRResult] = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        self.region_detector = TextRegionDetector()
+        
         self.logger.info(f"OCR Engine initialized with engines: {self.available_engines}")
 
     async def extract_text(self, image_data: Union[str, bytes, Path, Any]) -> OCRResult:
@@ -107,7 +181,184 @@ class OCREngine:
             if pil_image is None:
                 return OCRResult("", 0.0, "unknown", [], [])
             
-            if self.config.preprocess:
+            key = self._cache_key(pil_image)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                self._cache.move_to_end(key)
+                return cached
+            
+            # Identical page already being OCRed
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.cache_hits += 1
+                return await asyncio.shield(pending)
+            
+            self.cache_misses += 1
+            if self.config.layout_analysis:
+                extraction = self._extract_layout(pil_image)
+            else:
+                extraction = self._extract_from_image(pil_image)
+            future = self._pending[key] = asyncio.ensure_future(extraction)
+            try:
+                result = await asyncio.shield(future)
+            finally:
+                self._pending.pop(key, None)
+            
+            if result.confidence > 0 or result.text:
+                self._cache_result(key, result)
+            return result
+                
+        except Exception as e:
+            self.logger.error(f"OCR extraction failed: {e}")
+            return OCRResult("", 0.0, "unknown", [], [])
+
+    async def extract_text_many(self, images: Sequence[Union[str, bytes, Path, Any]]) -> List[OCRResult]:
+        """Extract text from many pages, e.g. a whole scanned document.
+        
+        Pages are OCRed concurrently, up to one per worker process, and
+        pages with identical content are only OCRed once.
+        
+        Args:
+            images: Page images in any form accepted by extract_text
+            
+        Returns:
+            OCRResult per page, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def extract(image_data):
+            async with semaphore:
+                return await self.extract_text(image_data)
+        
+        return list(await asyncio.gather(*(extract(image_data) for image_data in images)))
+
+    async def extract_text_layout(self,
+                                  image_data: Union[str, bytes, Path, Any],
+                                  regions: Optional[Sequence[Box]] = None,
+                                  text_layer_boxes: Sequence[Box] = ()) -> OCRResult:
+        """Extract text from the text regions of an image only.
+        
+        Text blocks are located with projection profiles and each block is
+        OCRed as a separate crop, scaled so its text lines reach
+        ``target_line_height``. Blank areas and areas that already have a
+        text layer are not OCRed.
+        
+        Args:
+            image_data: Image data (path, bytes, PIL Image, or base64 string)
+            regions: Areas to OCR, e.g. a figure or table (default: whole image)
+            text_layer_boxes: Areas whose text is already known
+            
+        Returns:
+            OCRResult with boxes in image coordinates and the OCRed regions
+        """
+        try:
+            pil_image = await self._load_image(image_data)
+            if pil_image is None:
+                return OCRResult("", 0.0, "unknown", [], [])
+            return await self._extract_layout(pil_image, regions, text_layer_boxes)
+        except Exception as e:
+            self.logger.error(f"Layout OCR extraction failed: {e}")
+            return OCRResult("", 0.0, "unknown", [], [])
+
+    def find_text_regions(self,
+                          image: Image.Image,
+                          regions: Optional[Sequence[Box]] = None,
+                          text_layer_boxes: Sequence[Box] = ()) -> List[TextRegion]:
+        """Locate text blocks inside ``regions`` (default: whole image)."""
+        if regions is None:
+            return self.region_detector.detect(image, exclude=text_layer_boxes)
+        
+        found = []
+        for x0, y0, x1, y1 in regions:
+            exclude = [(bx0 - x0, by0 - y0, bx1 - x0, by1 - y0) for bx0, by0, bx1, by1 in text_layer_boxes]
+            for region in self.region_detector.detect(image.crop((x0, y0, x1, y1)), exclude=exclude):
+                rx0, ry0, rx1, ry1 = region.bbox
+                found.append(TextRegion((rx0 + x0, ry0 + y0, rx1 + x0, ry1 + y0), region.ink_ratio, region.line_height))
+        return found
+
+    async def _extract_layout(self,
+                              pil_image: Image.Image,
+                              regions: Optional[Sequence[Box]] = None,
+                              text_layer_boxes: Sequence[Box] = ()) -> OCRResult:
+        """OCR the text regions of a loaded image in parallel and merge the results."""
+        loop = asyncio.get_running_loop()
+        text_regions = await loop.run_in_executor(
+            None, self.find_text_regions, pil_image, regions, text_layer_boxes
+        )
+        if not text_regions:
+            return OCRResult("", 0.0, self.config.languages[0], [], [])
+        
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def extract(region: TextRegion) -> Tuple[float, OCRResult]:
+            scale = self._region_scale(region)
+            crop = await loop.run_in_executor(None, self._prepare_region, pil_image, region, scale)
+            async with semaphore:
+                return scale, await self._extract_from_image(crop, preprocess=False)
+        
+        results = await asyncio.gather(*(extract(region) for region in text_regions))
+        
+        texts = []
+        word_confidences = []
+        bounding_boxes = []
+        for region, (scale, result) in zip(text_regions, results):
+            if result.text:
+                texts.append(result.text)
+            word_confidences.extend(result.word_confidences)
+            
+            # Back to image coordinates
+            x0, y0 = region.bbox[:2]
+            for bx0, by0, bx1, by1 in result.bounding_boxes:
+                bounding_boxes.append((
+                    x0 + int(bx0 / scale), y0 + int(by0 / scale),
+                    x0 + int(bx1 / scale), y0 + int(by1 / scale)
+                ))
+        
+        return OCRResult(
+            text='\n\n'.join(texts),
+            confidence=sum(word_confidences) / len(word_confidences) if word_confidences else 0.0,
+            language=self.config.languages[0],
+            word_confidences=word_confidences,
+            bounding_boxes=bounding_boxes,
+            regions=[region.bbox for region in text_regions]
+        )
+
+    def _region_scale(self, region: TextRegion) -> float:
+        """Scale that brings a region's text lines to the target height."""
+        if region.line_height <= 0:
+            return 1.0
+        scale = min(max(self.config.target_line_height / region.line_height, 0.5), 4.0)
+        # Resampling costs more than it helps for small corrections
+        return 1.0 if 0.8 <= scale <= 1.25 else scale
+
+    def _prepare_region(self, image: Image.Image, region: TextRegion, scale: float) -> Image.Image:
+        """Crop, scale and clean up one region for OCR."""
+        crop = image.crop(region.bbox)
+        if scale != 1.0:
+            size = (max(int(crop.width * scale), 1), max(int(crop.height * scale), 1))
+            crop = crop.resize(size, Image.Resampling.LANCZOS if scale > 1.0 else Image.Resampling.BOX)
+        return self._adapt_image(crop)
+
+    def _adapt_image(self, image: Image.Image) -> Image.Image:
+        """Convert to grayscale, fixing contrast and noise only where needed."""
+        if image.mode != 'L':
+            image = image.convert('L')
+        
+        # Stretch washed out scans; clean digital renders are left alone
+        if self.config.enhance_contrast and contrast_range(image) < 128:
+            image = ImageOps.autocontrast(image, cutoff=1)
+        
+        # Median filtering blurs thin strokes, so only use it on speckled scans
+        if self.config.denoise and speckle_ratio(image) > 0.05:
+            image = image.filter(ImageFilter.MedianFilter(size=3))
+        
+        return image
+
+    async def _extract_from_image(self, pil_image: Image.Image, preprocess: Optional[bool] = None) -> OCRResult:
+        """Run the configured engines on a loaded image."""
+        try:
+            if self.config.preprocess if preprocess is None else preprocess:
                 pil_image = await self._preprocess_image(pil_image)
             
             # Try primary engine first
@@ -183,22 +434,8 @@ class OCREngine:
     async def _preprocess_image(self, image: Image.Image) -> Image.Image:
         """Optimize image for OCR."""
         try:
-            # Convert to RGB if necessary
-            if image.mode not in ('RGB', 'L'):
-                image = image.convert('RGB')
-            
-            # Enhance contrast if enabled
-            if self.config.enhance_contrast:
-                enhancer = ImageEnhance.Contrast(image)
-                image = enhancer.enhance(1.2)
-            
-            # Convert to grayscale for better OCR
-            if image.mode != 'L':
-                image = image.convert('L')
-            
-            # Denoise if enabled
-            if self.config.denoise:
-                image = image.filter(ImageFilter.MedianFilter(size=3))
+            # Grayscale, with contrast and denoising adapted to the content
+            image = self._adapt_image(image)
             
             # Resize if too small (min 300 DPI equivalent)
             width, height = image.size
@@ -231,26 +468,11 @@ class OCREngine:
             # Configure Tesseract
             config = f'--oem {self.config.oem} --psm {self.config.psm} -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz.,!?()[]{{}}:;-+*/=<>@#$%^&_|\\`~"\' '
             
-            # Get text and confidence data
-            text = pytesseract.image_to_string(image, lang='+'.join(self.config.languages), config=config)
-            
-            # Get detailed data with bounding boxes and confidences
-            data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT, 
-                                           lang='+'.join(self.config.languages), config=config)
-            
-            # Extract word-level confidences and bounding boxes
-            word_confidences = []
-            bounding_boxes = []
-            
-            for i, conf in enumerate(data['conf']):
-                if int(conf) > 0:  # Valid confidence
-                    word_confidences.append(int(conf) / 100.0)
-                    bounding_boxes.append((
-                        data['left'][i],
-                        data['top'][i],
-                        data['left'][i] + data['width'][i],
-                        data['top'][i] + data['height'][i]
-                    ))
+            # One image_to_data pass gives text, confidences and boxes
+            loop = asyncio.get_running_loop()
+            text, word_confidences, bounding_boxes = await loop.run_in_executor(
+                self._get_executor(), _tesseract_page, image, '+'.join(self.config.languages), config
+            )
             
             # Calculate overall confidence
             overall_confidence = sum(word_confidences) / len(word_confidences) if word_confidences else 0.0
@@ -277,8 +499,11 @@ class OCREngine:
             import numpy as np
             image_array = np.array(image)
             
-            # Run EasyOCR
-            results = self.easyocr_reader.readtext(image_array, paragraph=False)
+            # Run EasyOCR off the event loop; the reader can't leave this process
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                None, lambda: self.easyocr_reader.readtext(image_array, paragraph=False)
+            )
             
             # Process results
             text_parts = []
@@ -318,6 +543,53 @@ class OCREngine:
             self.logger.error(f"EasyOCR failed: {e}")
             raise
 
+    def _get_executor(self) -> Optional[Executor]:
+        """Get the Tesseract process pool, or None for the default thread pool."""
+        if self._executor is None and self.max_workers > 1:
+            try:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            except (OSError, NotImplementedError) as e:
+                self.logger.warning(f"Process pool unavailable, running OCR in threads: {e}")
+                self.max_workers = 1
+        return self._executor
+
+    def _cache_key(self, image: Image.Image) -> str:
+        """Hash an image together with the settings that affect its OCR."""
+        digest = hashlib.sha1()
+        digest.update(f"{image.mode}:{image.size}:{self.config.engine}:{self.config.languages}:"
+                      f"{self.config.psm}:{self.config.oem}:{self.config.preprocess}".encode())
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+
+    def _cache_result(self, key: str, result: OCRResult) -> None:
+        """Store a page result, evicting the least recently used pages."""
+        if self.config.cache_size <= 0:
+            return
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.config.cache_size:
+            self._cache.popitem(last=False)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get page cache statistics."""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "cached_pages": len(self._cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached page results."""
+        self._cache.clear()
+
+    def close(self) -> None:
+        """Shut down the Tesseract worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     def get_available_engines(self) -> List[str]:
         """Get list of available OCR engines."""
         return self.available_engines.copy()
@@ -1,10 +1,12 @@
 """Abstract base class for document element parsers."""
 
 import asyncio
+import copy
+import pickle
 import time
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Callable, Hashable, List, Optional, Union
 from dataclasses import dataclass, field
 from pydantic import BaseModel, Field
 
@@ -163,8 +165,107 @@ class BaseParser(ABC):
     async def parse_with_monitoring(self, element: UnifiedElement, 
                                    hints: Optional[ProcessingHints] = None) -> ParserResult:
         """Parse element with performance monitoring and error handling."""
-        start_time = time.time()
         start_memory = self._get_memory_usage()
+        result = await self._parse_monitored(element, hints)
+        result.metadata.memory_used = self._get_memory_usage() - start_memory
+        return result
+    
+    async def parse_many(self, elements: List[UnifiedElement], 
+                         hints: Optional[ProcessingHints] = None,
+                         max_concurrent: int = 10,
+                         timeout: Optional[float] = None) -> List[Union[ParserResult, Exception]]:
+        """Parse several elements with monitoring.
+        
+        Up to ``max_concurrent`` elements are parsed at once. A failing element
+        does not abort the batch: its exception (``asyncio.TimeoutError`` after
+        ``timeout`` seconds) is returned in its slot, like
+        ``asyncio.gather(..., return_exceptions=True)``.
+        
+        Args:
+            elements: Elements to parse
+            hints: Optional processing hints shared by the batch
+            max_concurrent: Maximum number of elements parsed concurrently
+            timeout: Optional timeout per element in seconds
+        
+        Returns:
+            Results or exceptions in the order of ``elements``
+        """
+        semaphore = asyncio.Semaphore(max(max_concurrent, 1))
+        
+        async def parse_one(element: UnifiedElement) -> ParserResult:
+            async with semaphore:
+                return await asyncio.wait_for(self.parse_with_monitoring(element, hints), timeout=timeout)
+        
+        return list(await asyncio.gather(*[parse_one(element) for element in elements], return_exceptions=True))
+    
+    async def _parse_many_unique(self, elements: List[UnifiedElement], 
+                                 hints: Optional[ProcessingHints],
+                                 key: Callable[[UnifiedElement], Optional[Hashable]],
+                                 timeout: Optional[float] = None) -> List[Union[ParserResult, Exception]]:
+        """Batched ``parse_many`` that parses repeated elements once.
+        
+        Meant for CPU-bound parsers whose ``parse`` never awaits I/O, so the
+        elements run one after another. Elements with the same
+        ``key`` (what ``parse`` actually reads) are parsed once and each
+        repeat gets its own copy of the result; a ``None`` key is never shared.
+        Memory is sampled once for the batch and split evenly over the parsed
+        elements.
+        """
+        results: List[Union[ParserResult, Exception, None]] = [None] * len(elements)
+        slots: Dict[Hashable, List[int]] = {}
+        start_memory = self._get_memory_usage()
+        
+        parsed = []
+        for index, element in enumerate(elements):
+            if not self.can_parse(element):
+                results[index] = UnsupportedElementError(
+                    element.type if hasattr(element, 'type') else 'unknown',
+                    self.name,
+                    [t.value for t in self.get_supported_types()]
+                )
+                continue
+            
+            element_key = key(element)
+            if element_key is not None and element_key in slots:
+                slots[element_key].append(index)
+                continue
+            if element_key is not None:
+                slots[element_key] = [index]
+            
+            try:
+                results[index] = await asyncio.wait_for(self._parse_monitored(element, hints), timeout=timeout)
+                parsed.append(results[index])
+            except Exception as e:
+                results[index] = e
+        
+        if parsed:
+            memory_used = (self._get_memory_usage() - start_memory) // len(parsed)
+            for result in parsed:
+                result.metadata.memory_used = memory_used
+        
+        # Repeated elements get copies, so changing one result leaves the others alone
+        for indices in slots.values():
+            first = results[indices[0]]
+            if len(indices) == 1 or not isinstance(first, ParserResult):
+                for index in indices[1:]:
+                    results[index] = first
+                continue
+            
+            # Unpickling a snapshot is about twice as fast as deepcopy
+            try:
+                snapshot = pickle.dumps(first, pickle.HIGHEST_PROTOCOL)
+                make_copy = lambda: pickle.loads(snapshot)
+            except Exception:
+                make_copy = lambda: copy.deepcopy(first)
+            for index in indices[1:]:
+                results[index] = make_copy()
+        
+        return results
+    
+    async def _parse_monitored(self, element: UnifiedElement, 
+                               hints: Optional[ProcessingHints] = None) -> ParserResult:
+        """Parse with timeout, validation and statistics, but no memory sampling."""
+        start_time = time.time()
         
         try:
             # Check if element is supported
@@ -188,7 +289,6 @@ class BaseParser(ABC):
             result.metadata.parser_name = self.name
             result.metadata.parser_version = self.version
             result.metadata.processing_time = time.time() - start_time
-            result.metadata.memory_used = self._get_memory_usage() - start_memory
             
             # Validate result
             validation_errors = self.validate(result)
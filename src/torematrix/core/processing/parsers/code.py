@@ -4,7 +4,7 @@ import re
 import ast
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Set, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -643,6 +643,13 @@ class CodeParser(BaseParser):
                 validation_errors=[f"Code parsing error: {str(e)}"]
             )
     
+    async def parse_many(self, elements: List[UnifiedElement], 
+                         hints: Optional[ProcessingHints] = None,
+                         max_concurrent: int = 10,
+                         timeout: Optional[float] = None) -> List[Union[ParserResult, Exception]]:
+        """Parse a batch of code blocks, parsing repeated snippets once."""
+        return await self._parse_many_unique(elements, hints, self._extract_code_content, timeout)
+    
     def validate(self, result: ParserResult) -> List[str]:
         """Validate code parsing result."""
         errors = []
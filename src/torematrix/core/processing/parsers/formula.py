@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass
 import re
 
@@ -150,6 +150,13 @@ class FormulaParser(BaseParser):
                 validation_errors=[f"Formula analysis error: {str(e)}"]
             )
     
+    async def parse_many(self, elements: List[UnifiedElement], 
+                         hints: Optional[ProcessingHints] = None,
+                         max_concurrent: int = 10,
+                         timeout: Optional[float] = None) -> List[Union[ParserResult, Exception]]:
+        """Parse a batch of formulas, parsing repeated formulas once."""
+        return await self._parse_many_unique(elements, hints, self._extract_formula_text, timeout)
+    
     def validate(self, result: ParserResult) -> List[str]:
         """Validate formula parsing result."""
         errors = []
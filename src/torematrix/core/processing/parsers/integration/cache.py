@@ -6,7 +6,7 @@ import hashlib
 import pickle
 import time
 import logging
-from typing import Dict, Any, Optional, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
@@ -58,12 +58,12 @@ class ParserCache:
         self.logger = logging.getLogger("torematrix.parsers.cache")
         
         # Configuration
-        self.max_size = config.get('max_size', 10000)
-        self.default_ttl = config.get('default_ttl', 3600)  # 1 hour
-        self.max_memory_mb = config.get('max_memory_mb', 100)  # 100MB
-        self.cleanup_interval = config.get('cleanup_interval', 300)  # 5 minutes
-        self.enable_persistence = config.get('enable_persistence', False)
-        self.persistence_file = config.get('persistence_file', '/tmp/parser_cache.pkl')
+        self.max_size = self.config.get('max_size', 10000)
+        self.default_ttl = self.config.get('default_ttl', 3600)  # 1 hour
+        self.max_memory_mb = self.config.get('max_memory_mb', 100)  # 100MB
+        self.cleanup_interval = self.config.get('cleanup_interval', 300)  # 5 minutes
+        self.enable_persistence = self.config.get('enable_persistence', False)
+        self.persistence_file = self.config.get('persistence_file', '/tmp/parser_cache.pkl')
         
         # Cache storage
         self._cache: Dict[str, CacheEntry] = {}
@@ -73,8 +73,12 @@ class ParserCache:
         # Statistics
         self._stats = CacheStatistics()
         
-        # Cleanup task
-        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+        # Cleanup task (needs a running event loop)
+        self._cleanup_task = None
+        try:
+            self._cleanup_task = asyncio.get_running_loop().create_task(self._periodic_cleanup())
+        except RuntimeError:
+            self.logger.debug("No running event loop, periodic cleanup disabled")
         
         # Load from persistence if enabled
         if self.enable_persistence:
@@ -141,6 +145,85 @@ class ParserCache:
         
         self.logger.debug(f"Cached result for key: {cache_key[:16]}... (size: {entry_size} bytes)")
     
+    async def get_many(self, elements: List[UnifiedElement]) -> List[Optional[ParserResult]]:
+        """Get cached results for several elements in one pass.
+        
+        Same as calling ``get`` for each element, but statistics and the LRU
+        order are updated once for the whole batch.
+        """
+        results = []
+        hit_keys = []
+        
+        for element in elements:
+            cache_key = self._generate_key(element)
+            entry = self._cache.get(cache_key)
+            
+            if entry is not None and entry.is_expired():
+                await self._remove_entry(cache_key)
+                self._stats.expired_entries += 1
+                entry = None
+            
+            if entry is None:
+                results.append(None)
+                continue
+            
+            entry.update_access()
+            hit_keys.append(cache_key)
+            results.append(entry.result)
+        
+        # Update statistics
+        self._stats.total_requests += len(elements)
+        self._stats.cache_hits += len(hit_keys)
+        self._stats.cache_misses += len(elements) - len(hit_keys)
+        self._update_hit_rate()
+        
+        if hit_keys:
+            # Most recently used last, in order of each key's last access
+            touched = list(dict.fromkeys(reversed(hit_keys)))[::-1]
+            touched_set = set(touched)
+            self._access_order = [key for key in self._access_order if key not in touched_set] + touched
+        
+        self.logger.debug(f"Batch cache lookup: {len(hit_keys)}/{len(elements)} hits")
+        return results
+    
+    async def set_many(self, elements: List[UnifiedElement], results: List[ParserResult],
+                       ttl: Optional[int] = None, parser_used: str = "") -> None:
+        """Cache results for several elements, pairing them by position.
+        
+        Repeated elements collapse onto one entry holding the last result, so
+        each distinct key is sized and stored once.
+        """
+        latest: Dict[str, Tuple[UnifiedElement, ParserResult]] = {}
+        for element, result in zip(elements, results):
+            cache_key = self._generate_key(element)
+            # Re-insert so the dict follows the order of last occurrence
+            latest.pop(cache_key, None)
+            latest[cache_key] = (element, result)
+        
+        for cache_key, (element, result) in latest.items():
+            is_new = cache_key not in self._cache
+            
+            entry_size = self._calculate_size(result)
+            await self._ensure_capacity(entry_size)
+            
+            self._cache[cache_key] = CacheEntry(
+                result=result,
+                timestamp=datetime.utcnow(),
+                ttl_seconds=ttl or self.default_ttl,
+                size_bytes=entry_size,
+                parser_used=parser_used
+            )
+            # New keys are not in the access order yet, so skip the list scan
+            if is_new:
+                self._access_order.append(cache_key)
+            else:
+                self._update_access_order(cache_key)
+            self._key_to_element_type[cache_key] = getattr(element, 'type', 'unknown')
+            
+            self._stats.total_size_bytes += entry_size
+        
+        self._update_average_entry_size()
+    
     async def invalidate(self, element: UnifiedElement) -> bool:
         """Invalidate cached result for element."""
         cache_key = self._generate_key(element)
@@ -19,10 +19,10 @@ class FallbackHandler:
         self.logger = logging.getLogger("torematrix.parsers.fallback")
         
         # Fallback strategies configuration
-        self.enable_text_extraction = config.get('enable_text_extraction', True)
-        self.enable_basic_classification = config.get('enable_basic_classification', True)
-        self.enable_metadata_extraction = config.get('enable_metadata_extraction', True)
-        self.min_confidence_threshold = config.get('min_confidence_threshold', 0.3)
+        self.enable_text_extraction = self.config.get('enable_text_extraction', True)
+        self.enable_basic_classification = self.config.get('enable_basic_classification', True)
+        self.enable_metadata_extraction = self.config.get('enable_metadata_extraction', True)
+        self.min_confidence_threshold = self.config.get('min_confidence_threshold', 0.3)
     
     async def handle_no_parser(self, element: UnifiedElement) -> Optional['ParseResponse']:
         """Handle case when no suitable parser is found."""
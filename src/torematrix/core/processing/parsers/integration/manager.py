@@ -3,13 +3,13 @@
 import asyncio
 import time
 import logging
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 
 from ....models.element import Element as UnifiedElement
 from ..factory import ParserFactory
 from ..types import ProcessingHints
-from ..base import ParserResult
+from ..base import BaseParser, ParserResult
 from .cache import ParserCache
 from .monitor import ParserMonitor
 from .fallback_handler import FallbackHandler
@@ -41,7 +41,7 @@ class ParserManager:
     """Central manager for all parser operations."""
     
     def __init__(self, config: Dict[str, Any] = None):
-        self.config = config or {}
+        self.config = config = config or {}
         self.factory = ParserFactory()
         self.cache = ParserCache(config.get('cache', {}))
         self.monitor = ParserMonitor()
@@ -61,7 +61,8 @@ class ParserManager:
             'cache_hits': 0,
             'errors': 0,
             'total_time': 0.0,
-            'parser_usage': {}
+            'parser_usage': {},
+            'parser_throughput': {}
         }
         
         # Request tracking
@@ -74,32 +75,199 @@ class ParserManager:
         return await self._execute_parse_request(request)
     
     async def parse_batch(self, elements: List[UnifiedElement], **kwargs) -> List[ParseResponse]:
-        """Parse multiple elements concurrently."""
+        """Parse multiple elements, batching the work per parser.
+        
+        Cached results come from a single ``ParserCache.get_many`` query. The
+        remaining elements are grouped by the parser that handles them and each
+        group is parsed with one ``parse_many`` call, with cache writes and
+        monitor updates done once per group.
+        """
         requests = [ParseRequest(element=elem, **kwargs) for elem in elements]
+        responses: List[Optional[ParseResponse]] = [None] * len(requests)
+        self._stats['total_requests'] += len(requests)
+        
+        pending = list(range(len(requests)))
+        if self.enable_caching and requests and requests[0].use_cache:
+            pending = await self._resolve_cached(requests, responses)
+        
+        # Group by parser instance, keeping input order within each group
+        groups: Dict[int, Tuple[Any, List[int]]] = {}
+        for index in pending:
+            request = requests[index]
+            start_time = time.time()
+            try:
+                parser = self.factory.get_parser(request.element, request.hints)
+            except Exception as e:
+                responses[index] = await self._batch_error_response(request, e, start_time)
+                continue
+            
+            if not parser:
+                fallback_response = await self.fallback.handle_no_parser(request.element)
+                responses[index] = fallback_response or ParseResponse(
+                    success=False,
+                    result=None,
+                    error=f"No suitable parser found for element type: {getattr(request.element, 'type', 'unknown')}",
+                    processing_time=time.time() - start_time
+                )
+                continue
+            
+            groups.setdefault(id(parser), (parser, []))[1].append(index)
+        
+        # Parse groups concurrently; each parses up to max_concurrent elements at once
+        await asyncio.gather(*[
+            self._execute_parse_group(parser, [requests[i] for i in indices], indices, responses)
+            for parser, indices in groups.values()
+        ])
         
-        # Process in batches to respect concurrency limits
-        results = []
-        for i in range(0, len(requests), self.max_concurrent):
-            batch = requests[i:i + self.max_concurrent]
-            batch_results = await asyncio.gather(
-                *[self._execute_parse_request(req) for req in batch],
-                return_exceptions=True
+        return responses
+    
+    async def _resolve_cached(self, requests: List[ParseRequest],
+                              responses: List[Optional[ParseResponse]]) -> List[int]:
+        """Fill responses for cached elements, returning the indices still to parse."""
+        start_time = time.time()
+        cached_results = await self.cache.get_many([request.element for request in requests])
+        lookup_time = (time.time() - start_time) / len(requests)
+        
+        pending = []
+        for index, cached_result in enumerate(cached_results):
+            if not cached_result:
+                pending.append(index)
+                continue
+            
+            self._stats['cache_hits'] += 1
+            responses[index] = ParseResponse(
+                success=True,
+                result=cached_result,
+                error=None,
+                processing_time=lookup_time,
+                cache_hit=True,
+                parser_used="cache"
             )
             
-            # Handle exceptions
-            for j, result in enumerate(batch_results):
-                if isinstance(result, Exception):
-                    error_response = ParseResponse(
-                        success=False,
-                        result=None,
-                        error=str(result),
-                        processing_time=0.0
-                    )
-                    results.append(error_response)
-                else:
-                    results.append(result)
+        return pending
+    
+    async def _execute_parse_group(self, parser: Any, group: List[ParseRequest], indices: List[int],
+                                   responses: List[Optional[ParseResponse]]) -> None:
+        """Parse all elements of a batch handled by the same parser."""
+        start_time = time.time()
+        request_id = self._get_request_id()
+        parser_name = parser.__class__.__name__
+        elements = [request.element for request in group]
+        hints = group[0].hints
+        timeout = group[0].timeout
+        self._active_requests[request_id] = {
+            'element_type': getattr(elements[0], 'type', 'unknown'),
+            'parser': parser_name,
+            'batch_size': len(group),
+            'start_time': start_time
+        }
+        
+        try:
+            if isinstance(parser, BaseParser):
+                outcomes = await parser.parse_many(elements, hints, max_concurrent=self.max_concurrent,
+                                                   timeout=timeout)
+            else:
+                # Parsers outside the BaseParser hierarchy only parse single elements
+                semaphore = asyncio.Semaphore(self.max_concurrent)
+                
+                async def parse_one(element: UnifiedElement) -> ParserResult:
+                    async with semaphore:
+                        return await asyncio.wait_for(parser.parse_with_monitoring(element, hints), timeout=timeout)
+                
+                outcomes = await asyncio.gather(*[parse_one(element) for element in elements],
+                                                return_exceptions=True)
+        except Exception as e:
+            outcomes = [e] * len(group)
+        finally:
+            if request_id in self._active_requests:
+                del self._active_requests[request_id]
+        
+        batch_time = time.time() - start_time
+        processing_time = batch_time / len(group)
+        
+        parsed_requests = []
+        parsed_results = []
+        for index, request, outcome in zip(indices, group, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                self._stats['errors'] += 1
+                responses[index] = ParseResponse(
+                    success=False,
+                    result=None,
+                    error=f"Parsing timeout after {request.timeout}s",
+                    processing_time=processing_time
+                )
+            elif isinstance(outcome, Exception):
+                responses[index] = await self._batch_error_response(request, outcome, start_time)
+            else:
+                parsed_requests.append(request)
+                parsed_results.append(outcome)
+                responses[index] = ParseResponse(
+                    success=True,
+                    result=outcome,
+                    error=None,
+                    processing_time=processing_time,
+                    parser_used=parser_name
+                )
         
-        return results
+        if not parsed_results:
+            return
+        
+        # Cache successful results
+        if self.enable_caching:
+            cacheable = [(request.element, result) for request, result in zip(parsed_requests, parsed_results)
+                         if result.success]
+            if cacheable:
+                await self.cache.set_many(
+                    [element for element, _ in cacheable],
+                    [result for _, result in cacheable],
+                    parser_used=parser_name
+                )
+        
+        # Update statistics
+        self._stats['successful_parses'] += len(parsed_results)
+        self._stats['total_time'] += processing_time * len(parsed_results)
+        self._stats['parser_usage'][parser_name] = (
+            self._stats['parser_usage'].get(parser_name, 0) + len(parsed_results)
+        )
+        self._record_throughput(parser_name, len(group), batch_time)
+        
+        # Record metrics
+        if self.enable_monitoring:
+            await self.monitor.record_batch_metrics(
+                parser_type=parser_name,
+                element_types=[getattr(request.element, 'type', 'unknown') for request in parsed_requests],
+                successes=[result.success for result in parsed_results],
+                confidences=[result.metadata.confidence if result.metadata else 0.0
+                             for result in parsed_results],
+                batch_time=batch_time
+            )
+    
+    async def _batch_error_response(self, request: ParseRequest, error: Exception,
+                                    start_time: float) -> ParseResponse:
+        """Build the response for a batched element whose parsing raised."""
+        message = f"Parsing error: {str(error)}"
+        self._stats['errors'] += 1
+        self.logger.error(f"Batched parse of {getattr(request.element, 'type', 'unknown')} failed: {message}")
+        
+        fallback_response = await self.fallback.handle_error(request.element, error)
+        if fallback_response:
+            return fallback_response
+        
+        return ParseResponse(
+            success=False,
+            result=None,
+            error=message,
+            processing_time=time.time() - start_time
+        )
+    
+    def _record_throughput(self, parser_name: str, elements: int, elapsed: float) -> None:
+        """Accumulate per-parser throughput counters."""
+        throughput = self._stats['parser_throughput'].setdefault(
+            parser_name, {'batches': 0, 'elements': 0, 'total_time': 0.0}
+        )
+        throughput['batches'] += 1
+        throughput['elements'] += elements
+        throughput['total_time'] += elapsed
     
     async def _execute_parse_request(self, request: ParseRequest) -> ParseResponse:
         """Execute a single parse request with full monitoring."""
@@ -168,6 +336,7 @@ class ParserManager:
             if parser_name not in self._stats['parser_usage']:
                 self._stats['parser_usage'][parser_name] = 0
             self._stats['parser_usage'][parser_name] += 1
+            self._record_throughput(parser_name, 1, processing_time)
             
             # Record metrics
             if self.enable_monitoring:
@@ -238,6 +407,18 @@ class ParserManager:
         # Add active request count
         stats['active_requests'] = len(self._active_requests)
         
+        # Add per-parser throughput
+        stats['parser_throughput'] = {
+            parser_name: {
+                **throughput,
+                'avg_batch_size': throughput['elements'] / max(throughput['batches'], 1),
+                'elements_per_second': (
+                    throughput['elements'] / throughput['total_time'] if throughput['total_time'] > 0 else 0.0
+                )
+            }
+            for parser_name, throughput in self._stats['parser_throughput'].items()
+        }
+        
         # Add parser performance
         stats['parser_performance'] = {}
         for parser_name in stats['parser_usage']:
@@ -261,7 +442,8 @@ class ParserManager:
             'cache_hits': 0,
             'errors': 0,
             'total_time': 0.0,
-            'parser_usage': {}
+            'parser_usage': {},
+            'parser_throughput': {}
         }
         
         # Reset parser statistics
@@ -40,6 +40,16 @@ class PerformanceStats:
     total_memory: int = 0
     avg_memory: float = 0.0
     
+    # Batch throughput
+    batch_count: int = 0
+    batch_elements: int = 0
+    batch_time: float = 0.0
+    
+    @property
+    def throughput(self) -> float:
+        """Elements parsed per second of batch time."""
+        return self.batch_elements / self.batch_time if self.batch_time > 0 else 0.0
+    
     def update(self, metric: ParseMetric):
         """Update stats with new metric."""
         self.total_requests += 1
@@ -75,10 +85,10 @@ class ParserMonitor:
         self.logger = logging.getLogger("torematrix.parsers.monitor")
         
         # Configuration
-        self.retention_hours = config.get('retention_hours', 24)
-        self.max_metrics = config.get('max_metrics', 10000)
-        self.aggregation_interval = config.get('aggregation_interval', 60)  # seconds
-        self.enable_detailed_logging = config.get('enable_detailed_logging', False)
+        self.retention_hours = self.config.get('retention_hours', 24)
+        self.max_metrics = self.config.get('max_metrics', 10000)
+        self.aggregation_interval = self.config.get('aggregation_interval', 60)  # seconds
+        self.enable_detailed_logging = self.config.get('enable_detailed_logging', False)
         
         # Metrics storage
         self._metrics: deque[ParseMetric] = deque(maxlen=self.max_metrics)
@@ -90,15 +100,21 @@ class ParserMonitor:
         self._current_hour_metrics = deque(maxlen=3600)  # 1 metric per second max
         self._alerts = []
         self._alert_thresholds = {
-            'max_processing_time': config.get('max_processing_time', 30.0),
-            'min_success_rate': config.get('min_success_rate', 0.95),
-            'max_error_rate': config.get('max_error_rate', 0.05),
-            'min_confidence': config.get('min_confidence', 0.7)
+            'max_processing_time': self.config.get('max_processing_time', 30.0),
+            'min_success_rate': self.config.get('min_success_rate', 0.95),
+            'max_error_rate': self.config.get('max_error_rate', 0.05),
+            'min_confidence': self.config.get('min_confidence', 0.7)
         }
         
-        # Background tasks
-        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-        self._aggregation_task = asyncio.create_task(self._periodic_aggregation())
+        # Background tasks (need a running event loop)
+        self._cleanup_task = None
+        self._aggregation_task = None
+        try:
+            loop = asyncio.get_running_loop()
+            self._cleanup_task = loop.create_task(self._periodic_cleanup())
+            self._aggregation_task = loop.create_task(self._periodic_aggregation())
+        except RuntimeError:
+            self.logger.debug("No running event loop, background tasks disabled")
     
     async def record_parse_metrics(self, parser_type: str, element_type: str, 
                                   success: bool, processing_time: float, 
@@ -144,6 +160,62 @@ class ParserMonitor:
                 f"confidence: {confidence:.2f})"
             )
     
+    async def record_batch_metrics(self, parser_type: str, element_types: List[str],
+                                   successes: List[bool], confidences: List[float],
+                                   batch_time: float) -> None:
+        """Record metrics for elements parsed together in one batch.
+        
+        Each element is charged an equal share of ``batch_time``. Alerts are
+        checked once per batch, on the failed and least confident elements.
+        """
+        if not element_types:
+            return
+        
+        timestamp = datetime.utcnow()
+        processing_time = batch_time / len(element_types)
+        metrics = [
+            ParseMetric(
+                timestamp=timestamp,
+                parser_type=parser_type,
+                element_type=element_type,
+                success=success,
+                processing_time=processing_time,
+                confidence=confidence
+            )
+            for element_type, success, confidence in zip(element_types, successes, confidences)
+        ]
+        
+        self._metrics.extend(metrics)
+        self._current_hour_metrics.extend(metrics)
+        
+        if parser_type not in self._parser_stats:
+            self._parser_stats[parser_type] = PerformanceStats(parser_type=parser_type)
+        parser_stats = self._parser_stats[parser_type]
+        
+        for metric in metrics:
+            parser_stats.update(metric)
+            if metric.element_type not in self._element_stats:
+                self._element_stats[metric.element_type] = PerformanceStats(parser_type=metric.element_type)
+            self._element_stats[metric.element_type].update(metric)
+        
+        parser_stats.batch_count += 1
+        parser_stats.batch_elements += len(metrics)
+        parser_stats.batch_time += batch_time
+        self._recent_times[parser_type].extend(processing_time for _ in metrics)
+        
+        failed = [m for m in metrics if not m.success]
+        succeeded = [m for m in metrics if m.success]
+        representatives = failed[:1] + ([min(succeeded, key=lambda m: m.confidence)] if succeeded else [])
+        for metric in representatives:
+            await self._check_alerts(metric)
+        
+        if self.enable_detailed_logging:
+            self.logger.debug(
+                f"Recorded batch: {parser_type} x{len(metrics)} "
+                f"(failed: {len(failed)}, time: {batch_time:.3f}s, "
+                f"throughput: {parser_stats.throughput:.1f}/s)"
+            )
+    
     async def get_parser_performance(self, parser_type: str) -> Optional[Dict[str, Any]]:
         """Get performance metrics for a specific parser."""
         if parser_type not in self._parser_stats:
@@ -178,6 +250,11 @@ class ParserMonitor:
             'memory': {
                 'avg_memory_mb': stats.avg_memory / (1024 * 1024) if stats.avg_memory > 0 else 0
             },
+            'throughput': {
+                'batches': stats.batch_count,
+                'avg_batch_size': stats.batch_elements / max(stats.batch_count, 1),
+                'elements_per_second': stats.throughput
+            },
             'last_updated': datetime.utcnow().isoformat()
         }
     
@@ -207,7 +284,8 @@ class ParserMonitor:
             parser_breakdown[parser_type] = {
                 'requests': stats.total_requests,
                 'success_rate': stats.successful_requests / max(stats.total_requests, 1),
-                'avg_time': stats.avg_time
+                'avg_time': stats.avg_time,
+                'throughput': stats.throughput
             }
         
         # Element type breakdown
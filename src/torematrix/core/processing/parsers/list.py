@@ -2,7 +2,7 @@
 
 import re
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 
 from .base import BaseParser, ParserResult, ParserMetadata
@@ -154,6 +154,15 @@ class ListParser(BaseParser):
             self.logger.error(f"List parsing failed: {str(e)}")
             return self._create_failure_result(f"List parsing failed: {str(e)}")
     
+    async def parse_many(self, elements: List[UnifiedElement], 
+                         hints: Optional[ProcessingHints] = None,
+                         max_concurrent: int = 10,
+                         timeout: Optional[float] = None) -> List[Union[ParserResult, Exception]]:
+        """Parse a batch of lists, parsing repeated list text once."""
+        return await self._parse_many_unique(
+            elements, hints, lambda element: getattr(element, 'text', None) or None, timeout
+        )
+    
     def validate(self, result: ParserResult) -> List[str]:
         """Validate list parsing result."""
         errors = []
@@ -1,11 +1,17 @@
 """Table structure parser with data type inference."""
 
 import re
+import csv
 import json
 import asyncio
-from typing import Dict, Any, List, Optional, Tuple, Union
+from collections import Counter
+from collections.abc import Mapping
+from io import StringIO
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+import numpy as np
+
 from ...models.element import Element as UnifiedElement
 from .base import BaseParser, ParserResult, ParserMetadata
 from .types import ElementType, ParserCapabilities, ProcessingHints
@@ -37,6 +43,175 @@ class TableStructure:
     merged_cells: List[Tuple[int, int, int, int]] = None  # (row1, col1, row2, col2)
 
 
+# Column delimiters of text tables, in order of preference on ties
+DELIMITERS = ('|', '\t', ',')
+
+# Lines inspected to pick the delimiter
+DELIMITER_SAMPLE_LINES = 20
+
+# Rows per chunk when streaming CSV exports
+CSV_CHUNK_ROWS = 1000
+
+_SEPARATOR_LINE = re.compile(r'^[\|\-\+\s]*$')
+
+# What int() and float() accept, for printable ASCII values with commas removed.
+# Float values must contain a '.' to count as floats.
+_DIGITS = r'\d+(?:_\d+)*'
+_NUMBER = re.compile(
+    rf'\s*[+-]?(?:(?P<integer>{_DIGITS})'
+    rf'|(?P<float>(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?))\s*\Z'
+)
+_DATE = re.compile(r'\d{1,2}/\d{1,2}/\d{4}|\d{1,2}-\d{1,2}-\d{4}|\d{4}-\d{1,2}-\d{1,2}|\w+ \d{1,2}, \d{4}')
+_CURRENCY = re.compile(r'[\$€£¥][\d,]+\.?\d*')
+_BOOLEANS = frozenset(['true', 'false', 'yes', 'no', '1', '0', 'y', 'n'])
+
+
+def _number_kind(value: str) -> Optional[str]:
+    """'integer' or 'float' if the value parses as one (commas ignored), else None."""
+    if value.isascii() and value.isprintable():
+        match = _NUMBER.match(value.replace(',', ''))
+        if match is None:
+            return None
+        return "integer" if match.group("integer") is not None else "float"
+    
+    # Other digits, spaces and control characters: let int() and float() decide
+    try:
+        int(value.replace(',', ''))
+        return "integer"
+    except ValueError:
+        pass
+    try:
+        float(value.replace(',', ''))
+        return "float" if '.' in value else None
+    except ValueError:
+        return None
+
+
+def _classify_value(value: str) -> str:
+    """Data type of a single stripped cell value."""
+    kind = _number_kind(value)
+    if kind is not None:
+        return kind
+    if _DATE.match(value):
+        return "date"
+    if value.lower() in _BOOLEANS:
+        return "boolean"
+    if _CURRENCY.match(value):
+        return "currency"
+    if value.endswith('%') and _number_kind(value[:-1]) == "float":
+        return "percentage"
+    return "text"
+
+
+class TableExports(Mapping):
+    """Export formats of a table, rendered when first accessed.
+    
+    ``exports["csv"]`` gives the whole document as a string. ``iter_format``
+    yields it in chunks instead, so large tables can be written out without
+    holding every format in memory.
+    """
+    
+    FORMATS = ("csv", "json", "html", "markdown")
+    
+    def __init__(self, structure: TableStructure, data: List[List[str]]):
+        self.structure = structure
+        self.data = data
+        self._rendered: Dict[str, str] = {}
+    
+    def __getitem__(self, name: str) -> str:
+        if name not in self.FORMATS:
+            raise KeyError(name)
+        if name not in self._rendered:
+            self._rendered[name] = ''.join(self.iter_format(name))
+        return self._rendered[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FORMATS)
+    
+    def __len__(self) -> int:
+        return len(self.FORMATS)
+    
+    def iter_format(self, name: str) -> Iterator[str]:
+        """Stream an export format in chunks."""
+        if name == "csv":
+            return _iter_csv(self.data)
+        if name == "json":
+            return _iter_json(self.structure, self.data)
+        if name == "html":
+            return _iter_html(self.structure, self.data)
+        if name == "markdown":
+            return _iter_markdown(self.data)
+        raise KeyError(name)
+
+
+def _iter_csv(data: List[List[str]]) -> Iterator[str]:
+    """CSV rows, in chunks of ``CSV_CHUNK_ROWS`` rows."""
+    for start in range(0, len(data), CSV_CHUNK_ROWS):
+        buffer = StringIO()
+        csv.writer(buffer).writerows(data[start:start + CSV_CHUNK_ROWS])
+        yield buffer.getvalue()
+
+
+def _iter_json(structure: TableStructure, data: List[List[str]]) -> Iterator[str]:
+    """JSON document with table shape, types and data."""
+    document = {
+        "headers": structure.headers,
+        "rows": structure.rows,
+        "columns": structure.cols,
+        "column_types": structure.column_types,
+        "data": data
+    }
+    return json.JSONEncoder(indent=2).iterencode(document)
+
+
+def _join_lines(lines: Iterator[str]) -> Iterator[str]:
+    """Stream of ``lines`` joined by newlines."""
+    separator = ''
+    for line in lines:
+        yield separator + line
+        separator = '\n'
+
+
+def _iter_html(structure: TableStructure, data: List[List[str]]) -> Iterator[str]:
+    """HTML table, one chunk per line."""
+    def lines():
+        yield "<table>"
+        
+        if structure.has_header and structure.headers:
+            yield "  <thead>"
+            yield "    <tr>"
+            for header in structure.headers:
+                yield f"      <th>{header}</th>"
+            yield "    </tr>"
+            yield "  </thead>"
+        
+        yield "  <tbody>"
+        start_row = 1 if structure.has_header else 0
+        for row in data[start_row:]:
+            yield "    <tr>"
+            for cell in row:
+                yield f"      <td>{cell}</td>"
+            yield "    </tr>"
+        yield "  </tbody>"
+        yield "</table>"
+    
+    return _join_lines(lines())
+
+
+def _iter_markdown(data: List[List[str]]) -> Iterator[str]:
+    """Markdown table with the first row as header, one chunk per line."""
+    def lines():
+        if not data:
+            return
+        headers = data[0]
+        yield "| " + " | ".join(headers) + " |"
+        yield "| " + " | ".join(["---"] * len(headers)) + " |"
+        for row in data[1:]:
+            yield "| " + " | ".join(row) + " |"
+    
+    return _join_lines(lines())
+
+
 class TableParser(BaseParser):
     """Parser for table elements with structure preservation."""
     
@@ -83,8 +258,9 @@ class TableParser(BaseParser):
             # Calculate confidence
             confidence = self._calculate_table_confidence(structure, element)
             
-            # Generate export formats
-            export_formats = self._generate_export_formats(structure)
+            # Export formats render lazily from the same 2D data
+            table_data = self._structure_to_data(structure)
+            export_formats = self._generate_export_formats(structure, table_data)
             
             return ParserResult(
                 success=True,
@@ -96,7 +272,7 @@ class TableParser(BaseParser):
                     "column_types": structure.column_types,
                     "cells": [self._cell_to_dict(cell) for cell in structure.cells],
                     "has_merged_cells": bool(structure.merged_cells),
-                    "table_data": self._structure_to_data(structure)
+                    "table_data": table_data
                 },
                 metadata=ParserMetadata(
                     confidence=confidence,
@@ -106,8 +282,8 @@ class TableParser(BaseParser):
                         "structure_complexity": self._calculate_complexity(structure)
                     }
                 ),
-                extracted_content=self._structure_to_text(structure),
-                structured_data=self._structure_to_data(structure),
+                extracted_content='\n'.join('\t'.join(row) for row in table_data),
+                structured_data=table_data,
                 export_formats=export_formats
             )
             
@@ -117,6 +293,19 @@ class TableParser(BaseParser):
                 validation_errors=[f"Structure extraction error: {str(e)}"]
             )
     
+    async def parse_many(self, elements: List[UnifiedElement], 
+                         hints: Optional[ProcessingHints] = None,
+                         max_concurrent: int = 10,
+                         timeout: Optional[float] = None) -> List[Union[ParserResult, Exception]]:
+        """Parse a batch of tables, parsing repeated text tables once."""
+        return await self._parse_many_unique(elements, hints, self._batch_key, timeout)
+    
+    def _batch_key(self, element: UnifiedElement) -> Optional[str]:
+        """Text the table is parsed from, or None when metadata drives parsing."""
+        if hasattr(element, 'metadata') and element.metadata:
+            return None
+        return getattr(element, 'text', None)
+    
     def validate(self, result: ParserResult) -> List[str]:
         """Validate table parsing result."""
         errors = []
@@ -165,25 +354,53 @@ class TableParser(BaseParser):
         raise StructureExtractionError("table", "No usable table metadata found")
     
     async def _extract_from_text(self, text: str) -> TableStructure:
-        """Extract table structure from plain text."""
-        # Try different table text patterns
-        patterns = [
-            self._parse_pipe_separated,
-            self._parse_tab_separated,
-            self._parse_comma_separated,
-            self._parse_aligned_columns
-        ]
+        """Extract table structure from plain text.
         
-        for pattern_parser in patterns:
-            try:
-                structure = await pattern_parser(text)
-                if structure and structure.rows > 0 and structure.cols > 0:
-                    return structure
-            except Exception:
-                continue
+        The delimiter is picked once from a sample of lines, then the text
+        is tokenized in a single pass. Text without a delimiter is read as
+        whitespace-aligned columns.
+        """
+        if not text or not text.strip():
+            raise StructureExtractionError("table", "Empty text")
+        
+        delimiter = self._detect_delimiter(text.strip().split('\n'))
+        if delimiter == '|':
+            structure = await self._parse_pipe_separated(text)
+        elif delimiter == '\t':
+            structure = await self._parse_tab_separated(text)
+        elif delimiter == ',':
+            structure = await self._parse_comma_separated(text)
+        else:
+            structure = await self._parse_aligned_columns(text)
         
+        if structure.rows > 0 and structure.cols > 0:
+            return structure
         raise StructureExtractionError("table", "Could not extract table structure from text")
     
+    def _detect_delimiter(self, lines: List[str]) -> Optional[str]:
+        """Pick the delimiter found in the most sampled lines.
+        
+        Args:
+            lines: Lines of the table text
+            
+        Returns:
+            The delimiter, or None if none occurs in at least half the sample
+        """
+        sample = []
+        for line in lines:
+            if not _SEPARATOR_LINE.match(line.strip()):
+                sample.append(line)
+                if len(sample) == DELIMITER_SAMPLE_LINES:
+                    break
+        if not sample:
+            return '|'  # Only separator lines; let the pipe parser reject them
+        
+        counts = {delimiter: sum(1 for line in sample if delimiter in line) for delimiter in DELIMITERS}
+        best = max(DELIMITERS, key=lambda d: (counts[d], -DELIMITERS.index(d)))
+        if counts[best] * 2 < len(sample):
+            return None
+        return best
+    
     async def _parse_pipe_separated(self, text: str) -> TableStructure:
         """Parse pipe-separated table format."""
         lines = text.strip().split('\n')
@@ -191,36 +408,18 @@ class TableParser(BaseParser):
             raise StructureExtractionError("table", "Empty text")
         
         # Filter out separator lines (lines with only |, -, +, space)
-        data_lines = [line for line in lines if not re.match(r'^[\|\-\+\s]*$', line.strip())]
+        data_lines = [line for line in lines if not _SEPARATOR_LINE.match(line.strip())]
         
         if not data_lines:
             raise StructureExtractionError("table", "No data lines found")
         
-        rows = len(data_lines)
-        cells = []
-        
-        # Parse each line
-        for row_idx, line in enumerate(data_lines):
-            # Split by pipe and clean
-            row_cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-            
-            for col_idx, content in enumerate(row_cells):
-                cells.append(TableCell(
-                    content=content,
-                    row=row_idx,
-                    col=col_idx
-                ))
-        
-        # Determine column count from maximum columns in any row
-        cols = max(cell.col for cell in cells) + 1 if cells else 0
+        # Split by pipe and clean, dropping empty cells
+        rows_data = []
+        for line in data_lines:
+            stripped = (cell.strip() for cell in line.split('|'))
+            rows_data.append([cell for cell in stripped if cell])
         
-        return TableStructure(
-            rows=rows,
-            cols=cols,
-            cells=cells,
-            headers=[],
-            column_types=[]
-        )
+        return self._rows_to_structure(rows_data)
     
     async def _parse_tab_separated(self, text: str) -> TableStructure:
         """Parse tab-separated table format."""
@@ -228,62 +427,21 @@ class TableParser(BaseParser):
         if not lines:
             raise StructureExtractionError("table", "Empty text")
         
-        rows = len(lines)
-        cells = []
-        
-        for row_idx, line in enumerate(lines):
-            row_cells = line.split('\t')
-            for col_idx, content in enumerate(row_cells):
-                cells.append(TableCell(
-                    content=content.strip(),
-                    row=row_idx,
-                    col=col_idx
-                ))
-        
-        cols = max(cell.col for cell in cells) + 1 if cells else 0
-        
-        return TableStructure(
-            rows=rows,
-            cols=cols,
-            cells=cells,
-            headers=[],
-            column_types=[]
-        )
+        return self._rows_to_structure([
+            [content.strip() for content in line.split('\t')] for line in lines
+        ])
     
     async def _parse_comma_separated(self, text: str) -> TableStructure:
         """Parse comma-separated table format."""
-        import csv
-        from io import StringIO
-        
         try:
-            reader = csv.reader(StringIO(text))
-            rows_data = list(reader)
-            
-            if not rows_data:
-                raise StructureExtractionError("table", "No rows found")
-            
-            rows = len(rows_data)
-            cols = max(len(row) for row in rows_data) if rows_data else 0
-            cells = []
-            
-            for row_idx, row in enumerate(rows_data):
-                for col_idx, content in enumerate(row):
-                    cells.append(TableCell(
-                        content=content.strip(),
-                        row=row_idx,
-                        col=col_idx
-                    ))
-            
-            return TableStructure(
-                rows=rows,
-                cols=cols,
-                cells=cells,
-                headers=[],
-                column_types=[]
-            )
-            
+            rows_data = list(csv.reader(StringIO(text)))
         except Exception as e:
             raise StructureExtractionError("table", f"CSV parsing failed: {e}")
+        
+        if not rows_data:
+            raise StructureExtractionError("table", "No rows found")
+        
+        return self._rows_to_structure([[content.strip() for content in row] for row in rows_data])
     
     async def _parse_aligned_columns(self, text: str) -> TableStructure:
         """Parse aligned column table format."""
@@ -291,82 +449,72 @@ class TableParser(BaseParser):
         if not lines:
             raise StructureExtractionError("table", "Empty text")
         
+        # A single line has no alignment to go by
+        if len(lines) < 2:
+            raise StructureExtractionError("table", "Could not detect columns")
+        
         # Analyze column positions based on whitespace
         column_positions = self._detect_column_positions(lines)
         
         if len(column_positions) < 2:
             raise StructureExtractionError("table", "Could not detect columns")
         
-        rows = len(lines)
-        cols = len(column_positions) - 1
-        cells = []
-        
-        for row_idx, line in enumerate(lines):
-            for col_idx in range(cols):
-                start_pos = column_positions[col_idx]
-                end_pos = column_positions[col_idx + 1]
-                content = line[start_pos:end_pos].strip()
-                
-                cells.append(TableCell(
-                    content=content,
-                    row=row_idx,
-                    col=col_idx
-                ))
-        
-        return TableStructure(
-            rows=rows,
-            cols=cols,
-            cells=cells,
-            headers=[],
-            column_types=[]
-        )
+        spans = list(zip(column_positions[:-1], column_positions[1:]))
+        return self._rows_to_structure([
+            [line[start:end].strip() for start, end in spans] for line in lines
+        ])
     
     def _detect_column_positions(self, lines: List[str]) -> List[int]:
         """Detect column positions in aligned text."""
         if not lines:
             return [0]
         
-        # Find positions where all lines have whitespace
+        # Mark positions where some line has a non-space character
         max_length = max(len(line) for line in lines)
-        column_breaks = []
-        
-        for pos in range(max_length):
-            is_break = True
-            for line in lines:
-                if pos < len(line) and not line[pos].isspace():
-                    is_break = False
-                    break
-            if is_break:
-                column_breaks.append(pos)
-        
-        # Convert breaks to column start positions
-        positions = [0]
-        in_break = False
-        
-        for pos in range(max_length):
-            if pos in column_breaks:
-                if not in_break:
-                    in_break = True
-            else:
-                if in_break:
-                    positions.append(pos)
-                    in_break = False
+        coverage = np.zeros(max_length + 1, dtype=np.int64)
+        for line in lines:
+            for match in re.finditer(r'\S+', line):
+                coverage[match.start()] += 1
+                coverage[match.end()] -= 1
+        is_break = np.cumsum(coverage[:max_length]) == 0
+        
+        # Columns start where a run of break positions ends
+        starts = np.flatnonzero(is_break[:-1] & ~is_break[1:]) + 1
+        return [0] + starts.tolist() + [max_length]
+    
+    def _rows_to_structure(self, rows_data: List[List[str]]) -> TableStructure:
+        """Build a table structure from rows of cell contents."""
+        cells = [
+            TableCell(content=content, row=row_idx, col=col_idx)
+            for row_idx, row in enumerate(rows_data)
+            for col_idx, content in enumerate(row)
+        ]
         
-        positions.append(max_length)
-        return positions
+        return TableStructure(
+            rows=len(rows_data),
+            cols=max((len(row) for row in rows_data), default=0),
+            cells=cells,
+            headers=[],
+            column_types=[]
+        )
     
     async def _infer_column_types(self, structure: TableStructure) -> None:
         """Infer data types for table columns."""
-        structure.column_types = []
+        # Gather each column's values in one pass over the cells
+        columns: List[List[str]] = [[] for _ in range(structure.cols)]
+        for cell in structure.cells:
+            if 0 <= cell.col < structure.cols:
+                columns[cell.col].append(cell.content)
         
-        for col in range(structure.cols):
-            column_cells = [cell for cell in structure.cells if cell.col == col]
-            column_type = self._infer_column_type(column_cells)
-            structure.column_types.append(column_type)
+        structure.column_types = [self._infer_type_from_values(values) for values in columns]
     
     def _infer_column_type(self, cells: List[TableCell]) -> str:
         """Infer data type for a column."""
-        if not cells:
+        return self._infer_type_from_values([cell.content for cell in cells])
+    
+    def _infer_type_from_values(self, values: List[str]) -> str:
+        """Infer a column's data type, classifying each distinct value once."""
+        if not values:
             return "text"
         
         # Count type matches
@@ -380,26 +528,9 @@ class TableParser(BaseParser):
             "text": 0
         }
         
-        for cell in cells:
-            content = cell.content.strip()
-            if not content:
-                continue
-            
-            # Check each type
-            if self._is_integer(content):
-                type_counts["integer"] += 1
-            elif self._is_float(content):
-                type_counts["float"] += 1
-            elif self._is_date(content):
-                type_counts["date"] += 1
-            elif self._is_boolean(content):
-                type_counts["boolean"] += 1
-            elif self._is_currency(content):
-                type_counts["currency"] += 1
-            elif self._is_percentage(content):
-                type_counts["percentage"] += 1
-            else:
-                type_counts["text"] += 1
+        for content, count in Counter(value.strip() for value in values).items():
+            if content:
+                type_counts[_classify_value(content)] += count
         
         # Return most common type (excluding text)
         non_text_types = {k: v for k, v in type_counts.items() if k != "text" and v > 0}
@@ -409,37 +540,23 @@ class TableParser(BaseParser):
     
     def _is_integer(self, value: str) -> bool:
         """Check if value is an integer."""
-        try:
-            int(value.replace(',', ''))
-            return True
-        except ValueError:
-            return False
+        return _number_kind(value) == "integer"
     
     def _is_float(self, value: str) -> bool:
         """Check if value is a float."""
-        try:
-            float(value.replace(',', ''))
-            return '.' in value
-        except ValueError:
-            return False
+        return _number_kind(value) == "float"
     
     def _is_date(self, value: str) -> bool:
         """Check if value is a date."""
-        date_patterns = [
-            r'\d{1,2}/\d{1,2}/\d{4}',
-            r'\d{1,2}-\d{1,2}-\d{4}',
-            r'\d{4}-\d{1,2}-\d{1,2}',
-            r'\w+ \d{1,2}, \d{4}'
-        ]
-        return any(re.match(pattern, value) for pattern in date_patterns)
+        return bool(_DATE.match(value))
     
     def _is_boolean(self, value: str) -> bool:
         """Check if value is a boolean."""
-        return value.lower() in ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']
+        return value.lower() in _BOOLEANS
     
     def _is_currency(self, value: str) -> bool:
         """Check if value is currency."""
-        return bool(re.match(r'[\$€£¥][\d,]+\.?\d*', value))
+        return bool(_CURRENCY.match(value))
     
     def _is_percentage(self, value: str) -> bool:
         """Check if value is percentage."""
@@ -591,83 +708,28 @@ class TableParser(BaseParser):
         data = self._structure_to_data(structure)
         return '\n'.join('\t'.join(row) for row in data)
     
-    def _generate_export_formats(self, structure: TableStructure) -> Dict[str, Any]:
-        """Generate various export formats."""
-        data = self._structure_to_data(structure)
-        
-        return {
-            "csv": self._to_csv(data),
-            "json": self._to_json(structure),
-            "html": self._to_html(structure),
-            "markdown": self._to_markdown(data)
-        }
+    def _generate_export_formats(self, structure: TableStructure,
+                                 data: Optional[List[List[str]]] = None) -> TableExports:
+        """Generate various export formats, rendered on first access."""
+        if data is None:
+            data = self._structure_to_data(structure)
+        return TableExports(structure, data)
     
     def _to_csv(self, data: List[List[str]]) -> str:
         """Convert to CSV format."""
-        import csv
-        from io import StringIO
-        
-        output = StringIO()
-        writer = csv.writer(output)
-        for row in data:
-            writer.writerow(row)
-        return output.getvalue()
+        return ''.join(_iter_csv(data))
     
     def _to_json(self, structure: TableStructure) -> str:
         """Convert to JSON format."""
-        data = {
-            "headers": structure.headers,
-            "rows": structure.rows,
-            "columns": structure.cols,
-            "column_types": structure.column_types,
-            "data": self._structure_to_data(structure)
-        }
-        return json.dumps(data, indent=2)
+        return ''.join(_iter_json(structure, self._structure_to_data(structure)))
     
     def _to_html(self, structure: TableStructure) -> str:
         """Convert to HTML table format."""
-        data = self._structure_to_data(structure)
-        
-        html = ["<table>"]
-        
-        if structure.has_header and structure.headers:
-            html.append("  <thead>")
-            html.append("    <tr>")
-            for header in structure.headers:
-                html.append(f"      <th>{header}</th>")
-            html.append("    </tr>")
-            html.append("  </thead>")
-        
-        html.append("  <tbody>")
-        start_row = 1 if structure.has_header else 0
-        for row in data[start_row:]:
-            html.append("    <tr>")
-            for cell in row:
-                html.append(f"      <td>{cell}</td>")
-            html.append("    </tr>")
-        html.append("  </tbody>")
-        html.append("</table>")
-        
-        return '\n'.join(html)
+        return ''.join(_iter_html(structure, self._structure_to_data(structure)))
     
     def _to_markdown(self, data: List[List[str]]) -> str:
         """Convert to Markdown table format."""
-        if not data:
-            return ""
-        
-        lines = []
-        
-        # Headers
-        if data:
-            headers = data[0]
-            lines.append("| " + " | ".join(headers) + " |")
-            lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
-            
-            # Data rows
-            for row in data[1:]:
-                lines.append("| " + " | ".join(row) + " |")
-        
-        return '\n'.join(lines)
+        return ''.join(_iter_markdown(data))
     
     def _parse_table_data(self, table_data: Any) -> TableStructure:
         """Parse table data from various formats."""
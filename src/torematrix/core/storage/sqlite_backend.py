@@ -602,4 +602,5 @@ class SQLiteRepository(Repository[T], SQLiteBackend):
     # Explicitly implement abstract methods from Repository interface
     def transaction(self):
         """Transaction context manager - delegates to backend implementation."""
-        return super().transaction()
\ No newline at end of file
+        # super() would resolve to the abstract Repository.transaction
+        return SQLiteBackend.transaction(self)
\ No newline at end of file
@@ -8,10 +8,11 @@ library with comprehensive error handling and resource management.
 import asyncio
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union, Callable
 from contextlib import asynccontextmanager
 
 from .config import UnstructuredConfig
+from .optimization.memory_manager import MemoryManager
 from .exceptions import (
     UnstructuredError,
     UnstructuredParsingError,
@@ -21,6 +22,9 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Parsed element trees take several times the size of the source file
+PARSE_MEMORY_FACTOR = 4.0
+
 
 class UnstructuredClient:
     """
@@ -30,8 +34,11 @@ class UnstructuredClient:
     and progress tracking for document parsing operations.
     """
     
-    def __init__(self, config: Optional[UnstructuredConfig] = None):
+    def __init__(self, 
+                 config: Optional[UnstructuredConfig] = None,
+                 memory_manager: Optional[MemoryManager] = None):
         self.config = config or UnstructuredConfig()
+        self.memory_manager = memory_manager
         self._logger = logging.getLogger(__name__)
         self._semaphore = asyncio.Semaphore(self.config.performance.max_concurrent)
         self._session_active = False
@@ -204,6 +211,9 @@ class UnstructuredClient:
         """
         Parse multiple documents concurrently.
         
+        Collects the results of iter_parse(); prefer iterating directly for
+        large batches so elements can be released as they are consumed.
+        
         Args:
             file_paths: List of file paths to parse
             progress_callback: Optional progress callback
@@ -212,28 +222,127 @@ class UnstructuredClient:
             Dictionary mapping file paths to parsed elements
         """
         results = {}
-        total_files = len(file_paths)
+        async for path, elements in self.iter_parse(file_paths, progress_callback=progress_callback):
+            results[path] = elements
+        return results
+    
+    async def iter_parse(self,
+                         file_paths: Iterable[Union[str, Path]],
+                         max_concurrency: Optional[int] = None,
+                         ordered: bool = False,
+                         timeout_per_file: Optional[float] = None,
+                         return_exceptions: bool = False,
+                         progress_callback: Optional[Callable[[float], None]] = None,
+                         **kwargs) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Parse documents with bounded concurrency, yielding results as they finish.
+        
+        Paths are read lazily, so generators of any length are fine. At most
+        ``max_concurrency`` files are parsed or waiting to be yielded at a
+        time, and when a memory manager is set no further file is started
+        while it reports that the file's estimated memory cannot be
+        allocated. A failed or timed out file does not affect the rest of
+        the batch.
+        
+        Args:
+            file_paths: Paths of documents to parse
+            max_concurrency: Parse window size (default: performance.max_concurrent)
+            ordered: Yield in input order instead of completion order
+            timeout_per_file: Seconds allowed per file (default: performance.timeout_seconds)
+            return_exceptions: Yield the exception for failed files instead of []
+            progress_callback: Optional progress callback, only called when
+                the number of files is known
+            **kwargs: Additional parsing parameters
+            
+        Yields:
+            (path, elements) tuples
+        """
+        limit = max(1, max_concurrency or self.config.performance.max_concurrent)
+        timeout = timeout_per_file or self.config.performance.timeout_seconds
+        total_files = len(file_paths) if hasattr(file_paths, '__len__') else None
+        
+        paths = iter(file_paths)
+        pending: Optional[Path] = None
+        exhausted = False
+        next_index = 0       # input position of the next file to start
+        next_to_yield = 0    # input position awaited in ordered mode
         completed = 0
         
-        async def parse_single(file_path):
-            nonlocal completed
-            try:
-                elements = await self.parse_document(file_path)
-                results[str(file_path)] = elements
-                completed += 1
-                
-                if progress_callback:
-                    progress_callback(completed / total_files)
-                    
-            except Exception as e:
-                self._logger.error(f"Failed to parse {file_path}: {e}")
-                results[str(file_path)] = []
+        running: Dict[asyncio.Task, Tuple[int, str]] = {}
+        finished: Dict[int, Tuple[str, Any]] = {}
         
-        # Create tasks for concurrent processing
-        tasks = [parse_single(Path(fp)) for fp in file_paths]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        async def parse_one(path: Path) -> List[Any]:
+            return await asyncio.wait_for(self.parse_document(path, **kwargs), timeout=timeout)
         
-        return results
+        try:
+            while True:
+                # Fill the window while memory allows; always keep one file going
+                while not exhausted and len(running) + len(finished) < limit:
+                    if pending is None:
+                        try:
+                            pending = Path(next(paths))
+                        except StopIteration:
+                            exhausted = True
+                            break
+                    if running and not self._can_start_parse(pending):
+                        break
+                    task = asyncio.ensure_future(parse_one(pending))
+                    running[task] = (next_index, str(pending))
+                    next_index += 1
+                    pending = None
+                
+                if not running and not finished:
+                    return
+                
+                if running:
+                    done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        index, path = running.pop(task)
+                        finished[index] = (path, self._parse_outcome(task, path, return_exceptions))
+                
+                if ordered:
+                    ready = []
+                    while next_to_yield in finished:
+                        ready.append(finished.pop(next_to_yield))
+                        next_to_yield += 1
+                else:
+                    ready = list(finished.values())
+                    finished.clear()
+                
+                for path, outcome in ready:
+                    completed += 1
+                    if progress_callback and total_files:
+                        progress_callback(completed / total_files)
+                    yield path, outcome
+        finally:
+            # Consumer stopped early or failed; don't leave parses running
+            for task in running:
+                task.cancel()
+    
+    def _can_start_parse(self, file_path: Path) -> bool:
+        """Check with the memory manager before starting another parse."""
+        if not self.memory_manager:
+            return True
+        return self.memory_manager.check_can_allocate(self._estimate_parse_memory_mb(file_path))
+    
+    def _estimate_parse_memory_mb(self, file_path: Path) -> float:
+        """Estimate the memory needed to parse a file from its size."""
+        try:
+            size_mb = file_path.stat().st_size / (1024 * 1024)
+        except OSError:
+            size_mb = 0.0
+        return size_mb * PARSE_MEMORY_FACTOR
+    
+    def _parse_outcome(self, task: asyncio.Task, path: str, return_exceptions: bool) -> Any:
+        """Get the elements of a finished parse, or what to yield for a failure."""
+        error = task.exception()
+        if error is None:
+            return task.result()
+        
+        if isinstance(error, asyncio.TimeoutError):
+            error = UnstructuredTimeoutError(f"Parsing timeout for {Path(path).name}")
+        self._logger.error(f"Failed to parse {path}: {error}")
+        return error if return_exceptions else []
     
     async def health_check(self) -> Dict[str, Any]:
         """
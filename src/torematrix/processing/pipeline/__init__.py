@@ -29,6 +29,10 @@ from .resources import (
     ResourceMonitor,
     ResourceUsage
 )
+from .admission import (
+    ResourceAdmissionController,
+    ResourceGrant
+)
 from .templates import (
     PipelineTemplate,
     StandardDocumentPipeline,
@@ -74,6 +78,8 @@ __all__ = [
     # Resources
     'ResourceMonitor',
     'ResourceUsage',
+    'ResourceAdmissionController',
+    'ResourceGrant',
     
     # Templates
     'PipelineTemplate',
@@ -0,0 +1,264 @@
+"""
+Event-driven resource admission for pipeline stages.
+
+Stages take tokens from fixed pools (CPU cores, memory MB, GPU slots)
+before they run and return them when they finish. A stage that does not
+fit waits in a queue and is admitted as soon as a release frees enough
+tokens, instead of polling for free resources.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional, List, Any
+
+import psutil
+
+from .config import ResourceRequirements
+from .exceptions import ResourceError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResourceGrant:
+    """Resources held by one stage execution until released."""
+    stage_name: str
+    pipeline_id: Optional[str]
+    amounts: Dict[str, float]
+    queue_wait: float = 0.0
+
+
+@dataclass
+class _Waiter:
+    """A stage waiting for admission."""
+    sequence: int
+    priority: int
+    grant: ResourceGrant
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ResourceAdmissionController:
+    """
+    Token-based admission control for pipeline stages.
+    
+    Waiters are admitted in priority order. Among waiters of equal
+    priority, the pipeline currently holding the fewest grants goes
+    first, then the oldest request. The queue is strict: when the next
+    waiter does not fit, nobody behind it is admitted, so large requests
+    are not starved by a stream of small ones.
+    
+    All methods must be called from the event loop thread.
+    """
+    
+    def __init__(
+        self,
+        cpu_cores: float,
+        memory_mb: float,
+        gpu_slots: int = 0
+    ):
+        self.capacity: Dict[str, float] = {
+            "cpu_cores": float(cpu_cores),
+            "memory_mb": float(memory_mb),
+            "gpu_slots": float(gpu_slots)
+        }
+        self.available: Dict[str, float] = dict(self.capacity)
+        
+        self._waiters: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._held_by_pipeline: Dict[Optional[str], int] = {}
+        self.active_grants = 0
+        
+        # Queue-wait metrics per stage name
+        self.wait_stats: Dict[str, Dict[str, float]] = {}
+    
+    @classmethod
+    def from_system(
+        cls,
+        max_cpu_percent: float = 80.0,
+        max_memory_percent: float = 80.0,
+        gpu_slots: int = 0
+    ) -> 'ResourceAdmissionController':
+        """Create a controller sized to a share of this machine."""
+        cpu_cores = max((os.cpu_count() or 1) * max_cpu_percent / 100.0, 1.0)
+        memory_mb = psutil.virtual_memory().total // (1024 * 1024) * max_memory_percent / 100.0
+        return cls(cpu_cores=cpu_cores, memory_mb=memory_mb, gpu_slots=gpu_slots)
+    
+    def _amounts(self, requirements: ResourceRequirements) -> Dict[str, float]:
+        """Convert stage requirements to pool amounts, capped at pool capacity.
+        
+        A stage asking for more than a pool holds gets the whole pool and
+        therefore runs alone; a request against an empty pool can never be
+        admitted.
+        """
+        requested = {
+            "cpu_cores": float(requirements.cpu_cores),
+            "memory_mb": float(requirements.memory_mb),
+            "gpu_slots": 1.0 if requirements.gpu_required else 0.0
+        }
+        
+        amounts = {}
+        for pool, amount in requested.items():
+            if amount > 0 and self.capacity[pool] <= 0:
+                raise ResourceError(
+                    f"No {pool} capacity configured",
+                    required=requirements.model_dump(),
+                    available=dict(self.capacity)
+                )
+            amounts[pool] = min(amount, self.capacity[pool])
+        return amounts
+    
+    def _fits(self, amounts: Dict[str, float]) -> bool:
+        """Check if the pools currently hold ``amounts``."""
+        return all(self.available[pool] >= amount for pool, amount in amounts.items())
+    
+    def _take(self, grant: ResourceGrant) -> None:
+        """Remove a grant's tokens from the pools."""
+        for pool, amount in grant.amounts.items():
+            self.available[pool] -= amount
+        self._held_by_pipeline[grant.pipeline_id] = self._held_by_pipeline.get(grant.pipeline_id, 0) + 1
+        self.active_grants += 1
+    
+    def _next_waiter(self) -> Optional[_Waiter]:
+        """Pick the waiter to admit next."""
+        if not self._waiters:
+            return None
+        return min(
+            self._waiters,
+            key=lambda w: (-w.priority, self._held_by_pipeline.get(w.grant.pipeline_id, 0), w.sequence)
+        )
+    
+    def _dispatch(self) -> None:
+        """Admit queued waiters while the next one fits."""
+        while True:
+            waiter = self._next_waiter()
+            if waiter is None or not self._fits(waiter.grant.amounts):
+                return
+            
+            self._waiters.remove(waiter)
+            if waiter.future.done():  # cancelled while queued
+                continue
+            
+            waiter.grant.queue_wait = time.monotonic() - waiter.enqueued_at
+            self._take(waiter.grant)
+            waiter.future.set_result(waiter.grant)
+    
+    def _record_wait(self, stage_name: str, wait: float, timed_out: bool = False) -> None:
+        """Update queue-wait metrics of a stage."""
+        stats = self.wait_stats.setdefault(stage_name, {
+            "admissions": 0,
+            "timeouts": 0,
+            "total_wait": 0.0,
+            "max_wait": 0.0
+        })
+        if timed_out:
+            stats["timeouts"] += 1
+        else:
+            stats["admissions"] += 1
+            stats["total_wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+    
+    async def acquire(
+        self,
+        stage_name: str,
+        requirements: ResourceRequirements,
+        pipeline_id: Optional[str] = None,
+        priority: int = 0,
+        timeout: Optional[float] = None
+    ) -> ResourceGrant:
+        """
+        Wait until the stage's resources are free and take them.
+        
+        Args:
+            stage_name: Stage requesting resources
+            requirements: Resources the stage needs
+            pipeline_id: Pipeline the stage belongs to, used for fairness
+            priority: Higher priorities are admitted first
+            timeout: Seconds to wait before giving up
+        
+        Returns:
+            Grant to pass to release()
+        
+        Raises:
+            ResourceError: If the resources cannot be granted in time
+        """
+        grant = ResourceGrant(stage_name, pipeline_id, self._amounts(requirements))
+        
+        if not self._waiters and self._fits(grant.amounts):
+            self._take(grant)
+            self._record_wait(stage_name, 0.0)
+            return grant
+        
+        waiter = _Waiter(
+            sequence=next(self._sequence),
+            priority=priority,
+            grant=grant,
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        logger.debug(f"Queued {stage_name} for resources ({len(self._waiters)} waiting)")
+        
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the wait ended; hand the tokens back
+                self.release(grant)
+            else:
+                waiter.future.cancel()
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # The waiter may have been blocking the queue
+                self._dispatch()
+            
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            
+            wait = time.monotonic() - waiter.enqueued_at
+            self._record_wait(stage_name, wait, timed_out=True)
+            raise ResourceError(
+                f"Resources not available for stage {stage_name} after {timeout}s",
+                required=requirements.model_dump(),
+                available=dict(self.available)
+            )
+        
+        self._record_wait(stage_name, grant.queue_wait)
+        return grant
+    
+    def release(self, grant: ResourceGrant) -> None:
+        """Return a grant's tokens and admit the waiters that now fit."""
+        for pool, amount in grant.amounts.items():
+            self.available[pool] = min(self.available[pool] + amount, self.capacity[pool])
+        
+        held = self._held_by_pipeline.get(grant.pipeline_id, 0) - 1
+        if held > 0:
+            self._held_by_pipeline[grant.pipeline_id] = held
+        else:
+            self._held_by_pipeline.pop(grant.pipeline_id, None)
+        self.active_grants -= 1
+        
+        self._dispatch()
+    
+    def get_queue_wait_metrics(self) -> Dict[str, Dict[str, float]]:
+        """Get queue-wait metrics per stage."""
+        metrics = {}
+        for stage_name, stats in self.wait_stats.items():
+            metrics[stage_name] = dict(stats)
+            metrics[stage_name]["average_wait"] = (
+                stats["total_wait"] / stats["admissions"] if stats["admissions"] else 0.0
+            )
+        return metrics
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get admission controller statistics."""
+        return {
+            "capacity": dict(self.capacity),
+            "available": dict(self.available),
+            "active_grants": self.active_grants,
+            "waiting": len(self._waiters),
+            "queue_wait": self.get_queue_wait_metrics()
+        }
@@ -47,6 +47,7 @@ class StageConfig(BaseModel):
     retries: int = Field(default=3, ge=0, le=10)
     critical: bool = Field(default=True, description="Fail pipeline if stage fails")
     conditional: Optional[str] = Field(default=None, description="Condition expression")
+    priority: int = Field(default=0, ge=-10, le=10, description="Resource admission priority, higher first")
     
     # Resource requirements
     resources: ResourceRequirements = Field(default_factory=ResourceRequirements)
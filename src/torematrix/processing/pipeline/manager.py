@@ -27,6 +27,7 @@ from .exceptions import (
     PipelineCancelledError
 )
 from .dag import build_dag, get_execution_order, get_parallel_groups
+from .admission import ResourceAdmissionController, ResourceGrant
 
 logger = logging.getLogger(__name__)
 
@@ -68,12 +69,16 @@ class PipelineManager:
         config: PipelineConfig,
         event_bus: EventBus,
         state_store: Optional[StateStore] = None,
-        resource_monitor: Optional['ResourceMonitor'] = None
+        resource_monitor: Optional['ResourceMonitor'] = None,
+        admission_controller: Optional[ResourceAdmissionController] = None
     ):
         self.config = config
         self.event_bus = event_bus
         self.state_store = state_store or StateStore()  # Use temporary if not provided
         self.resource_monitor = resource_monitor
+        # Shared between managers to apply one resource budget across pipelines
+        self.admission_controller = admission_controller
+        self.resource_wait_timeout = 60  # seconds
         
         # Pipeline state
         self.dag: nx.DiGraph = nx.DiGraph()
@@ -310,11 +315,24 @@ class PipelineManager:
     async def _execute_stage(self, stage_name: str, context: PipelineContext):
         """Execute a single stage."""
         stage = self.stages[stage_name]
+        grant: Optional[ResourceGrant] = None
+        queue_wait = 0.0
         
-        # Check resources if monitor available
-        if self.resource_monitor:
+        # Wait for admission; released stages wake waiters immediately
+        if self.admission_controller:
+            grant = await self.admission_controller.acquire(
+                stage_name,
+                stage.get_resource_requirements(),
+                pipeline_id=context.pipeline_id,
+                priority=stage.config.priority,
+                timeout=self.resource_wait_timeout
+            )
+            queue_wait = grant.queue_wait
+        
+        # Otherwise poll the resource monitor if available
+        elif self.resource_monitor:
             requirements = stage.get_resource_requirements()
-            max_wait = 60  # seconds
+            max_wait = self.resource_wait_timeout
             start_wait = datetime.utcnow()
             
             while not await self.resource_monitor.check_availability(requirements):
@@ -328,6 +346,7 @@ class PipelineManager:
             
             # Allocate resources
             await self.resource_monitor.allocate(stage_name, requirements)
+            queue_wait = (datetime.utcnow() - start_wait).total_seconds()
         
         logger.info(f"Executing stage: {stage_name}")
         start_time = datetime.utcnow()
@@ -340,7 +359,7 @@ class PipelineManager:
             # Emit stage start event
             await self.event_bus.publish(Event(
                 event_type="stage.started",
-                payload={"pipeline_id": context.pipeline_id, "stage": stage_name}
+                payload={"pipeline_id": context.pipeline_id, "stage": stage_name, "queue_wait": queue_wait}
             ))
             
             # Execute with timeout
@@ -426,7 +445,9 @@ class PipelineManager:
         
         finally:
             # Release resources
-            if self.resource_monitor:
+            if grant is not None:
+                self.admission_controller.release(grant)
+            elif self.resource_monitor:
                 await self.resource_monitor.release(stage_name)
     
     def _check_dependencies(self, stage_name: str, context: PipelineContext) -> bool:
@@ -9,6 +9,7 @@ This module provides:
 
 from .config import WorkerConfig, ResourceLimits, ResourceType
 from .pool import WorkerPool, WorkerType, WorkerStatus
+from .scheduler import TaskScheduler
 from .progress import ProgressTracker, TaskProgress, PipelineProgress
 from .resources import ResourceMonitor, ResourceSnapshot
 
@@ -22,6 +23,7 @@ __all__ = [
     "WorkerPool",
     "WorkerType",
     "WorkerStatus",
+    "TaskScheduler",
     
     # Progress Tracking
     "ProgressTracker",
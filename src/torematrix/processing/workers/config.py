@@ -25,6 +25,7 @@ class WorkerConfig(BaseModel):
     # Queue settings
     max_queue_size: int = Field(default=1000, ge=10, description="Maximum queue size")
     priority_queue_size: int = Field(default=100, ge=10, description="Priority queue size")
+    aging_interval: float = Field(default=5.0, gt=0, description="Seconds of waiting that equal one priority level")
     
     # Timeouts
     default_timeout: float = Field(default=300.0, gt=0, description="Default task timeout in seconds")
@@ -2,6 +2,7 @@
 
 from typing import Dict, List, Any, Optional, Set, Callable, Tuple
 from dataclasses import dataclass, field
+from collections import deque
 from datetime import datetime, timedelta
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
@@ -14,6 +15,7 @@ import time
 from .config import WorkerConfig, ResourceLimits, ResourceType
 from .resources import ResourceMonitor
 from .progress import ProgressTracker
+from .scheduler import TaskScheduler, DEFAULT_TENANT, percentiles
 from .exceptions import (
     WorkerPoolError, TaskError, TaskTimeoutError, 
     WorkerTimeoutError, ResourceError
@@ -96,6 +98,14 @@ class WorkerTask:
     result: Optional[Any] = None
     error: Optional[str] = None
     worker_id: Optional[str] = None
+    tenant: str = DEFAULT_TENANT
+    worker_type: WorkerType = WorkerType.THREAD
+    estimated_time: float = 0.0
+    
+    @property
+    def is_interactive(self) -> bool:
+        """Critical and high priority tasks are user-facing; the rest is batch work."""
+        return self.priority <= ProcessorPriority.HIGH
     
     @property
     def wait_time(self) -> Optional[float]:
@@ -137,12 +147,10 @@ class WorkerPool:
         self.thread_pool: Optional[ThreadPoolExecutor] = None
         self.process_pool: Optional[ProcessPoolExecutor] = None
         
-        # Task management
-        self.task_queue: asyncio.Queue = asyncio.Queue(
-            maxsize=config.max_queue_size
-        )
-        self.priority_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(
-            maxsize=config.priority_queue_size
+        # Task management: one scheduler queue per worker group (thread, process)
+        self.scheduler = TaskScheduler(
+            aging_interval=config.aging_interval,
+            max_size=config.max_queue_size
         )
         self.active_tasks: Dict[str, WorkerTask] = {}
         self.completed_tasks: List[WorkerTask] = []
@@ -160,6 +168,12 @@ class WorkerPool:
         self._total_tasks_submitted = 0
         self._total_tasks_completed = 0
         self._total_tasks_failed = 0
+        
+        # End-to-end latencies (submit to completion) of recent tasks
+        self._latencies: Dict[str, deque] = {
+            "interactive": deque(maxlen=1000),
+            "batch": deque(maxlen=1000)
+        }
     
     async def start(self):
         """Start the worker pool."""
@@ -188,20 +202,13 @@ class WorkerPool:
                 )
                 logger.info(f"Started {self.config.process_workers} process workers")
             
-            # Start async workers
+            # Start async workers; they run coroutines and feed the thread pool
             for i in range(self.config.async_workers):
-                worker_id = f"async-{i}"
-                worker = asyncio.create_task(
-                    self._async_worker(worker_id),
-                    name=f"worker-{worker_id}"
-                )
-                self.async_workers.append(worker)
-                self.worker_stats[worker_id] = WorkerStats(
-                    worker_id=worker_id,
-                    worker_type=WorkerType.ASYNC,
-                    status=WorkerStatus.IDLE
-                )
-                self._worker_locks[worker_id] = asyncio.Lock()
+                self._start_worker(f"async-{i}", WorkerType.ASYNC, WorkerType.THREAD)
+            
+            # One dispatcher per process so the process pool is kept busy
+            for i in range(self.config.process_workers):
+                self._start_worker(f"process-{i}", WorkerType.PROCESS, WorkerType.PROCESS)
             
             logger.info(f"Started {self.config.async_workers} async workers")
             
@@ -289,11 +296,17 @@ class WorkerPool:
         processor_func: Callable,
         priority: ProcessorPriority = ProcessorPriority.NORMAL,
         timeout: Optional[float] = None,
-        required_resources: Optional[Dict[ResourceType, float]] = None
+        required_resources: Optional[Dict[ResourceType, float]] = None,
+        tenant: Optional[str] = None,
+        worker_type: WorkerType = WorkerType.THREAD
     ) -> str:
         """
         Submit a task to the worker pool.
         
+        ``tenant`` defaults to the context's ``tenant_id``. Synchronous
+        CPU-bound processors can ask for ``WorkerType.PROCESS``; thread
+        workers steal them when the process group is busy.
+        
         Returns task ID for tracking.
         """
         if not self._running:
@@ -317,7 +330,9 @@ class WorkerPool:
             processor_func=processor_func,
             priority=priority,
             timeout=timeout or self.config.default_timeout,
-            submitted_at=datetime.utcnow()
+            submitted_at=datetime.utcnow(),
+            tenant=tenant or getattr(context, 'tenant_id', None) or DEFAULT_TENANT,
+            worker_type=worker_type if self.process_pool else WorkerType.THREAD
         )
         
         # Allocate resources if specified
@@ -326,19 +341,8 @@ class WorkerPool:
             if not allocated:
                 raise ResourceError(f"Failed to allocate resources for task {task_id}")
         
-        # Add to appropriate queue
-        try:
-            if priority == ProcessorPriority.CRITICAL:
-                await asyncio.wait_for(
-                    self.priority_queue.put((priority.value, task)),
-                    timeout=1.0
-                )
-            else:
-                await asyncio.wait_for(
-                    self.task_queue.put(task),
-                    timeout=1.0
-                )
-        except asyncio.TimeoutError:
+        # Queue for the task's worker group
+        if not self.scheduler.put(task, task.worker_type.value):
             # Release allocated resources
             if required_resources and self.resource_monitor:
                 await self.resource_monitor.release(task_id)
@@ -432,7 +436,7 @@ class WorkerPool:
             total_workers=len(self.worker_stats),
             active_workers=active_workers,
             idle_workers=idle_workers,
-            queued_tasks=self.task_queue.qsize() + self.priority_queue.qsize(),
+            queued_tasks=self.scheduler.qsize(),
             completed_tasks=self._total_tasks_completed,
             failed_tasks=self._total_tasks_failed,
             average_wait_time=avg_wait_time,
@@ -479,34 +483,43 @@ class WorkerPool:
         
         return completed
     
-    async def _async_worker(self, worker_id: str):
+    def _start_worker(self, worker_id: str, worker_type: WorkerType, group: WorkerType):
+        """Start a dispatcher task serving a worker group."""
+        worker = asyncio.create_task(
+            self._async_worker(worker_id, group),
+            name=f"worker-{worker_id}"
+        )
+        self.async_workers.append(worker)
+        self.worker_stats[worker_id] = WorkerStats(
+            worker_id=worker_id,
+            worker_type=worker_type,
+            status=WorkerStatus.IDLE
+        )
+        self._worker_locks[worker_id] = asyncio.Lock()
+    
+    async def _async_worker(self, worker_id: str, group: WorkerType = WorkerType.THREAD):
         """Async worker process."""
         logger.info(f"Starting async worker: {worker_id}")
         
+        # Idle thread workers steal process tasks. Thread tasks are never moved
+        # into worker processes: closures and bound methods don't pickle, and
+        # side effects would be lost in the other process.
+        steal_from = (WorkerType.PROCESS.value,) if group == WorkerType.THREAD else ()
+        
         while self._running:
             task = None
             try:
                 # Update status
                 await self._update_worker_status(worker_id, WorkerStatus.IDLE)
                 
-                # Try priority queue first
-                try:
-                    _, task = await asyncio.wait_for(
-                        self.priority_queue.get(),
-                        timeout=0.1
-                    )
-                except asyncio.TimeoutError:
-                    # Try regular queue
-                    try:
-                        task = await asyncio.wait_for(
-                            self.task_queue.get(),
-                            timeout=1.0
-                        )
-                    except asyncio.TimeoutError:
-                        continue
+                scheduled = self.scheduler.pop(group.value, steal_from)
+                if scheduled is None:
+                    await self.scheduler.wait(timeout=1.0)
+                    continue
                 
-                if task:
-                    await self._process_task(worker_id, task)
+                task, _ = scheduled
+                task.worker_type = group
+                await self._process_task(worker_id, task)
                 
             except asyncio.CancelledError:
                 logger.info(f"Worker {worker_id} cancelled")
@@ -568,10 +581,11 @@ class WorkerPool:
         if asyncio.iscoroutinefunction(task.processor_func):
             result = await task.processor_func(task.context)
         else:
-            # Run sync function in thread pool
+            # Run sync function in the pool of the group that took the task
+            executor = self.process_pool if task.worker_type == WorkerType.PROCESS else self.thread_pool
             loop = asyncio.get_event_loop()
             result = await loop.run_in_executor(
-                self.thread_pool, task.processor_func, task.context
+                executor, task.processor_func, task.context
             )
         
         # Update progress
@@ -597,6 +611,16 @@ class WorkerPool:
             if task.processing_time:
                 stats.total_processing_time += task.processing_time
         
+        # Feed run times back into scheduling and record latency
+        if task.processing_time is not None:
+            self.scheduler.record_completion(task, task.processing_time)
+            averages = [s.average_processing_time for s in self.worker_stats.values() if s.tasks_completed]
+            if averages:
+                self.scheduler.default_estimate = sum(averages) / len(averages)
+        if task.completed_at:
+            latency = (task.completed_at - task.submitted_at).total_seconds()
+            self._latencies["interactive" if task.is_interactive else "batch"].append(latency)
+        
         # Complete progress tracking
         if self.progress_tracker:
             await self.progress_tracker.complete_task(
@@ -722,7 +746,16 @@ class WorkerPool:
             "average_processing_time": pool_stats.average_processing_time,
             "resource_utilization": pool_stats.resource_utilization,
             "uptime_seconds": self._get_uptime_seconds(),
-            "total_tasks_submitted": self._total_tasks_submitted
+            "total_tasks_submitted": self._total_tasks_submitted,
+            "scheduler": self.scheduler.get_stats(),
+            "latency": self.get_latency_percentiles()
+        }
+    
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, float]]:
+        """Get submit-to-completion latency percentiles for interactive and batch tasks."""
+        return {
+            task_class: percentiles(list(samples))
+            for task_class, samples in self._latencies.items()
         }
     
     async def wait_for_completion(self, timeout: float = 60.0) -> bool:
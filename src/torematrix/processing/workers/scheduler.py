@@ -0,0 +1,204 @@
+"""Priority task scheduling with aging, tenant fair share and work stealing."""
+
+from typing import Dict, List, Any, Optional, Callable, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+
+if TYPE_CHECKING:
+    from .pool import WorkerTask
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TENANT = "default"
+
+
+@dataclass(order=True)
+class ScheduledTask:
+    """Queue entry ordered by virtual deadline, then submission order."""
+    deadline: float
+    sequence: int
+    task: 'WorkerTask' = field(compare=False)
+    enqueued_at: float = field(compare=False, default=0.0)
+
+
+class TaskScheduler:
+    """
+    Multi-level task queue shared by the worker groups of a pool.
+    
+    Every task gets a virtual deadline when it is queued:
+    
+        enqueue time + aging_interval * priority level + expected run time
+    
+    with the run time capped at ``aging_interval``. Each priority level
+    therefore starts ``aging_interval`` seconds behind the one above it.
+    Shorter tasks are preferred within about one level. Because later
+    arrivals get later deadlines, a waiting task eventually overtakes
+    everything submitted after it, so low priorities cannot starve.
+    
+    Tasks are kept per worker group and tenant. The next task comes from
+    the tenant whose head deadline, plus the service it received beyond
+    its fair share, is smallest. That extra service is capped at
+    ``max_tenant_lag`` (default ``aging_interval``) so a busy tenant is
+    delayed by at most that much and aging still bounds its wait. A group
+    with nothing to run steals from the other groups.
+    """
+    
+    def __init__(self, aging_interval: float = 5.0, max_size: int = 1000, smoothing: float = 0.3,
+                 max_tenant_lag: Optional[float] = None):
+        self.aging_interval = aging_interval
+        self.max_tenant_lag = aging_interval if max_tenant_lag is None else max_tenant_lag
+        self.max_size = max_size
+        # Weight of the latest run in the per-processor time estimate
+        self.smoothing = smoothing
+        
+        self.queues: Dict[str, Dict[str, List[ScheduledTask]]] = {}
+        self.tenant_shares: Dict[str, float] = {}
+        self.tenant_service: Dict[str, float] = {}
+        self.processing_estimates: Dict[str, float] = {}
+        self.default_estimate = 0.0
+        
+        self._sequence = itertools.count()
+        self._size = 0
+        self._available = asyncio.Event()
+        
+        self.steals = 0
+    
+    def set_tenant_share(self, tenant: str, share: float) -> None:
+        """Set a tenant's relative share of worker time (default 1.0)."""
+        if share <= 0:
+            raise ValueError("Tenant share must be positive")
+        self.tenant_shares[tenant] = share
+    
+    def estimate(self, processor_name: str) -> float:
+        """Get the expected processing time of a processor's tasks."""
+        return self.processing_estimates.get(processor_name, self.default_estimate)
+    
+    def put(self, task: 'WorkerTask', group: str) -> bool:
+        """Queue a task for a worker group; returns False if the queue is full."""
+        if self._size >= self.max_size:
+            return False
+        
+        now = time.monotonic()
+        estimate = self.estimate(task.processor_name)
+        task.estimated_time = estimate
+        deadline = now + self.aging_interval * task.priority.value + min(estimate, self.aging_interval)
+        
+        entry = ScheduledTask(deadline, next(self._sequence), task, now)
+        heapq.heappush(self.queues.setdefault(group, {}).setdefault(task.tenant, []), entry)
+        self._size += 1
+        self._available.set()
+        return True
+    
+    def pop(
+        self,
+        group: str,
+        steal_from: Tuple[str, ...] = (),
+        can_steal: Optional[Callable[['WorkerTask'], bool]] = None
+    ) -> Optional[Tuple['WorkerTask', str]]:
+        """
+        Take the next task for ``group``, stealing if it has none.
+        
+        Returns the task and the group it was queued for, or None.
+        """
+        entry = self._pop_group(group)
+        if entry is not None:
+            return entry.task, group
+        
+        for other in steal_from:
+            entry = self._pop_group(other, can_steal)
+            if entry is not None:
+                self.steals += 1
+                logger.debug(f"Group {group} stole task {entry.task.task_id} from {other}")
+                return entry.task, other
+        
+        return None
+    
+    async def wait(self, timeout: float) -> None:
+        """Wait until another task is queued or ``timeout`` expires."""
+        self._available.clear()
+        try:
+            await asyncio.wait_for(self._available.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+    
+    def record_completion(self, task: 'WorkerTask', processing_time: float) -> None:
+        """Update the processor's time estimate and the tenant's service."""
+        previous = self.processing_estimates.get(task.processor_name)
+        if previous is None:
+            self.processing_estimates[task.processor_name] = processing_time
+        else:
+            self.processing_estimates[task.processor_name] = (
+                (1 - self.smoothing) * previous + self.smoothing * processing_time
+            )
+        self.tenant_service[task.tenant] = self.tenant_service.get(task.tenant, 0.0) + processing_time
+    
+    def qsize(self, group: Optional[str] = None) -> int:
+        """Number of queued tasks, overall or for one group."""
+        if group is None:
+            return self._size
+        return sum(len(heap) for heap in self.queues.get(group, {}).values())
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "queued_tasks": self._size,
+            "queued_by_group": {group: self.qsize(group) for group in self.queues},
+            "steals": self.steals,
+            "tenant_service": dict(self.tenant_service),
+            "processing_estimates": dict(self.processing_estimates)
+        }
+    
+    def _tenant_lag(self, tenant: str) -> float:
+        """Service received by a tenant, scaled by its share."""
+        return self.tenant_service.get(tenant, 0.0) / self.tenant_shares.get(tenant, 1.0)
+    
+    def _pop_group(
+        self,
+        group: str,
+        can_run: Optional[Callable[['WorkerTask'], bool]] = None
+    ) -> Optional[ScheduledTask]:
+        """Pop the best task of a group, skipping heads ``can_run`` rejects."""
+        tenants = self.queues.get(group)
+        if not tenants:
+            return None
+        
+        candidates = [
+            tenant for tenant, heap in tenants.items()
+            if heap and (can_run is None or can_run(heap[0].task))
+        ]
+        if not candidates:
+            return None
+        
+        baseline = min(self._tenant_lag(tenant) for tenant in candidates)
+        tenant = min(
+            candidates,
+            key=lambda t: (
+                tenants[t][0].deadline + min(self._tenant_lag(t) - baseline, self.max_tenant_lag),
+                tenants[t][0].sequence
+            )
+        )
+        
+        heap = tenants[tenant]
+        entry = heapq.heappop(heap)
+        if not heap:
+            del tenants[tenant]
+        self._size -= 1
+        return entry
+
+
+def percentiles(samples: List[float], points: Tuple[int, ...] = (50, 90, 99)) -> Dict[str, float]:
+    """Nearest-rank percentiles of ``samples``, e.g. {'p50': ..., 'p99': ...}."""
+    if not samples:
+        return {f"p{point}": 0.0 for point in points}
+    
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        rank = max(math.ceil(point / 100.0 * len(ordered)) - 1, 0)
+        result[f"p{point}"] = ordered[rank]
+    return result
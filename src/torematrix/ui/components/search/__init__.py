@@ -7,7 +7,9 @@ with full-text search, indexing, type filtering, and advanced query processing.
 
 from .engine import SearchEngine, IndexedSearchEngine
 from .indexer import ElementIndexer, SearchIndex
+from .segments import SegmentedSearchIndex
 from .query_parser import QueryParser, SearchQuery
+from .term_dictionary import TermDictionary
 from .filters import FilterManager, FilterSet
 from .highlighting import SearchHighlighter
 from .statistics import SearchStatistics
@@ -17,8 +19,10 @@ __all__ = [
     'IndexedSearchEngine', 
     'ElementIndexer',
     'SearchIndex',
+    'SegmentedSearchIndex',
     'QueryParser',
     'SearchQuery',
+    'TermDictionary',
     'FilterManager',
     'FilterSet',
     'SearchHighlighter',
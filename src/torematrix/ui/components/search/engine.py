@@ -15,8 +15,8 @@ import threading
 
 from ....core.models.element import Element, ElementType
 from ....core.state.store import StateStore
-from .indexer import ElementIndexer, IndexStrategy, SearchIndex
-from .query_parser import QueryParser, SearchQuery, QueryType, BooleanOperator
+from .indexer import ElementIndexer, IndexEntry, IndexStrategy, SearchIndex
+from .query_parser import QueryParser, SearchQuery, QueryToken, QueryType, BooleanOperator
 
 
 class SearchMode(Enum):
@@ -95,6 +95,16 @@ class SearchEngine:
 class IndexedSearchEngine(SearchEngine):
     """High-performance search engine with indexing and advanced features."""
     
+    # Relevance bonus per element type (some types might be more relevant)
+    TYPE_BONUSES = {
+        ElementType.TITLE: 3.0,
+        ElementType.HEADER: 2.0,
+        ElementType.NARRATIVE_TEXT: 1.0,
+        ElementType.TABLE: 1.5,
+        ElementType.LIST: 1.2
+    }
+    CONFIDENCE_WEIGHT = 5.0
+    
     def __init__(self, state_store: StateStore, index_strategy: IndexStrategy = IndexStrategy.BALANCED):
         super().__init__(state_store)
         
@@ -158,26 +168,30 @@ class IndexedSearchEngine(SearchEngine):
                     query=query
                 )
             
-            # Execute search
-            matching_ids = self._execute_search(query)
-            
-            # Apply additional filters
-            matching_ids = self._apply_filters(matching_ids, options.get('filters', {}))
-            
-            # Get elements and create results
-            elements = self._get_elements_by_ids(matching_ids)
-            search_results = self._create_search_results(elements, query, options)
-            
-            # Rank results
-            ranking = options.get('ranking', self.ranking_strategy)
-            search_results = self._rank_results(search_results, query, ranking)
-            
-            # Apply pagination
             limit = options.get('limit', self.default_limit)
             offset = options.get('offset', 0)
-            total_count = len(search_results)
+            ranking = options.get('ranking', self.ranking_strategy)
             
-            paginated_results = search_results[offset:offset + limit]
+            if self._can_rank_in_index(query, ranking, options):
+                # Top-k straight from the index; only the returned page is materialized
+                paginated_results, total_count = self._search_top_k(query, offset, limit, options)
+            else:
+                # Execute search
+                matching_ids = self._execute_search(query)
+                
+                # Apply additional filters
+                matching_ids = self._apply_filters(matching_ids, options.get('filters', {}))
+                
+                # Get elements and create results
+                elements = self._get_elements_by_ids(matching_ids)
+                search_results = self._create_search_results(elements, query, options)
+                
+                # Rank results
+                search_results = self._rank_results(search_results, query, ranking)
+                
+                # Apply pagination
+                total_count = len(search_results)
+                paginated_results = search_results[offset:offset + limit]
             has_more = offset + limit < total_count
             
             # Create result set
@@ -247,6 +261,34 @@ class IndexedSearchEngine(SearchEngine):
         
         return suggestions[:limit]
     
+    def _can_rank_in_index(self, query: SearchQuery, ranking: RankingStrategy,
+                           options: Dict[str, Any]) -> bool:
+        """Whether the index can rank the query without the full match set."""
+        return (ranking == RankingStrategy.RELEVANCE and
+                query.is_simple() and
+                not options.get('filters'))
+    
+    def _search_top_k(self, query: SearchQuery, offset: int, limit: int,
+                      options: Dict[str, Any]) -> Tuple[List[SearchResult], int]:
+        """Rank a simple query with the index's BM25 top-k retrieval."""
+        token = query.tokens[0]
+        ranked = self.indexer.search_ranked(
+            token.value,
+            k=offset + limit,
+            fuzzy=query.fuzzy_enabled,
+            prior=self._entry_static_score,
+            prior_bound=self.CONFIDENCE_WEIGHT + max(max(self.TYPE_BONUSES.values()), 1.0)
+        )
+        
+        state = self.state_store.get_state()
+        elements_dict = state.get('elements', {})
+        results = []
+        for element_id, score in ranked.hits[offset:]:
+            element = elements_dict.get(element_id)
+            if element is not None:
+                results.append(self._create_search_result(element, query, options, score=score))
+        return results, ranked.total_count
+    
     def _execute_search(self, query: SearchQuery) -> Set[str]:
         """Execute search query against index."""
         if not query.tokens:
@@ -316,16 +358,25 @@ class IndexedSearchEngine(SearchEngine):
             return self.indexer.search(token.value, fuzzy=False)
         
         elif token.type == QueryType.WILDCARD:
-            # Convert wildcard to fuzzy search
-            return self.indexer.search(token.value, fuzzy=True)
+            return self.indexer.search_wildcard(token.pattern or f"{token.value}*")
         
         elif token.type == QueryType.FUZZY:
-            return self.indexer.search(token.value, fuzzy=True)
+            return self.indexer.search(token.value, fuzzy=True,
+                                       max_distance=self._fuzzy_distance(token))
         
         else:
             # Default to simple search
             return self.indexer.search(token.value, fuzzy=query.fuzzy_enabled)
     
+    def _fuzzy_distance(self, token: QueryToken, default: int = 2) -> int:
+        """Edit distance from a ``~N`` modifier."""
+        if token.modifier and token.modifier.startswith('~'):
+            try:
+                return int(token.modifier[1:])
+            except ValueError:
+                pass
+        return default
+    
     def _apply_filters(self, element_ids: Set[str], filters: Dict[str, Any]) -> Set[str]:
         """Apply additional filters to search results."""
         if not filters:
@@ -382,10 +433,12 @@ class IndexedSearchEngine(SearchEngine):
         
         return results
     
-    def _create_search_result(self, element: Element, query: SearchQuery, options: Dict[str, Any]) -> SearchResult:
+    def _create_search_result(self, element: Element, query: SearchQuery, options: Dict[str, Any],
+                              score: Optional[float] = None) -> SearchResult:
         """Create a single SearchResult."""
-        # Calculate base score
-        score = self._calculate_base_score(element, query)
+        # Calculate base score unless the index already ranked the element
+        if score is None:
+            score = self._calculate_base_score(element, query)
         
         # Create match info
         match_info = self._create_match_info(element, query)
@@ -407,35 +460,27 @@ class IndexedSearchEngine(SearchEngine):
         """Calculate base relevance score for element."""
         score = 0.0
         
-        # Text relevance scoring
+        # Text relevance scoring (BM25 over the indexed term frequencies)
         text_terms = query.get_text_terms()
-        if text_terms and element.text:
-            text_lower = element.text.lower()
-            for term in text_terms:
-                term_lower = term.lower()
-                # Count occurrences
-                count = text_lower.count(term_lower)
-                if count > 0:
-                    # TF-IDF inspired scoring
-                    tf = count / len(text_lower.split())
-                    score += tf * 10  # Base multiplier
+        if text_terms:
+            score += self.indexer.score_element(element.element_id, " ".join(text_terms))
+        
+        confidence = element.metadata.confidence if element.metadata else None
+        return score + self._static_score(element.element_type, confidence)
+    
+    def _static_score(self, element_type: ElementType, confidence: Optional[float]) -> float:
+        """Query-independent part of the relevance score."""
+        score = self.TYPE_BONUSES.get(element_type, 1.0)
         
         # Confidence bonus
-        if element.metadata and element.metadata.confidence:
-            score += element.metadata.confidence * 5
-        
-        # Element type bonus (some types might be more relevant)
-        type_bonuses = {
-            ElementType.TITLE: 3.0,
-            ElementType.HEADER: 2.0,
-            ElementType.NARRATIVE_TEXT: 1.0,
-            ElementType.TABLE: 1.5,
-            ElementType.LIST: 1.2
-        }
-        score += type_bonuses.get(element.element_type, 1.0)
+        if confidence:
+            score += confidence * self.CONFIDENCE_WEIGHT
         
         return score
     
+    def _entry_static_score(self, entry: IndexEntry) -> float:
+        return self._static_score(entry.element_type, entry.metadata_fields.get('confidence'))
+    
     def _create_match_info(self, element: Element, query: SearchQuery) -> Dict[str, Any]:
         """Create match information for result."""
         match_info = {}
@@ -4,19 +4,24 @@ Search Indexing System for Element Management
 Provides high-performance search indexing with real-time updates and fuzzy matching.
 """
 
+import os
 import time
 import uuid
-from typing import Dict, List, Set, Optional, Any, Tuple
+import heapq
+from typing import Dict, List, Set, FrozenSet, Optional, Any, Tuple, Callable, Iterable, Iterator, Mapping, Sequence, Union
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import Counter, defaultdict
 from enum import Enum
+from pathlib import Path
 import re
 import hashlib
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import threading
 
 from ....core.models.element import Element, ElementType
 from ....core.state.store import StateStore
+from .postings import BM25, PostingList, intersect, top_k_conjunctive, top_k_max_score, union
+from .term_dictionary import TermDictionary
 
 
 class IndexStrategy(Enum):
@@ -39,6 +44,8 @@ class IndexEntry:
     page_number: Optional[int] = None
     languages: List[str] = field(default_factory=list)
     last_modified: float = field(default_factory=time.time)
+    doc_id: int = -1  # dense id used in posting lists
+    length: int = 0  # number of term occurrences, for BM25 length normalization
     
     def matches_term(self, term: str, fuzzy: bool = False) -> bool:
         """Check if entry matches search term."""
@@ -86,13 +93,67 @@ class IndexStatistics:
     most_common_terms: List[Tuple[str, int]] = field(default_factory=list)
 
 
+@dataclass
+class RankedResults:
+    """Top-k hits of a ranked search."""
+    hits: List[Tuple[str, float]] = field(default_factory=list)  # (element_id, score), best first
+    total_count: Optional[int] = None  # None when pruning skipped matches without counting them
+
+
+class _TermIndexView(Mapping):
+    """Read-only ``term -> element ids`` view decoded from the posting lists."""
+    
+    def __init__(self, index: 'SearchIndex'):
+        self._index = index
+    
+    def __getitem__(self, term: str) -> FrozenSet[str]:
+        postings = self._index.postings[term]
+        docs = self._index._docs
+        return frozenset(docs[doc_id].element_id for doc_id, _ in postings
+                         if docs[doc_id] is not None)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.postings)
+    
+    def __len__(self) -> int:
+        return len(self._index.postings)
+    
+    def __contains__(self, term: object) -> bool:
+        return term in self._index.postings
+
+
 class SearchIndex:
-    """High-performance search index for document elements."""
+    """High-performance search index for document elements.
+    
+    Elements get dense integer doc ids in insertion order and every term maps
+    to a compressed :class:`PostingList` of (doc id, term frequency) pairs.
+    Removed elements leave a tombstone in ``_docs``; their postings are
+    dropped when a list becomes mostly dead or when the doc ids are compacted.
+    """
+    
+    # BM25 parameters
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    
+    # Renumber doc ids once this many (and at least half of them) are tombstones
+    COMPACT_MIN_DEAD_DOCS = 1024
+    
+    # Intersections probe a list through skip entries instead of decoding it
+    # when it is this many times longer than the current candidates
+    SKIP_PROBE_RATIO = 16
+    
+    # Elements per partial index in bulk_load workers
+    BULK_CHUNK_SIZE = 2000
     
     def __init__(self, strategy: IndexStrategy = IndexStrategy.BALANCED):
         self.strategy = strategy
         self.entries: Dict[str, IndexEntry] = {}
-        self.term_index: Dict[str, Set[str]] = defaultdict(set)  # term -> element_ids
+        self.postings: Dict[str, PostingList] = {}  # term -> (doc_id, tf) postings
+        self._docs: List[Optional[IndexEntry]] = []  # doc_id -> entry, None once removed
+        self._dead_docs = 0
+        self._total_length = 0
+        self._distinct_term_total = 0
+        self.term_dictionary = TermDictionary()  # distinct terms for fuzzy/prefix/wildcard lookup
         self.type_index: Dict[ElementType, Set[str]] = defaultdict(set)  # type -> element_ids
         self.page_index: Dict[int, Set[str]] = defaultdict(set)  # page -> element_ids
         self.confidence_ranges: Dict[Tuple[float, float], Set[str]] = {}  # confidence range -> element_ids
@@ -106,6 +167,11 @@ class SearchIndex:
         # Configuration based on strategy
         self._configure_strategy()
     
+    @property
+    def term_index(self) -> Mapping[str, FrozenSet[str]]:
+        """Read-only ``term -> element ids`` mapping."""
+        return _TermIndexView(self)
+    
     def _configure_strategy(self) -> None:
         """Configure index based on optimization strategy."""
         if self.strategy == IndexStrategy.SPEED:
@@ -136,52 +202,149 @@ class SearchIndex:
             if element.element_id in self.entries:
                 self.remove_element(element.element_id)
             
-            # Extract searchable terms
-            terms = self._extract_terms(element)
-            
-            # Create metadata fields
-            metadata_fields = {}
-            if element.metadata:
-                metadata_fields = {
-                    'confidence': element.metadata.confidence,
-                    'detection_method': element.metadata.detection_method,
-                    'page_number': element.metadata.page_number,
-                    'languages': element.metadata.languages,
-                    'custom_fields': element.metadata.custom_fields
-                }
+            self._insert(*self._analyze(element))
             
-            # Create index entry
-            entry = IndexEntry(
-                element_id=element.element_id,
-                element_type=element.element_type,
-                terms=terms,
-                text_content=element.text,
-                metadata_fields=metadata_fields,
-                confidence=element.metadata.confidence if element.metadata else 1.0,
-                page_number=element.metadata.page_number if element.metadata else None,
-                languages=element.metadata.languages if element.metadata else []
-            )
-            
-            # Add to main index
-            self.entries[element.element_id] = entry
-            
-            # Update term index
-            for term in terms:
-                self.term_index[term].add(element.element_id)
-            
-            # Update type index
-            self.type_index[element.element_type].add(element.element_id)
+            # Update statistics
+            self._update_statistics()
+    
+    def add_elements(self, elements: Iterable[Element]) -> int:
+        """Add or update many elements under one lock acquisition.
+        
+        Statistics are updated once for the whole batch. Returns the number
+        of elements added.
+        """
+        count = 0
+        with self._lock:
+            for element in elements:
+                if element.element_id in self.entries:
+                    self.remove_element(element.element_id)
+                self._insert(*self._analyze(element))
+                count += 1
+            self._update_statistics()
+        return count
+    
+    def bulk_load(self, elements: Sequence[Element], workers: Optional[int] = None,
+                  chunk_size: Optional[int] = None) -> int:
+        """Index many elements, tokenizing them in a process pool.
+        
+        Each worker builds a partial index over a chunk of ``elements``; the
+        partial indexes are merged in chunk order, so doc ids and the
+        last-wins handling of repeated element ids match :meth:`add_elements`.
+        Small inputs, or ``workers`` of 1, are indexed in this process.
+        
+        Args:
+            elements: Elements to index
+            workers: Worker processes, defaults to the CPU count
+            chunk_size: Elements per partial index, defaults to ``BULK_CHUNK_SIZE``
+        
+        Returns:
+            Number of elements indexed
+        """
+        workers = workers or os.cpu_count() or 1
+        chunk_size = chunk_size or self.BULK_CHUNK_SIZE
+        if workers <= 1 or len(elements) <= chunk_size:
+            return self.add_elements(elements)
+        
+        chunks = [elements[i:i + chunk_size] for i in range(0, len(elements), chunk_size)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            partials = pool.map(_build_partial_index, [self.strategy] * len(chunks), chunks)
+            for entries, postings in partials:
+                self.merge_partial(entries, postings)
+        return len(elements)
+    
+    def merge_partial(self, entries: List[IndexEntry], postings: Dict[str, PostingList]) -> None:
+        """Append a partial index built by :meth:`doc_snapshot` of another index.
+        
+        The partial's doc ids are shifted past ours and its posting lists are
+        appended to ours. Elements present in both are replaced.
+        """
+        with self._lock:
+            for entry in entries:
+                if entry.element_id in self.entries:
+                    self.remove_element(entry.element_id)
             
-            # Update page index
-            if entry.page_number is not None:
-                self.page_index[entry.page_number].add(element.element_id)
+            # Removals may compact doc ids, so take the offset afterwards
+            offset = len(self._docs)
+            for entry in entries:
+                entry.doc_id += offset
+                self.entries[entry.element_id] = entry
+                self._docs.append(entry)
+                self._total_length += entry.length
+                self._distinct_term_total += len(entry.terms)
+                self.type_index[entry.element_type].add(entry.element_id)
+                if entry.page_number is not None:
+                    self.page_index[entry.page_number].add(entry.element_id)
+                self._update_confidence_index(entry.element_id, entry.confidence)
             
-            # Update confidence ranges
-            self._update_confidence_index(element.element_id, entry.confidence)
+            new_terms = []
+            for term, partial in postings.items():
+                existing = self.postings.get(term)
+                if existing is None:
+                    existing = self.postings[term] = PostingList()
+                    new_terms.append(term)
+                existing.extend(partial, offset)
+            self.term_dictionary.update(new_terms)
             
-            # Update statistics
             self._update_statistics()
     
+    def _analyze(self, element: Element) -> Tuple[IndexEntry, Dict[str, int]]:
+        """Build the index entry and term frequencies of an element."""
+        # Extract searchable terms
+        frequencies = self._extract_term_frequencies(element)
+        
+        # Create metadata fields
+        metadata_fields = {}
+        if element.metadata:
+            metadata_fields = {
+                'confidence': element.metadata.confidence,
+                'detection_method': element.metadata.detection_method,
+                'page_number': element.metadata.page_number,
+                'languages': element.metadata.languages,
+                'custom_fields': element.metadata.custom_fields
+            }
+        
+        # Create index entry
+        entry = IndexEntry(
+            element_id=element.element_id,
+            element_type=element.element_type,
+            terms=set(frequencies),
+            text_content=element.text,
+            metadata_fields=metadata_fields,
+            confidence=element.metadata.confidence if element.metadata else 1.0,
+            page_number=element.metadata.page_number if element.metadata else None,
+            languages=element.metadata.languages if element.metadata else [],
+            length=sum(frequencies.values())
+        )
+        return entry, frequencies
+    
+    def _insert(self, entry: IndexEntry, frequencies: Dict[str, int]) -> None:
+        """Add an analyzed element under the next doc id; the caller holds the lock."""
+        entry.doc_id = len(self._docs)
+        
+        # Add to main index
+        self.entries[entry.element_id] = entry
+        self._docs.append(entry)
+        self._total_length += entry.length
+        self._distinct_term_total += len(entry.terms)
+        
+        # Update postings; doc ids only grow, so appends keep them sorted
+        for term, tf in frequencies.items():
+            postings = self.postings.get(term)
+            if postings is None:
+                postings = self.postings[term] = PostingList()
+                self.term_dictionary.add(term)
+            postings.append(entry.doc_id, tf)
+        
+        # Update type index
+        self.type_index[entry.element_type].add(entry.element_id)
+        
+        # Update page index
+        if entry.page_number is not None:
+            self.page_index[entry.page_number].add(entry.element_id)
+        
+        # Update confidence ranges
+        self._update_confidence_index(entry.element_id, entry.confidence)
+    
     def remove_element(self, element_id: str) -> bool:
         """Remove element from index."""
         with self._lock:
@@ -190,11 +353,19 @@ class SearchIndex:
             
             entry = self.entries[element_id]
             
-            # Remove from term index
+            # Tombstone the doc id and update postings
+            self._docs[entry.doc_id] = None
+            self._dead_docs += 1
+            self._total_length -= entry.length
+            self._distinct_term_total -= len(entry.terms)
             for term in entry.terms:
-                self.term_index[term].discard(element_id)
-                if not self.term_index[term]:
-                    del self.term_index[term]
+                postings = self.postings[term]
+                postings.live -= 1
+                if not postings.live:
+                    del self.postings[term]
+                    self.term_dictionary.remove(term)
+                elif postings.dead > postings.live:
+                    self.postings[term] = postings.remapped(self._live_doc_id)
             
             # Remove from type index
             self.type_index[entry.element_type].discard(element_id)
@@ -213,44 +384,184 @@ class SearchIndex:
             # Remove main entry
             del self.entries[element_id]
             
+            if (self._dead_docs >= self.COMPACT_MIN_DEAD_DOCS and
+                    self._dead_docs * 2 >= len(self._docs)):
+                self._compact_doc_ids()
+            
             # Update statistics
             self._update_statistics()
             return True
     
-    def search_text(self, query: str, fuzzy: bool = False) -> Set[str]:
-        """Search for elements by text content."""
+    def search_text(self, query: str, fuzzy: bool = False, max_distance: int = 2) -> Set[str]:
+        """Search for elements by text content.
+
+        Fuzzy terms are first resolved to the indexed terms within
+        ``max_distance`` edits, then mapped to their postings. Posting lists
+        are intersected smallest first.
+        """
         with self._lock:
-            if not query:
+            term_postings = self._query_postings(query, fuzzy, max_distance)
+            if not term_postings:
                 return set()
             
-            query_terms = self._extract_query_terms(query)
-            if not query_terms:
-                return set()
+            docs = self._docs
+            return {docs[doc_id].element_id for doc_id in self._intersect(term_postings)}
+    
+    def search_ranked(self, query: str, k: int = 50, fuzzy: bool = False, max_distance: int = 2,
+                      match_all: bool = True,
+                      prior: Optional[Callable[[IndexEntry], float]] = None,
+                      prior_bound: float = 0.0) -> RankedResults:
+        """Return the ``k`` best elements for ``query`` by BM25 score.
+        
+        Args:
+            query: Query text, tokenized like ``search_text``
+            k: Number of hits to return
+            fuzzy: Resolve query terms fuzzily
+            max_distance: Edit distance for fuzzy terms
+            match_all: Require every term (as ``search_text``); otherwise
+                any term matches and MaxScore skips documents that cannot
+                reach the current top-k
+            prior: Query-independent score added to every hit
+            prior_bound: Upper bound of ``prior``, used for pruning
+        
+        Only the top-k heap is kept; the full match set is never built.
+        """
+        with self._lock:
+            term_postings = self._query_postings(query, fuzzy, max_distance, match_all)
+            if not term_postings or k <= 0:
+                return RankedResults(total_count=0)
             
-            # Find matching elements for each term
-            matching_sets = []
-            for term in query_terms:
-                term_matches = set()
-                
-                if fuzzy and self.enable_fuzzy:
-                    # Fuzzy search - check all entries
-                    for entry in self.entries.values():
-                        if entry.matches_term(term, fuzzy=True):
-                            term_matches.add(entry.element_id)
-                else:
-                    # Exact search using index
-                    term_matches = self.term_index.get(term.lower(), set()).copy()
-                
-                matching_sets.append(term_matches)
+            bm25 = self._bm25()
+            idfs = [bm25.idf(postings.live) for postings in term_postings]
+            docs = self._docs
+            doc_length = lambda doc_id: docs[doc_id].length
+            doc_prior = (lambda doc_id: prior(docs[doc_id])) if prior is not None else None
             
-            # Intersect all term matches (AND operation)
-            if matching_sets:
-                result = matching_sets[0]
-                for match_set in matching_sets[1:]:
-                    result = result.intersection(match_set)
-                return result
+            if match_all:
+                heap, total = top_k_conjunctive(term_postings, idfs, bm25, k, doc_length, doc_prior,
+                                                self._is_live, self.SKIP_PROBE_RATIO)
+            else:
+                heap, total = top_k_max_score(term_postings, idfs, bm25, k, doc_length, doc_prior,
+                                              prior_bound, self._is_live)
             
-            return set()
+            hits = [(docs[doc_id].element_id, score)
+                    for score, doc_id in sorted(heap, key=lambda hit: (-hit[0], hit[1]))]
+            return RankedResults(hits=hits, total_count=total)
+    
+    def score_element(self, element_id: str, query: str) -> float:
+        """BM25 score of a single element for ``query``."""
+        with self._lock:
+            entry = self.entries.get(element_id)
+            if entry is None:
+                return 0.0
+            
+            score = 0.0
+            bm25 = self._bm25()
+            for term in self._extract_query_terms(query):
+                postings = self.postings.get(term)
+                if postings is not None:
+                    tf = postings.frequency(entry.doc_id)
+                    if tf:
+                        score += bm25.score(bm25.idf(postings.live), tf, entry.length)
+            return score
+    
+    def search_prefix(self, prefix: str) -> Set[str]:
+        """Search for elements containing a term that starts with ``prefix``."""
+        with self._lock:
+            if not prefix:
+                return set()
+            return self._postings_union(self.term_dictionary.prefix(prefix.lower()))
+    
+    def search_wildcard(self, pattern: str) -> Set[str]:
+        """Search for elements containing a term matching a ``*``/``?`` pattern.
+
+        Patterns are matched against indexed terms as written (lowercased,
+        not stemmed).
+        """
+        with self._lock:
+            if not pattern.strip('*?'):
+                return set()
+            return self._postings_union(self.term_dictionary.wildcard(pattern.lower()))
+    
+    def _postings_union(self, terms) -> Set[str]:
+        """Union of the element ids indexed under ``terms``."""
+        doc_ids = set()
+        for term in terms:
+            postings = self.postings.get(term)
+            if postings is not None:
+                doc_ids.update(postings.decode()[0])
+        docs = self._docs
+        return {docs[doc_id].element_id for doc_id in doc_ids if docs[doc_id] is not None}
+    
+    def _query_postings(self, query: str, fuzzy: bool, max_distance: int,
+                        match_all: bool = True) -> List[PostingList]:
+        """Posting list per query term.
+        
+        With ``match_all`` an empty list is returned as soon as one term has
+        no postings, since the conjunction cannot match.
+        """
+        if not query:
+            return []
+        
+        term_postings = []
+        for term in self._extract_query_terms(query):
+            if fuzzy and self.enable_fuzzy:
+                # Resolve candidate terms, then merge their postings
+                candidates = self.term_dictionary.fuzzy(term, max_distance)
+                postings = self._merge_postings([self.postings[candidate] for candidate in candidates])
+            else:
+                postings = self.postings.get(term)
+            
+            if postings is not None and postings.live:
+                term_postings.append(postings)
+            elif match_all:
+                return []
+        return term_postings
+    
+    def _merge_postings(self, lists: List[PostingList]) -> Optional[PostingList]:
+        """Union of several posting lists, summing term frequencies."""
+        return union(lists, self._is_live)
+    
+    def _intersect(self, term_postings: List[PostingList]) -> List[int]:
+        """Sorted live doc ids present in every posting list."""
+        return intersect(term_postings, self._is_live, self.SKIP_PROBE_RATIO)
+    
+    def _bm25(self) -> BM25:
+        """BM25 scorer for the current collection statistics."""
+        return BM25(len(self.entries), self._total_length, self.BM25_K1, self.BM25_B)
+    
+    def _is_live(self, doc_id: int) -> bool:
+        return self._docs[doc_id] is not None
+    
+    def _live_doc_id(self, doc_id: int) -> Optional[int]:
+        return doc_id if self._docs[doc_id] is not None else None
+    
+    def doc_snapshot(self) -> Tuple[List[IndexEntry], Dict[str, PostingList]]:
+        """Live entries indexed by dense doc id, with their posting lists.
+        
+        Compacts doc ids first, so the result can be written as a segment.
+        """
+        with self._lock:
+            if self._dead_docs:
+                self._compact_doc_ids()
+            return list(self._docs), dict(self.postings)
+    
+    def _compact_doc_ids(self) -> None:
+        """Renumber live documents densely and rebuild every posting list."""
+        remap: List[Optional[int]] = []
+        live_docs: List[Optional[IndexEntry]] = []
+        for entry in self._docs:
+            if entry is None:
+                remap.append(None)
+            else:
+                remap.append(len(live_docs))
+                entry.doc_id = len(live_docs)
+                live_docs.append(entry)
+        
+        self.postings = {term: postings.remapped(remap.__getitem__)
+                         for term, postings in self.postings.items()}
+        self._docs = live_docs
+        self._dead_docs = 0
     
     def search_by_type(self, element_types: Set[ElementType]) -> Set[str]:
         """Search for elements by type."""
@@ -283,21 +594,16 @@ class SearchIndex:
             if len(partial_query) < self.min_term_length:
                 return []
             
-            partial_lower = partial_query.lower()
-            suggestions = []
-            
-            # Find terms starting with partial query
-            for term in self.term_index:
-                if term.startswith(partial_lower):
-                    suggestions.append(term)
-                    if len(suggestions) >= limit:
-                        break
-            
-            return sorted(suggestions)
+            # Terms starting with the partial query, already sorted
+            return list(self.term_dictionary.prefix(partial_query.lower(), limit))
     
     def _extract_terms(self, element: Element) -> Set[str]:
         """Extract searchable terms from element."""
-        terms = set()
+        return set(self._extract_term_frequencies(element))
+    
+    def _extract_term_frequencies(self, element: Element) -> Dict[str, int]:
+        """Extract searchable terms from element with their occurrence counts."""
+        terms = Counter()
         
         # Extract from text content
         if element.text:
@@ -308,21 +614,21 @@ class SearchIndex:
         if element.metadata:
             # Add detection method
             if element.metadata.detection_method:
-                terms.add(element.metadata.detection_method.lower())
+                terms[element.metadata.detection_method.lower()] += 1
             
             # Add languages
             for lang in element.metadata.languages:
-                terms.add(f"lang:{lang.lower()}")
+                terms[f"lang:{lang.lower()}"] += 1
             
             # Add custom fields
             for key, value in element.metadata.custom_fields.items():
                 if isinstance(value, str):
-                    terms.add(f"{key}:{value.lower()}")
+                    terms[f"{key}:{value.lower()}"] += 1
                 elif isinstance(value, (int, float)):
-                    terms.add(f"{key}:{str(value)}")
+                    terms[f"{key}:{str(value)}"] += 1
         
         # Add element type
-        terms.add(f"type:{element.element_type.value.lower()}")
+        terms[f"type:{element.element_type.value.lower()}"] += 1
         
         return terms
     
@@ -388,18 +694,15 @@ class SearchIndex:
     def _update_statistics(self) -> None:
         """Update index statistics."""
         self.statistics.total_elements = len(self.entries)
-        self.statistics.total_terms = len(self.term_index)
+        self.statistics.total_terms = len(self.postings)
         self.statistics.last_update = time.time()
         self.statistics.update_count += 1
         
         # Calculate average terms per element
         if self.statistics.total_elements > 0:
-            total_terms_in_elements = sum(len(entry.terms) for entry in self.entries.values())
-            self.statistics.average_terms_per_element = total_terms_in_elements / self.statistics.total_elements
-        
-        # Calculate most common terms
-        term_counts = [(term, len(element_ids)) for term, element_ids in self.term_index.items()]
-        self.statistics.most_common_terms = sorted(term_counts, key=lambda x: x[1], reverse=True)[:10]
+            self.statistics.average_terms_per_element = (
+                self._distinct_term_total / self.statistics.total_elements
+            )
     
     def get_element_count(self) -> int:
         """Get total number of indexed elements."""
@@ -407,30 +710,63 @@ class SearchIndex:
     
     def get_term_count(self) -> int:
         """Get total number of indexed terms."""
-        return len(self.term_index)
+        return len(self.postings)
     
     def get_statistics(self) -> IndexStatistics:
         """Get index statistics."""
-        return self.statistics
+        with self._lock:
+            # Whole-index aggregates are computed on demand rather than per update
+            self.statistics.index_size_bytes = sum(postings.nbytes for postings in self.postings.values())
+            self.statistics.most_common_terms = heapq.nlargest(
+                10, ((term, postings.live) for term, postings in self.postings.items()),
+                key=lambda item: item[1]
+            )
+            return self.statistics
     
     def clear(self) -> None:
         """Clear all index data."""
         with self._lock:
             self.entries.clear()
-            self.term_index.clear()
+            self.postings.clear()
+            self._docs.clear()
+            self._dead_docs = 0
+            self._total_length = 0
+            self._distinct_term_total = 0
+            self.term_dictionary.clear()
             self.type_index.clear()
             self.page_index.clear()
             self.confidence_ranges.clear()
             self.statistics = IndexStatistics()
 
 
+def _build_partial_index(strategy: IndexStrategy,
+                         elements: List[Element]) -> Tuple[List[IndexEntry], Dict[str, PostingList]]:
+    """Index ``elements`` into a fresh index; runs in :meth:`SearchIndex.bulk_load` workers."""
+    index = SearchIndex(strategy)
+    index.add_elements(elements)
+    return index.doc_snapshot()
+
+
 class ElementIndexer:
     """Manages search indexing for document elements with real-time updates."""
     
-    def __init__(self, state_store: StateStore, strategy: IndexStrategy = IndexStrategy.BALANCED):
+    def __init__(self, state_store: StateStore, strategy: IndexStrategy = IndexStrategy.BALANCED,
+                 index_directory: Optional[Union[str, Path]] = None):
+        """Create indexer.
+        
+        Args:
+            state_store: Store whose elements are indexed
+            strategy: Indexing strategy
+            index_directory: Keep the index on disk in this directory as
+                memory-mapped segments; reopening it skips the initial indexing
+        """
         self.state_store = state_store
         self.strategy = strategy
-        self.search_index = SearchIndex(strategy)
+        if index_directory is not None:
+            from .segments import SegmentedSearchIndex
+            self.search_index = SegmentedSearchIndex(index_directory, strategy)
+        else:
+            self.search_index = SearchIndex(strategy)
         
         # Background processing
         self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="indexer")
@@ -453,6 +789,10 @@ class ElementIndexer:
     
     def _perform_initial_indexing(self) -> None:
         """Perform initial indexing of all elements."""
+        if self.search_index.get_element_count():
+            # Persistent index reopened; later changes arrive via the subscription
+            return
+        
         state = self.state_store.get_state()
         elements = state.get('elements', {})
         
@@ -486,9 +826,25 @@ class ElementIndexer:
         for element in elements:
             self.search_index.add_element(element)
     
-    def search(self, query: str, fuzzy: bool = False) -> Set[str]:
+    def search(self, query: str, fuzzy: bool = False, max_distance: int = 2) -> Set[str]:
         """Search for elements by text."""
-        return self.search_index.search_text(query, fuzzy)
+        return self.search_index.search_text(query, fuzzy, max_distance)
+    
+    def search_ranked(self, query: str, k: int = 50, **options) -> RankedResults:
+        """Search for the top-k elements by BM25 score."""
+        return self.search_index.search_ranked(query, k, **options)
+    
+    def score_element(self, element_id: str, query: str) -> float:
+        """BM25 score of an element for a query."""
+        return self.search_index.score_element(element_id, query)
+    
+    def search_prefix(self, prefix: str) -> Set[str]:
+        """Search for elements by term prefix."""
+        return self.search_index.search_prefix(prefix)
+    
+    def search_wildcard(self, pattern: str) -> Set[str]:
+        """Search for elements by wildcard pattern."""
+        return self.search_index.search_wildcard(pattern)
     
     def search_by_type(self, element_types: Set[ElementType]) -> Set[str]:
         """Search for elements by type."""
@@ -518,6 +874,13 @@ class ElementIndexer:
         """Get indexing statistics."""
         return self.search_index.get_statistics()
     
+    def flush(self) -> None:
+        """Make indexed changes durable (persistent indexes only)."""
+        if hasattr(self.search_index, 'commit'):
+            self.search_index.commit()
+    
     def shutdown(self) -> None:
         """Shutdown the indexer."""
-        self.executor.shutdown(wait=True)
\ No newline at end of file
+        self.executor.shutdown(wait=True)
+        if hasattr(self.search_index, 'close'):
+            self.search_index.close()
\ No newline at end of file
@@ -0,0 +1,483 @@
+"""
+Compressed Posting Lists
+
+A posting list holds the documents containing one term as (doc id, term
+frequency) pairs in increasing doc id order. Doc ids are the dense integers
+assigned by the search index; they are delta-encoded and written together
+with the frequency as varints, so a typical posting takes two or three bytes.
+
+Every ``SKIP_INTERVAL`` postings a skip entry records where the block starts,
+letting cursors jump ahead during intersections without decoding the
+postings in between.
+
+The intersection and BM25 top-k routines work on any posting lists, so the
+in-memory index and on-disk segments share them.
+"""
+
+import heapq
+import math
+import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+SKIP_INTERVAL = 64
+NO_MORE_DOCS = sys.maxsize
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytearray, offset: int) -> Tuple[int, int]:
+    """Decode a varint at ``offset``; returns (value, next offset)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _decode(data: bytearray, start: int, end: int, count: int, base: int) -> Tuple[List[int], List[int]]:
+    """Decode ``count`` postings in ``data[start:end]`` following doc id ``base``."""
+    if end - start == 2 * count:
+        # Every delta and frequency fits in one byte: decode with slices
+        docs = list(accumulate(data[start:end:2], initial=base))
+        del docs[0]
+        return docs, list(data[start + 1:end:2])
+
+    docs = []
+    tfs = []
+    doc_id = base
+    offset = start
+    while offset < end:
+        delta, offset = _read_varint(data, offset)
+        tf, offset = _read_varint(data, offset)
+        doc_id += delta
+        docs.append(doc_id)
+        tfs.append(tf)
+    return docs, tfs
+
+
+class PostingList:
+    """Delta/varint encoded postings of a single term.
+
+    Postings are append-only; deleted documents stay encoded until the list
+    is rebuilt with :meth:`remapped`. ``live`` counts the postings whose
+    document still exists and is maintained by the owning index.
+    """
+    __slots__ = ('_data', '_skips', '_count', 'last_doc', 'max_tf', 'live')
+
+    def __init__(self):
+        self._data = bytearray()
+        # (first doc id of block, byte offset of block, doc id preceding block)
+        self._skips: List[Tuple[int, int, int]] = []
+        self._count = 0
+        self.last_doc = -1
+        self.max_tf = 0
+        self.live = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def dead(self) -> int:
+        return self._count - self.live
+
+    @property
+    def nbytes(self) -> int:
+        """Encoded size of postings and skip entries."""
+        return len(self._data) + len(self._skips) * 3 * 8
+
+    @property
+    def block_count(self) -> int:
+        return len(self._skips)
+
+    def append(self, doc_id: int, tf: int = 1) -> None:
+        """Append a posting; ``doc_id`` must be greater than any doc id in the list."""
+        if doc_id <= self.last_doc:
+            raise ValueError(f"Doc id {doc_id} out of order (last {self.last_doc})")
+
+        if self._count % SKIP_INTERVAL == 0:
+            self._skips.append((doc_id, len(self._data), self.last_doc))
+        _write_varint(self._data, doc_id - self.last_doc)
+        _write_varint(self._data, tf)
+        self.last_doc = doc_id
+        self.max_tf = max(self.max_tf, tf)
+        self._count += 1
+        self.live += 1
+
+    def append_many(self, docs: List[int], tfs: List[int]) -> None:
+        """Append postings given as parallel lists of increasing doc ids and frequencies.
+
+        Equivalent to calling :meth:`append` for each pair, but encodes whole
+        blocks at once.
+        """
+        index = 0
+        # Complete the current block posting by posting
+        while index < len(docs) and self._count % SKIP_INTERVAL:
+            self.append(docs[index], tfs[index])
+            index += 1
+
+        for start in range(index, len(docs), SKIP_INTERVAL):
+            block_docs = docs[start:start + SKIP_INTERVAL]
+            block_tfs = tfs[start:start + SKIP_INTERVAL]
+            deltas = [doc_id - previous for previous, doc_id in zip([self.last_doc, *block_docs], block_docs)]
+            if min(deltas) <= 0:
+                raise ValueError(f"Doc ids out of order after {self.last_doc}")
+
+            self._skips.append((block_docs[0], len(self._data), self.last_doc))
+            if max(deltas) < 0x80 and max(block_tfs) < 0x80:
+                # One byte per delta and frequency: interleave them directly
+                encoded = bytearray(2 * len(deltas))
+                encoded[0::2] = bytes(deltas)
+                encoded[1::2] = bytes(block_tfs)
+                self._data += encoded
+            else:
+                for delta, tf in zip(deltas, block_tfs):
+                    _write_varint(self._data, delta)
+                    _write_varint(self._data, tf)
+            self._count += len(block_docs)
+            self.live += len(block_docs)
+            self.last_doc = block_docs[-1]
+            self.max_tf = max(self.max_tf, max(block_tfs))
+
+    def extend(self, other: 'PostingList', offset: int = 0) -> None:
+        """Append every posting of ``other`` with its doc ids shifted by ``offset``.
+
+        When this list ends on a block boundary the encoded bytes of ``other``
+        are copied as they are; only its first delta is re-encoded.
+        """
+        if not other._count:
+            return
+        first_doc = other._skips[0][0] + offset
+        if first_doc <= self.last_doc:
+            raise ValueError(f"Doc id {first_doc} out of order (last {self.last_doc})")
+
+        if self._count % SKIP_INTERVAL:
+            docs, tfs = other.decode()
+            self.append_many([doc_id + offset for doc_id in docs], tfs)
+            return
+
+        # Re-encode the first posting against our last doc id, copy the rest
+        first_tf_offset = _read_varint(other._data, 0)[1]
+        rest = _read_varint(other._data, first_tf_offset)[1]
+        head = bytearray()
+        _write_varint(head, first_doc - self.last_doc)
+        head += other._data[first_tf_offset:rest]
+        shift = len(self._data) + len(head) - rest
+
+        base = len(self._data)
+        self._skips.append((first_doc, base, self.last_doc))
+        self._skips.extend((doc_id + offset, position + shift, previous + offset)
+                           for doc_id, position, previous in other._skips[1:])
+        self._data += head
+        self._data += other._data[rest:]
+        self._count += other._count
+        self.live += other.live
+        self.last_doc = other.block(len(other._skips) - 1)[0][-1] + offset
+        self.max_tf = max(self.max_tf, other.max_tf)
+
+    def block(self, index: int) -> Tuple[List[int], List[int]]:
+        """Decode skip block ``index`` into doc ids and term frequencies."""
+        _, start, base = self._skips[index]
+        end = self._skips[index + 1][1] if index + 1 < len(self._skips) else len(self._data)
+        count = min(SKIP_INTERVAL, self._count - index * SKIP_INTERVAL)
+        return _decode(self._data, start, end, count, base)
+
+    def decode(self) -> Tuple[List[int], List[int]]:
+        """Decode the whole list into doc ids and term frequencies."""
+        return _decode(self._data, 0, len(self._data), self._count, -1)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(*self.decode())
+
+    def cursor(self, is_live: Optional[Callable[[int], bool]] = None) -> 'PostingCursor':
+        return PostingCursor(self, is_live)
+
+    def frequency(self, doc_id: int) -> int:
+        """Term frequency of ``doc_id``, 0 when it is not in the list."""
+        cursor = PostingCursor(self)
+        return cursor.tf if cursor.advance(doc_id) == doc_id else 0
+
+    def remapped(self, remap: Callable[[int], Optional[int]]) -> 'PostingList':
+        """Rebuild the list with doc ids passed through ``remap``.
+
+        Postings mapped to None are dropped; ``remap`` must preserve order.
+        """
+        docs = []
+        tfs = []
+        for doc_id, tf in self:
+            new_id = remap(doc_id)
+            if new_id is not None:
+                docs.append(new_id)
+                tfs.append(tf)
+        postings = PostingList()
+        postings.append_many(docs, tfs)
+        return postings
+
+    def encoded(self) -> Tuple[bytes, List[Tuple[int, int, int]]]:
+        """Encoded postings and skip entries, as stored by :meth:`from_buffer`."""
+        return bytes(self._data), list(self._skips)
+
+    @classmethod
+    def from_pairs(cls, pairs: List[Tuple[int, int]]) -> 'PostingList':
+        """Build a list from (doc id, tf) pairs sorted by doc id."""
+        postings = cls()
+        if pairs:
+            docs, tfs = zip(*pairs)
+            postings.append_many(list(docs), list(tfs))
+        return postings
+
+    @classmethod
+    def from_buffer(cls, data: bytes, skips: List[Tuple[int, int, int]],
+                    count: int, max_tf: int) -> 'PostingList':
+        """Read-only list over already encoded postings, e.g. from a segment file."""
+        postings = cls.__new__(cls)
+        postings._data = data
+        postings._skips = skips
+        postings._count = count
+        postings.last_doc = NO_MORE_DOCS  # nothing can be appended
+        postings.max_tf = max_tf
+        postings.live = count
+        return postings
+
+
+class PostingCursor:
+    """Forward-only iterator over a posting list supporting skips.
+
+    ``doc`` is the current doc id (``NO_MORE_DOCS`` when exhausted) and
+    ``tf`` its term frequency. Postings are decoded one skip block at a
+    time; postings rejected by ``is_live`` are passed over.
+    """
+    __slots__ = ('postings', 'doc', 'tf', '_block', '_docs', '_tfs', '_pos', '_is_live')
+
+    def __init__(self, postings: PostingList, is_live: Optional[Callable[[int], bool]] = None):
+        self.postings = postings
+        self.doc = -1
+        self.tf = 0
+        self._block = -1
+        self._docs: List[int] = []
+        self._tfs: List[int] = []
+        self._pos = 0
+        self._is_live = is_live
+        self.next()
+
+    def _load(self, block: int) -> None:
+        self._block = block
+        self._docs, self._tfs = self.postings.block(block)
+        self._pos = 0
+
+    def next(self) -> int:
+        """Move to the next live posting and return its doc id."""
+        while True:
+            if self._pos >= len(self._docs):
+                if self._block + 1 >= self.postings.block_count:
+                    self.doc = NO_MORE_DOCS
+                    self.tf = 0
+                    return self.doc
+                self._load(self._block + 1)
+
+            doc_id = self._docs[self._pos]
+            self._pos += 1
+            if self._is_live is None or self._is_live(doc_id):
+                self.doc = doc_id
+                self.tf = self._tfs[self._pos - 1]
+                return doc_id
+
+    def advance(self, target: int) -> int:
+        """Move to the first live posting with doc id >= ``target``."""
+        if self.doc >= target:
+            return self.doc
+
+        if not self._docs or self._docs[-1] < target:
+            # Target is past the current block: jump with the skip entries
+            block = bisect_right(self.postings._skips, (target, NO_MORE_DOCS, NO_MORE_DOCS)) - 1
+            if block > self._block:
+                self._load(block)
+
+        self._pos = bisect_left(self._docs, target, self._pos)
+        return self.next()
+
+
+class BM25:
+    """BM25 scoring with collection statistics fixed for one query."""
+    __slots__ = ('k1', 'b', 'doc_count', 'average_length')
+
+    def __init__(self, doc_count: int, total_length: int, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.doc_count = doc_count
+        self.average_length = (total_length / doc_count if doc_count else 0.0) or 1.0
+
+    def idf(self, doc_freq: int) -> float:
+        return math.log(1.0 + (self.doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+    def score(self, idf: float, tf: int, length: int) -> float:
+        norm = 1.0 - self.b + self.b * length / self.average_length
+        return idf * tf * (self.k1 + 1.0) / (tf + self.k1 * norm)
+
+    def bound(self, idf: float, max_tf: int) -> float:
+        """Upper bound of :meth:`score` for any document length."""
+        return idf * max_tf * (self.k1 + 1.0) / (max_tf + self.k1 * (1.0 - self.b))
+
+
+def union(term_postings: List[PostingList],
+          is_live: Optional[Callable[[int], bool]] = None) -> Optional[PostingList]:
+    """Merge several posting lists into one, summing term frequencies."""
+    if not term_postings:
+        return None
+    if len(term_postings) == 1:
+        return term_postings[0]
+
+    merged: Dict[int, int] = defaultdict(int)
+    for postings in term_postings:
+        for doc_id, tf in postings:
+            if is_live is None or is_live(doc_id):
+                merged[doc_id] += tf
+    return PostingList.from_pairs(sorted(merged.items()))
+
+
+def intersect(term_postings: List[PostingList], is_live: Optional[Callable[[int], bool]] = None,
+              probe_ratio: int = 16) -> List[int]:
+    """Sorted live doc ids present in every posting list.
+
+    Lists are visited smallest first. A list more than ``probe_ratio`` times
+    longer than the current candidates is probed through its skip entries;
+    otherwise it is decoded and intersected as a set.
+    """
+    ordered = sorted(term_postings, key=len)
+    candidates = ordered[0].decode()[0]
+    if is_live is not None:
+        candidates = [doc_id for doc_id in candidates if is_live(doc_id)]
+
+    for postings in ordered[1:]:
+        if not candidates:
+            break
+        if len(postings) > probe_ratio * len(candidates):
+            cursor = postings.cursor()
+            candidates = [doc_id for doc_id in candidates if cursor.advance(doc_id) == doc_id]
+        else:
+            present = set(postings.decode()[0])
+            candidates = [doc_id for doc_id in candidates if doc_id in present]
+    return candidates
+
+
+def frequencies(postings: PostingList, doc_ids: List[int], probe_ratio: int = 16) -> List[int]:
+    """Term frequencies of sorted ``doc_ids``, all of which are in ``postings``."""
+    if len(postings) > probe_ratio * len(doc_ids):
+        cursor = postings.cursor()
+        result = []
+        for doc_id in doc_ids:
+            cursor.advance(doc_id)
+            result.append(cursor.tf)
+        return result
+    lookup = dict(zip(*postings.decode()))
+    return [lookup[doc_id] for doc_id in doc_ids]
+
+
+def top_k_conjunctive(term_postings: List[PostingList], idfs: List[float], bm25: BM25, k: int,
+                      doc_length: Callable[[int], int],
+                      prior: Optional[Callable[[int], float]] = None,
+                      is_live: Optional[Callable[[int], bool]] = None,
+                      probe_ratio: int = 16) -> Tuple[List[Tuple[float, int]], int]:
+    """Score every document matching all terms, keeping a size-k heap.
+
+    Returns (score, doc id) pairs in heap order and the number of matches.
+    """
+    matches = intersect(term_postings, is_live, probe_ratio)
+    columns = [frequencies(postings, matches, probe_ratio) for postings in term_postings]
+    heap: List[Tuple[float, int]] = []
+
+    for doc_id, tfs in zip(matches, zip(*columns)):
+        length = doc_length(doc_id)
+        score = sum(bm25.score(idf, tf, length) for idf, tf in zip(idfs, tfs))
+        if prior is not None:
+            score += prior(doc_id)
+        if len(heap) < k:
+            heapq.heappush(heap, (score, -doc_id))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -doc_id))
+    return [(score, -neg_doc) for score, neg_doc in heap], len(matches)
+
+
+def top_k_max_score(term_postings: List[PostingList], idfs: List[float], bm25: BM25, k: int,
+                    doc_length: Callable[[int], int],
+                    prior: Optional[Callable[[int], float]] = None,
+                    prior_bound: float = 0.0,
+                    is_live: Optional[Callable[[int], bool]] = None,
+                    threshold: float = -math.inf) -> Tuple[List[Tuple[float, int]], Optional[int]]:
+    """Disjunctive top-k with MaxScore pruning.
+
+    Terms are ordered by their score upper bound. Once the heap is full, the
+    lowest-bound terms whose bounds together cannot beat the k-th score
+    become non-essential: they no longer produce candidates and are only
+    probed for documents found through the essential terms. ``threshold``
+    lets a caller merging several indexes start from a known k-th score.
+
+    Returns (score, doc id) pairs in heap order and the number of matches,
+    or None for the count when pruning skipped documents.
+    """
+    bounds = [bm25.bound(idf, postings.max_tf) for idf, postings in zip(idfs, term_postings)]
+    order = sorted(range(len(term_postings)), key=bounds.__getitem__)
+    cursors = [term_postings[i].cursor(is_live) for i in order]
+    idfs = [idfs[i] for i in order]
+    # cumulative[i]: best possible score from terms 0..i plus the prior
+    cumulative = []
+    running = prior_bound
+    for i in order:
+        running += bounds[i]
+        cumulative.append(running)
+
+    heap: List[Tuple[float, int]] = []
+    first_essential = 0
+    total = 0
+    pruned = False
+
+    def drop_non_essential() -> None:
+        nonlocal first_essential, pruned
+        while first_essential < len(cursors) and cumulative[first_essential] <= threshold:
+            first_essential += 1
+            pruned = True
+
+    drop_non_essential()
+    while first_essential < len(cursors):
+        doc_id = min(cursor.doc for cursor in cursors[first_essential:])
+        if doc_id == NO_MORE_DOCS:
+            break
+
+        length = doc_length(doc_id)
+        score = prior(doc_id) if prior is not None else 0.0
+        for i in range(first_essential, len(cursors)):
+            cursor = cursors[i]
+            if cursor.doc == doc_id:
+                score += bm25.score(idfs[i], cursor.tf, length)
+                cursor.next()
+
+        for i in range(first_essential - 1, -1, -1):
+            if score + cumulative[i] - prior_bound <= threshold:
+                pruned = True
+                break
+            cursor = cursors[i]
+            if cursor.advance(doc_id) == doc_id:
+                score += bm25.score(idfs[i], cursor.tf, length)
+
+        total += 1
+        if len(heap) < k:
+            heapq.heappush(heap, (score, -doc_id))
+        elif score > heap[0][0]:
+            heapq.heapreplace(heap, (score, -doc_id))
+
+        if len(heap) == k and heap[0][0] > threshold:
+            threshold = heap[0][0]
+            drop_non_essential()
+
+    return [(score, -neg_doc) for score, neg_doc in heap], None if pruned else total
@@ -40,6 +40,7 @@ class QueryToken:
     field: Optional[str] = None
     modifier: Optional[str] = None  # ~, *, etc.
     boost: float = 1.0
+    pattern: Optional[str] = None  # original wildcard pattern, e.g. doc*ent
     
     def __str__(self) -> str:
         field_prefix = f"{self.field}:" if self.field else ""
@@ -245,7 +246,8 @@ class QueryParser:
                 token = QueryToken(
                     type=QueryType.WILDCARD,
                     value=term.replace('*', ''),
-                    modifier='*'
+                    modifier='*',
+                    pattern=term
                 )
             # Check for fuzzy search
             elif '~' in term:
@@ -0,0 +1,907 @@
+"""
+Persistent Segmented Search Index
+
+A persistent index is a directory of immutable segment files plus a
+manifest naming the segments that make up the index:
+
+    segments.json          manifest, replaced atomically on every commit
+    seg_000001.seg         documents, sorted term table and postings
+    seg_000001_3.del       tombstones of seg_000001 written by commit 3
+
+Segments are memory-mapped and only their header is read when they are
+opened. Terms and element ids are found by binary search over fixed-width
+tables, and postings are decoded straight from the mapping, so opening an
+index costs the same whatever its size.
+
+New and updated elements go to an in-memory ``SearchIndex`` write buffer
+which is flushed as a new segment; removing an element that lives in a
+segment records a tombstone. Once there are more than ``merge_factor``
+segments the smallest ones are merged in the background, dropping
+tombstoned documents.
+"""
+
+import asyncio
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from ....core.models.element import Element, ElementType
+from .indexer import IndexEntry, IndexStatistics, IndexStrategy, RankedResults, SearchIndex
+from .postings import BM25, SKIP_INTERVAL, PostingList, intersect, top_k_conjunctive, top_k_max_score, union
+from .term_dictionary import TermDictionary
+
+SEGMENT_MAGIC = b"TMSEG001"
+SEGMENT_SUFFIX = ".seg"
+TOMBSTONE_SUFFIX = ".del"
+MANIFEST_NAME = "segments.json"
+MANIFEST_VERSION = 1
+
+# magic, doc count, term count, total length, doc table, id index, term table,
+# strings, meta length (offsets are absolute; meta JSON follows the header)
+_HEADER = struct.Struct("<8sIIQQQQQI")
+# element id offset, element id length, type code, length, page (-1: none),
+# confidence (NaN: element had no metadata)
+_DOC_RECORD = struct.Struct("<QHHIid")
+# term offset, term length, postings offset, postings length, skips offset,
+# posting count, max term frequency
+_TERM_RECORD = struct.Struct("<QHQIQII")
+# first doc id of block, byte offset in the postings, doc id preceding block
+_SKIP_RECORD = struct.Struct("<IIi")
+_DOC_ID = struct.Struct("<I")
+
+
+def write_segment(path: Path, entries: List[IndexEntry], postings: Dict[str, PostingList]) -> None:
+    """Write a segment file.
+
+    ``entries[i]`` is the document with doc id ``i``; ``postings`` must use
+    the same dense doc ids. The file is written next to ``path`` and renamed
+    into place once synced.
+    """
+    type_codes: Dict[ElementType, int] = {}
+    strings = bytearray()
+    doc_table = bytearray()
+    for entry in entries:
+        element_id = entry.element_id.encode("utf-8")
+        code = type_codes.setdefault(entry.element_type, len(type_codes))
+        confidence = entry.metadata_fields.get('confidence')
+        doc_table += _DOC_RECORD.pack(
+            len(strings), len(element_id), code, entry.length,
+            entry.page_number if entry.page_number is not None else -1,
+            confidence if confidence is not None else math.nan
+        )
+        strings += element_id
+
+    id_order = sorted(range(len(entries)), key=lambda doc_id: entries[doc_id].element_id.encode("utf-8"))
+    id_index = struct.pack(f"<{len(id_order)}I", *id_order)
+
+    meta = json.dumps({
+        'element_types': [element_type.value for element_type in type_codes],
+        'created': time.time(),
+    }).encode("utf-8")
+
+    terms = sorted((term for term, term_postings in postings.items() if len(term_postings)),
+                   key=lambda term: term.encode("utf-8"))
+    doc_table_offset = _HEADER.size + len(meta)
+    id_index_offset = doc_table_offset + len(doc_table)
+    term_table_offset = id_index_offset + len(id_index)
+    postings_offset = term_table_offset + len(terms) * _TERM_RECORD.size
+
+    term_table = bytearray()
+    postings_blob = bytearray()
+    term_strings = bytearray()
+    for term in terms:
+        data, skips = postings[term].encoded()
+        encoded_term = term.encode("utf-8")
+        data_offset = postings_offset + len(postings_blob)
+        postings_blob += data
+        skips_offset = postings_offset + len(postings_blob)
+        for skip in skips:
+            postings_blob += _SKIP_RECORD.pack(*skip)
+        term_table += _TERM_RECORD.pack(
+            len(strings) + len(term_strings), len(encoded_term), data_offset, len(data),
+            skips_offset, len(postings[term]), postings[term].max_tf
+        )
+        term_strings += encoded_term
+
+    strings_offset = postings_offset + len(postings_blob)
+    header = _HEADER.pack(
+        SEGMENT_MAGIC, len(entries), len(terms), sum(entry.length for entry in entries),
+        doc_table_offset, id_index_offset, term_table_offset, strings_offset, len(meta)
+    )
+
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as handle:
+        for section in (header, meta, doc_table, id_index, term_table, postings_blob, strings, term_strings):
+            handle.write(section)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+
+
+class Segment:
+    """Read-only, memory-mapped segment file."""
+
+    def __init__(self, path: Path, deleted: Optional[Iterable[int]] = None):
+        self.path = Path(path)
+        self.name = self.path.stem
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty segment file: {self.path}")
+
+        (magic, self.doc_count, self.term_count, self.total_length, self._doc_table,
+         self._id_index, self._term_table, self._strings, meta_length) = _HEADER.unpack_from(self._map, 0)
+        if magic != SEGMENT_MAGIC:
+            self.close()
+            raise ValueError(f"Not a search segment: {self.path}")
+
+        meta = json.loads(self._map[_HEADER.size:_HEADER.size + meta_length])
+        self._types = [ElementType(value) for value in meta['element_types']]
+        self.deleted: Set[int] = set(deleted or ())
+        self._term_dictionary: Optional[TermDictionary] = None
+
+    @property
+    def live_count(self) -> int:
+        return self.doc_count - len(self.deleted)
+
+    @property
+    def live_length(self) -> int:
+        """Total length of live documents."""
+        if not self.deleted:
+            return self.total_length
+        return self.total_length - sum(self.doc_length(doc_id) for doc_id in self.deleted)
+
+    @property
+    def is_live(self) -> Optional[Callable[[int], bool]]:
+        """Liveness check for posting cursors, None when nothing was deleted."""
+        if not self.deleted:
+            return None
+        deleted = self.deleted
+        return lambda doc_id: doc_id not in deleted
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._map)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    # Terms
+
+    def _term_record(self, index: int) -> Tuple[int, int, int, int, int, int, int]:
+        return _TERM_RECORD.unpack_from(self._map, self._term_table + index * _TERM_RECORD.size)
+
+    def _term_bytes(self, index: int) -> bytes:
+        record = self._term_record(index)
+        start = self._strings + record[0]
+        return self._map[start:start + record[1]]
+
+    def _term_lower_bound(self, key: bytes) -> int:
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self._term_bytes(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def postings(self, term: str) -> Optional[PostingList]:
+        key = term.encode("utf-8")
+        index = self._term_lower_bound(key)
+        if index >= self.term_count or self._term_bytes(index) != key:
+            return None
+
+        _, _, data_offset, data_length, skips_offset, count, max_tf = self._term_record(index)
+        skip_count = (count + SKIP_INTERVAL - 1) // SKIP_INTERVAL
+        skips = list(_SKIP_RECORD.iter_unpack(
+            self._map[skips_offset:skips_offset + skip_count * _SKIP_RECORD.size]
+        ))
+        return PostingList.from_buffer(
+            self._map[data_offset:data_offset + data_length], skips, count, max_tf
+        )
+
+    def iter_terms(self) -> Iterator[str]:
+        for index in range(self.term_count):
+            yield self._term_bytes(index).decode("utf-8")
+
+    def terms_with_prefix(self, prefix: str) -> Iterator[str]:
+        key = prefix.encode("utf-8")
+        for index in range(self._term_lower_bound(key), self.term_count):
+            term = self._term_bytes(index)
+            if not term.startswith(key):
+                return
+            yield term.decode("utf-8")
+
+    @property
+    def term_dictionary(self) -> TermDictionary:
+        """Dictionary of the segment's terms, built on first fuzzy or wildcard use."""
+        if self._term_dictionary is None:
+            dictionary = TermDictionary()
+            for term in self.iter_terms():
+                dictionary.add(term)
+            self._term_dictionary = dictionary
+        return self._term_dictionary
+
+    # Documents
+
+    def _doc_record(self, doc_id: int) -> Tuple[int, int, int, int, int, float]:
+        return _DOC_RECORD.unpack_from(self._map, self._doc_table + doc_id * _DOC_RECORD.size)
+
+    def element_id(self, doc_id: int) -> str:
+        offset, length = self._doc_record(doc_id)[:2]
+        start = self._strings + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def doc_length(self, doc_id: int) -> int:
+        return self._doc_record(doc_id)[3]
+
+    def entry(self, doc_id: int) -> IndexEntry:
+        """Index entry of a document; terms and text are not stored in segments."""
+        return self._make_entry(doc_id, self._doc_record(doc_id))
+
+    def _make_entry(self, doc_id: int, record: Tuple[int, int, int, int, int, float]) -> IndexEntry:
+        offset, length, code, doc_length, page, confidence = record
+        start = self._strings + offset
+        has_confidence = not math.isnan(confidence)
+        return IndexEntry(
+            element_id=self._map[start:start + length].decode("utf-8"),
+            element_type=self._types[code],
+            metadata_fields={'confidence': confidence} if has_confidence else {},
+            confidence=confidence if has_confidence else 1.0,
+            page_number=page if page >= 0 else None,
+            doc_id=doc_id,
+            length=doc_length
+        )
+
+    def iter_entries(self, live_only: bool = True) -> Iterator[IndexEntry]:
+        records = _DOC_RECORD.iter_unpack(
+            self._map[self._doc_table:self._doc_table + self.doc_count * _DOC_RECORD.size]
+        )
+        for doc_id, record in enumerate(records):
+            if not live_only or doc_id not in self.deleted:
+                yield self._make_entry(doc_id, record)
+
+    def find_element(self, element_id: str) -> Optional[int]:
+        """Doc id of a live document by element id."""
+        key = element_id.encode("utf-8")
+        low, high = 0, self.doc_count
+        while low < high:
+            middle = (low + high) // 2
+            doc_id = _DOC_ID.unpack_from(self._map, self._id_index + middle * _DOC_ID.size)[0]
+            offset, length = self._doc_record(doc_id)[:2]
+            start = self._strings + offset
+            current = self._map[start:start + length]
+            if current == key:
+                return doc_id if doc_id not in self.deleted else None
+            if current < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+
+class _BufferReader:
+    """Presents the in-memory write buffer like a segment for queries."""
+
+    def __init__(self, index: SearchIndex):
+        self._index = index
+        self.is_live = index._is_live
+        self.term_dictionary = index.term_dictionary
+
+    @property
+    def live_count(self) -> int:
+        return len(self._index.entries)
+
+    @property
+    def live_length(self) -> int:
+        return self._index._total_length
+
+    def postings(self, term: str) -> Optional[PostingList]:
+        postings = self._index.postings.get(term)
+        return postings if postings is not None and postings.live else None
+
+    def terms_with_prefix(self, prefix: str) -> Iterator[str]:
+        return self._index.term_dictionary.prefix(prefix)
+
+    def element_id(self, doc_id: int) -> str:
+        return self._index._docs[doc_id].element_id
+
+    def doc_length(self, doc_id: int) -> int:
+        return self._index._docs[doc_id].length
+
+    def entry(self, doc_id: int) -> IndexEntry:
+        return self._index._docs[doc_id]
+
+    def find_element(self, element_id: str) -> Optional[int]:
+        entry = self._index.entries.get(element_id)
+        return entry.doc_id if entry is not None else None
+
+
+Reader = Union[Segment, _BufferReader]
+
+
+class SegmentedSearchIndex:
+    """Persistent search index made of immutable segments and a write buffer.
+
+    Offers the query API of :class:`SearchIndex`. Changes become durable on
+    :meth:`commit`, which also runs automatically once ``max_buffered_docs``
+    elements are buffered.
+    """
+
+    SKIP_PROBE_RATIO = SearchIndex.SKIP_PROBE_RATIO
+
+    def __init__(self, directory: Union[str, Path], strategy: IndexStrategy = IndexStrategy.BALANCED,
+                 max_buffered_docs: int = 10000, merge_factor: int = 8,
+                 background_merge: bool = True):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.strategy = strategy
+        self.max_buffered_docs = max_buffered_docs
+        self.merge_factor = merge_factor
+
+        self.buffer = SearchIndex(strategy)
+        self.segments: List[Segment] = []
+        self.user_data: Dict[str, Any] = {}
+        self._generation = 0
+        self._next_segment = 1
+        self._tombstone_generations: Dict[str, int] = {}
+        self._dirty_tombstones: Set[str] = set()
+        self._obsolete_files: List[Path] = []
+
+        self._lock = threading.RLock()
+        self._merge_executor = (ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment-merge")
+                                if background_merge else None)
+        self._merge_future: Optional[Future] = None
+
+        self._open()
+
+    # Persistence
+
+    def _open(self) -> None:
+        manifest_path = self.directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            return
+
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if manifest.get('version') != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported search index version: {manifest.get('version')}")
+
+        self._generation = manifest['generation']
+        self._next_segment = manifest['next_segment']
+        self.user_data = manifest.get('user_data', {})
+        for info in manifest['segments']:
+            deleted = None
+            if info.get('tombstones'):
+                self._tombstone_generations[info['name']] = info['tombstones']
+                deleted = self._read_tombstones(self._tombstone_path(info['name'], info['tombstones']))
+            self.segments.append(Segment(self.directory / (info['name'] + SEGMENT_SUFFIX), deleted))
+
+    def _segment_path(self, name: str) -> Path:
+        return self.directory / (name + SEGMENT_SUFFIX)
+
+    def _tombstone_path(self, name: str, generation: int) -> Path:
+        return self.directory / f"{name}_{generation}{TOMBSTONE_SUFFIX}"
+
+    @staticmethod
+    def _read_tombstones(path: Path) -> Set[int]:
+        doc_ids = array('I')
+        doc_ids.frombytes(path.read_bytes())
+        if doc_ids.itemsize != 4:
+            raise ValueError("Unsupported platform integer size for tombstones")
+        return set(doc_ids)
+
+    @staticmethod
+    def _write_tombstones(path: Path, doc_ids: Set[int]) -> None:
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as handle:
+            handle.write(struct.pack(f"<{len(doc_ids)}I", *sorted(doc_ids)))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+
+    def _allocate_segment_name(self) -> str:
+        name = f"seg_{self._next_segment:06d}"
+        self._next_segment += 1
+        return name
+
+    def commit(self, user_data: Optional[Dict[str, Any]] = None) -> None:
+        """Flush the write buffer as a segment and persist tombstones.
+
+        Args:
+            user_data: JSON-serializable data stored with the commit, e.g. an
+                indexing checkpoint; available as ``user_data`` after reopening
+        """
+        with self._lock:
+            if user_data is not None:
+                self.user_data = user_data
+
+            if self.buffer.get_element_count():
+                entries, postings = self.buffer.doc_snapshot()
+                name = self._allocate_segment_name()
+                write_segment(self._segment_path(name), entries, postings)
+                self.segments.append(Segment(self._segment_path(name)))
+                self.buffer.clear()
+
+            self._write_manifest()
+
+        self.maybe_merge()
+
+    def _write_manifest(self) -> None:
+        """Write dirty tombstones and the manifest for a new generation."""
+        generation = self._generation + 1
+        for name in self._dirty_tombstones:
+            segment = next((segment for segment in self.segments if segment.name == name), None)
+            if segment is None:
+                continue
+            self._write_tombstones(self._tombstone_path(name, generation), segment.deleted)
+            previous = self._tombstone_generations.get(name)
+            if previous:
+                self._obsolete_files.append(self._tombstone_path(name, previous))
+            self._tombstone_generations[name] = generation
+        self._dirty_tombstones.clear()
+
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'generation': generation,
+            'next_segment': self._next_segment,
+            'segments': [
+                {
+                    'name': segment.name,
+                    'doc_count': segment.doc_count,
+                    'tombstones': self._tombstone_generations.get(segment.name, 0),
+                }
+                for segment in self.segments
+            ],
+            'user_data': self.user_data,
+        }
+        manifest_path = self.directory / MANIFEST_NAME
+        temp_path = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(manifest, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, manifest_path)
+        self._generation = generation
+
+        # Files no longer referenced by the manifest can go now
+        for path in self._obsolete_files:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._obsolete_files.clear()
+
+    # Merging
+
+    def maybe_merge(self) -> Optional[Future]:
+        """Start a background merge when there are too many segments."""
+        with self._lock:
+            if self._merge_future is not None and not self._merge_future.done():
+                return self._merge_future
+            candidates = self._merge_candidates()
+            if not candidates:
+                return None
+            if self._merge_executor is None:
+                self._merge_segments(candidates)
+                return None
+            self._merge_future = self._merge_executor.submit(self._merge_segments, candidates)
+            return self._merge_future
+
+    def _merge_candidates(self) -> List[Segment]:
+        if len(self.segments) <= self.merge_factor:
+            return []
+        return sorted(self.segments, key=lambda segment: segment.live_count)[:self.merge_factor]
+
+    def merge(self, max_segments: int = 1) -> None:
+        """Merge segments until at most ``max_segments`` remain (blocking)."""
+        self.wait_for_merges()
+        with self._lock:
+            if len(self.segments) > max(max_segments, 1):
+                count = len(self.segments) - max(max_segments, 1) + 1
+                self._merge_segments(sorted(self.segments, key=lambda segment: segment.live_count)[:count])
+            elif len(self.segments) == 1 and self.segments[0].deleted:
+                # Expunge tombstoned documents
+                self._merge_segments(list(self.segments))
+
+    def wait_for_merges(self) -> None:
+        future = self._merge_future
+        if future is not None:
+            future.result()
+
+    def _merge_segments(self, sources: List[Segment]) -> None:
+        """Merge ``sources`` into one segment without tombstoned documents.
+
+        The merged segment is written without holding the lock; documents
+        deleted from the sources meanwhile are carried over as tombstones.
+        """
+        with self._lock:
+            snapshot = {segment.name: set(segment.deleted) for segment in sources}
+            name = self._allocate_segment_name()
+
+        entries: List[IndexEntry] = []
+        remaps: List[Dict[int, int]] = []
+        for segment in sources:
+            remap = {}
+            for entry in segment.iter_entries(live_only=False):
+                if entry.doc_id not in snapshot[segment.name]:
+                    remap[entry.doc_id] = len(entries)
+                    entry.doc_id = len(entries)
+                    entries.append(entry)
+            remaps.append(remap)
+
+        postings: Dict[str, PostingList] = {}
+        for term, group in _merge_sorted_terms(sources):
+            merged = PostingList()
+            for index in group:
+                remap = remaps[index]
+                for doc_id, tf in sources[index].postings(term):
+                    new_id = remap.get(doc_id)
+                    if new_id is not None:
+                        merged.append(new_id, tf)
+            if len(merged):
+                postings[term] = merged
+
+        if entries:
+            write_segment(self._segment_path(name), entries, postings)
+
+        with self._lock:
+            source_names = {segment.name for segment in sources}
+            position = min(index for index, segment in enumerate(self.segments) if segment.name in source_names)
+            remaining = [segment for segment in self.segments if segment.name not in source_names]
+
+            # Nothing to write when every source document was deleted
+            if entries:
+                merged_segment = Segment(self._segment_path(name))
+                for segment, remap in zip(sources, remaps):
+                    for doc_id in segment.deleted - snapshot[segment.name]:
+                        merged_segment.deleted.add(remap[doc_id])
+                if merged_segment.deleted:
+                    self._dirty_tombstones.add(name)
+                remaining.insert(position, merged_segment)
+            self.segments = remaining
+
+            for segment in sources:
+                self._obsolete_files.append(segment.path)
+                generation = self._tombstone_generations.pop(segment.name, 0)
+                if generation:
+                    self._obsolete_files.append(self._tombstone_path(segment.name, generation))
+                self._dirty_tombstones.discard(segment.name)
+
+            self._write_manifest()
+            for segment in sources:
+                segment.close()
+
+    # Updates
+
+    def add_element(self, element: Element) -> None:
+        """Add or update element; buffered until the next commit."""
+        with self._lock:
+            self._delete_from_segments(element.element_id)
+            self.buffer.add_element(element)
+            if self.buffer.get_element_count() >= self.max_buffered_docs:
+                self.commit()
+
+    def add_elements(self, elements: Iterable[Element]) -> None:
+        """Add or update a batch of elements with one buffer update."""
+        with self._lock:
+            elements = list(elements)
+            for element in elements:
+                self._delete_from_segments(element.element_id)
+            self.buffer.add_elements(elements)
+            if self.buffer.get_element_count() >= self.max_buffered_docs:
+                self.commit()
+
+    def bulk_load(self, elements: Sequence[Element], workers: Optional[int] = None) -> None:
+        """Index many elements straight into a new committed segment.
+
+        Elements are tokenized in a process pool (see
+        :meth:`SearchIndex.bulk_load`); older copies of them are tombstoned.
+        """
+        partial = SearchIndex(self.strategy)
+        partial.bulk_load(elements, workers)
+        entries, postings = partial.doc_snapshot()
+        if not entries:
+            return
+
+        with self._lock:
+            for entry in entries:
+                self.buffer.remove_element(entry.element_id)
+                self._delete_from_segments(entry.element_id)
+            name = self._allocate_segment_name()
+            write_segment(self._segment_path(name), entries, postings)
+            self.segments.append(Segment(self._segment_path(name)))
+            self._write_manifest()
+
+        self.maybe_merge()
+
+    def remove_element(self, element_id: str) -> bool:
+        with self._lock:
+            removed = self.buffer.remove_element(element_id)
+            return self._delete_from_segments(element_id) or removed
+
+    def _delete_from_segments(self, element_id: str) -> bool:
+        for segment in reversed(self.segments):
+            doc_id = segment.find_element(element_id)
+            if doc_id is not None:
+                segment.deleted.add(doc_id)
+                self._dirty_tombstones.add(segment.name)
+                return True
+        return False
+
+    def clear(self) -> None:
+        """Remove all documents and segments."""
+        self.wait_for_merges()
+        with self._lock:
+            self.buffer.clear()
+            for segment in self.segments:
+                self._obsolete_files.append(segment.path)
+                generation = self._tombstone_generations.pop(segment.name, 0)
+                if generation:
+                    self._obsolete_files.append(self._tombstone_path(segment.name, generation))
+                segment.close()
+            self.segments = []
+            self._dirty_tombstones.clear()
+            self._write_manifest()
+
+    def close(self, commit: bool = True) -> None:
+        """Commit pending changes, finish merges and unmap segments."""
+        if commit:
+            self.commit()
+        self.wait_for_merges()
+        if self._merge_executor is not None:
+            self._merge_executor.shutdown(wait=True)
+        with self._lock:
+            for segment in self.segments:
+                segment.close()
+            self.segments = []
+
+    # BackgroundIndexer protocol
+
+    async def index_elements(self, elements: List[Element]) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.add_elements, elements)
+
+    async def bulk_index(self, elements: List[Element], workers: Optional[int] = None) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.bulk_load, elements, workers)
+
+    async def flush(self, user_data: Optional[Dict[str, Any]] = None) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.commit, user_data)
+
+    async def optimize(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.merge, 1)
+
+    # Queries
+
+    def _readers(self) -> List[Reader]:
+        return [*self.segments, _BufferReader(self.buffer)]
+
+    def _reader_postings(self, reader: Reader, term: str, fuzzy: bool,
+                         max_distance: int) -> Optional[PostingList]:
+        if fuzzy and self.buffer.enable_fuzzy:
+            candidates = reader.term_dictionary.fuzzy(term, max_distance)
+            lists = [reader.postings(candidate) for candidate in candidates]
+            return union([postings for postings in lists if postings is not None], reader.is_live)
+        return reader.postings(term)
+
+    def _collect_postings(self, query: str, fuzzy: bool, max_distance: int
+                          ) -> Tuple[List[str], List[List[Optional[PostingList]]]]:
+        terms = list(self.buffer._extract_query_terms(query)) if query else []
+        per_reader = [[self._reader_postings(reader, term, fuzzy, max_distance) for term in terms]
+                      for reader in self._readers()]
+        return terms, per_reader
+
+    def _bm25(self) -> BM25:
+        readers = self._readers()
+        return BM25(sum(reader.live_count for reader in readers),
+                    sum(reader.live_length for reader in readers),
+                    SearchIndex.BM25_K1, SearchIndex.BM25_B)
+
+    def search_text(self, query: str, fuzzy: bool = False, max_distance: int = 2) -> Set[str]:
+        """Search for elements containing every query term."""
+        with self._lock:
+            terms, per_reader = self._collect_postings(query, fuzzy, max_distance)
+            if not terms:
+                return set()
+
+            result = set()
+            for reader, lists in zip(self._readers(), per_reader):
+                if all(postings is not None for postings in lists):
+                    doc_ids = intersect(lists, reader.is_live, self.SKIP_PROBE_RATIO)
+                    result.update(reader.element_id(doc_id) for doc_id in doc_ids)
+            return result
+
+    def search_ranked(self, query: str, k: int = 50, fuzzy: bool = False, max_distance: int = 2,
+                      match_all: bool = True,
+                      prior: Optional[Callable[[IndexEntry], float]] = None,
+                      prior_bound: float = 0.0) -> RankedResults:
+        """BM25 top-k over all segments; see :meth:`SearchIndex.search_ranked`.
+
+        Document frequencies count tombstoned documents until their segment
+        is merged, so scores can drift slightly from a freshly built index.
+        """
+        with self._lock:
+            terms, per_reader = self._collect_postings(query, fuzzy, max_distance)
+            if not terms or k <= 0:
+                return RankedResults(total_count=0)
+
+            bm25 = self._bm25()
+            doc_freqs = [sum(lists[i].live for lists in per_reader if lists[i] is not None)
+                         for i in range(len(terms))]
+            idfs = [bm25.idf(doc_freq) for doc_freq in doc_freqs]
+
+            # (score, -reader, -doc) so that ties favour older segments and lower doc ids
+            best: List[Tuple[float, int, int]] = []
+            total: Optional[int] = 0
+            readers = self._readers()
+            for position, (reader, lists) in enumerate(zip(readers, per_reader)):
+                doc_prior = None
+                if prior is not None:
+                    doc_prior = lambda doc_id, reader=reader: prior(reader.entry(doc_id))
+
+                if match_all:
+                    if any(postings is None for postings in lists):
+                        continue
+                    heap, count = top_k_conjunctive(lists, idfs, bm25, k, reader.doc_length, doc_prior,
+                                                    reader.is_live, self.SKIP_PROBE_RATIO)
+                else:
+                    present = [i for i, postings in enumerate(lists) if postings is not None]
+                    if not present:
+                        continue
+                    threshold = best[0][0] if len(best) >= k else -math.inf
+                    heap, count = top_k_max_score([lists[i] for i in present], [idfs[i] for i in present],
+                                                  bm25, k, reader.doc_length, doc_prior, prior_bound,
+                                                  reader.is_live, threshold)
+
+                total = total + count if total is not None and count is not None else None
+                for score, doc_id in heap:
+                    item = (score, -position, -doc_id)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+
+            hits = [(readers[-position].element_id(-neg_doc), score)
+                    for score, position, neg_doc in sorted(best, reverse=True)]
+            return RankedResults(hits=hits, total_count=total)
+
+    def score_element(self, element_id: str, query: str) -> float:
+        """BM25 score of a single element for ``query``."""
+        with self._lock:
+            for reader in reversed(self._readers()):
+                doc_id = reader.find_element(element_id)
+                if doc_id is not None:
+                    break
+            else:
+                return 0.0
+
+            bm25 = self._bm25()
+            readers = self._readers()
+            length = reader.doc_length(doc_id)
+            score = 0.0
+            for term in self.buffer._extract_query_terms(query):
+                postings = reader.postings(term)
+                tf = postings.frequency(doc_id) if postings is not None else 0
+                if tf:
+                    # Live postings only, as in search_ranked
+                    term_postings = [other.postings(term) for other in readers]
+                    doc_freq = sum(other.live for other in term_postings if other is not None)
+                    score += bm25.score(bm25.idf(doc_freq), tf, length)
+            return score
+
+    def _element_ids(self, reader: Reader, postings: Iterable[Optional[PostingList]]) -> Set[str]:
+        doc_ids = set()
+        for term_postings in postings:
+            if term_postings is not None:
+                doc_ids.update(term_postings.decode()[0])
+        is_live = reader.is_live
+        return {reader.element_id(doc_id) for doc_id in doc_ids if is_live is None or is_live(doc_id)}
+
+    def search_prefix(self, prefix: str) -> Set[str]:
+        with self._lock:
+            if not prefix:
+                return set()
+            result = set()
+            for reader in self._readers():
+                terms = reader.terms_with_prefix(prefix.lower())
+                result.update(self._element_ids(reader, (reader.postings(term) for term in terms)))
+            return result
+
+    def search_wildcard(self, pattern: str) -> Set[str]:
+        with self._lock:
+            if not pattern.strip('*?'):
+                return set()
+            result = set()
+            for reader in self._readers():
+                terms = reader.term_dictionary.wildcard(pattern.lower())
+                result.update(self._element_ids(reader, (reader.postings(term) for term in terms)))
+            return result
+
+    def get_suggestions(self, partial_query: str, limit: int = 10) -> List[str]:
+        with self._lock:
+            if len(partial_query) < self.buffer.min_term_length:
+                return []
+            suggestions: List[str] = []
+            merged = heapq.merge(*(reader.terms_with_prefix(partial_query.lower())
+                                   for reader in self._readers()))
+            for term in merged:
+                if not suggestions or suggestions[-1] != term:
+                    suggestions.append(term)
+                    if len(suggestions) >= limit:
+                        break
+            return suggestions
+
+    def search_by_type(self, element_types: Set[ElementType]) -> Set[str]:
+        with self._lock:
+            result = set()
+            for reader in self._readers():
+                terms = [f"type:{element_type.value.lower()}" for element_type in element_types]
+                result.update(self._element_ids(reader, (reader.postings(term) for term in terms)))
+            return result
+
+    def search_by_page(self, page_numbers: Set[int]) -> Set[str]:
+        with self._lock:
+            result = self.buffer.search_by_page(page_numbers)
+            for segment in self.segments:
+                result.update(entry.element_id for entry in segment.iter_entries()
+                              if entry.page_number in page_numbers)
+            return result
+
+    def search_by_confidence(self, min_confidence: float, max_confidence: float) -> Set[str]:
+        with self._lock:
+            result = self.buffer.search_by_confidence(min_confidence, max_confidence)
+            for segment in self.segments:
+                result.update(entry.element_id for entry in segment.iter_entries()
+                              if min_confidence <= entry.confidence <= max_confidence)
+            return result
+
+    def get_element_count(self) -> int:
+        with self._lock:
+            return self.buffer.get_element_count() + sum(segment.live_count for segment in self.segments)
+
+    def get_segment_count(self) -> int:
+        return len(self.segments)
+
+    def get_statistics(self) -> IndexStatistics:
+        """Index statistics; ``total_terms`` counts terms per segment and may overcount."""
+        with self._lock:
+            statistics = self.buffer.get_statistics()
+            return IndexStatistics(
+                total_elements=self.get_element_count(),
+                total_terms=statistics.total_terms + sum(segment.term_count for segment in self.segments),
+                index_size_bytes=statistics.index_size_bytes + sum(segment.nbytes for segment in self.segments),
+                last_update=statistics.last_update,
+                update_count=statistics.update_count,
+                average_terms_per_element=statistics.average_terms_per_element,
+                most_common_terms=statistics.most_common_terms,
+            )
+
+
+def _merge_sorted_terms(segments: List[Segment]) -> Iterator[Tuple[str, List[int]]]:
+    """Yield each term of the segments in order with the indexes of the segments holding it."""
+    def tagged(index: int) -> Iterator[Tuple[str, int]]:
+        for term in segments[index].iter_terms():
+            yield term, index
+
+    streams = [tagged(index) for index in range(len(segments))]
+    current: Optional[str] = None
+    group: List[int] = []
+    for term, index in heapq.merge(*streams, key=lambda item: item[0].encode("utf-8")):
+        if term != current:
+            if current is not None:
+                yield current, group
+            current, group = term, []
+        group.append(index)
+    if current is not None:
+        yield current, group
@@ -0,0 +1,201 @@
+"""
+Term Dictionary for Fuzzy, Prefix and Wildcard Lookups
+
+Keeps the distinct terms of a search index in structures that resolve
+approximate queries without scanning every indexed element:
+
+- a sorted term list for prefix lookups (binary search)
+- a trigram index for wildcard patterns (``doc*ent``, ``te?t``)
+- a trie walked with Levenshtein rows for fuzzy lookups; branches whose
+  best possible distance exceeds the limit are pruned, which is equivalent
+  to running a Levenshtein automaton against the dictionary
+
+Queries return candidate terms; callers map them to postings.
+"""
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+class _TrieNode:
+    """Trie node; ``term`` is set when a dictionary term ends here."""
+    __slots__ = ('children', 'term')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.term: Optional[str] = None
+
+
+class TermDictionary:
+    """Dictionary of distinct index terms with approximate lookups."""
+
+    WILDCARD_CHARS = '*?'
+
+    def __init__(self):
+        self._sorted_terms: List[str] = []
+        self._trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._root = _TrieNode()
+
+    def __len__(self) -> int:
+        return len(self._sorted_terms)
+
+    def __contains__(self, term: str) -> bool:
+        index = bisect_left(self._sorted_terms, term)
+        return index < len(self._sorted_terms) and self._sorted_terms[index] == term
+
+    def add(self, term: str) -> bool:
+        """Add a term; returns False if it was already present."""
+        if term in self:
+            return False
+
+        insort(self._sorted_terms, term)
+        self._index_term(term)
+        return True
+
+    def update(self, terms) -> int:
+        """Add many terms, sorting once; returns the number of new terms."""
+        new_terms = {term for term in terms if term not in self}
+        for term in new_terms:
+            self._index_term(term)
+        if new_terms:
+            self._sorted_terms.extend(new_terms)
+            self._sorted_terms.sort()
+        return len(new_terms)
+
+    def _index_term(self, term: str) -> None:
+        """Add ``term`` to the trigram index and the trie."""
+        for trigram in self._term_trigrams(term):
+            self._trigrams[trigram].add(term)
+
+        node = self._root
+        for char in term:
+            node = node.children.setdefault(char, _TrieNode())
+        node.term = term
+
+    def remove(self, term: str) -> bool:
+        """Remove a term; returns False if it was not present."""
+        index = bisect_left(self._sorted_terms, term)
+        if index >= len(self._sorted_terms) or self._sorted_terms[index] != term:
+            return False
+
+        del self._sorted_terms[index]
+        for trigram in self._term_trigrams(term):
+            terms = self._trigrams.get(trigram)
+            if terms is not None:
+                terms.discard(term)
+                if not terms:
+                    del self._trigrams[trigram]
+
+        # Unmark the trie node and prune branches left without terms
+        path: List[Tuple[_TrieNode, str]] = []
+        node = self._root
+        for char in term:
+            path.append((node, char))
+            node = node.children[char]
+        node.term = None
+        for parent, char in reversed(path):
+            child = parent.children[char]
+            if child.term is not None or child.children:
+                break
+            del parent.children[char]
+        return True
+
+    def clear(self) -> None:
+        self._sorted_terms.clear()
+        self._trigrams.clear()
+        self._root = _TrieNode()
+
+    def prefix(self, prefix: str, limit: Optional[int] = None) -> Iterator[str]:
+        """Terms starting with ``prefix`` in sorted order."""
+        index = bisect_left(self._sorted_terms, prefix)
+        count = 0
+        while index < len(self._sorted_terms):
+            term = self._sorted_terms[index]
+            if not term.startswith(prefix) or (limit is not None and count >= limit):
+                return
+            yield term
+            count += 1
+            index += 1
+
+    def wildcard(self, pattern: str) -> List[str]:
+        """Terms matching a pattern where ``*`` matches any run and ``?`` one character."""
+        if not any(char in pattern for char in self.WILDCARD_CHARS):
+            return [pattern] if pattern in self else []
+
+        head = self._literal_prefix(pattern)
+        # Pure prefix pattern: answered by the sorted list alone
+        if pattern == head + '*':
+            return list(self.prefix(head))
+
+        candidates = self._trigram_candidates(pattern)
+        if candidates is None:
+            # No trigram long enough to narrow the search
+            candidates = self.prefix(head)
+        return sorted(term for term in candidates if fnmatchcase(term, pattern))
+
+    def fuzzy(self, term: str, max_distance: int = 2) -> Dict[str, int]:
+        """Terms within ``max_distance`` edits of ``term``, with their distance."""
+        if max_distance <= 0:
+            return {term: 0} if term in self else {}
+
+        matches: Dict[str, int] = {}
+        first_row = list(range(len(term) + 1))
+        # Explicit stack instead of recursion to cope with long terms
+        stack = [(child, char, first_row) for char, child in self._root.children.items()]
+        while stack:
+            node, char, previous_row = stack.pop()
+            row = [previous_row[0] + 1]
+            for column in range(1, len(term) + 1):
+                cost = 0 if term[column - 1] == char else 1
+                row.append(min(row[column - 1] + 1,
+                               previous_row[column] + 1,
+                               previous_row[column - 1] + cost))
+
+            if node.term is not None and row[-1] <= max_distance:
+                matches[node.term] = row[-1]
+            if min(row) <= max_distance:
+                stack.extend((child, next_char, row) for next_char, child in node.children.items())
+        return matches
+
+    @staticmethod
+    def _term_trigrams(term: str) -> Set[str]:
+        # Anchored with ^ and $ so short terms and term boundaries are indexed too
+        padded = f"^{term}$"
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def _literal_prefix(self, pattern: str) -> str:
+        for index, char in enumerate(pattern):
+            if char in self.WILDCARD_CHARS:
+                return pattern[:index]
+        return pattern
+
+    def _trigram_candidates(self, pattern: str) -> Optional[Set[str]]:
+        """Intersect trigram postings of the literal parts of ``pattern``.
+
+        Returns None when the pattern has no literal run of three characters
+        (including the ``^``/``$`` anchors).
+        """
+        padded = f"^{pattern}$"
+        runs: List[str] = []
+        current = ''
+        for char in padded:
+            if char in self.WILDCARD_CHARS:
+                runs.append(current)
+                current = ''
+            else:
+                current += char
+        runs.append(current)
+
+        trigrams = {run[i:i + 3] for run in runs for i in range(len(run) - 2)}
+        if not trigrams:
+            return None
+
+        postings = sorted((self._trigrams.get(trigram, set()) for trigram in trigrams), key=len)
+        candidates = set(postings[0])
+        for terms in postings[1:]:
+            candidates &= terms
+            if not candidates:
+                break
+        return candidates
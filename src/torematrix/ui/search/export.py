@@ -23,6 +23,7 @@ from PyQt6.QtWidgets import (
 )
 
 from torematrix.core.models.element import Element
+from torematrix.utils.export_streams import open_text_stream
 from .highlighting import HighlightedElement
 
 logger = logging.getLogger(__name__)
@@ -263,32 +264,40 @@ class ResultExporter(QThread):
         """Export to JSON format"""
         self._emit_progress("Converting to JSON...")
         
-        output_data = {
-            'export_info': {
-                'format': 'json',
-                'timestamp': datetime.now().isoformat(),
-                'total_elements': len(elements),
-                'configuration': self._serialize_config()
-            },
-            'elements': []
-        }
-        
-        for i, element in enumerate(elements):
-            self._update_progress(i)
-            
-            element_data = self._serialize_element(element)
-            output_data['elements'].append(element_data)
-        
-        # Write to file
-        output_file = self.output_path
-        if not output_file.endswith('.json'):
-            output_file += '.json'
+        output_file = self._output_file('.json')
+        indent = self.config.json_indent if self.config.json_pretty else None
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            if self.config.json_pretty:
-                json.dump(output_data, f, indent=self.config.json_indent, ensure_ascii=False)
+        export_info = {
+            'format': 'json',
+            'timestamp': datetime.now().isoformat(),
+            'total_elements': len(elements),
+            'configuration': self._serialize_config()
+        }
+        info_json = json.dumps(export_info, indent=indent, ensure_ascii=False)
+        
+        # Elements are written one at a time; the layout matches json.dump
+        # of the complete document without ever holding it in memory
+        with self._open_output(output_file) as f:
+            if indent is None:
+                f.write('{"export_info": ' + info_json + ', "elements": [')
+                separator, item_prefix, closing = ', ', '', ']}'
             else:
-                json.dump(output_data, f, ensure_ascii=False)
+                pad = ' ' * indent
+                f.write('{\n' + pad + '"export_info": ' + info_json.replace('\n', '\n' + pad)
+                        + ',\n' + pad + '"elements": [')
+                separator, item_prefix, closing = ',', '\n' + pad * 2, '\n' + pad + ']\n}'
+            
+            for i, element in enumerate(elements):
+                self._update_progress(i)
+                
+                element_json = json.dumps(self._serialize_element(element), indent=indent, ensure_ascii=False)
+                if indent is not None:
+                    element_json = element_json.replace('\n', item_prefix)
+                f.write((separator if i else '') + item_prefix + element_json)
+            
+            if not elements:
+                closing = ']}' if indent is None else ']\n}'
+            f.write(closing)
         
         return output_file
     
@@ -296,9 +305,7 @@ class ResultExporter(QThread):
         """Export to CSV format"""
         self._emit_progress("Converting to CSV...")
         
-        output_file = self.output_path
-        if not output_file.endswith('.csv'):
-            output_file += '.csv'
+        output_file = self._output_file('.csv')
         
         # Determine CSV columns
         columns = ['id', 'type', 'text', 'content']
@@ -309,7 +316,7 @@ class ResultExporter(QThread):
         if self.config.include_highlights:
             columns.extend(['highlighted_text', 'match_count', 'search_terms'])
         
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        with self._open_output(output_file, newline='') as f:
             writer = csv.writer(
                 f, 
                 delimiter=self.config.csv_delimiter,
@@ -333,31 +340,28 @@ class ResultExporter(QThread):
         """Export to XML format"""
         self._emit_progress("Converting to XML...")
         
-        # Create root element
-        root = ET.Element('search_results')
+        output_file = self._output_file('.xml')
         
         # Add metadata
-        info_elem = ET.SubElement(root, 'export_info')
+        info_elem = ET.Element('export_info')
         ET.SubElement(info_elem, 'format').text = 'xml'
         ET.SubElement(info_elem, 'timestamp').text = datetime.now().isoformat()
         ET.SubElement(info_elem, 'total_elements').text = str(len(elements))
         
-        # Add elements
-        elements_elem = ET.SubElement(root, 'elements')
-        
-        for i, element in enumerate(elements):
-            self._update_progress(i)
+        with self._open_output(output_file) as f:
+            f.write("<?xml version='1.0' encoding='utf-8'?>\n<search_results>")
+            f.write(ET.tostring(info_elem, encoding='unicode'))
+            f.write('<elements>')
             
-            elem_xml = self._serialize_element_for_xml(element)
-            elements_elem.append(elem_xml)
-        
-        # Write to file
-        output_file = self.output_path
-        if not output_file.endswith('.xml'):
-            output_file += '.xml'
-        
-        tree = ET.ElementTree(root)
-        tree.write(output_file, encoding='utf-8', xml_declaration=True)
+            # Serialize each element subtree on its own instead of building
+            # the whole document tree first
+            for i, element in enumerate(elements):
+                self._update_progress(i)
+                
+                elem_xml = self._serialize_element_for_xml(element)
+                f.write(ET.tostring(elem_xml, encoding='unicode'))
+            
+            f.write('</elements></search_results>')
         
         return output_file
     
@@ -366,27 +370,24 @@ class ResultExporter(QThread):
         self._emit_progress("Converting to HTML...")
         
         html_content = self._generate_html_template()
+        html_content = html_content.replace('{{TIMESTAMP}}', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        html_content = html_content.replace('{{TOTAL_ELEMENTS}}', str(len(elements)))
+        head, tail = html_content.split('{{ELEMENTS}}', 1)
         
-        # Add elements
-        elements_html = []
-        for i, element in enumerate(elements):
-            self._update_progress(i)
-            
-            element_html = self._serialize_element_for_html(element)
-            elements_html.append(element_html)
+        output_file = self._output_file('.html')
         
-        # Combine everything
-        final_html = html_content.replace('{{ELEMENTS}}', '\n'.join(elements_html))
-        final_html = final_html.replace('{{TIMESTAMP}}', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-        final_html = final_html.replace('{{TOTAL_ELEMENTS}}', str(len(elements)))
-        
-        # Write to file
-        output_file = self.output_path
-        if not output_file.endswith('.html'):
-            output_file += '.html'
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(final_html)
+        with self._open_output(output_file) as f:
+            f.write(head)
+            
+            # Add elements
+            for i, element in enumerate(elements):
+                self._update_progress(i)
+                
+                if i:
+                    f.write('\n')
+                f.write(self._serialize_element_for_html(element))
+            
+            f.write(tail)
         
         return output_file
     
@@ -394,11 +395,9 @@ class ResultExporter(QThread):
         """Export to plain text format"""
         self._emit_progress("Converting to text...")
         
-        output_file = self.output_path
-        if not output_file.endswith('.txt'):
-            output_file += '.txt'
+        output_file = self._output_file('.txt')
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with self._open_output(output_file) as f:
             # Write header
             f.write(f"Search Results Export\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -436,11 +435,9 @@ class ResultExporter(QThread):
         """Export to Markdown format"""
         self._emit_progress("Converting to Markdown...")
         
-        output_file = self.output_path
-        if not output_file.endswith('.md'):
-            output_file += '.md'
+        output_file = self._output_file('.md')
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with self._open_output(output_file) as f:
             # Write header
             f.write("# Search Results Export\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  \n")
@@ -496,6 +493,23 @@ class ResultExporter(QThread):
         
         return output_file
     
+    # Output helpers
+    
+    def _output_file(self, extension: str) -> str:
+        """Resolve the output path, adding the format and gzip extensions."""
+        output_file = self.output_path
+        if self.config.compress_output and output_file.endswith('.gz'):
+            output_file = output_file[:-3]
+        if not output_file.endswith(extension):
+            output_file += extension
+        if self.config.compress_output:
+            output_file += '.gz'
+        return output_file
+    
+    def _open_output(self, output_file: str, newline: Optional[str] = None) -> IO[str]:
+        """Open the output for streaming, gzip-compressing when configured."""
+        return open_text_stream(output_file, 'utf-8', self.config.compress_output, newline)
+    
     # Serialization helper methods
     
     def _serialize_config(self) -> Dict[str, Any]:
@@ -1009,7 +1023,8 @@ def export_elements(elements: List[Union[Element, HighlightedElement]],
     exporter = ResultExporter(elements, config, output_path)
     exporter.run()  # Synchronous execution
     
-    return output_path
+    # Compressed exports gain a .gz suffix
+    return exporter.progress.output_files[-1] if exporter.progress.output_files else output_path
 
 
 def show_export_dialog(elements: List[Union[Element, HighlightedElement]], 
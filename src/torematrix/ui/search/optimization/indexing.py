@@ -53,6 +53,9 @@ class IndexingConfig:
     enable_priority_queue: bool = True
     auto_optimize_index: bool = True
     checkpoint_interval: int = 1000  # Save progress every N elements
+    bulk_workers: int = 0  # Worker processes for bulk builds (0 = CPU count)
+    coalesce_updates: bool = True  # Merge queued tasks into one index update
+    max_coalesced_elements: int = 2000  # Upper bound for a coalesced update
 
 
 @dataclass
@@ -197,6 +200,7 @@ class BackgroundIndexer:
         
         # Checkpointing
         self.last_checkpoint = time.time()
+        self.last_checkpoint_elements = 0
         self.checkpoint_data: Dict[str, Any] = {}
         
         logger.info(f"BackgroundIndexer initialized with batch_size={self.config.batch_size}")
@@ -246,6 +250,10 @@ class BackgroundIndexer:
             except asyncio.CancelledError:
                 pass
         
+        # Persist whatever was indexed since the last checkpoint
+        if self.progress.processed_elements > self.last_checkpoint_elements:
+            await self._create_checkpoint()
+        
         with self.state_lock:
             self.is_running = False
             self.state = IndexingState.IDLE
@@ -326,6 +334,52 @@ class BackgroundIndexer:
         
         return task_ids
     
+    async def bulk_index(self, elements: List[Element]) -> IndexingResult:
+        """Index a large set of elements in one bulk build
+        
+        Indexers offering ``bulk_index`` tokenize in worker processes and
+        merge the partial indexes once; others receive the elements in
+        ``batch_size`` batches. Unlike queued tasks this runs immediately
+        and does not require the workers to be started.
+        
+        Args:
+            elements: Elements to index
+            
+        Returns:
+            IndexingResult of the build
+        """
+        task_id = str(uuid4())
+        start_time = time.time()
+        result = IndexingResult(
+            task_id=task_id,
+            success=False,
+            processed_count=0,
+            failed_count=0,
+            execution_time=0.0
+        )
+        self.progress.total_elements += len(elements)
+        
+        try:
+            if hasattr(self.search_indexer, 'bulk_index'):
+                await self.search_indexer.bulk_index(elements, self.config.bulk_workers or None)
+            else:
+                for i in range(0, len(elements), self.config.batch_size):
+                    await self.search_indexer.index_elements(elements[i:i + self.config.batch_size])
+            result.processed_count = len(elements)
+            result.success = True
+        except Exception as e:
+            logger.error(f"Error in bulk indexing {task_id}: {e}")
+            result.failed_count = len(elements)
+            result.errors.append(f"Bulk indexing failed: {str(e)}")
+        finally:
+            result.execution_time = time.time() - start_time
+        
+        self.statistics.update_from_result(result)
+        await self._update_progress(result)
+        
+        logger.info(f"Bulk indexed {result.processed_count} elements in {result.execution_time:.2f}s")
+        return result
+    
     def get_indexing_progress(self) -> IndexingProgress:
         """Get current indexing progress
         
@@ -427,16 +481,19 @@ class BackgroundIndexer:
         
         while not self.should_stop:
             try:
+                # Wait while paused, leaving queued tasks in place
+                if self.state == IndexingState.PAUSED:
+                    await asyncio.sleep(0.1)
+                    continue
+                
                 # Wait for task (with timeout to check stop condition)
                 task = await self._get_next_task(timeout=1.0)
                 
                 if task is None:
                     continue  # Timeout, check stop condition again
                 
-                # Skip if paused
-                if self.state == IndexingState.PAUSED:
-                    await asyncio.sleep(0.1)
-                    continue
+                if self.config.coalesce_updates:
+                    task = self._coalesce_pending(task)
                 
                 # Process task
                 result = await self._process_indexing_task(task, worker_id)
@@ -481,6 +538,56 @@ class BackgroundIndexer:
         except asyncio.TimeoutError:
             return None
     
+    def _coalesce_pending(self, task: IndexingTask) -> IndexingTask:
+        """Merge already queued tasks of the same priority into ``task``
+        
+        Incremental updates then reach the index as a few large batches
+        instead of many small ones. When an element is queued more than
+        once only its latest version is indexed; the superseded copies are
+        counted as processed.
+        
+        Args:
+            task: Task taken from the queue
+            
+        Returns:
+            ``task`` itself, or a task combining it with queued ones
+        """
+        tasks = [task]
+        total = len(task.elements)
+        
+        if self.config.enable_priority_queue:
+            queue = self.priority_queues[task.priority]
+            while queue and total + len(queue[0].elements) <= self.config.max_coalesced_elements:
+                tasks.append(queue.popleft())
+                total += len(tasks[-1].elements)
+        
+        while total < self.config.max_coalesced_elements:
+            try:
+                next_task = self.task_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            tasks.append(next_task)
+            total += len(next_task.elements)
+        
+        if len(tasks) == 1:
+            return task
+        
+        latest: Dict[str, Element] = {}
+        for queued in tasks:
+            for element in queued.elements:
+                latest.pop(element.element_id, None)
+                latest[element.element_id] = element
+        
+        return IndexingTask(
+            task_id=task.task_id,
+            elements=list(latest.values()),
+            priority=task.priority,
+            metadata={
+                'coalesced_task_ids': [queued.task_id for queued in tasks],
+                'superseded_elements': total - len(latest)
+            }
+        )
+    
     async def _process_indexing_task(self, task: IndexingTask, worker_id: str) -> IndexingResult:
         """Process a single indexing task
         
@@ -529,6 +636,8 @@ class BackgroundIndexer:
                     result.failed_count += len(batch)
                     result.errors.append(f"Batch {i//batch_size}: {str(e)}")
             
+            # Superseded duplicates of a coalesced task count as processed
+            result.processed_count += task.metadata.get('superseded_elements', 0)
             result.success = result.failed_count == 0
             task.completed_at = datetime.now()
             
@@ -575,13 +684,17 @@ class BackgroundIndexer:
                 except Exception as e:
                     logger.error(f"Error in progress callback: {e}")
         
-        # Checkpoint if needed
-        if (time.time() - self.last_checkpoint > self.config.checkpoint_interval and 
-            self.config.checkpoint_interval > 0):
+        # Checkpoint every checkpoint_interval processed elements
+        if (self.config.checkpoint_interval > 0 and
+            self.progress.processed_elements - self.last_checkpoint_elements >= self.config.checkpoint_interval):
             await self._create_checkpoint()
     
     async def _create_checkpoint(self) -> None:
-        """Create progress checkpoint"""
+        """Create progress checkpoint
+        
+        Indexers that persist their index (``flush``) commit it together with
+        the checkpoint, so indexing can resume from the last checkpoint.
+        """
         self.checkpoint_data = {
             'progress': {
                 'total_elements': self.progress.total_elements,
@@ -599,7 +712,15 @@ class BackgroundIndexer:
             'timestamp': datetime.now().isoformat()
         }
         
+        if hasattr(self.search_indexer, 'flush'):
+            try:
+                await self.search_indexer.flush(self.checkpoint_data)
+            except Exception as e:
+                logger.error(f"Error flushing index at checkpoint: {e}")
+                return
+        
         self.last_checkpoint = time.time()
+        self.last_checkpoint_elements = self.progress.processed_elements
         logger.debug("Created indexing checkpoint")
     
     async def _performance_monitor_loop(self) -> None:
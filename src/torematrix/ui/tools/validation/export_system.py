@@ -11,7 +11,7 @@ import xml.etree.ElementTree as ET
 from xml.dom import minidom
 import io
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -33,6 +33,9 @@ from torematrix.core.operations.hierarchy import HierarchyManager
 from torematrix.core.state import StateStore
 from torematrix.core.events import EventBus
 from torematrix.utils.geometry import Rect
+from torematrix.utils.export_streams import (
+    ProgressCallback, ThrottledProgress, serialize_batches, stream_to_file
+)
 
 
 logger = logging.getLogger(__name__)
@@ -88,7 +91,9 @@ class ExportOptions:
     max_text_length: int = -1  # -1 means no limit
     encoding: str = "utf-8"
     pretty_print: bool = True
-    compression: bool = False
+    compression: bool = False  # gzip the output while it is written
+    chunk_size: int = 1000  # elements serialized per streamed chunk
+    parallel_workers: int = 1  # threads serializing chunks concurrently
     output_path: str = ""
     template_path: str = ""
     additional_options: Dict[str, Any] = field(default_factory=dict)
@@ -122,9 +127,24 @@ class ExportEngine:
             ExportFormat.TXT: self._export_txt,
             ExportFormat.YAML: self._export_yaml,
         }
+        self.stream_formats = {
+            ExportFormat.JSON: self._stream_json,
+            ExportFormat.XML: self._stream_xml,
+            ExportFormat.CSV: self._stream_csv,
+            ExportFormat.HTML: self._stream_html,
+            ExportFormat.MARKDOWN: self._stream_markdown,
+            ExportFormat.TXT: self._stream_txt,
+            ExportFormat.YAML: self._stream_yaml,
+        }
     
-    def export(self, elements: List[Element], options: ExportOptions) -> ExportResult:
-        """Export elements using specified options."""
+    def export(self, elements: List[Element], options: ExportOptions,
+               progress_callback: Optional[ProgressCallback] = None) -> ExportResult:
+        """Export elements using specified options.
+        
+        Output is streamed to ``options.output_path`` chunk by chunk, so memory
+        use is bounded by ``options.chunk_size`` rather than the export size.
+        ``progress_callback(processed, total)`` is invoked as chunks complete.
+        """
         start_time = datetime.now()
         
         try:
@@ -145,7 +165,13 @@ class ExportEngine:
             
             # Export using appropriate handler
             if options.format in self.supported_formats:
-                export_data = self.supported_formats[options.format](filtered_elements, options)
+                if options.format in self.stream_formats:
+                    export_data = self.stream_formats[options.format](
+                        filtered_elements, options,
+                        ThrottledProgress(progress_callback) if progress_callback else None
+                    )
+                else:
+                    export_data = self.supported_formats[options.format](filtered_elements, options)
                 
                 # Write to file
                 file_size = self._write_to_file(export_data, options)
@@ -216,100 +242,211 @@ class ExportEngine:
     
     def _export_json(self, elements: List[Element], options: ExportOptions) -> str:
         """Export elements to JSON format."""
-        data = {
-            "export_info": {
-                "format": "json",
-                "timestamp": datetime.now().isoformat(),
-                "element_count": len(elements),
-                "options": {
-                    "include_metadata": options.include_metadata,
-                    "include_coordinates": options.include_coordinates,
-                    "include_hierarchy": options.include_hierarchy,
-                    "include_relationships": options.include_relationships,
-                }
-            },
-            "elements": []
+        return ''.join(self._stream_json(elements, options))
+    
+    def _export_xml(self, elements: List[Element], options: ExportOptions) -> str:
+        """Export elements to XML format."""
+        return ''.join(self._stream_xml(elements, options))
+    
+    def _export_csv(self, elements: List[Element], options: ExportOptions) -> str:
+        """Export elements to CSV format."""
+        return ''.join(self._stream_csv(elements, options))
+    
+    def _export_html(self, elements: List[Element], options: ExportOptions) -> str:
+        """Export elements to HTML format."""
+        return ''.join(self._stream_html(elements, options))
+    
+    def _export_markdown(self, elements: List[Element], options: ExportOptions) -> str:
+        """Export elements to Markdown format."""
+        return ''.join(self._stream_markdown(elements, options))
+    
+    def _export_txt(self, elements: List[Element], options: ExportOptions) -> str:
+        """Export elements to plain text format."""
+        return ''.join(self._stream_txt(elements, options))
+    
+    def _export_yaml(self, elements: List[Element], options: ExportOptions) -> str:
+        """Export elements to YAML format."""
+        return ''.join(self._stream_yaml(elements, options))
+    
+    # Streaming writers: each yields the export in chunks of at most
+    # options.chunk_size elements so output never has to fit in memory.
+    
+    def _serialize(self, elements: List[Element], options: ExportOptions,
+                   serializer, progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Serialize element chunks in order, in parallel when configured."""
+        return serialize_batches(
+            elements,
+            serializer,
+            batch_size=max(1, options.chunk_size),
+            max_workers=options.parallel_workers,
+            progress_callback=progress_callback
+        )
+    
+    def _element_text(self, element: Element, options: ExportOptions) -> str:
+        return element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
+    
+    def _element_type_name(self, element: Element) -> str:
+        return element.element_type.value if element.element_type else "unknown"
+    
+    def _export_info(self, format_name: str, elements: List[Element], options: ExportOptions) -> Dict[str, Any]:
+        return {
+            "format": format_name,
+            "timestamp": datetime.now().isoformat(),
+            "element_count": len(elements),
+            "options": {
+                "include_metadata": options.include_metadata,
+                "include_coordinates": options.include_coordinates,
+                "include_hierarchy": options.include_hierarchy,
+                "include_relationships": options.include_relationships,
+            }
+        }
+    
+    def _element_record(self, element: Element, options: ExportOptions, skip_empty: bool = False) -> Dict[str, Any]:
+        """Build the dictionary form of an element used by JSON and YAML."""
+        element_data = {
+            "id": element.id,
+            "type": self._element_type_name(element),
+            "text": self._element_text(element, options)
         }
         
-        for element in elements:
-            element_data = {
-                "id": element.id,
-                "type": element.element_type.value if element.element_type else "unknown",
-                "text": element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
+        if options.include_coordinates and element.bounds:
+            element_data["coordinates"] = {
+                "x": element.bounds.x,
+                "y": element.bounds.y,
+                "width": element.bounds.width,
+                "height": element.bounds.height
             }
-            
-            if options.include_coordinates and element.bounds:
-                element_data["coordinates"] = {
-                    "x": element.bounds.x,
-                    "y": element.bounds.y,
-                    "width": element.bounds.width,
-                    "height": element.bounds.height
-                }
-            
-            if options.include_hierarchy:
+        
+        if options.include_hierarchy:
+            if not skip_empty or element.parent_id:
                 element_data["parent_id"] = element.parent_id
+            if not skip_empty or element.children:
                 element_data["children"] = element.children
-            
-            if options.include_metadata and element.metadata:
-                element_data["metadata"] = element.metadata
-            
-            data["elements"].append(element_data)
         
-        return json.dumps(data, indent=2 if options.pretty_print else None, ensure_ascii=False)
+        if options.include_metadata and element.metadata:
+            element_data["metadata"] = element.metadata
+        
+        return element_data
     
-    def _export_xml(self, elements: List[Element], options: ExportOptions) -> str:
-        """Export elements to XML format."""
-        root = ET.Element("document")
+    def _stream_json(self, elements: List[Element], options: ExportOptions,
+                     progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as JSON, matching json.dumps layout of the full document."""
+        indent = 2 if options.pretty_print else None
+        info = json.dumps(self._export_info("json", elements, options), indent=indent, ensure_ascii=False)
+        
+        if indent is None:
+            yield '{"export_info": ' + info + ', "elements": ['
+            separator = ", "
+        else:
+            yield '{\n  "export_info": ' + info.replace('\n', '\n  ') + ',\n  "elements": ['
+            separator = ","
         
-        # Add export info
-        export_info = ET.SubElement(root, "export_info")
-        ET.SubElement(export_info, "format").text = "xml"
-        ET.SubElement(export_info, "timestamp").text = datetime.now().isoformat()
-        ET.SubElement(export_info, "element_count").text = str(len(elements))
+        if not elements:
+            yield ']}' if indent is None else ']\n}'
+            return
         
-        # Add elements
-        elements_elem = ET.SubElement(root, "elements")
+        def serialize(batch: List[Element]) -> List[str]:
+            records = [
+                json.dumps(self._element_record(e, options), indent=indent, ensure_ascii=False)
+                for e in batch
+            ]
+            if indent is not None:
+                records = ['\n    ' + r.replace('\n', '\n    ') for r in records]
+            return records
         
-        for element in elements:
-            elem_node = ET.SubElement(elements_elem, "element")
-            elem_node.set("id", element.id)
-            elem_node.set("type", element.element_type.value if element.element_type else "unknown")
-            
-            if options.include_text:
-                text_elem = ET.SubElement(elem_node, "text")
-                text_elem.text = element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
-            
-            if options.include_coordinates and element.bounds:
-                coords_elem = ET.SubElement(elem_node, "coordinates")
-                coords_elem.set("x", str(element.bounds.x))
-                coords_elem.set("y", str(element.bounds.y))
-                coords_elem.set("width", str(element.bounds.width))
-                coords_elem.set("height", str(element.bounds.height))
+        first = True
+        for records in self._serialize(elements, options, serialize, progress_callback):
+            chunk = separator.join(records)
+            yield chunk if first else separator + chunk
+            first = False
+        
+        yield ']}' if indent is None else '\n  ]\n}'
+    
+    def _xml_element_node(self, element: Element, options: ExportOptions) -> ET.Element:
+        elem_node = ET.Element("element")
+        elem_node.set("id", element.id)
+        elem_node.set("type", self._element_type_name(element))
+        
+        if options.include_text:
+            text_elem = ET.SubElement(elem_node, "text")
+            text_elem.text = self._element_text(element, options)
+        
+        if options.include_coordinates and element.bounds:
+            coords_elem = ET.SubElement(elem_node, "coordinates")
+            coords_elem.set("x", str(element.bounds.x))
+            coords_elem.set("y", str(element.bounds.y))
+            coords_elem.set("width", str(element.bounds.width))
+            coords_elem.set("height", str(element.bounds.height))
+        
+        if options.include_hierarchy:
+            if element.parent_id:
+                hierarchy_elem = ET.SubElement(elem_node, "hierarchy")
+                hierarchy_elem.set("parent_id", element.parent_id)
             
-            if options.include_hierarchy:
-                if element.parent_id:
-                    hierarchy_elem = ET.SubElement(elem_node, "hierarchy")
-                    hierarchy_elem.set("parent_id", element.parent_id)
-                
-                if element.children:
-                    children_elem = ET.SubElement(elem_node, "children")
-                    for child_id in element.children:
-                        child_elem = ET.SubElement(children_elem, "child")
-                        child_elem.set("id", child_id)
+            if element.children:
+                children_elem = ET.SubElement(elem_node, "children")
+                for child_id in element.children:
+                    child_elem = ET.SubElement(children_elem, "child")
+                    child_elem.set("id", child_id)
+        
+        return elem_node
+    
+    def _dom_node(self, document: minidom.Document, node: ET.Element) -> minidom.Element:
+        """Build the DOM that minidom.parseString would produce for ``node``."""
+        dom_node = document.createElement(node.tag)
+        for name, value in node.attrib.items():
+            dom_node.setAttribute(name, value)
+        if node.text:
+            # XML parsers normalize line endings in text content
+            text = node.text.replace('\r\n', '\n').replace('\r', '\n')
+            dom_node.appendChild(document.createTextNode(text))
+        for child in node:
+            dom_node.appendChild(self._dom_node(document, child))
+        return dom_node
+    
+    def _pretty_xml(self, nodes: List[ET.Element], level: int) -> str:
+        """Serialize ``nodes`` exactly as minidom.toprettyxml lays them out at ``level``."""
+        document = minidom.Document()
+        buffer = io.StringIO()
+        for node in nodes:
+            self._dom_node(document, node).writexml(buffer, "  " * level, "  ", "\n")
+        return buffer.getvalue()
+    
+    def _stream_xml(self, elements: List[Element], options: ExportOptions,
+                    progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as XML, one serialized <element> subtree at a time.
+        
+        The output is identical to serializing the whole document with
+        ET.tostring, or with minidom.toprettyxml when pretty printing.
+        """
+        header = ET.Element("export_info")
+        ET.SubElement(header, "format").text = "xml"
+        ET.SubElement(header, "timestamp").text = datetime.now().isoformat()
+        ET.SubElement(header, "element_count").text = str(len(elements))
         
-        # Pretty print if requested
         if options.pretty_print:
-            rough_string = ET.tostring(root, encoding='unicode')
-            reparsed = minidom.parseString(rough_string)
-            return reparsed.toprettyxml(indent="  ")
+            yield '<?xml version="1.0" ?>\n<document>\n' + self._pretty_xml([header], 1)
+            empty, opening, closing = '  <elements/>\n', '  <elements>\n', '  </elements>\n'
+            
+            def serialize(batch: List[Element]) -> str:
+                return self._pretty_xml([self._xml_element_node(e, options) for e in batch], 2)
+        else:
+            yield '<document>' + ET.tostring(header, encoding='unicode')
+            empty, opening, closing = '<elements />', '<elements>', '</elements>'
+            
+            def serialize(batch: List[Element]) -> str:
+                return ''.join(ET.tostring(self._xml_element_node(e, options), encoding='unicode')
+                               for e in batch)
+        
+        if elements:
+            yield opening
+            yield from self._serialize(elements, options, serialize, progress_callback)
+            yield closing
         else:
-            return ET.tostring(root, encoding='unicode')
+            yield empty
+        yield '</document>\n' if options.pretty_print else '</document>'
     
-    def _export_csv(self, elements: List[Element], options: ExportOptions) -> str:
-        """Export elements to CSV format."""
-        output = io.StringIO()
-        
-        # Prepare headers
+    def _csv_headers(self, options: ExportOptions) -> List[str]:
         headers = ["id", "type", "text"]
         if options.include_coordinates:
             headers.extend(["x", "y", "width", "height"])
@@ -317,38 +454,68 @@ class ExportEngine:
             headers.extend(["parent_id", "children"])
         if options.include_metadata:
             headers.append("metadata")
+        return headers
+    
+    def _csv_row(self, element: Element, options: ExportOptions) -> List[Any]:
+        row = [
+            element.id,
+            self._element_type_name(element),
+            self._element_text(element, options)
+        ]
         
-        writer = csv.writer(output)
-        writer.writerow(headers)
+        if options.include_coordinates:
+            if element.bounds:
+                row.extend([element.bounds.x, element.bounds.y, element.bounds.width, element.bounds.height])
+            else:
+                row.extend(["", "", "", ""])
         
-        # Write elements
-        for element in elements:
-            row = [
-                element.id,
-                element.element_type.value if element.element_type else "unknown",
-                element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
-            ]
-            
-            if options.include_coordinates:
-                if element.bounds:
-                    row.extend([element.bounds.x, element.bounds.y, element.bounds.width, element.bounds.height])
-                else:
-                    row.extend(["", "", "", ""])
-            
-            if options.include_hierarchy:
-                row.append(element.parent_id or "")
-                row.append("|".join(element.children) if element.children else "")
-            
-            if options.include_metadata:
-                row.append(json.dumps(element.metadata) if element.metadata else "")
-            
-            writer.writerow(row)
+        if options.include_hierarchy:
+            row.append(element.parent_id or "")
+            row.append("|".join(element.children) if element.children else "")
         
-        return output.getvalue()
+        if options.include_metadata:
+            row.append(json.dumps(element.metadata) if element.metadata else "")
+        
+        return row
     
-    def _export_html(self, elements: List[Element], options: ExportOptions) -> str:
-        """Export elements to HTML format."""
-        html_parts = [
+    def _stream_csv(self, elements: List[Element], options: ExportOptions,
+                    progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as CSV rows."""
+        def write_rows(rows: List[List[Any]]) -> str:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            return buffer.getvalue()
+        
+        yield write_rows([self._csv_headers(options)])
+        yield from self._serialize(
+            elements, options,
+            lambda batch: write_rows([self._csv_row(e, options) for e in batch]),
+            progress_callback
+        )
+    
+    def _html_element(self, element: Element, options: ExportOptions) -> List[str]:
+        parts = ['<div class="element">']
+        parts.append(f'<div class="element-header">Element: {element.id} ({self._element_type_name(element)})</div>')
+        
+        if options.include_text:
+            parts.append(f'<div class="element-text">{self._element_text(element, options)}</div>')
+        
+        if options.include_coordinates and element.bounds:
+            parts.append(f'<div class="element-metadata">Coordinates: ({element.bounds.x}, {element.bounds.y}, {element.bounds.width}, {element.bounds.height})</div>')
+        
+        if options.include_hierarchy:
+            if element.parent_id:
+                parts.append(f'<div class="element-metadata">Parent: {element.parent_id}</div>')
+            if element.children:
+                parts.append(f'<div class="element-metadata">Children: {", ".join(element.children)}</div>')
+        
+        parts.append('</div>')
+        return parts
+    
+    def _stream_html(self, elements: List[Element], options: ExportOptions,
+                     progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as an HTML document."""
+        yield '\n'.join([
             '<!DOCTYPE html>',
             '<html>',
             '<head>',
@@ -363,165 +530,142 @@ class ExportEngine:
             '</style>',
             '</head>',
             '<body>',
-            f'<h1>Document Export</h1>',
+            '<h1>Document Export</h1>',
             f'<p>Exported on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>',
             f'<p>Total elements: {len(elements)}</p>',
             '<hr>'
+        ])
+        
+        yield from self._serialize(
+            elements, options,
+            lambda batch: ''.join('\n' + '\n'.join(self._html_element(e, options)) for e in batch),
+            progress_callback
+        )
+        yield '\n</body>\n</html>'
+    
+    def _markdown_element(self, element: Element, options: ExportOptions) -> List[str]:
+        parts = [
+            f'## Element: {element.id}',
+            f'**Type:** {self._element_type_name(element)}',
+            ''
         ]
         
-        for element in elements:
-            html_parts.append('<div class="element">')
-            html_parts.append(f'<div class="element-header">Element: {element.id} ({element.element_type.value if element.element_type else "unknown"})</div>')
-            
-            if options.include_text:
-                text = element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
-                html_parts.append(f'<div class="element-text">{text}</div>')
-            
-            if options.include_coordinates and element.bounds:
-                html_parts.append(f'<div class="element-metadata">Coordinates: ({element.bounds.x}, {element.bounds.y}, {element.bounds.width}, {element.bounds.height})</div>')
-            
-            if options.include_hierarchy:
-                if element.parent_id:
-                    html_parts.append(f'<div class="element-metadata">Parent: {element.parent_id}</div>')
-                if element.children:
-                    html_parts.append(f'<div class="element-metadata">Children: {", ".join(element.children)}</div>')
-            
-            html_parts.append('</div>')
+        if options.include_text:
+            parts.append(f'**Text:** {self._element_text(element, options)}')
+            parts.append('')
         
-        html_parts.extend(['</body>', '</html>'])
+        if options.include_coordinates and element.bounds:
+            parts.append(f'**Coordinates:** ({element.bounds.x}, {element.bounds.y}, {element.bounds.width}, {element.bounds.height})')
+            parts.append('')
         
-        return '\n'.join(html_parts)
+        if options.include_hierarchy:
+            if element.parent_id:
+                parts.append(f'**Parent:** {element.parent_id}')
+            if element.children:
+                parts.append(f'**Children:** {", ".join(element.children)}')
+            parts.append('')
+        
+        parts.append('---')
+        parts.append('')
+        return parts
     
-    def _export_markdown(self, elements: List[Element], options: ExportOptions) -> str:
-        """Export elements to Markdown format."""
-        md_parts = [
+    def _stream_markdown(self, elements: List[Element], options: ExportOptions,
+                         progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as Markdown sections."""
+        yield '\n'.join([
             '# Document Export',
             f'Exported on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
             f'Total elements: {len(elements)}',
             '---',
             ''
+        ])
+        
+        yield from self._serialize(
+            elements, options,
+            lambda batch: ''.join('\n' + '\n'.join(self._markdown_element(e, options)) for e in batch),
+            progress_callback
+        )
+    
+    def _txt_element(self, index: int, element: Element, options: ExportOptions) -> List[str]:
+        parts = [
+            f'Element {index}: {element.id}',
+            f'Type: {self._element_type_name(element)}'
         ]
         
-        for element in elements:
-            # Element header
-            md_parts.append(f'## Element: {element.id}')
-            md_parts.append(f'**Type:** {element.element_type.value if element.element_type else "unknown"}')
-            md_parts.append('')
-            
-            # Element text
-            if options.include_text:
-                text = element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
-                md_parts.append(f'**Text:** {text}')
-                md_parts.append('')
-            
-            # Coordinates
-            if options.include_coordinates and element.bounds:
-                md_parts.append(f'**Coordinates:** ({element.bounds.x}, {element.bounds.y}, {element.bounds.width}, {element.bounds.height})')
-                md_parts.append('')
-            
-            # Hierarchy
-            if options.include_hierarchy:
-                if element.parent_id:
-                    md_parts.append(f'**Parent:** {element.parent_id}')
-                if element.children:
-                    md_parts.append(f'**Children:** {", ".join(element.children)}')
-                md_parts.append('')
-            
-            md_parts.append('---')
-            md_parts.append('')
+        if options.include_text:
+            parts.append(f'Text: {self._element_text(element, options)}')
+        
+        if options.include_coordinates and element.bounds:
+            parts.append(f'Coordinates: ({element.bounds.x}, {element.bounds.y}, {element.bounds.width}, {element.bounds.height})')
         
-        return '\n'.join(md_parts)
+        if options.include_hierarchy:
+            if element.parent_id:
+                parts.append(f'Parent: {element.parent_id}')
+            if element.children:
+                parts.append(f'Children: {", ".join(element.children)}')
+        
+        parts.append('-' * 30)
+        parts.append('')
+        return parts
     
-    def _export_txt(self, elements: List[Element], options: ExportOptions) -> str:
-        """Export elements to plain text format."""
-        text_parts = [
+    def _stream_txt(self, elements: List[Element], options: ExportOptions,
+                    progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as plain text."""
+        yield '\n'.join([
             'Document Export',
             f'Exported on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
             f'Total elements: {len(elements)}',
             '=' * 50,
             ''
-        ]
-        
-        for i, element in enumerate(elements, 1):
-            text_parts.append(f'Element {i}: {element.id}')
-            text_parts.append(f'Type: {element.element_type.value if element.element_type else "unknown"}')
-            
-            if options.include_text:
-                text = element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
-                text_parts.append(f'Text: {text}')
-            
-            if options.include_coordinates and element.bounds:
-                text_parts.append(f'Coordinates: ({element.bounds.x}, {element.bounds.y}, {element.bounds.width}, {element.bounds.height})')
-            
-            if options.include_hierarchy:
-                if element.parent_id:
-                    text_parts.append(f'Parent: {element.parent_id}')
-                if element.children:
-                    text_parts.append(f'Children: {", ".join(element.children)}')
-            
-            text_parts.append('-' * 30)
-            text_parts.append('')
-        
-        return '\n'.join(text_parts)
+        ])
+        
+        # Element numbers are global, so number the input before chunking
+        numbered = list(enumerate(elements, 1))
+        yield from self._serialize(
+            numbered, options,
+            lambda batch: ''.join('\n' + '\n'.join(self._txt_element(i, e, options)) for i, e in batch),
+            progress_callback
+        )
     
-    def _export_yaml(self, elements: List[Element], options: ExportOptions) -> str:
-        """Export elements to YAML format."""
+    def _stream_yaml(self, elements: List[Element], options: ExportOptions,
+                     progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+        """Stream elements as YAML, matching yaml.dump layout of the full document."""
         try:
             import yaml
-            
-            data = {
-                "export_info": {
-                    "format": "yaml",
-                    "timestamp": datetime.now().isoformat(),
-                    "element_count": len(elements),
-                    "options": {
-                        "include_metadata": options.include_metadata,
-                        "include_coordinates": options.include_coordinates,
-                        "include_hierarchy": options.include_hierarchy,
-                        "include_relationships": options.include_relationships,
-                    }
-                },
-                "elements": []
-            }
-            
-            for element in elements:
-                element_data = {
-                    "id": element.id,
-                    "type": element.element_type.value if element.element_type else "unknown",
-                    "text": element.text[:options.max_text_length] if options.max_text_length > 0 else element.text
-                }
-                
-                if options.include_coordinates and element.bounds:
-                    element_data["coordinates"] = {
-                        "x": element.bounds.x,
-                        "y": element.bounds.y,
-                        "width": element.bounds.width,
-                        "height": element.bounds.height
-                    }
-                
-                if options.include_hierarchy:
-                    if element.parent_id:
-                        element_data["parent_id"] = element.parent_id
-                    if element.children:
-                        element_data["children"] = element.children
-                
-                if options.include_metadata and element.metadata:
-                    element_data["metadata"] = element.metadata
-                
-                data["elements"].append(element_data)
-            
-            return yaml.dump(data, default_flow_style=False, allow_unicode=True)
-            
         except ImportError:
             # Fallback to JSON if yaml not available
-            return self._export_json(elements, options)
+            yield from self._stream_json(elements, options, progress_callback)
+            return
+        
+        # yaml.dump sorts keys, so the element list comes before export_info
+        if elements:
+            yield 'elements:\n'
+            yield from self._serialize(
+                elements, options,
+                lambda batch: yaml.dump(
+                    [self._element_record(e, options, skip_empty=True) for e in batch],
+                    default_flow_style=False, allow_unicode=True
+                ),
+                progress_callback
+            )
+        else:
+            yield 'elements: []\n'
+        
+        yield yaml.dump(
+            {"export_info": self._export_info("yaml", elements, options)},
+            default_flow_style=False, allow_unicode=True
+        )
     
-    def _write_to_file(self, data: str, options: ExportOptions) -> int:
-        """Write data to file and return file size."""
-        with open(options.output_path, 'w', encoding=options.encoding) as f:
-            f.write(data)
+    def _write_to_file(self, data: Union[str, Iterable[str]], options: ExportOptions) -> int:
+        """Write data (a string or an iterator of chunks) to file and return file size."""
+        if isinstance(data, str) and not options.compression:
+            with open(options.output_path, 'w', encoding=options.encoding) as f:
+                f.write(data)
+            
+            return len(data.encode(options.encoding))
         
-        return len(data.encode(options.encoding))
+        chunks = [data] if isinstance(data, str) else data
+        return stream_to_file(chunks, options.output_path, options.encoding, options.compression)
 
 
 class ExportWidget(QWidget):
@@ -923,9 +1067,8 @@ class ExportThread(QThread):
             self.progress_updated.emit(25)
             
             self.status_updated.emit("Exporting elements...")
-            self.progress_updated.emit(50)
             
-            result = self.engine.export(self.elements, self.options)
+            result = self.engine.export(self.elements, self.options, self._on_progress)
             
             self.status_updated.emit("Export completed!")
             self.progress_updated.emit(100)
@@ -942,4 +1085,9 @@ class ExportThread(QThread):
                 execution_time=0.0,
                 error_message=str(e)
             )
-            self.export_completed.emit(error_result)
\ No newline at end of file
+            self.export_completed.emit(error_result)
+    
+    def _on_progress(self, processed: int, total: int):
+        """Map streamed element progress onto the 25-100% range."""
+        if total:
+            self.progress_updated.emit(25 + int(75 * processed / total))
\ No newline at end of file
@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 
+from ...utils.rtree import PackedRTree
 from .coordinates import Rectangle, Point
 from .spatial import SpatialIndexManager, SpatialElement
 # Forward reference to avoid circular imports
@@ -47,6 +48,200 @@ class ElementCluster:
     importance: float = 0.5
 
 
+@dataclass
+class PyramidCell:
+    """Elements whose centers fall in one grid cell of an ElementPyramid level."""
+    members: Dict[str, Any] = field(default_factory=dict)
+    cluster: Optional[ElementCluster] = None  # cached aggregate, reset on edits
+
+
+class ElementPyramid:
+    """Multi-resolution grid of element aggregates for level-of-detail rendering.
+    
+    Level 0 uses square cells of ``base_cell_size`` document units and each
+    level above doubles the cell size. Every element is counted in exactly
+    one cell per level (the one containing its center), so adding, moving
+    or removing an element touches one cell per level and the aggregates of
+    untouched cells stay cached between frames.
+    """
+    
+    def __init__(self, base_cell_size: float = 8.0, levels: int = 12, cell_pixels: float = 24.0):
+        if base_cell_size <= 0 or levels <= 0:
+            raise ValueError("base_cell_size and levels must be positive")
+        
+        self.base_cell_size = base_cell_size
+        self.levels = levels
+        # Smallest on-screen size of an aggregate cell
+        self.cell_pixels = cell_pixels
+        
+        self.grids: List[Dict[Tuple[int, int], PyramidCell]] = [{} for _ in range(levels)]
+        self.centers: Dict[str, Tuple[float, float]] = {}
+        
+        self.total_edits = 0
+        self.cluster_builds = 0
+    
+    def __len__(self) -> int:
+        return len(self.centers)
+    
+    def __contains__(self, element_id: str) -> bool:
+        return element_id in self.centers
+    
+    def cell_size(self, level: int) -> float:
+        """Get the document-space edge length of cells at ``level``."""
+        return self.base_cell_size * 2.0 ** level
+    
+    def add(self, element: Any) -> None:
+        """Add an element, replacing an element with the same ID."""
+        element_id = element.element_id
+        if element_id in self.centers:
+            self.remove(element_id)
+        
+        bounds = element.bounds
+        center = (bounds.x + bounds.width / 2, bounds.y + bounds.height / 2)
+        self.centers[element_id] = center
+        for level, grid in enumerate(self.grids):
+            key = self._cell_key(center, level)
+            cell = grid.get(key)
+            if cell is None:
+                cell = grid[key] = PyramidCell()
+            cell.members[element_id] = element
+            cell.cluster = None
+        self.total_edits += 1
+    
+    def add_many(self, elements: List[Any]) -> None:
+        """Add several elements."""
+        for element in elements:
+            self.add(element)
+    
+    def remove(self, element_id: str) -> bool:
+        """Remove an element; returns False if it is not in the pyramid."""
+        center = self.centers.pop(element_id, None)
+        if center is None:
+            return False
+        
+        for level, grid in enumerate(self.grids):
+            key = self._cell_key(center, level)
+            cell = grid[key]
+            del cell.members[element_id]
+            if cell.members:
+                cell.cluster = None
+            else:
+                del grid[key]
+        self.total_edits += 1
+        return True
+    
+    def update(self, element: Any) -> None:
+        """Re-aggregate an element whose bounds or properties changed."""
+        self.add(element)
+    
+    def clear(self) -> None:
+        """Remove every element."""
+        for grid in self.grids:
+            grid.clear()
+        self.centers.clear()
+    
+    def level_for_zoom(self, zoom_level: float) -> int:
+        """Get the finest level whose cells are at least ``cell_pixels`` on screen."""
+        cells = self.cell_pixels / (self.base_cell_size * max(zoom_level, 1e-6))
+        level = math.ceil(math.log2(cells)) if cells > 1 else 0
+        return min(level, self.levels - 1)
+    
+    def query(self, region: Rectangle, zoom_level: float,
+              max_primitives: Optional[int] = None) -> List[ElementCluster]:
+        """Get the aggregates of the cells that overlap ``region`` at ``zoom_level``.
+        
+        Starts at the level matching the zoom and moves to coarser levels
+        until at most ``max_primitives`` cells cover the region, so the
+        result size is bounded no matter how many elements the region holds.
+        The top level is used when no level is coarse enough.
+        """
+        level = self.level_for_zoom(zoom_level)
+        if max_primitives is not None:
+            while level < self.levels - 1 and self._cell_count(region, level) > max_primitives:
+                level += 1
+        
+        clusters = []
+        for key, cell in self._cells_in(region, level):
+            if cell.cluster is None:
+                cell.cluster = self._build_cluster(level, key, cell)
+            if cell.cluster.bounds.intersects(region):
+                clusters.append(cell.cluster)
+        return clusters
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get pyramid statistics."""
+        return {
+            'element_count': len(self.centers),
+            'levels': self.levels,
+            'base_cell_size': self.base_cell_size,
+            'cells_per_level': [len(grid) for grid in self.grids],
+            'total_edits': self.total_edits,
+            'cluster_builds': self.cluster_builds
+        }
+    
+    def _cell_key(self, center: Tuple[float, float], level: int) -> Tuple[int, int]:
+        """Get the grid coordinates of the cell containing ``center``."""
+        size = self.cell_size(level)
+        return (math.floor(center[0] / size), math.floor(center[1] / size))
+    
+    def _cell_range(self, region: Rectangle, level: int) -> Tuple[int, int, int, int]:
+        """Get the first and last column and row a query of ``region`` scans."""
+        size = self.cell_size(level)
+        # Members overhang their cell by up to their own size, so scan
+        # the covering range with a one-cell border and let the caller
+        # check the aggregated bounds
+        return (math.floor(region.x / size) - 1,
+                math.floor((region.x + region.width) / size) + 1,
+                math.floor(region.y / size) - 1,
+                math.floor((region.y + region.height) / size) + 1)
+    
+    def _cell_count(self, region: Rectangle, level: int) -> int:
+        """Count the cells a query of ``region`` at ``level`` visits at most."""
+        first_column, last_column, first_row, last_row = self._cell_range(region, level)
+        cells = (last_column - first_column + 1) * (last_row - first_row + 1)
+        return min(cells, len(self.grids[level]))
+    
+    def _cells_in(self, region: Rectangle, level: int):
+        """Yield the non-empty cells whose members can overlap ``region``."""
+        grid = self.grids[level]
+        first_column, last_column, first_row, last_row = self._cell_range(region, level)
+        
+        if (last_column - first_column + 1) * (last_row - first_row + 1) > len(grid):
+            for key, cell in grid.items():
+                if first_column <= key[0] <= last_column and first_row <= key[1] <= last_row:
+                    yield key, cell
+            return
+        
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                cell = grid.get((column, row))
+                if cell is not None:
+                    yield (column, row), cell
+    
+    def _build_cluster(self, level: int, key: Tuple[int, int], cell: PyramidCell) -> ElementCluster:
+        """Aggregate the members of a cell."""
+        elements = list(cell.members.values())
+        min_x = min(e.bounds.x for e in elements)
+        min_y = min(e.bounds.y for e in elements)
+        max_x = max(e.bounds.x + e.bounds.width for e in elements)
+        max_y = max(e.bounds.y + e.bounds.height for e in elements)
+        bounds = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
+        
+        self.cluster_builds += 1
+        return ElementCluster(
+            cluster_id=f"lod_{level}_{key[0]}_{key[1]}",
+            elements=elements,
+            bounds=bounds,
+            centroid=Point(bounds.x + bounds.width / 2, bounds.y + bounds.height / 2),
+            zoom_level=self.cell_pixels / self.cell_size(level),
+            representative_element=max(elements, key=lambda e: e.bounds.width * e.bounds.height),
+            cluster_size=float(len(elements)),
+            cluster_type="lod",
+            layer_names={getattr(e, 'layer_name', '') for e in elements},
+            element_types={getattr(e, 'element_type', '') for e in elements}
+        )
+
+
 class ElementClusterer:
     """Main element clustering system."""
     
@@ -58,41 +253,36 @@ class ElementClusterer:
         self.total_clusterings = 0
         self.total_clustering_time = 0.0
         self.lock = threading.RLock()
+        
+        # Elements closer than this (in document units at zoom 1.0) share a
+        # cluster; the distance grows as the view zooms out.
+        self.cluster_distance = 20.0
+        self.min_cluster_size = 2
+        
+        # Level-of-detail pyramids per page, built once and edited in place
+        self.pyramids: Dict[str, ElementPyramid] = {}
+        self.max_aggregates = 500
     
     def cluster_elements(self, elements: List[Any], 
                         zoom_level: float, 
-                        strategy: Optional[ClusteringStrategy] = None) -> List[ElementCluster]:
-        """Cluster elements using specified or current strategy."""
+                        strategy: Optional[ClusteringStrategy] = None,
+                        page_key: Optional[str] = None) -> List[ElementCluster]:
+        """Cluster elements using specified or current strategy.
+        
+        With ``page_key`` the clusters come from the page's pyramid, which
+        is built from ``elements`` on the first call and afterwards only
+        changes through add_page_element() and remove_page_element().
+        """
         with self.lock:
             import time
             start_time = time.time()
             
-            # Simple spatial clustering for now
             clusters = []
             if zoom_level < 1.0 and len(elements) > 5:
-                # Create one cluster for low zoom levels
-                if elements:
-                    # Calculate bounds
-                    min_x = min(e.bounds.x for e in elements)
-                    min_y = min(e.bounds.y for e in elements)
-                    max_x = max(e.bounds.x + e.bounds.width for e in elements)
-                    max_y = max(e.bounds.y + e.bounds.height for e in elements)
-                    
-                    bounds = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
-                    centroid = Point(
-                        bounds.x + bounds.width / 2,
-                        bounds.y + bounds.height / 2
-                    )
-                    
-                    cluster = ElementCluster(
-                        cluster_id=f"cluster_0",
-                        elements=elements,
-                        bounds=bounds,
-                        centroid=centroid,
-                        zoom_level=zoom_level,
-                        cluster_type="spatial"
-                    )
-                    clusters.append(cluster)
+                if page_key is not None:
+                    clusters = self._pyramid_clusters(self.get_pyramid(page_key, elements), zoom_level)
+                else:
+                    clusters = self._spatial_clusters(elements, zoom_level)
             
             # Update performance metrics
             clustering_time = time.time() - start_time
@@ -101,6 +291,117 @@ class ElementClusterer:
             
             return clusters
     
+    def get_pyramid(self, page_key: str, elements: Optional[List[Any]] = None) -> ElementPyramid:
+        """Get the LOD pyramid of a page, building it from ``elements`` if missing."""
+        with self.lock:
+            pyramid = self.pyramids.get(page_key)
+            if pyramid is None:
+                pyramid = self.pyramids[page_key] = ElementPyramid()
+                pyramid.add_many(elements or [])
+            return pyramid
+    
+    def add_page_element(self, page_key: str, element: Any) -> None:
+        """Add or update an element in a page's pyramid."""
+        with self.lock:
+            self.get_pyramid(page_key).add(element)
+    
+    def remove_page_element(self, page_key: str, element_id: str) -> bool:
+        """Remove an element from a page's pyramid."""
+        with self.lock:
+            pyramid = self.pyramids.get(page_key)
+            return pyramid.remove(element_id) if pyramid else False
+    
+    def aggregate_region(self, page_key: str, region: Rectangle, zoom_level: float,
+                         max_primitives: Optional[int] = None) -> List[ElementCluster]:
+        """Get at most ``max_primitives`` aggregates covering ``region`` of a page."""
+        with self.lock:
+            if max_primitives is None:
+                max_primitives = self.max_aggregates
+            return self.get_pyramid(page_key).query(region, zoom_level, max_primitives)
+    
+    def invalidate_page(self, page_key: Optional[str] = None) -> None:
+        """Drop the pyramid of a page, or of every page if None."""
+        with self.lock:
+            if page_key is None:
+                self.pyramids.clear()
+            else:
+                self.pyramids.pop(page_key, None)
+    
+    def _pyramid_clusters(self, pyramid: ElementPyramid, zoom_level: float) -> List[ElementCluster]:
+        """Get the multi-element aggregates of a whole pyramid at ``zoom_level``."""
+        if not len(pyramid):
+            return []
+        
+        # The occupied top-level cells cover the page in a handful of lookups
+        top = pyramid.levels - 1
+        size = pyramid.cell_size(top)
+        columns = [column for column, _ in pyramid.grids[top]]
+        rows = [row for _, row in pyramid.grids[top]]
+        min_x, min_y = min(columns) * size, min(rows) * size
+        max_x, max_y = (max(columns) + 1) * size, (max(rows) + 1) * size
+        region = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
+        
+        return [cluster for cluster in pyramid.query(region, zoom_level, self.max_aggregates)
+                if len(cluster.elements) >= self.min_cluster_size]
+    
+    def _spatial_clusters(self, elements: List[Any], zoom_level: float) -> List[ElementCluster]:
+        """Group elements whose bounds are within the zoom-scaled cluster distance.
+        
+        Neighbours come from one batched R-tree query over the elements'
+        bounds expanded by the distance; connected neighbours are merged
+        with union-find.
+        """
+        margin = self.cluster_distance / max(zoom_level, 0.01)
+        boxes = [(e.bounds.x, e.bounds.y, e.bounds.x + e.bounds.width, e.bounds.y + e.bounds.height)
+                 for e in elements]
+        tree = PackedRTree()
+        tree.load(range(len(elements)), boxes)
+        neighbours = tree.search_many([(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+                                       for x0, y0, x1, y1 in boxes])
+        
+        parent = list(range(len(elements)))
+        
+        def find(index: int) -> int:
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+        
+        for index, near in enumerate(neighbours):
+            for other in near:
+                root, other_root = find(index), find(other)
+                if root != other_root:
+                    parent[max(root, other_root)] = min(root, other_root)
+        
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(elements)):
+            groups.setdefault(find(index), []).append(index)
+        
+        clusters = []
+        for members in groups.values():
+            if len(members) < self.min_cluster_size:
+                continue
+            
+            min_x = min(boxes[i][0] for i in members)
+            min_y = min(boxes[i][1] for i in members)
+            max_x = max(boxes[i][2] for i in members)
+            max_y = max(boxes[i][3] for i in members)
+            bounds = Rectangle(min_x, min_y, max_x - min_x, max_y - min_y)
+            
+            cluster_elements = [elements[i] for i in members]
+            clusters.append(ElementCluster(
+                cluster_id=f"cluster_{len(clusters)}",
+                elements=cluster_elements,
+                bounds=bounds,
+                centroid=Point(bounds.x + bounds.width / 2, bounds.y + bounds.height / 2),
+                zoom_level=zoom_level,
+                cluster_type="spatial",
+                layer_names={getattr(e, 'layer_name', '') for e in cluster_elements},
+                element_types={getattr(e, 'element_type', '') for e in cluster_elements}
+            ))
+        
+        return clusters
+    
     def get_statistics(self) -> Dict[str, Any]:
         """Get clustering statistics."""
         with self.lock:
@@ -112,5 +413,6 @@ class ElementClusterer:
                 'total_clusterings': self.total_clusterings,
                 'average_clustering_time': avg_time,
                 'cache_entries': len(self.cluster_cache),
-                'cache_max_age': self.cache_max_age
+                'cache_max_age': self.cache_max_age,
+                'pyramid_pages': len(self.pyramids)
             }
\ No newline at end of file
@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 
+from .clustering import ElementCluster, ElementPyramid
 from .coordinates import Rectangle, Point
 from .spatial import SpatialIndexManager, SpatialElement
 # Forward reference to avoid circular imports
@@ -64,6 +65,8 @@ class CullingResult:
     culling_time_ms: float
     lod_level: int
     cache_hit: bool = False
+    # Set instead of visible_elements when a dense view is drawn as aggregates
+    aggregates: List[ElementCluster] = field(default_factory=list)
     
     @property
     def cull_ratio(self) -> float:
@@ -215,6 +218,10 @@ class ViewportCuller:
         self.preload_margin = 100.0  # pixels
         self.min_element_size_pixels = 2.0
         
+        # Level-of-detail aggregation for dense views at low zoom
+        self.lod_pyramid: Optional[ElementPyramid] = None
+        self.max_lod_primitives = 500
+        
         # Thread safety
         self.lock = threading.RLock()
     
@@ -229,36 +236,150 @@ class ViewportCuller:
                 if cached_result is not None:
                     return cached_result
             
-            # Perform culling based on strategy
-            if self.strategy == CullingStrategy.BASIC:
-                result = self._basic_culling(viewport)
-            elif self.strategy == CullingStrategy.HIERARCHICAL:
-                result = self._hierarchical_culling(viewport)
-            elif self.strategy == CullingStrategy.FRUSTUM:
-                result = self._frustum_culling(viewport)
-            elif self.strategy == CullingStrategy.OCCLUSION:
-                result = self._occlusion_culling(viewport)
-            else:
-                result = self._basic_culling(viewport)
+            aggregated = self._aggregate(viewport, start_time)
+            if aggregated is not None:
+                return aggregated
             
-            # Update performance metrics
-            culling_time = (time.time() - start_time) * 1000
-            result.culling_time_ms = culling_time
-            self._update_performance_metrics(culling_time)
+            return self._cull(viewport, start_time)
+    
+    def cull_many(self, viewports: List[ViewportBounds]) -> List[CullingResult]:
+        """Cull several viewports, e.g. every visible page, with one batched index query."""
+        with self.lock:
+            results: List[Optional[CullingResult]] = [None] * len(viewports)
+            pending = []
+            for position, viewport in enumerate(viewports):
+                if self.enable_caching:
+                    results[position] = self.cache.get(viewport, self.strategy)
+                if results[position] is None:
+                    results[position] = self._aggregate(viewport, time.time())
+                if results[position] is None:
+                    pending.append(position)
             
-            # Cache result
-            if self.enable_caching:
-                self.cache.put(viewport, self.strategy, result)
+            regions = [self._query_bounds(viewports[position]) for position in pending]
+            candidates = self.spatial_index.query_regions(regions) if regions else []
+            for position, elements in zip(pending, candidates):
+                results[position] = self._cull(viewports[position], time.time(), elements)
             
-            return result
+            return results
     
-    def _basic_culling(self, viewport: ViewportBounds) -> CullingResult:
-        """Basic viewport culling using simple intersection."""
-        # Expand viewport bounds for preloading
-        expanded_bounds = viewport.expanded_bounds()
+    def enable_lod_aggregation(self, enable: bool = True, max_primitives: Optional[int] = None) -> None:
+        """Draw dense low-zoom views as pyramid aggregates instead of elements.
+        
+        The pyramid is built once from the spatial index and then kept up to
+        date through the index's change listeners.
+        """
+        with self.lock:
+            if max_primitives is not None:
+                self.max_lod_primitives = max_primitives
+            
+            if enable and self.lod_pyramid is None:
+                self.lod_pyramid = ElementPyramid()
+                self.lod_pyramid.add_many([spatial_element.element for spatial_element
+                                           in self.spatial_index.spatial_index.get_all_elements()])
+                self.spatial_index.add_change_listener(self._on_index_change)
+            elif not enable and self.lod_pyramid is not None:
+                self.spatial_index.remove_change_listener(self._on_index_change)
+                self.lod_pyramid = None
+            
+            self.cache.clear()
+    
+    def _on_index_change(self, action: str, element: Any) -> None:
+        """Apply a spatial index edit to the LOD pyramid."""
+        with self.lock:
+            if self.lod_pyramid is None:
+                return
+            if action == 'add':
+                self.lod_pyramid.add(element)
+            else:
+                self.lod_pyramid.remove(element.element_id)
+            self.cache.clear()
+    
+    def _aggregate(self, viewport: ViewportBounds, start_time: float) -> Optional[CullingResult]:
+        """Cull a dense low-detail view to pyramid aggregates.
+        
+        Returns None when aggregation is off, the view is detailed enough
+        or the visible elements fit in max_lod_primitives, in which case
+        they are culled individually as usual.
+        """
+        if (self.lod_pyramid is None or not self.enable_lod
+                or self.strategy not in (CullingStrategy.HIERARCHICAL, CullingStrategy.OCCLUSION)):
+            return None
+        
+        lod_level = viewport.get_lod_level()
+        if lod_level < 2:
+            return None
+        
+        aggregates = self.lod_pyramid.query(viewport.bounds, viewport.zoom_level, self.max_lod_primitives)
+        total = sum(len(cluster.elements) for cluster in aggregates)
+        if total <= self.max_lod_primitives:
+            return None
         
-        # Query spatial index
-        all_elements = self.spatial_index.query_region(expanded_bounds)
+        result = CullingResult(
+            visible_elements=[],
+            culled_count=total,
+            total_elements=total,
+            culling_time_ms=0.0,
+            lod_level=lod_level,
+            aggregates=aggregates
+        )
+        result.culling_time_ms = (time.time() - start_time) * 1000
+        self._update_performance_metrics(result.culling_time_ms)
+        
+        if self.enable_caching:
+            self.cache.put(viewport, self.strategy, result)
+        
+        return result
+    
+    def _cull(self, viewport: ViewportBounds, start_time: float,
+              candidates: Optional[List[Any]] = None) -> CullingResult:
+        """Run the current strategy, then record metrics and cache the result."""
+        # Perform culling based on strategy
+        if self.strategy == CullingStrategy.HIERARCHICAL:
+            result = self._hierarchical_culling(viewport, candidates)
+        elif self.strategy == CullingStrategy.FRUSTUM:
+            result = self._frustum_culling(viewport, candidates)
+        elif self.strategy == CullingStrategy.OCCLUSION:
+            result = self._occlusion_culling(viewport, candidates)
+        else:
+            result = self._basic_culling(viewport, candidates)
+        
+        # Update performance metrics
+        culling_time = (time.time() - start_time) * 1000
+        result.culling_time_ms = culling_time
+        self._update_performance_metrics(culling_time)
+        
+        # Cache result
+        if self.enable_caching:
+            self.cache.put(viewport, self.strategy, result)
+        
+        return result
+    
+    def _lod_parameters(self, lod_level: int) -> Tuple[float, float]:
+        """Margin multiplier and minimum element size for a LOD level."""
+        if lod_level == 0:  # Highest detail
+            return 1.5, self.min_element_size_pixels
+        elif lod_level == 1:  # Medium detail
+            return 1.2, self.min_element_size_pixels * 1.5
+        elif lod_level == 2:  # Low detail
+            return 1.0, self.min_element_size_pixels * 2.0
+        else:  # Lowest detail
+            return 0.8, self.min_element_size_pixels * 3.0
+    
+    def _query_bounds(self, viewport: ViewportBounds) -> Rectangle:
+        """Apply the strategy's preload margin to the viewport and return the region to query."""
+        if self.strategy in (CullingStrategy.HIERARCHICAL, CullingStrategy.OCCLUSION):
+            margin_multiplier, _ = self._lod_parameters(viewport.get_lod_level())
+            viewport.margin = self.preload_margin * margin_multiplier
+        elif self.strategy == CullingStrategy.FRUSTUM:
+            viewport.margin = self.preload_margin
+        return viewport.expanded_bounds()
+    
+    def _basic_culling(self, viewport: ViewportBounds, candidates: Optional[List[Any]] = None) -> CullingResult:
+        """Basic viewport culling using simple intersection."""
+        # Query spatial index unless a batch query already did
+        if candidates is None:
+            candidates = self.spatial_index.query_region(viewport.expanded_bounds())
+        all_elements = candidates
         visible_elements = []
         
         viewport_center = Point(
@@ -282,30 +403,17 @@ class ViewportCuller:
             lod_level=viewport.get_lod_level()
         )
     
-    def _hierarchical_culling(self, viewport: ViewportBounds) -> CullingResult:
+    def _hierarchical_culling(self, viewport: ViewportBounds, candidates: Optional[List[Any]] = None) -> CullingResult:
         """Hierarchical culling with level-of-detail support."""
         lod_level = viewport.get_lod_level()
         
         # Adjust culling parameters based on LOD
-        if lod_level == 0:  # Highest detail
-            margin_multiplier = 1.5
-            size_threshold = self.min_element_size_pixels
-        elif lod_level == 1:  # Medium detail
-            margin_multiplier = 1.2
-            size_threshold = self.min_element_size_pixels * 1.5
-        elif lod_level == 2:  # Low detail
-            margin_multiplier = 1.0
-            size_threshold = self.min_element_size_pixels * 2.0
-        else:  # Lowest detail
-            margin_multiplier = 0.8
-            size_threshold = self.min_element_size_pixels * 3.0
+        _, size_threshold = self._lod_parameters(lod_level)
         
-        # Expand viewport with LOD-adjusted margin
-        viewport.margin = self.preload_margin * margin_multiplier
-        expanded_bounds = viewport.expanded_bounds()
-        
-        # Query spatial index
-        all_elements = self.spatial_index.query_region(expanded_bounds)
+        # Query spatial index with the LOD-adjusted margin
+        if candidates is None:
+            candidates = self.spatial_index.query_region(self._query_bounds(viewport))
+        all_elements = candidates
         visible_elements = []
         
         viewport_center = Point(
@@ -327,7 +435,7 @@ class ViewportCuller:
             lod_level=lod_level
         )
     
-    def _frustum_culling(self, viewport: ViewportBounds) -> CullingResult:
+    def _frustum_culling(self, viewport: ViewportBounds, candidates: Optional[List[Any]] = None) -> CullingResult:
         """Frustum culling for 3D-like behavior."""
         # For 2D, this is similar to hierarchical but with distance-based importance
         lod_level = viewport.get_lod_level()
@@ -340,12 +448,10 @@ class ViewportCuller:
         
         max_distance = max(viewport.bounds.width, viewport.bounds.height) * 0.7
         
-        # Expand viewport for frustum
-        viewport.margin = self.preload_margin
-        expanded_bounds = viewport.expanded_bounds()
-        
-        # Query spatial index
-        all_elements = self.spatial_index.query_region(expanded_bounds)
+        # Query spatial index with the frustum margin
+        if candidates is None:
+            candidates = self.spatial_index.query_region(self._query_bounds(viewport))
+        all_elements = candidates
         visible_elements = []
         
         for element in all_elements:
@@ -372,10 +478,10 @@ class ViewportCuller:
             lod_level=lod_level
         )
     
-    def _occlusion_culling(self, viewport: ViewportBounds) -> CullingResult:
+    def _occlusion_culling(self, viewport: ViewportBounds, candidates: Optional[List[Any]] = None) -> CullingResult:
         """Advanced occlusion culling (simplified for 2D)."""
         # Start with hierarchical culling
-        result = self._hierarchical_culling(viewport)
+        result = self._hierarchical_culling(viewport, candidates)
         
         # Sort by z-index (front to back)
         result.visible_elements.sort(key=lambda e: e.get_z_index(), reverse=True)
@@ -529,6 +635,8 @@ class ViewportCuller:
             'lod_enabled': self.enable_lod,
             'preload_margin': self.preload_margin,
             'min_element_size_pixels': self.min_element_size_pixels,
+            'lod_aggregation': self.lod_pyramid is not None,
+            'max_lod_primitives': self.max_lod_primitives,
             'cache_statistics': cache_stats
         }
     
@@ -540,6 +648,7 @@ class ViewportCuller:
         """Clean up culling resources."""
         self.cache.clear()
         self.element_cull_info.clear()
+        self.enable_lod_aggregation(False)
         
         # Reset statistics
         self.total_culls = 0
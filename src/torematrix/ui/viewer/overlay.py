@@ -14,13 +14,14 @@ from dataclasses import dataclass, field
 
 import numpy as np
 from PyQt6.QtCore import QObject, QRectF, QTimer, pyqtSignal
-from PyQt6.QtGui import QColor, QPainter, QPen, QBrush
+from PyQt6.QtGui import QColor, QPainter, QPen, QBrush, QTransform
 from PyQt6.QtWidgets import QWidget
 
 from .coordinates import CoordinateTransform, Rectangle, Point
 from .layers import LayerManager, OverlayLayer
-from .renderer import RendererBackend, CanvasRenderer, SVGRenderer
-from .pipeline import RenderPipeline, RenderOperation, RenderPriority
+from .renderer import RendererBackend, CanvasRenderer, SVGRenderer, RenderingPerformanceProfiler
+from .pipeline import DirtyRegionTracker, RenderPipeline, RenderOperation, RenderPriority
+from .tiles import OverlayTileCache
 
 
 class RenderBackend(Enum):
@@ -123,6 +124,14 @@ class OverlayEngine:
         self.render_pipeline: Optional[RenderPipeline] = None
         self.use_pipeline = False
         
+        # Tiled overlay cache (canvas backend only)
+        self.tile_cache: Optional[OverlayTileCache] = None
+        self.frame_profiler: Optional[RenderingPerformanceProfiler] = None
+        self.tile_timer = QTimer()
+        self.tile_timer.setSingleShot(True)
+        self.tile_timer.timeout.connect(self._rebuild_deferred_tiles)
+        self.deferred_tiles_per_tick = 4
+        
         # Initialize backend
         self.set_backend(backend)
         
@@ -139,6 +148,9 @@ class OverlayEngine:
             raise ValueError(f"Unsupported backend: {backend}")
         
         self.current_backend = backend
+        if self.tile_cache:
+            # Tiles hold output of the previous backend
+            self.tile_cache.clear()
         self.signals.backend_changed.emit(backend.value)
     
     def get_backend(self) -> RenderBackend:
@@ -153,6 +165,8 @@ class OverlayEngine:
                 viewport_bounds=self.viewport_info.bounds,
                 zoom_level=self.viewport_info.zoom_level
             )
+            if self.tile_cache:
+                self.tile_cache.dirty_tracker.update_viewport(bounds)
             self.schedule_render()
     
     def set_viewport(self, bounds: Rectangle, zoom_level: float = 1.0, center: Optional[Point] = None) -> None:
@@ -179,7 +193,13 @@ class OverlayEngine:
     
     def create_layer(self, name: str, z_index: int = 0) -> OverlayLayer:
         """Create a new overlay layer."""
-        layer = self.layer_manager.create_layer(name, z_index)
+        layer = self.layer_manager.create_layer(name, z_index=z_index)
+        
+        # Cached tiles hold the composed layers, so layer changes invalidate them
+        layer.signals.visibility_changed.connect(lambda _: self.invalidate_layer(name))
+        layer.signals.z_index_changed.connect(lambda _: self.invalidate_layer(name))
+        layer.signals.style_changed.connect(lambda _: self.invalidate_layer(name))
+        
         self.signals.layer_added.emit(name)
         return layer
     
@@ -188,6 +208,7 @@ class OverlayEngine:
         removed = self.layer_manager.remove_layer(name)
         if removed:
             self.signals.layer_removed.emit(name)
+            self._invalidate_tiles()
             self.schedule_render()
         return removed
     
@@ -223,6 +244,7 @@ class OverlayEngine:
         layer = self.layer_manager.get_layer(layer_name)
         if layer:
             layer.clear()
+            self._invalidate_tiles()
             self.schedule_render()
             return True
         return False
@@ -263,10 +285,13 @@ class OverlayEngine:
             if self.renderer_backend and self.viewport_info:
                 self.renderer_backend.begin_render(context)
                 
-                # Render layers in z-order
-                for layer in self.layer_manager.get_layers_by_z_order():
-                    if layer.is_visible():
-                        self._render_layer(layer, context)
+                if self._tiles_active():
+                    self._composite_tiles()
+                else:
+                    # Render layers in z-order
+                    for layer in self.layer_manager.get_layers_by_z_order():
+                        if layer.is_visible():
+                            self._render_layer(layer, context)
                 
                 self.renderer_backend.end_render()
             
@@ -328,8 +353,103 @@ class OverlayEngine:
     def _mark_dirty(self, bounds: Rectangle) -> None:
         """Mark a region as dirty for re-rendering."""
         self.dirty_regions.append(bounds)
+        if self.tile_cache:
+            self.tile_cache.dirty_tracker.mark_dirty(bounds)
         self.schedule_render()
     
+    def enable_tile_cache(self, enable: bool = True, tile_size: int = 256, max_tiles: int = 256) -> None:
+        """Enable or disable the tiled overlay cache.
+        
+        With the cache, frames composite pre-rendered tiles instead of painting
+        every element, and only tiles touched by dirty regions are repainted.
+        """
+        if enable and not self.tile_cache:
+            self.frame_profiler = RenderingPerformanceProfiler()
+            self.tile_cache = OverlayTileCache(
+                self._paint_tile_region,
+                tile_size=tile_size,
+                max_tiles=max_tiles,
+                dirty_tracker=DirtyRegionTracker(self._tile_tracker_bounds()),
+                profiler=self.frame_profiler
+            )
+            self.schedule_render()
+        elif not enable and self.tile_cache:
+            self.tile_timer.stop()
+            self.tile_cache.clear()
+            self.tile_cache = None
+            self.frame_profiler = None
+            self.schedule_render()
+    
+    def _tiles_active(self) -> bool:
+        """Check if this frame is composited from tiles."""
+        return (self.tile_cache is not None and
+                isinstance(self.renderer_backend, CanvasRenderer) and
+                self.renderer_backend.painter is not None)
+    
+    def _tile_tracker_bounds(self) -> Optional[Rectangle]:
+        """Document-space bounds covered by the tile dirty tracker.
+        
+        Tiles cover the whole document, so without document bounds dirty
+        regions are not clipped at all rather than clipped to the viewport.
+        """
+        if self.coordinate_transform:
+            return self.coordinate_transform.document_bounds
+        return None
+    
+    def _invalidate_tiles(self) -> None:
+        """Invalidate every cached tile."""
+        if self.tile_cache:
+            self.tile_cache.dirty_tracker.mark_full_redraw()
+    
+    def _composite_tiles(self) -> None:
+        """Draw the visible overlay from cached tiles."""
+        painter = self.renderer_backend.painter
+        
+        if self.coordinate_transform:
+            matrix = self.coordinate_transform.doc_to_screen_matrix
+            transform = QTransform(matrix[0, 0], matrix[1, 0], matrix[0, 1],
+                                   matrix[1, 1], matrix[0, 2], matrix[1, 2])
+            visible_region = self.coordinate_transform.get_visible_document_bounds()
+            zoom = self.coordinate_transform.zoom_level
+        else:
+            transform = QTransform()
+            visible_region = self.viewport_info.bounds
+            zoom = 1.0
+        
+        painter.save()
+        painter.setTransform(transform, True)
+        self.tile_cache.composite(painter, visible_region, zoom)
+        painter.restore()
+        
+        if self.tile_cache.has_deferred_work() and not self.tile_timer.isActive():
+            self.tile_timer.start(50)
+    
+    def _paint_tile_region(self, painter: QPainter, region: Rectangle) -> int:
+        """Paint visible elements intersecting a document region onto a tile."""
+        if not isinstance(self.renderer_backend, CanvasRenderer):
+            return 0
+        
+        entries = []
+        for layer in self.layer_manager.get_layers_by_z_order():
+            if layer.is_visible():
+                for element in layer.get_elements_in_bounds(region):
+                    entries.append((element, element.get_bounds(), element.get_style()))
+        
+        return self.renderer_backend.render_to_painter(painter, entries)
+    
+    def _rebuild_deferred_tiles(self) -> None:
+        """Repaint a few off-screen dirty tiles while no frame is pending."""
+        if not self.tile_cache:
+            return
+        
+        if self.render_scheduled or self.is_rendering:
+            self.tile_timer.start(50)
+            return
+        
+        self.tile_cache.rebuild_deferred(self.deferred_tiles_per_tick)
+        if self.tile_cache.has_deferred_work():
+            self.tile_timer.start(50)
+    
     def _update_performance_metrics(self, render_time: float) -> None:
         """Update performance metrics."""
         self.performance_metrics['render_times'].append(render_time)
@@ -552,6 +672,11 @@ class OverlayEngine:
             'use_pipeline': self.use_pipeline
         }
         
+        # Add tile cache statistics
+        if self.tile_cache:
+            stats['tile_cache'] = self.tile_cache.get_statistics()
+            stats['frame_metrics'] = self.frame_profiler.get_average_metrics()
+        
         # Add pipeline statistics
         if self.render_pipeline:
             stats['pipeline_metrics'] = self.render_pipeline.get_performance_metrics()
@@ -575,6 +700,11 @@ class OverlayEngine:
         if self.render_timer:
             self.render_timer.stop()
         
+        self.tile_timer.stop()
+        if self.tile_cache:
+            self.tile_cache.clear()
+            self.tile_cache = None
+        
         if self.render_pipeline:
             self.render_pipeline.cleanup()
             self.render_pipeline = None
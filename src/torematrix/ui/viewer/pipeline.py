@@ -208,7 +208,8 @@ class RenderScheduler:
 class DirtyRegionTracker:
     """Tracks dirty regions that need re-rendering."""
     
-    def __init__(self, viewport_bounds: Rectangle):
+    def __init__(self, viewport_bounds: Optional[Rectangle]):
+        # None when the bounds are unknown; regions are then kept unclipped
         self.viewport_bounds = viewport_bounds
         self.dirty_regions: List[Rectangle] = []
         self.full_redraw_needed = False
@@ -220,12 +221,15 @@ class DirtyRegionTracker:
             if self.full_redraw_needed:
                 return
             
-            # Check if region is within viewport
-            if not self.viewport_bounds.intersects(region):
-                return
-            
-            # Clip region to viewport
-            clipped_region = self.viewport_bounds.intersection(region)
+            if self.viewport_bounds is None:
+                clipped_region = region
+            else:
+                # Check if region is within viewport
+                if not self.viewport_bounds.intersects(region):
+                    return
+                
+                # Clip region to viewport
+                clipped_region = self.viewport_bounds.intersection(region)
             
             # Try to merge with existing dirty regions
             merged = False
@@ -239,21 +243,31 @@ class DirtyRegionTracker:
             if not merged:
                 self.dirty_regions.append(clipped_region)
             
+            if self.viewport_bounds is None:
+                return
+            
             # Check if we should do full redraw
             total_dirty_area = sum(r.width * r.height for r in self.dirty_regions)
             viewport_area = self.viewport_bounds.width * self.viewport_bounds.height
             
             if total_dirty_area > viewport_area * 0.75:  # 75% threshold
-                self.mark_full_redraw()
+                self._set_full_redraw()
     
     def mark_full_redraw(self) -> None:
         """Mark for full redraw."""
         with QMutexLocker(self.mutex):
-            self.full_redraw_needed = True
-            self.dirty_regions.clear()
+            self._set_full_redraw()
+    
+    def _set_full_redraw(self) -> None:
+        """Switch to full redraw; the caller holds the (non-recursive) mutex."""
+        self.full_redraw_needed = True
+        self.dirty_regions.clear()
     
-    def get_dirty_regions(self) -> List[Rectangle]:
-        """Get current dirty regions."""
+    def get_dirty_regions(self) -> List[Optional[Rectangle]]:
+        """Get current dirty regions.
+        
+        A full redraw with unknown viewport bounds is reported as ``[None]``.
+        """
         with QMutexLocker(self.mutex):
             if self.full_redraw_needed:
                 return [self.viewport_bounds]
@@ -265,11 +279,11 @@ class DirtyRegionTracker:
             self.dirty_regions.clear()
             self.full_redraw_needed = False
     
-    def update_viewport(self, new_bounds: Rectangle) -> None:
+    def update_viewport(self, new_bounds: Optional[Rectangle]) -> None:
         """Update viewport bounds."""
         with QMutexLocker(self.mutex):
             self.viewport_bounds = new_bounds
-            self.mark_full_redraw()  # Force full redraw on viewport change
+            self._set_full_redraw()  # Force full redraw on viewport change
 
 
 class RenderPipeline(QObject):
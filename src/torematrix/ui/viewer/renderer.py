@@ -61,7 +61,7 @@ class RenderStyle:
     
     # Visual effects
     opacity: float = 1.0
-    blend_mode: Qt.CompositionMode = Qt.CompositionMode.CompositionMode_SourceOver
+    blend_mode: QPainter.CompositionMode = QPainter.CompositionMode.CompositionMode_SourceOver
     shadow_offset: Tuple[float, float] = (0, 0)
     shadow_color: Optional[QColor] = None
     shadow_blur: float = 0.0
@@ -409,6 +409,24 @@ class CanvasRenderer(RendererBackend):
         # Default to rectangle rendering
         self.render_rectangle(bounds, render_style)
     
+    def render_to_painter(self, painter: QPainter,
+                          elements: List[Tuple[Any, Rectangle, Dict[str, Any]]], context=None) -> int:
+        """Render (element, bounds, style) entries with an external painter, e.g. onto a cached tile."""
+        previous_painter = self.painter
+        start_count = self.performance_metrics['primitive_count']
+        self.painter = painter
+        
+        try:
+            for element, bounds, style in elements:
+                # Styles and transformations must not leak into the next element
+                painter.save()
+                self.render_element(element, bounds, style, context)
+                painter.restore()
+        finally:
+            self.painter = previous_painter
+        
+        return self.performance_metrics['primitive_count'] - start_count
+    
     def clear_region(self, bounds: Rectangle) -> None:
         """Clear a rectangular region."""
         if not self.painter:
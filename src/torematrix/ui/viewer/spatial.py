@@ -1,17 +1,17 @@
 """
 Spatial Indexing System for Agent 3 Performance Optimization.
-This module provides quadtree spatial indexing for efficient element lookup
+This module provides R-tree spatial indexing for efficient element lookup
 and management in the document viewer overlay system.
 """
 from __future__ import annotations
 
-import math
 import threading
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from ...utils.rtree import DEFAULT_NODE_SIZE, PackedRTree
 from .coordinates import Rectangle, Point
 # Forward reference to avoid circular imports
 from typing import TYPE_CHECKING
@@ -131,208 +131,12 @@ class SpatialIndex(ABC):
         pass
 
 
-class QuadTreeNode:
-    """Node in a quadtree spatial index."""
+class RTreeSpatialIndex(SpatialIndex):
+    """Packed R-tree implementation of spatial indexing."""
     
-    def __init__(self, bounds: SpatialBounds, max_objects: int = 10, max_levels: int = 5, level: int = 0):
+    def __init__(self, bounds: SpatialBounds, node_size: int = DEFAULT_NODE_SIZE):
         self.bounds = bounds
-        self.max_objects = max_objects
-        self.max_levels = max_levels
-        self.level = level
-        self.objects: List[SpatialElement] = []
-        self.nodes: List[Optional[QuadTreeNode]] = [None, None, None, None]
-        
-        # Statistics
-        self.query_count = 0
-        self.insert_count = 0
-        self.last_accessed = datetime.now()
-    
-    def clear(self) -> None:
-        """Clear all objects and child nodes."""
-        self.objects.clear()
-        for i in range(4):
-            if self.nodes[i] is not None:
-                self.nodes[i].clear()
-                self.nodes[i] = None
-    
-    def is_leaf(self) -> bool:
-        """Check if this is a leaf node."""
-        return all(node is None for node in self.nodes)
-    
-    def _get_index(self, element_bounds: SpatialBounds) -> int:
-        """Determine which quadrant the element belongs to."""
-        mid_x = self.bounds.x + self.bounds.width / 2
-        mid_y = self.bounds.y + self.bounds.height / 2
-        
-        # Check if element can fit completely in a quadrant
-        top_quadrant = element_bounds.y + element_bounds.height < mid_y
-        bottom_quadrant = element_bounds.y >= mid_y
-        left_quadrant = element_bounds.x + element_bounds.width < mid_x
-        right_quadrant = element_bounds.x >= mid_x
-        
-        if top_quadrant:
-            if right_quadrant:
-                return 0  # Top-right
-            elif left_quadrant:
-                return 1  # Top-left
-        elif bottom_quadrant:
-            if left_quadrant:
-                return 2  # Bottom-left
-            elif right_quadrant:
-                return 3  # Bottom-right
-        
-        return -1  # Element doesn't fit completely in any quadrant
-    
-    def _split(self) -> None:
-        """Split the node into four quadrants."""
-        sub_width = self.bounds.width / 2
-        sub_height = self.bounds.height / 2
-        x = self.bounds.x
-        y = self.bounds.y
-        
-        # Create child nodes for each quadrant
-        self.nodes[0] = QuadTreeNode(  # Top-right
-            SpatialBounds(x + sub_width, y, sub_width, sub_height),
-            self.max_objects, self.max_levels, self.level + 1
-        )
-        self.nodes[1] = QuadTreeNode(  # Top-left
-            SpatialBounds(x, y, sub_width, sub_height),
-            self.max_objects, self.max_levels, self.level + 1
-        )
-        self.nodes[2] = QuadTreeNode(  # Bottom-left
-            SpatialBounds(x, y + sub_height, sub_width, sub_height),
-            self.max_objects, self.max_levels, self.level + 1
-        )
-        self.nodes[3] = QuadTreeNode(  # Bottom-right
-            SpatialBounds(x + sub_width, y + sub_height, sub_width, sub_height),
-            self.max_objects, self.max_levels, self.level + 1
-        )
-    
-    def insert(self, element: SpatialElement) -> bool:
-        """Insert element into this node."""
-        self.insert_count += 1
-        self.last_accessed = datetime.now()
-        
-        # If we have child nodes, try to insert into appropriate child
-        if not self.is_leaf():
-            index = self._get_index(element.bounds)
-            if index != -1:
-                return self.nodes[index].insert(element)
-        
-        # Add to this node
-        self.objects.append(element)
-        
-        # Check if we need to split
-        if len(self.objects) > self.max_objects and self.level < self.max_levels:
-            if self.is_leaf():
-                self._split()
-            
-            # Try to redistribute objects to child nodes
-            objects_to_keep = []
-            for obj in self.objects:
-                index = self._get_index(obj.bounds)
-                if index != -1:
-                    self.nodes[index].insert(obj)
-                else:
-                    objects_to_keep.append(obj)
-            
-            self.objects = objects_to_keep
-        
-        return True
-    
-    def remove(self, element_id: str) -> bool:
-        """Remove element from this node."""
-        self.last_accessed = datetime.now()
-        
-        # Remove from this node's objects
-        initial_count = len(self.objects)
-        self.objects = [obj for obj in self.objects if obj.element_id != element_id]
-        removed = len(self.objects) < initial_count
-        
-        # Remove from child nodes
-        if not self.is_leaf():
-            for node in self.nodes:
-                if node is not None and node.remove(element_id):
-                    removed = True
-        
-        return removed
-    
-    def query(self, bounds: SpatialBounds) -> List[SpatialElement]:
-        """Query elements within bounds."""
-        self.query_count += 1
-        self.last_accessed = datetime.now()
-        
-        results = []
-        
-        # Check objects in this node
-        for obj in self.objects:
-            if obj.intersects(bounds):
-                results.append(obj)
-        
-        # Check child nodes that intersect with query bounds
-        if not self.is_leaf():
-            for node in self.nodes:
-                if node is not None and node.bounds.intersects(bounds):
-                    results.extend(node.query(bounds))
-        
-        return results
-    
-    def query_point(self, point: Point) -> List[SpatialElement]:
-        """Query elements at a specific point."""
-        self.query_count += 1
-        self.last_accessed = datetime.now()
-        
-        results = []
-        
-        # Check objects in this node
-        for obj in self.objects:
-            if obj.bounds.contains(point):
-                results.append(obj)
-        
-        # Check child nodes that contain the point
-        if not self.is_leaf():
-            for node in self.nodes:
-                if node is not None and node.bounds.contains(point):
-                    results.extend(node.query_point(point))
-        
-        return results
-    
-    def get_statistics(self) -> Dict[str, Any]:
-        """Get statistics for this node and all children."""
-        stats = {
-            'level': self.level,
-            'object_count': len(self.objects),
-            'is_leaf': self.is_leaf(),
-            'query_count': self.query_count,
-            'insert_count': self.insert_count,
-            'last_accessed': self.last_accessed,
-            'bounds': {
-                'x': self.bounds.x,
-                'y': self.bounds.y,
-                'width': self.bounds.width,
-                'height': self.bounds.height
-            }
-        }
-        
-        if not self.is_leaf():
-            stats['children'] = []
-            for i, node in enumerate(self.nodes):
-                if node is not None:
-                    child_stats = node.get_statistics()
-                    child_stats['quadrant'] = i
-                    stats['children'].append(child_stats)
-        
-        return stats
-
-
-class QuadTreeSpatialIndex(SpatialIndex):
-    """Quadtree implementation of spatial indexing."""
-    
-    def __init__(self, bounds: SpatialBounds, max_objects: int = 10, max_levels: int = 5):
-        self.bounds = bounds
-        self.max_objects = max_objects
-        self.max_levels = max_levels
-        self.root = QuadTreeNode(bounds, max_objects, max_levels, 0)
+        self.tree = PackedRTree(node_size)
         self.element_lookup: Dict[str, SpatialElement] = {}
         
         # Thread safety
@@ -345,52 +149,67 @@ class QuadTreeSpatialIndex(SpatialIndex):
         self.average_query_time = 0.0
         self.created_time = datetime.now()
     
+    @staticmethod
+    def _box(bounds: SpatialBounds) -> Tuple[float, float, float, float]:
+        """Convert bounds to an (x0, y0, x1, y1) box."""
+        return (bounds.x, bounds.y, bounds.x + bounds.width, bounds.y + bounds.height)
+    
     def insert(self, element: SpatialElement) -> bool:
-        """Insert element into spatial index."""
+        """Insert element into spatial index, replacing an element with the same ID."""
         with self.lock:
             try:
                 start_time = datetime.now()
                 
-                # Remove existing element if it exists
-                if element.element_id in self.element_lookup:
-                    self.remove(element.element_id)
+                self.tree.insert(element.element_id, self._box(element.bounds))
+                self.element_lookup[element.element_id] = element
+                self.total_inserts += 1
                 
-                # Insert new element
-                success = self.root.insert(element)
-                
-                if success:
-                    self.element_lookup[element.element_id] = element
-                    self.total_inserts += 1
-                
-                # Update performance metrics
                 elapsed = (datetime.now() - start_time).total_seconds() * 1000
                 self._update_performance_metrics('insert', elapsed)
                 
-                return success
+                return True
                 
             except Exception:
                 return False
     
+    def insert_many(self, elements: List[SpatialElement]) -> int:
+        """Insert several elements, repacking the tree when the batch is large.
+        
+        Returns the number of elements inserted.
+        """
+        with self.lock:
+            if not elements:
+                return 0
+            
+            if len(elements) * 4 < len(self.element_lookup):
+                return sum(1 for element in elements if self.insert(element))
+            
+            # Large batch: one STR bulk load over old and new elements
+            for element in elements:
+                self.element_lookup[element.element_id] = element
+            self.tree.load(
+                list(self.element_lookup),
+                [self._box(element.bounds) for element in self.element_lookup.values()]
+            )
+            self.total_inserts += len(elements)
+            return len(elements)
+    
     def remove(self, element_id: str) -> bool:
         """Remove element from spatial index."""
         with self.lock:
             try:
                 start_time = datetime.now()
                 
-                if element_id not in self.element_lookup:
+                if not self.tree.remove(element_id):
                     return False
                 
-                success = self.root.remove(element_id)
-                
-                if success:
-                    del self.element_lookup[element_id]
-                    self.total_removes += 1
+                del self.element_lookup[element_id]
+                self.total_removes += 1
                 
-                # Update performance metrics
                 elapsed = (datetime.now() - start_time).total_seconds() * 1000
                 self._update_performance_metrics('remove', elapsed)
                 
-                return success
+                return True
                 
             except Exception:
                 return False
@@ -401,10 +220,10 @@ class QuadTreeSpatialIndex(SpatialIndex):
             try:
                 start_time = datetime.now()
                 
-                results = self.root.query(bounds)
+                lookup = self.element_lookup
+                results = [lookup[element_id] for element_id in self.tree.search(self._box(bounds))]
                 self.total_queries += 1
                 
-                # Update performance metrics
                 elapsed = (datetime.now() - start_time).total_seconds() * 1000
                 self._update_performance_metrics('query', elapsed)
                 
@@ -413,16 +232,35 @@ class QuadTreeSpatialIndex(SpatialIndex):
             except Exception:
                 return []
     
+    def query_many(self, bounds_list: List[SpatialBounds]) -> List[List[SpatialElement]]:
+        """Query several regions in one vectorized traversal."""
+        with self.lock:
+            try:
+                start_time = datetime.now()
+                
+                lookup = self.element_lookup
+                matches = self.tree.search_many([self._box(bounds) for bounds in bounds_list])
+                results = [[lookup[element_id] for element_id in ids] for ids in matches]
+                self.total_queries += len(bounds_list)
+                
+                elapsed = (datetime.now() - start_time).total_seconds() * 1000
+                self._update_performance_metrics('query', elapsed)
+                
+                return results
+                
+            except Exception:
+                return [[] for _ in bounds_list]
+    
     def query_point(self, point: Point) -> List[SpatialElement]:
         """Query elements at a point."""
         with self.lock:
             try:
                 start_time = datetime.now()
                 
-                results = self.root.query_point(point)
+                lookup = self.element_lookup
+                results = [lookup[element_id] for element_id in self.tree.search_point(point.x, point.y)]
                 self.total_queries += 1
                 
-                # Update performance metrics
                 elapsed = (datetime.now() - start_time).total_seconds() * 1000
                 self._update_performance_metrics('query_point', elapsed)
                 
@@ -432,35 +270,16 @@ class QuadTreeSpatialIndex(SpatialIndex):
                 return []
     
     def query_nearest(self, point: Point, max_distance: float = float('inf'), max_results: int = 10) -> List[Tuple[SpatialElement, float]]:
-        """Query nearest elements to a point."""
+        """Query nearest elements to a point by distance to their centers."""
         with self.lock:
             try:
                 start_time = datetime.now()
                 
-                # Get all elements within expanded bounds
-                search_bounds = SpatialBounds(
-                    point.x - max_distance,
-                    point.y - max_distance,
-                    2 * max_distance,
-                    2 * max_distance
-                )
-                
-                candidates = self.query(search_bounds)
-                
-                # Calculate distances and sort
-                distances = []
-                for element in candidates:
-                    center = element.get_center()
-                    distance = math.sqrt((center.x - point.x) ** 2 + (center.y - point.y) ** 2)
-                    
-                    if distance <= max_distance:
-                        distances.append((element, distance))
-                
-                # Sort by distance and limit results
-                distances.sort(key=lambda x: x[1])
-                results = distances[:max_results]
+                lookup = self.element_lookup
+                nearest = self.tree.nearest(point.x, point.y, k=max_results, max_distance=max_distance)
+                results = [(lookup[element_id], distance) for element_id, distance in nearest]
+                self.total_queries += 1
                 
-                # Update performance metrics
                 elapsed = (datetime.now() - start_time).total_seconds() * 1000
                 self._update_performance_metrics('query_nearest', elapsed)
                 
@@ -472,7 +291,7 @@ class QuadTreeSpatialIndex(SpatialIndex):
     def clear(self) -> None:
         """Clear all elements from index."""
         with self.lock:
-            self.root.clear()
+            self.tree.clear()
             self.element_lookup.clear()
             
             # Reset statistics
@@ -482,22 +301,11 @@ class QuadTreeSpatialIndex(SpatialIndex):
             self.average_query_time = 0.0
     
     def rebuild(self, new_bounds: Optional[SpatialBounds] = None) -> None:
-        """Rebuild the spatial index with optional new bounds."""
+        """Repack the tree, optionally recording new document bounds."""
         with self.lock:
-            # Store current elements
-            elements = list(self.element_lookup.values())
-            
-            # Update bounds if provided
             if new_bounds:
                 self.bounds = new_bounds
-            
-            # Clear and rebuild
-            self.clear()
-            self.root = QuadTreeNode(self.bounds, self.max_objects, self.max_levels, 0)
-            
-            # Re-insert all elements
-            for element in elements:
-                self.insert(element)
+            self.tree.rebuild()
     
     def get_element(self, element_id: str) -> Optional[SpatialElement]:
         """Get element by ID."""
@@ -517,17 +325,14 @@ class QuadTreeSpatialIndex(SpatialIndex):
     def get_statistics(self) -> Dict[str, Any]:
         """Get comprehensive spatial index statistics."""
         with self.lock:
-            root_stats = self.root.get_statistics()
-            
             return {
-                'index_type': 'QuadTree',
+                'index_type': 'RTree',
                 'total_elements': len(self.element_lookup),
                 'total_queries': self.total_queries,
                 'total_inserts': self.total_inserts,
                 'total_removes': self.total_removes,
                 'average_query_time_ms': self.average_query_time,
-                'max_objects_per_node': self.max_objects,
-                'max_levels': self.max_levels,
+                'node_size': self.tree.node_size,
                 'created_time': self.created_time,
                 'bounds': {
                     'x': self.bounds.x,
@@ -535,7 +340,7 @@ class QuadTreeSpatialIndex(SpatialIndex):
                     'width': self.bounds.width,
                     'height': self.bounds.height
                 },
-                'tree_structure': root_stats
+                'tree_structure': self.tree.get_statistics()
             }
     
     def _update_performance_metrics(self, operation: str, elapsed_ms: float) -> None:
@@ -549,11 +354,31 @@ class QuadTreeSpatialIndex(SpatialIndex):
                 self.average_query_time = (1 - alpha) * self.average_query_time + alpha * elapsed_ms
 
 
+class QuadTreeSpatialIndex(RTreeSpatialIndex):
+    """Former quadtree index, now backed by the packed R-tree.
+    
+    ``max_objects`` and ``max_levels`` are kept for existing callers and
+    reported in the statistics; they no longer shape the tree.
+    """
+    
+    def __init__(self, bounds: SpatialBounds, max_objects: int = 10, max_levels: int = 5):
+        super().__init__(bounds)
+        self.max_objects = max_objects
+        self.max_levels = max_levels
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get spatial index statistics including the legacy tree parameters."""
+        stats = super().get_statistics()
+        stats['max_objects_per_node'] = self.max_objects
+        stats['max_levels'] = self.max_levels
+        return stats
+
+
 class SpatialIndexManager:
     """Manager for spatial indexing operations."""
     
-    def __init__(self, initial_bounds: SpatialBounds, max_objects: int = 10, max_levels: int = 5):
-        self.spatial_index = QuadTreeSpatialIndex(initial_bounds, max_objects, max_levels)
+    def __init__(self, initial_bounds: SpatialBounds, node_size: int = DEFAULT_NODE_SIZE):
+        self.spatial_index = RTreeSpatialIndex(initial_bounds, node_size)
         self.auto_rebuild_threshold = 1000  # Rebuild after this many operations
         self.operation_count = 0
         
@@ -564,40 +389,75 @@ class SpatialIndexManager:
         # Element tracking
         self.element_layers: Dict[str, Set[str]] = {}  # layer_name -> element_ids
         self.element_types: Dict[str, Set[str]] = {}   # element_type -> element_ids
+        
+        # Called with ('add' | 'remove', element) after every successful edit
+        self.change_listeners: List[Callable[[str, Any], None]] = []
+    
+    def add_change_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """Register a callback for element additions and removals."""
+        if listener not in self.change_listeners:
+            self.change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """Unregister a change callback."""
+        if listener in self.change_listeners:
+            self.change_listeners.remove(listener)
+    
+    def _notify(self, action: str, element: Any) -> None:
+        """Report an edit to the change listeners."""
+        for listener in self.change_listeners:
+            listener(action, element)
+    
+    def _to_spatial_element(self, element: Any) -> SpatialElement:
+        """Wrap an overlay element for the spatial index."""
+        return SpatialElement(
+            element_id=element.element_id,
+            bounds=SpatialBounds.from_rectangle(element.bounds),
+            element=element,
+            z_index=element.get_z_index(),
+            layer_name=element.layer_name
+        )
+    
+    def _track_element(self, element: Any) -> None:
+        """Record element layer and type for layer/type queries."""
+        if element.layer_name not in self.element_layers:
+            self.element_layers[element.layer_name] = set()
+        self.element_layers[element.layer_name].add(element.element_id)
+        
+        if element.element_type not in self.element_types:
+            self.element_types[element.element_type] = set()
+        self.element_types[element.element_type].add(element.element_id)
     
     def add_element(self, element: Any) -> bool:
         """Add element to spatial index."""
         try:
-            # Convert to spatial element
-            spatial_bounds = SpatialBounds.from_rectangle(element.bounds)
-            spatial_element = SpatialElement(
-                element_id=element.element_id,
-                bounds=spatial_bounds,
-                element=element,
-                z_index=element.get_z_index(),
-                layer_name=element.layer_name
-            )
-            
-            # Insert into spatial index
-            success = self.spatial_index.insert(spatial_element)
+            success = self.spatial_index.insert(self._to_spatial_element(element))
             
             if success:
-                # Update tracking
-                if element.layer_name not in self.element_layers:
-                    self.element_layers[element.layer_name] = set()
-                self.element_layers[element.layer_name].add(element.element_id)
-                
-                if element.element_type not in self.element_types:
-                    self.element_types[element.element_type] = set()
-                self.element_types[element.element_type].add(element.element_id)
-                
+                self._track_element(element)
                 self._check_auto_rebuild()
+                self._notify('add', element)
             
             return success
             
         except Exception:
             return False
     
+    def add_elements(self, elements: List[Any]) -> int:
+        """Add many elements at once; large batches are bulk-loaded.
+        
+        Returns the number of elements added.
+        """
+        try:
+            spatial_elements = [self._to_spatial_element(element) for element in elements]
+            added = self.spatial_index.insert_many(spatial_elements)
+            for element in elements:
+                self._track_element(element)
+                self._notify('add', element)
+            return added
+        except Exception:
+            return 0
+    
     def remove_element(self, element_id: str) -> bool:
         """Remove element from spatial index."""
         try:
@@ -621,6 +481,7 @@ class SpatialIndexManager:
                         del self.element_types[element_type]
                 
                 self._check_auto_rebuild()
+                self._notify('remove', spatial_element.element)
             
             return success
             
@@ -636,6 +497,15 @@ class SpatialIndexManager:
         except Exception:
             return []
     
+    def query_regions(self, bounds_list: List[Rectangle]) -> List[List[Any]]:
+        """Query several regions in one batch, e.g. all visible pages."""
+        try:
+            spatial_bounds = [SpatialBounds.from_rectangle(bounds) for bounds in bounds_list]
+            return [[elem.element for elem in spatial_elements]
+                    for spatial_elements in self.spatial_index.query_many(spatial_bounds)]
+        except Exception:
+            return [[] for _ in bounds_list]
+    
     def query_point(self, point: Point) -> List[Any]:
         """Query elements at a point."""
         try:
@@ -0,0 +1,287 @@
+"""
+Tiled overlay cache for the document viewer.
+
+Overlay content is pre-rendered into fixed-size QImage tiles laid out on a
+document-space grid. Every power-of-two zoom level ("bucket") has its own
+grid, so a frame only composites the visible tiles of the nearest bucket
+and paints tiles that are missing or were invalidated. Panning reuses the
+cached tiles and zooming within a bucket only rescales them.
+
+Invalidation is driven by a DirtyRegionTracker in document coordinates.
+Dirty tiles that are on screen are repainted in the next frame; dirty tiles
+that are off screen are queued and repainted later by rebuild_deferred().
+"""
+from __future__ import annotations
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtGui import QImage, QPainter
+
+from .coordinates import Rectangle
+from .pipeline import DirtyRegionTracker
+from .renderer import RenderingPerformanceProfiler
+
+# (zoom bucket, column, row)
+TileKey = Tuple[int, int, int]
+
+# Paints everything intersecting a document region with a painter that
+# already maps document coordinates onto the tile; returns the primitive count
+RegionPainter = Callable[[QPainter, Rectangle], int]
+
+
+@dataclass
+class OverlayTile:
+    """A pre-rendered overlay tile."""
+    key: TileKey
+    bounds: Rectangle
+    image: QImage
+    primitive_count: int = 0
+    stale: bool = False
+    render_time: float = 0.0
+
+
+class OverlayTileCache:
+    """LRU cache of pre-rendered overlay tiles per zoom bucket."""
+    
+    def __init__(self, paint_region: RegionPainter, tile_size: int = 256, max_tiles: int = 256,
+                 dirty_tracker: Optional[DirtyRegionTracker] = None,
+                 profiler: Optional[RenderingPerformanceProfiler] = None,
+                 min_bucket: int = -4, max_bucket: int = 4, bleed: float = 2.0):
+        if tile_size <= 0:
+            raise ValueError("tile_size must be positive")
+        
+        self.paint_region = paint_region
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.dirty_tracker = dirty_tracker
+        self.profiler = profiler
+        self.min_bucket = min_bucket
+        self.max_bucket = max_bucket
+        # Strokes and antialiasing reach past element bounds, so tiles paint
+        # and invalidate this many document units beyond their edges
+        self.bleed = bleed
+        
+        self.tiles: OrderedDict[TileKey, OverlayTile] = OrderedDict()
+        self.deferred: Dict[TileKey, None] = {}  # insertion-ordered set
+        self.visible_keys: Set[TileKey] = set()
+        self.current_bucket: Optional[int] = None
+        
+        self.statistics = {
+            'hits': 0,
+            'misses': 0,
+            'rebuilds': 0,
+            'deferred_rebuilds': 0,
+            'invalidations': 0,
+            'evictions': 0
+        }
+    
+    def zoom_bucket(self, zoom: float) -> int:
+        """Get the power-of-two bucket whose tiles are composited at ``zoom``."""
+        bucket = round(math.log2(max(zoom, 1e-6)))
+        return min(max(bucket, self.min_bucket), self.max_bucket)
+    
+    def tile_span(self, bucket: int) -> float:
+        """Get the document-space edge length of a tile in ``bucket``."""
+        return self.tile_size / 2.0 ** bucket
+    
+    def tile_bounds(self, key: TileKey) -> Rectangle:
+        """Get the document-space bounds of a tile."""
+        bucket, column, row = key
+        span = self.tile_span(bucket)
+        return Rectangle(column * span, row * span, span, span)
+    
+    def tile_keys(self, region: Rectangle, bucket: int) -> List[TileKey]:
+        """Get the keys of the tiles covering ``region``, row by row."""
+        span = self.tile_span(bucket)
+        first_column = math.floor(region.x / span)
+        first_row = math.floor(region.y / span)
+        last_column = max(math.ceil((region.x + region.width) / span), first_column + 1)
+        last_row = max(math.ceil((region.y + region.height) / span), first_row + 1)
+        
+        return [(bucket, column, row)
+                for row in range(first_row, last_row)
+                for column in range(first_column, last_column)]
+    
+    def invalidate(self, region: Optional[Rectangle] = None) -> int:
+        """Invalidate cached tiles overlapping ``region`` (all tiles if None).
+        
+        Tiles of the current bucket are kept and repainted: on the next
+        frame if visible, otherwise by rebuild_deferred(). Tiles of other
+        buckets are dropped.
+        """
+        if region is not None:
+            region = region.expand(self.bleed)
+        
+        invalidated = 0
+        for key, tile in list(self.tiles.items()):
+            if region is not None and not tile.bounds.intersects(region):
+                continue
+            
+            invalidated += 1
+            if key[0] != self.current_bucket:
+                del self.tiles[key]
+                continue
+            
+            tile.stale = True
+            if key not in self.visible_keys:
+                self.deferred[key] = None
+        
+        self.statistics['invalidations'] += invalidated
+        return invalidated
+    
+    def sync_dirty_regions(self) -> int:
+        """Invalidate tiles for the regions reported by the dirty tracker."""
+        if not self.dirty_tracker:
+            return 0
+        
+        regions = self.dirty_tracker.get_dirty_regions()
+        self.dirty_tracker.clear_dirty_regions()
+        return sum(self.invalidate(region) for region in regions)
+    
+    def composite(self, painter: QPainter, visible_region: Rectangle, zoom: float) -> Dict[str, int]:
+        """Draw the tiles covering ``visible_region``.
+        
+        ``painter`` must map document coordinates onto the target and
+        ``zoom`` is the number of target pixels per document unit. Missing
+        and stale visible tiles are painted first.
+        """
+        if self.profiler:
+            self.profiler.start_frame()
+        
+        self.sync_dirty_regions()
+        
+        bucket = self.zoom_bucket(zoom)
+        if bucket != self.current_bucket:
+            # Off-screen work queued for the previous zoom level is not worth doing
+            self.deferred.clear()
+            self.current_bucket = bucket
+        
+        keys = self.tile_keys(visible_region, bucket)
+        self.visible_keys = set(keys)
+        
+        rebuilt = 0
+        primitive_count = 0
+        for key in keys:
+            tile = self.tiles.get(key)
+            if tile is None or tile.stale:
+                self.statistics['misses'] += 1
+                tile = self._render_tile(key)
+                rebuilt += 1
+                primitive_count += tile.primitive_count
+            else:
+                self.statistics['hits'] += 1
+                self.tiles.move_to_end(key)
+            
+            self.deferred.pop(key, None)
+            bounds = tile.bounds
+            painter.drawImage(QRectF(bounds.x, bounds.y, bounds.width, bounds.height), tile.image)
+        
+        self._evict()
+        
+        if self.profiler:
+            self.profiler.end_frame(primitive_count)
+        
+        return {
+            'tiles': len(keys),
+            'rebuilt': rebuilt,
+            'primitive_count': primitive_count
+        }
+    
+    def has_deferred_work(self) -> bool:
+        """Check if off-screen tiles are waiting to be repainted."""
+        return bool(self.deferred)
+    
+    def rebuild_deferred(self, max_tiles: Optional[int] = None) -> int:
+        """Repaint stale off-screen tiles, at most ``max_tiles`` of them.
+        
+        Meant to run while the viewer is idle so the tiles are ready when
+        they are panned into view.
+        """
+        rebuilt = 0
+        while self.deferred and (max_tiles is None or rebuilt < max_tiles):
+            key = next(iter(self.deferred))
+            del self.deferred[key]
+            
+            tile = self.tiles.get(key)
+            if tile is None or not tile.stale:
+                continue
+            
+            self._render_tile(key)
+            rebuilt += 1
+        
+        self.statistics['deferred_rebuilds'] += rebuilt
+        return rebuilt
+    
+    def clear(self) -> None:
+        """Drop every tile."""
+        self.tiles.clear()
+        self.deferred.clear()
+        self.visible_keys.clear()
+        self.current_bucket = None
+    
+    def get_statistics(self) -> Dict[str, object]:
+        """Get cache statistics."""
+        lookups = self.statistics['hits'] + self.statistics['misses']
+        
+        stats = dict(self.statistics)
+        stats.update({
+            'tile_count': len(self.tiles),
+            'stale_tiles': sum(1 for tile in self.tiles.values() if tile.stale),
+            'deferred_tiles': len(self.deferred),
+            'memory_bytes': sum(tile.image.sizeInBytes() for tile in self.tiles.values()),
+            'hit_rate': self.statistics['hits'] / lookups if lookups else 0.0,
+            'current_bucket': self.current_bucket,
+            'tile_size': self.tile_size
+        })
+        return stats
+    
+    def _render_tile(self, key: TileKey) -> OverlayTile:
+        """Paint a tile, reusing the image of the tile it replaces."""
+        start_time = time.perf_counter()
+        
+        previous = self.tiles.get(key)
+        if previous is not None:
+            image = previous.image
+        else:
+            image = QImage(self.tile_size, self.tile_size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        
+        bounds = self.tile_bounds(key)
+        scale = 2.0 ** key[0]
+        
+        painter = QPainter(image)
+        try:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+            painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+            painter.scale(scale, scale)
+            painter.translate(-bounds.x, -bounds.y)
+            primitive_count = self.paint_region(painter, bounds.expand(self.bleed))
+        finally:
+            painter.end()
+        
+        tile = OverlayTile(
+            key=key,
+            bounds=bounds,
+            image=image,
+            primitive_count=primitive_count,
+            render_time=time.perf_counter() - start_time
+        )
+        self.tiles[key] = tile
+        self.tiles.move_to_end(key)
+        self.statistics['rebuilds'] += 1
+        return tile
+    
+    def _evict(self) -> None:
+        """Evict least recently used tiles beyond max_tiles, never visible ones."""
+        while len(self.tiles) > self.max_tiles:
+            key = next(iter(self.tiles))
+            if key in self.visible_keys:
+                break
+            del self.tiles[key]
+            self.deferred.pop(key, None)
+            self.statistics['evictions'] += 1
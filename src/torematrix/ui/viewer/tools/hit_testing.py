@@ -14,6 +14,7 @@ from PyQt6.QtGui import QPolygonF, QTransform
 
 from ..coordinates import Point, Rectangle
 from ..layers import LayerElement
+from ....utils.rtree import PackedRTree
 
 
 @dataclass
@@ -170,7 +171,7 @@ class QuadTreeNode:
 class SpatialIndex(QObject):
     """
     Spatial indexing system for optimized hit testing.
-    Uses quad-tree for efficient spatial queries.
+    Uses the shared packed R-tree for efficient spatial queries.
     """
     
     index_updated = pyqtSignal()
@@ -183,7 +184,8 @@ class SpatialIndex(QObject):
         if bounds is None:
             bounds = Rectangle(0, 0, 10000, 10000)  # Large default area
         
-        self.quad_tree = QuadTreeNode(bounds, max_depth=8, max_elements=10)
+        self.bounds = bounds
+        self.tree = PackedRTree()
         self.element_cache: Dict[str, LayerElement] = {}
         self.dirty = False
         
@@ -193,46 +195,49 @@ class SpatialIndex(QObject):
         self.cache_hits = 0
         self.cache_misses = 0
     
+    @property
+    def quad_tree(self) -> PackedRTree:
+        """Former name of the index tree, kept for existing callers."""
+        return self.tree
+    
     def add_element(self, element: LayerElement):
-        """Add element to spatial index."""
+        """Add element to spatial index, replacing an element with the same ID."""
         if not element or not hasattr(element, 'id'):
             return
         
         self.element_cache[element.id] = element
-        self.quad_tree.insert(element)
+        if getattr(element, 'bounds', None):
+            self.tree.insert(element.id, self._box(element.bounds))
+        else:
+            self.tree.remove(element.id)
         self.dirty = True
     
+    def add_elements(self, elements: List[LayerElement]):
+        """Add many elements and bulk-load the tree once."""
+        for element in elements:
+            if element and hasattr(element, 'id'):
+                self.element_cache[element.id] = element
+        self._rebuild_index()
+    
     def remove_element(self, element_id: str):
         """Remove element from spatial index."""
         if element_id in self.element_cache:
             del self.element_cache[element_id]
-            self._rebuild_index()  # Full rebuild needed for removal
+            self.tree.remove(element_id)
     
     def update_element(self, element: LayerElement):
         """Update element in spatial index."""
-        if not element or not hasattr(element, 'id'):
-            return
-        
-        # Remove old version and add new
-        if element.id in self.element_cache:
-            self.remove_element(element.id)
-        
         self.add_element(element)
     
     def query_point(self, point: Point, tolerance: float = 5.0) -> List[LayerElement]:
-        """Query elements at point with tolerance."""
+        """Query elements whose bounds lie within ``tolerance`` of point."""
         start_time = time.perf_counter()
         
         try:
-            results = self.quad_tree.query_point(point, tolerance)
-            
-            # Filter by actual hit testing
-            hit_results = []
-            for element in results:
-                if self._precise_hit_test(element, point, tolerance):
-                    hit_results.append(element)
-            
-            return hit_results
+            return self._lookup(self.tree.search((
+                point.x - tolerance, point.y - tolerance,
+                point.x + tolerance, point.y + tolerance
+            )))
         
         finally:
             # Record performance
@@ -245,7 +250,7 @@ class SpatialIndex(QObject):
         start_time = time.perf_counter()
         
         try:
-            return self.quad_tree.query(bounds)
+            return self._lookup(self.tree.search(self._box(bounds)))
         
         finally:
             # Record performance
@@ -253,35 +258,36 @@ class SpatialIndex(QObject):
             query_time = (end_time - start_time) * 1000
             self.query_times.append(query_time)
     
-    def nearest_elements(self, point: Point, max_count: int = 5, 
-                        max_distance: float = 100.0) -> List[HitTestResult]:
-        """Find nearest elements to point."""
-        # Query larger area around point
-        search_bounds = Rectangle(
-            point.x - max_distance, point.y - max_distance,
-            max_distance * 2, max_distance * 2
-        )
-        
-        candidates = self.query_rectangle(search_bounds)
+    def query_rectangles(self, bounds_list: List[Rectangle]) -> List[List[LayerElement]]:
+        """Query several rectangles in one vectorized traversal."""
+        start_time = time.perf_counter()
         
-        # Calculate distances and sort
-        results = []
-        for element in candidates:
-            distance = self._calculate_distance(element, point)
-            if distance <= max_distance:
-                results.append(HitTestResult(
-                    element=element,
-                    distance=distance,
-                    point=point,
-                    confidence=1.0 - (distance / max_distance)
-                ))
+        try:
+            matches = self.tree.search_many([self._box(bounds) for bounds in bounds_list])
+            return [self._lookup(element_ids) for element_ids in matches]
         
-        results.sort()
-        return results[:max_count]
+        finally:
+            end_time = time.perf_counter()
+            query_time = (end_time - start_time) * 1000
+            self.query_times.append(query_time)
+    
+    def nearest_elements(self, point: Point, max_count: int = 5, 
+                        max_distance: float = 100.0) -> List[HitTestResult]:
+        """Find nearest elements to point by distance to their centers."""
+        nearest = self.tree.nearest(point.x, point.y, k=max_count, max_distance=max_distance)
+        return [
+            HitTestResult(
+                element=self.element_cache[element_id],
+                distance=distance,
+                point=point,
+                confidence=1.0 - (distance / max_distance)
+            )
+            for element_id, distance in nearest
+        ]
     
     def clear(self):
         """Clear all elements from index."""
-        self.quad_tree.clear()
+        self.tree.clear()
         self.element_cache.clear()
         self.dirty = False
         self.index_updated.emit()
@@ -313,7 +319,7 @@ class SpatialIndex(QObject):
             'query_count': len(self.query_times),
             'cache_hit_rate': hit_rate,
             'element_count': len(self.element_cache),
-            'tree_stats': self.quad_tree.get_statistics(),
+            'tree_stats': self.tree.get_statistics(),
             'meets_target': avg_query < 10.0  # 10ms target
         }
         
@@ -331,16 +337,14 @@ class SpatialIndex(QObject):
     # Private methods
     
     def _rebuild_index(self):
-        """Rebuild spatial index from scratch."""
+        """Bulk-load the tree from the element cache."""
         start_time = time.perf_counter()
         
         try:
-            # Clear and rebuild
-            elements = list(self.element_cache.values())
-            self.quad_tree.clear()
-            
-            for element in elements:
-                self.quad_tree.insert(element)
+            elements = [element for element in self.element_cache.values()
+                        if getattr(element, 'bounds', None)]
+            self.tree.load([element.id for element in elements],
+                           [self._box(element.bounds) for element in elements])
             
             self.dirty = False
             self.index_updated.emit()
@@ -351,20 +355,15 @@ class SpatialIndex(QObject):
             rebuild_time = (end_time - start_time) * 1000
             self.rebuild_times.append(rebuild_time)
     
-    def _precise_hit_test(self, element: LayerElement, point: Point, tolerance: float) -> bool:
-        """Perform precise hit testing on element."""
-        if not hasattr(element, 'bounds') or not element.bounds:
-            return False
-        
-        # Check if point is within element bounds plus tolerance
-        expanded_bounds = Rectangle(
-            element.bounds.x - tolerance,
-            element.bounds.y - tolerance,
-            element.bounds.width + tolerance * 2,
-            element.bounds.height + tolerance * 2
-        )
-        
-        return expanded_bounds.contains_point(point)
+    def _lookup(self, element_ids: List[str]) -> List[LayerElement]:
+        """Map tree keys back to elements."""
+        cache = self.element_cache
+        return [cache[element_id] for element_id in element_ids]
+    
+    @staticmethod
+    def _box(bounds: Rectangle) -> Tuple[float, float, float, float]:
+        """Convert a rectangle to an (x0, y0, x1, y1) box."""
+        return (bounds.x, bounds.y, bounds.x + bounds.width, bounds.y + bounds.height)
     
     def _calculate_distance(self, element: LayerElement, point: Point) -> float:
         """Calculate distance from point to element."""
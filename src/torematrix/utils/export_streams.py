@@ -0,0 +1,123 @@
+"""
+Streaming helpers for exporters.
+
+Exporters produce their output as an iterator of text chunks instead of one
+large string. These helpers write such iterators to a file (optionally
+gzip-compressed on the fly), report progress while doing so, and serialize
+chunks of elements in parallel while preserving output order.
+"""
+
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar, IO
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+import gzip
+import os
+import time
+
+T = TypeVar("T")
+
+# Progress callback: (processed_items, total_items)
+ProgressCallback = Callable[[int, int], None]
+
+
+def open_text_stream(path: str, encoding: str = "utf-8", compress: bool = False,
+                     newline: Optional[str] = None) -> IO[str]:
+    """Open ``path`` for text writing, gzip-compressing on the fly if requested."""
+    if compress:
+        return gzip.open(path, "wt", encoding=encoding, newline=newline)
+    if newline is None:
+        return open(path, "w", encoding=encoding)
+    return open(path, "w", encoding=encoding, newline=newline)
+
+
+def write_chunks(chunks: Iterable[str], stream: IO[str], flush_every: int = 0) -> int:
+    """Write text chunks to an open stream; return the number of characters written.
+
+    With ``flush_every`` > 0 the stream is flushed after that many chunks so
+    readers (or sockets) see output while the export is still running.
+    """
+    written = 0
+    for count, chunk in enumerate(chunks, 1):
+        if not chunk:
+            continue
+        stream.write(chunk)
+        written += len(chunk)
+        if flush_every and count % flush_every == 0:
+            stream.flush()
+    return written
+
+
+def stream_to_file(chunks: Iterable[str], path: str, encoding: str = "utf-8",
+                   compress: bool = False, newline: Optional[str] = None) -> int:
+    """Stream text chunks into ``path`` and return the resulting file size in bytes."""
+    with open_text_stream(path, encoding, compress, newline) as stream:
+        write_chunks(chunks, stream)
+    return os.path.getsize(path)
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield lists of up to ``size`` consecutive items."""
+    batch: List[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def serialize_batches(items: Sequence[T], serializer: Callable[[List[T]], str],
+                      batch_size: int = 1000, max_workers: int = 1,
+                      progress_callback: Optional[ProgressCallback] = None) -> Iterator[str]:
+    """Serialize ``items`` batch by batch, yielding text chunks in input order.
+
+    With ``max_workers`` > 1 batches are serialized on a thread pool. At most
+    ``2 * max_workers`` batches are in flight at any time, so memory stays
+    bounded regardless of the number of items.
+    """
+    total = len(items)
+    processed = 0
+
+    if max_workers <= 1:
+        for batch in batched(items, batch_size):
+            yield serializer(batch)
+            processed += len(batch)
+            if progress_callback:
+                progress_callback(processed, total)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: "deque[tuple[int, Future]]" = deque()
+        for batch in batched(items, batch_size):
+            pending.append((len(batch), executor.submit(serializer, batch)))
+            if len(pending) >= 2 * max_workers:
+                size, future = pending.popleft()
+                yield future.result()
+                processed += size
+                if progress_callback:
+                    progress_callback(processed, total)
+        while pending:
+            size, future = pending.popleft()
+            yield future.result()
+            processed += size
+            if progress_callback:
+                progress_callback(processed, total)
+
+
+class ThrottledProgress:
+    """Wrap a progress callback so it fires at most every ``interval`` seconds.
+
+    The final call (processed == total) is always forwarded.
+    """
+
+    def __init__(self, callback: ProgressCallback, interval: float = 0.1):
+        self.callback = callback
+        self.interval = interval
+        self._last = 0.0
+
+    def __call__(self, processed: int, total: int) -> None:
+        now = time.monotonic()
+        if processed >= total or now - self._last >= self.interval:
+            self._last = now
+            self.callback(processed, total)
@@ -0,0 +1,477 @@
+"""
+Packed R-tree over NumPy bounding-box arrays.
+
+Boxes are ``(x0, y0, x1, y1)`` tuples with closed intervals, so boxes that
+only touch along an edge intersect. The tree is bulk-loaded with
+Sort-Tile-Recursive packing: items are cut into vertical slices by center x,
+each slice is sorted by center y and chopped into leaves. Every level is a
+single ``(n, 4)`` array and node ``i`` owns children
+``[i * node_size, (i + 1) * node_size)`` of the level below, so traversal is
+index arithmetic plus vectorized comparisons.
+
+Leaves are packed below capacity so later inserts usually find a free slot.
+Every item remembers its leaf, which turns updates and removals into a slot
+write followed by refitting the O(log n) ancestors. Inserts that find no
+room go to a small overflow list that every query scans; the tree is
+repacked once that list grows.
+
+Internally boxes are stored as ``(-x0, -y0, x1, y1)``. Intersection is then
+four ``>=`` comparisons against ``(-qx1, -qy1, qx0, qy0)`` and an enclosing
+box is a plain column maximum.
+"""
+
+import heapq
+import itertools
+import math
+from typing import Dict, Hashable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+Box = Tuple[float, float, float, float]
+
+DEFAULT_NODE_SIZE = 16
+DEFAULT_FILL_FACTOR = 0.75
+
+# Stored form of a box that never intersects anything and encloses nothing;
+# used for free slots and padding
+_EMPTY = (-math.inf, -math.inf, -math.inf, -math.inf)
+
+# Marker in the slot -> leaf map for items waiting in the overflow list
+_OVERFLOW = -2
+
+# A row of four True values viewed as one uint32
+_ALL_TRUE = 0x01010101
+
+
+def _stored(boxes) -> np.ndarray:
+    """Convert boxes to ``(n, 4)`` rows of the stored ``(-x0, -y0, x1, y1)`` form."""
+    stored = np.array(boxes, dtype=np.float64).reshape(-1, 4)
+    stored[:, :2] *= -1
+    return stored
+
+
+def _query_key(boxes) -> np.ndarray:
+    """Convert query boxes to the ``(-x1, -y1, x0, y0)`` form compared against stored boxes."""
+    boxes = np.asarray(boxes, dtype=np.float64)
+    return np.concatenate((-boxes[..., 2:], boxes[..., :2]), axis=-1)
+
+
+def _intersects(stored: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """Mask of ``stored`` rows intersecting ``key`` (one key, or one per row)."""
+    # Viewing each row of four booleans as one uint32 tests them all at once
+    return (stored >= key).view(np.uint32).ravel() == _ALL_TRUE
+
+
+def _box_distance(stored: np.ndarray, x: float, y: float) -> np.ndarray:
+    """Euclidean distance from a point to each box (0 inside, inf for empty boxes)."""
+    dx = np.maximum(np.maximum(-stored[:, 0] - x, x - stored[:, 2]), 0.0)
+    dy = np.maximum(np.maximum(-stored[:, 1] - y, y - stored[:, 3]), 0.0)
+    return np.hypot(dx, dy)
+
+
+def _center_distance(stored: np.ndarray, x: float, y: float) -> np.ndarray:
+    """Euclidean distance from a point to each box center."""
+    return np.hypot((stored[:, 2] - stored[:, 0]) / 2 - x, (stored[:, 3] - stored[:, 1]) / 2 - y)
+
+
+class PackedRTree:
+    """STR-packed R-tree mapping hashable keys to bounding boxes."""
+
+    def __init__(self, node_size: int = DEFAULT_NODE_SIZE, fill_factor: float = DEFAULT_FILL_FACTOR):
+        if node_size < 2:
+            raise ValueError("node_size must be at least 2")
+        if not 0.0 < fill_factor <= 1.0:
+            raise ValueError("fill_factor must be in (0, 1]")
+        self.node_size = node_size
+        self.fill_factor = fill_factor
+        self._leaf_fill = max(1, int(node_size * fill_factor))
+        self._child_offsets = np.arange(node_size)
+        self.rebuild_count = 0
+        self._reset(0)
+
+    def _reset(self, capacity: int) -> None:
+        """Drop all items and allocate ``capacity`` free slots."""
+        # One extra trailing row that stays empty: leaves mark free entries
+        # with slot -1, and indexing with -1 then yields a box that never matches.
+        self._boxes = np.tile(_EMPTY, (capacity + 1, 1))
+        self._slot_leaf = np.full(capacity + 1, -1, dtype=np.int64)
+        self._keys: List[Optional[Hashable]] = [None] * capacity
+        self._slots: Dict[Hashable, int] = {}
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._leaves = np.full((0, self.node_size), -1, dtype=np.int64)
+        self._levels: List[np.ndarray] = []
+        self._scan_depth = 0
+        self._overflow: Set[int] = set()
+        self._overflow_slots: Optional[np.ndarray] = None
+
+    # ---- size and lookup -------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def keys(self) -> Iterator[Hashable]:
+        """Iterate over stored keys."""
+        return iter(self._slots)
+
+    def get(self, key: Hashable) -> Optional[Box]:
+        """Return the box stored for ``key``, or None."""
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        nx0, ny0, x1, y1 = self._boxes[slot].tolist()
+        return (-nx0, -ny0, x1, y1)
+
+    @property
+    def height(self) -> int:
+        """Number of levels including the leaves."""
+        return len(self._levels)
+
+    def bounds(self) -> Optional[Box]:
+        """Bounding box of every stored item, or None when empty."""
+        if not self._slots:
+            return None
+        nx0, ny0, x1, y1 = self._boxes.max(axis=0).tolist()
+        return (-nx0, -ny0, x1, y1)
+
+    # ---- building --------------------------------------------------------
+
+    def load(self, keys: Sequence[Hashable], boxes) -> None:
+        """Replace the contents with ``keys`` and their ``boxes`` and pack the tree.
+
+        ``boxes`` is anything convertible to an ``(n, 4)`` float array. If a
+        key repeats, its last box wins.
+        """
+        keys = list(keys)
+        boxes = _stored(boxes)
+        if len(keys) != len(boxes):
+            raise ValueError("keys and boxes must have the same length")
+
+        slots = {key: position for position, key in enumerate(keys)}
+        if len(slots) < len(keys):
+            keep = np.fromiter(sorted(slots.values()), dtype=np.int64, count=len(slots))
+            keys = [keys[position] for position in keep.tolist()]
+            boxes = boxes[keep]
+            slots = {key: position for position, key in enumerate(keys)}
+
+        self._reset(len(keys))
+        self._boxes[:-1] = boxes
+        self._keys = keys
+        self._slots = slots
+        self._free = []
+        self._pack()
+
+    def rebuild(self) -> None:
+        """Repack the tree from the current items."""
+        self._pack()
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._reset(0)
+
+    def _pack(self) -> None:
+        """Sort-Tile-Recursive packing of all live slots into leaves and levels."""
+        self.rebuild_count += 1
+        self._overflow.clear()
+        self._overflow_slots = None
+        self._slot_leaf[:] = -1
+        self._levels = []
+        self._scan_depth = 0
+
+        count = len(self._slots)
+        node_size = self.node_size
+        if not count:
+            self._leaves = np.full((0, node_size), -1, dtype=np.int64)
+            return
+
+        live = np.fromiter(self._slots.values(), dtype=np.int64, count=count)
+        boxes = self._boxes[live]
+        # Twice the centers; only their order and spread matter
+        center_x = boxes[:, 2] - boxes[:, 0]
+        center_y = boxes[:, 3] - boxes[:, 1]
+
+        fill = self._leaf_fill
+        leaf_count = -(-count // fill)
+        # The slice count follows the aspect ratio of the data so leaves come
+        # out roughly square, also for a long column of stacked pages
+        width = np.ptp(center_x) / 2 + (boxes[:, 2] + boxes[:, 0]).mean()
+        height = np.ptp(center_y) / 2 + (boxes[:, 3] + boxes[:, 1]).mean()
+        slices = math.ceil(math.sqrt(leaf_count * width / height)) if height > 0 else leaf_count
+        slices = min(max(slices, 1), leaf_count)
+        slice_size = -(-leaf_count // slices) * fill
+        slice_of = np.empty(count, dtype=np.int64)
+        slice_of[np.argsort(center_x, kind="stable")] = np.arange(count) // slice_size
+        order = live[np.lexsort((center_y, slice_of))]
+
+        # Every level below the root is padded with empty entries to whole
+        # nodes, so child ranges never need bounds checks. Padding never
+        # matches a query and is never descended into.
+        padded_leaves = leaf_count if leaf_count == 1 else -(-leaf_count // node_size) * node_size
+        packed = np.full(padded_leaves * fill, -1, dtype=np.int64)
+        packed[:count] = order
+        self._leaves = np.full((padded_leaves, node_size), -1, dtype=np.int64)
+        self._leaves[:, :fill] = packed.reshape(padded_leaves, fill)
+        self._slot_leaf[order] = np.arange(count) // fill
+
+        level = self._boxes[self._leaves].max(axis=1)
+        self._levels.append(level)
+        while len(level) > 1:
+            level = level.reshape(-1, node_size, 4).max(axis=1)
+            if len(level) > 1 and len(level) % node_size:
+                padded = np.tile(_EMPTY, (-(-len(level) // node_size) * node_size, 1))
+                padded[:len(level)] = level
+                level = padded
+            self._levels.append(level)
+
+        # Single queries begin with a full scan of the finest level that is
+        # still small, skipping the near-root levels every query passes through
+        self._scan_depth = len(self._levels) - 1
+        while self._scan_depth and len(self._levels[self._scan_depth - 1]) <= node_size * node_size:
+            self._scan_depth -= 1
+
+    # ---- updates ---------------------------------------------------------
+
+    def insert(self, key: Hashable, box: Box) -> None:
+        """Store ``key`` with ``box``, replacing any box it already had."""
+        if key in self._slots:
+            self.remove(key)
+        stored = _stored(box)[0]
+        slot = self._allocate(key, stored)
+
+        leaf = self._choose_leaf(stored)
+        if leaf is None:
+            self._overflow.add(slot)
+            self._overflow_slots = None
+            self._slot_leaf[slot] = _OVERFLOW
+            if len(self._overflow) > max(4 * self.node_size, len(self._slots) // 16):
+                self._pack()
+            return
+
+        row = self._leaves[leaf]
+        row[np.flatnonzero(row < 0)[0]] = slot
+        self._slot_leaf[slot] = leaf
+        self._refit(leaf)
+
+    def update(self, key: Hashable, box: Box) -> None:
+        """Move ``key`` to ``box`` (same as insert)."""
+        self.insert(key, box)
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove ``key``; returns False if it was not stored."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return False
+
+        leaf = int(self._slot_leaf[slot])
+        self._boxes[slot] = _EMPTY
+        self._keys[slot] = None
+        self._slot_leaf[slot] = -1
+        self._free.append(slot)
+
+        if leaf == _OVERFLOW:
+            self._overflow.discard(slot)
+            self._overflow_slots = None
+        else:
+            row = self._leaves[leaf]
+            row[row == slot] = -1
+            self._refit(leaf)
+        return True
+
+    def _allocate(self, key: Hashable, stored: np.ndarray) -> int:
+        """Take a free slot for ``key``, growing the arrays when none is left."""
+        if not self._free:
+            capacity = len(self._keys)
+            grown = max(self.node_size, capacity * 2)
+            boxes = np.tile(_EMPTY, (grown + 1, 1))
+            boxes[:capacity] = self._boxes[:capacity]
+            slot_leaf = np.full(grown + 1, -1, dtype=np.int64)
+            slot_leaf[:capacity] = self._slot_leaf[:capacity]
+            self._boxes, self._slot_leaf = boxes, slot_leaf
+            self._keys.extend([None] * (grown - capacity))
+            self._free = list(range(grown - 1, capacity - 1, -1))
+
+        slot = self._free.pop()
+        self._boxes[slot] = stored
+        self._keys[slot] = key
+        self._slots[key] = slot
+        return slot
+
+    def _choose_leaf(self, stored: np.ndarray) -> Optional[int]:
+        """Descend by least area enlargement to a leaf with a free entry."""
+        if not self._levels:
+            return None
+        if len(self._levels) == 1:
+            return 0 if (self._leaves[0] < 0).any() else None
+
+        node = 0
+        for depth in range(len(self._levels) - 1, 0, -1):
+            first = node * self.node_size
+            children = self._levels[depth - 1][first:first + self.node_size]
+            grown = np.maximum(children, stored)
+            with np.errstate(invalid="ignore"):
+                area = (children[:, 2] + children[:, 0]) * (children[:, 3] + children[:, 1])
+                cost = (grown[:, 2] + grown[:, 0]) * (grown[:, 3] + grown[:, 1]) - area
+            # Empty children have no area to grow; only pick them as a last resort
+            cost[children[:, 2] == -math.inf] = math.inf
+            if depth == 1:
+                with_room = np.flatnonzero((self._leaves[first:first + self.node_size] < 0).any(axis=1))
+                if not len(with_room):
+                    return None
+                node = first + int(with_room[np.argmin(cost[with_room])])
+            else:
+                node = first + int(np.argmin(cost))
+        return node
+
+    def _refit(self, leaf: int) -> None:
+        """Recompute the box of ``leaf`` and of its ancestors while they change."""
+        enclosing = self._boxes[self._leaves[leaf]].max(axis=0)
+        index = leaf
+        for depth, level in enumerate(self._levels):
+            if np.array_equal(level[index], enclosing):
+                return
+            level[index] = enclosing
+            if depth + 1 == len(self._levels):
+                return
+            index //= self.node_size
+            first = index * self.node_size
+            enclosing = level[first:first + self.node_size].max(axis=0)
+
+    # ---- queries ---------------------------------------------------------
+
+    def _overflow_array(self) -> np.ndarray:
+        if self._overflow_slots is None:
+            self._overflow_slots = np.fromiter(self._overflow, dtype=np.int64, count=len(self._overflow))
+        return self._overflow_slots
+
+    def _expand(self, nodes: np.ndarray) -> np.ndarray:
+        """Child indices of ``nodes`` one level down."""
+        return (nodes[:, None] * self.node_size + self._child_offsets).ravel()
+
+    def search_slots(self, box: Box) -> np.ndarray:
+        """Slots of items intersecting ``box``."""
+        key = _query_key(box)
+        candidates = np.empty(0, dtype=np.int64)
+        if self._levels:
+            depth = self._scan_depth
+            nodes = np.flatnonzero(_intersects(self._levels[depth], key))
+            while depth and len(nodes):
+                depth -= 1
+                nodes = self._expand(nodes)
+                nodes = nodes[_intersects(self._levels[depth][nodes], key)]
+            candidates = self._leaves[nodes].ravel()
+        if self._overflow:
+            candidates = np.concatenate((candidates, self._overflow_array()))
+        return candidates[_intersects(self._boxes[candidates], key)]
+
+    def search(self, box: Box) -> List[Hashable]:
+        """Keys of items whose boxes intersect ``box``."""
+        keys = self._keys
+        return [keys[slot] for slot in self.search_slots(box).tolist()]
+
+    def search_point(self, x: float, y: float) -> List[Hashable]:
+        """Keys of items whose boxes contain the point."""
+        return self.search((x, y, x, y))
+
+    def search_many(self, boxes) -> List[List[Hashable]]:
+        """Run one box query per row of ``boxes`` in a single vectorized traversal."""
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        queries, slots = self._search_pairs(_query_key(boxes))
+        bounds = np.searchsorted(queries, np.arange(len(boxes) + 1)).tolist()
+        keys = self._keys
+        slot_list = slots.tolist()
+        return [[keys[slot] for slot in slot_list[bounds[q]:bounds[q + 1]]] for q in range(len(boxes))]
+
+    def _search_pairs(self, query_keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(query, slot) pairs of intersecting items, sorted by query."""
+        query_count = len(query_keys)
+        query_ids = np.empty(0, dtype=np.int64)
+        slots = np.empty(0, dtype=np.int64)
+
+        if self._levels and query_count:
+            query_ids = np.arange(query_count)
+            nodes = np.zeros(query_count, dtype=np.int64)
+            for depth in range(len(self._levels) - 1, -1, -1):
+                hit = _intersects(self._levels[depth][nodes], query_keys[query_ids])
+                query_ids = np.repeat(query_ids[hit], self.node_size)
+                nodes = nodes[hit]
+                if depth:
+                    nodes = self._expand(nodes)
+                else:
+                    slots = self._leaves[nodes].ravel()
+
+        overflow = self._overflow_array()
+        if len(overflow) and query_count:
+            query_ids = np.concatenate((query_ids, np.repeat(np.arange(query_count), len(overflow))))
+            slots = np.concatenate((slots, np.tile(overflow, query_count)))
+
+        hit = _intersects(self._boxes[slots], query_keys[query_ids])
+        query_ids, slots = query_ids[hit], slots[hit]
+        order = np.argsort(query_ids, kind="stable")
+        return query_ids[order], slots[order]
+
+    def nearest(self, x: float, y: float, k: int = 1, max_distance: float = math.inf,
+                metric: str = "center") -> List[Tuple[Hashable, float]]:
+        """Best-first k nearest neighbours of a point.
+
+        ``metric`` is ``"center"`` (distance to box centers) or ``"box"``
+        (distance to the box, 0 inside it). Results are ``(key, distance)``
+        pairs in ascending distance, limited to ``max_distance``.
+        """
+        if metric == "center":
+            item_distance = _center_distance
+        elif metric == "box":
+            item_distance = _box_distance
+        else:
+            raise ValueError(f"Unknown metric: {metric}")
+        if k <= 0:
+            return []
+
+        # Entries: (distance, tie breaker, depth or -1 for items, index).
+        # A node's box distance never exceeds either metric for the items
+        # below it, so items pop in global distance order.
+        heap: List[Tuple[float, int, int, int]] = []
+        counter = itertools.count()
+
+        def push(distances: np.ndarray, depth: int, indices: np.ndarray) -> None:
+            keep = np.isfinite(distances) & (distances <= max_distance)
+            for distance, index in zip(distances[keep].tolist(), indices[keep].tolist()):
+                heapq.heappush(heap, (distance, next(counter), depth, index))
+
+        if self._overflow:
+            overflow = self._overflow_array()
+            push(item_distance(self._boxes[overflow], x, y), -1, overflow)
+        if self._levels:
+            level = self._levels[self._scan_depth]
+            push(_box_distance(level, x, y), self._scan_depth, np.arange(len(level)))
+
+        results: List[Tuple[Hashable, float]] = []
+        while heap and len(results) < k:
+            distance, _, depth, index = heapq.heappop(heap)
+            if depth < 0:
+                results.append((self._keys[index], distance))
+            elif depth == 0:
+                slots = self._leaves[index]
+                slots = slots[slots >= 0]
+                push(item_distance(self._boxes[slots], x, y), -1, slots)
+            else:
+                children = self._expand(np.array([index]))
+                push(_box_distance(self._levels[depth - 1][children], x, y), depth - 1, children)
+        return results
+
+    # ---- diagnostics -----------------------------------------------------
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Tree shape and fill statistics."""
+        used = self._leaves >= 0
+        leaf_count = int(used.any(axis=1).sum())
+        return {
+            'items': len(self._slots),
+            'node_size': self.node_size,
+            'height': len(self._levels),
+            'leaf_count': leaf_count,
+            'leaf_fill': int(used.sum()) / (leaf_count * self.node_size) if leaf_count else 0.0,
+            'overflow': len(self._overflow),
+            'rebuilds': self.rebuild_count,
+        }
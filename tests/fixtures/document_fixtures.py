@@ -0,0 +1,143 @@
+"""
+Synthetic document generators for benchmarks.
+
+Produces deterministic documents made of real ``torematrix`` elements at
+several scales, so benchmark runs on different commits process exactly the
+same input.
+"""
+
+import os
+import random
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+from torematrix.core.models.coordinates import Coordinates
+from torematrix.core.models.element import Element, ElementType
+from torematrix.core.models.metadata import ElementMetadata
+
+# Number of elements per benchmark scale
+BENCHMARK_SCALES: Dict[str, int] = {
+    "small": 100,
+    "medium": 1_000,
+    "large": 10_000,
+}
+
+
+def benchmark_scales(*names: str) -> List[str]:
+    """Scales to parametrize a benchmark with.
+
+    Restricted to ``names`` when given, and to the comma separated list in
+    ``TOREMATRIX_BENCHMARK_SCALES`` when that is set.
+    """
+    requested = os.environ.get("TOREMATRIX_BENCHMARK_SCALES")
+    enabled = {n.strip() for n in requested.split(",")} if requested else set(BENCHMARK_SCALES)
+    return [name for name in BENCHMARK_SCALES
+            if name in enabled and (not names or name in names)]
+
+
+PAGE_WIDTH = 612.0
+PAGE_HEIGHT = 792.0
+ELEMENTS_PER_PAGE = 40
+
+_VOCABULARY = (
+    "document analysis extraction layout table figure caption section "
+    "paragraph heading reference invoice contract report summary revenue "
+    "quarter growth policy customer account payment schedule appendix "
+    "introduction method result discussion conclusion signature address"
+).split()
+
+# Element type mix roughly matching real documents
+_TYPE_WEIGHTS: List[Tuple[ElementType, int]] = [
+    (ElementType.NARRATIVE_TEXT, 50),
+    (ElementType.TITLE, 8),
+    (ElementType.LIST_ITEM, 15),
+    (ElementType.TABLE, 5),
+    (ElementType.HEADER, 5),
+    (ElementType.FOOTER, 5),
+    (ElementType.FIGURE_CAPTION, 4),
+    (ElementType.IMAGE, 3),
+    (ElementType.TEXT, 5),
+]
+
+
+def generate_text(rng: random.Random, words: int) -> str:
+    """Generate pseudo-text from a fixed vocabulary."""
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words)).capitalize() + "."
+
+
+def generate_bbox(index: int) -> Tuple[float, float, float, float]:
+    """Layout box for the ``index``-th element, stacked top to bottom per page."""
+    slot = index % ELEMENTS_PER_PAGE
+    row_height = PAGE_HEIGHT / ELEMENTS_PER_PAGE
+    column = slot % 2
+    x0 = 36.0 + column * (PAGE_WIDTH / 2)
+    y0 = slot * row_height
+    return (x0, y0, x0 + PAGE_WIDTH / 2 - 48.0, y0 + row_height * 0.8)
+
+
+def generate_elements(count: int, seed: int = 42) -> List[Element]:
+    """Generate ``count`` elements spread over pages of ``ELEMENTS_PER_PAGE``."""
+    rng = random.Random(seed)
+    types = [t for t, _ in _TYPE_WEIGHTS]
+    weights = [w for _, w in _TYPE_WEIGHTS]
+
+    elements = []
+    section_id = None
+    for index in range(count):
+        element_type = rng.choices(types, weights)[0]
+        words = 4 if element_type in (ElementType.TITLE, ElementType.HEADER) else rng.randint(12, 60)
+        element_id = f"elem-{index:07d}"
+        element = Element(
+            element_id=element_id,
+            element_type=element_type,
+            text=generate_text(rng, words),
+            metadata=ElementMetadata(
+                coordinates=Coordinates(layout_bbox=generate_bbox(index), system="point"),
+                confidence=round(rng.uniform(0.6, 1.0), 3),
+                detection_method="synthetic",
+                page_number=index // ELEMENTS_PER_PAGE + 1,
+                languages=["en"],
+            ),
+            parent_id=section_id if element_type != ElementType.TITLE else None,
+        )
+        if element_type == ElementType.TITLE:
+            section_id = element_id
+        elements.append(element)
+    return elements
+
+
+def generate_unified_elements(count: int, seed: int = 42) -> List[SimpleNamespace]:
+    """Generate elements in the ``id``/``type`` shape the metadata extractors read."""
+    return [
+        SimpleNamespace(id=element.element_id, type=element.element_type.value,
+                        text=element.text, metadata=element.metadata)
+        for element in generate_elements(count, seed)
+    ]
+
+
+def generate_element_dicts(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """Generate elements as plain dictionaries (state store / storage payloads)."""
+    return [element.to_dict() for element in generate_elements(count, seed)]
+
+
+def page_count(element_count: int) -> int:
+    """Number of pages a generated document of ``element_count`` elements spans."""
+    return max(1, -(-element_count // ELEMENTS_PER_PAGE))
+
+
+def generate_page_images(pages: int, seed: int = 42, scale: float = 2.0) -> List[Any]:
+    """Render generated pages as PIL images of black text on white (OCR input)."""
+    from PIL import Image, ImageDraw
+
+    elements = generate_elements(pages * ELEMENTS_PER_PAGE, seed)
+    images = []
+    for page in range(pages):
+        image = Image.new("L", (int(PAGE_WIDTH * scale), int(PAGE_HEIGHT * scale)), color=255)
+        draw = ImageDraw.Draw(image)
+        for element in elements[page * ELEMENTS_PER_PAGE:(page + 1) * ELEMENTS_PER_PAGE]:
+            x0, y0, x1, _ = element.metadata.coordinates.layout_bbox
+            # Cut the text to roughly what fits in the box at the default font size
+            width = int((x1 - x0) * scale / 6)
+            draw.text((x0 * scale, y0 * scale), element.text[:width], fill=0)
+        images.append(image)
+    return images
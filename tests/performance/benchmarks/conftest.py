@@ -0,0 +1,206 @@
+"""
+Benchmark harness for the end-to-end performance suite.
+
+Every benchmark records its timings through the ``bench`` fixture. At the end
+of the session all results are written to a JSON file (one per run) so that
+runs on different commits can be compared with
+``scripts/compare-benchmarks.py``.
+
+Environment variables:
+    TOREMATRIX_BENCHMARK_DIR: output directory (default ``benchmark-results``)
+    TOREMATRIX_BENCHMARK_SCALES: comma separated scales to run
+        (default ``small,medium,large``, see ``benchmark_scales``)
+    TOREMATRIX_BENCHMARK_ROUNDS: override the number of timed rounds
+"""
+
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import pytest
+
+RESULTS_SCHEMA_VERSION = 1
+
+
+@dataclass
+class BenchmarkRecord:
+    """Timing statistics of one benchmark at one scale."""
+    name: str
+    group: str
+    scale: str
+    items: int
+    rounds: int
+    min: float
+    median: float
+    mean: float
+    stddev: float
+    throughput: float  # items per second, based on the median
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class BenchmarkRecorder:
+    """Times callables and collects the results of a benchmark session."""
+
+    def __init__(self):
+        self.records: List[BenchmarkRecord] = []
+        rounds = os.environ.get("TOREMATRIX_BENCHMARK_ROUNDS")
+        self.rounds_override = int(rounds) if rounds else None
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        *,
+        group: str,
+        scale: str,
+        items: int,
+        rounds: int = 5,
+        warmup: int = 1,
+        setup: Optional[Callable[[], Any]] = None,
+        teardown: Optional[Callable[[Any], Any]] = None,
+        **extra: Any
+    ) -> BenchmarkRecord:
+        """Time ``func`` over several rounds.
+
+        ``setup`` runs before every round (warmup included) and is not timed;
+        when given, its return value is passed to ``func`` and ``teardown``.
+        """
+        rounds = self.rounds_override or rounds
+
+        def run_once() -> float:
+            state = setup() if setup else None
+            gc.collect()
+            start = time.perf_counter()
+            try:
+                if setup:
+                    func(state)
+                else:
+                    func()
+                return time.perf_counter() - start
+            finally:
+                if teardown:
+                    teardown(state)
+
+        for _ in range(warmup):
+            run_once()
+        timings = [run_once() for _ in range(rounds)]
+        return self._record(name, group, scale, items, timings, extra)
+
+    def measure_async(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        *,
+        group: str,
+        scale: str,
+        items: int,
+        rounds: int = 5,
+        warmup: int = 1,
+        setup: Optional[Callable[[], Awaitable[Any]]] = None,
+        teardown: Optional[Callable[[Any], Awaitable[Any]]] = None,
+        **extra: Any
+    ) -> BenchmarkRecord:
+        """Async counterpart of :meth:`measure`; each round runs in a fresh event loop."""
+
+        async def timed() -> float:
+            state = await setup() if setup else None
+            gc.collect()
+            start = time.perf_counter()
+            try:
+                if setup:
+                    await func(state)
+                else:
+                    await func()
+                return time.perf_counter() - start
+            finally:
+                if teardown:
+                    await teardown(state)
+
+        rounds = self.rounds_override or rounds
+        for _ in range(warmup):
+            asyncio.run(timed())
+        timings = [asyncio.run(timed()) for _ in range(rounds)]
+        return self._record(name, group, scale, items, timings, extra)
+
+    def _record(
+        self,
+        name: str,
+        group: str,
+        scale: str,
+        items: int,
+        timings: List[float],
+        extra: Dict[str, Any]
+    ) -> BenchmarkRecord:
+        median = statistics.median(timings)
+        record = BenchmarkRecord(
+            name=name,
+            group=group,
+            scale=scale,
+            items=items,
+            rounds=len(timings),
+            min=min(timings),
+            median=median,
+            mean=statistics.mean(timings),
+            stddev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            throughput=items / median if median > 0 else 0.0,
+            extra=extra,
+        )
+        self.records.append(record)
+        print(f"{group}/{name}[{scale}]: median {median * 1000:.2f} ms, "
+              f"{record.throughput:,.0f} items/s")
+        return record
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "schema": RESULTS_SCHEMA_VERSION,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git("rev-parse", "HEAD"),
+            "branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+            "machine": {
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "processor": platform.processor(),
+                "cpu_count": os.cpu_count(),
+            },
+            "benchmarks": [asdict(record) for record in self.records],
+        }
+
+    def save(self, directory: Path) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        data = self.to_json()
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+        commit = (data["commit"] or "unknown")[:10]
+        path = directory / f"{stamp}_{commit}.json"
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return path
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+@pytest.fixture(scope="session")
+def bench() -> BenchmarkRecorder:
+    """Session-wide benchmark recorder; results are saved when the session ends."""
+    recorder = BenchmarkRecorder()
+    yield recorder
+
+    if recorder.records:
+        directory = Path(os.environ.get("TOREMATRIX_BENCHMARK_DIR", "benchmark-results"))
+        path = recorder.save(directory)
+        print(f"\nBenchmark results written to {path}")
@@ -0,0 +1,71 @@
+"""
+Benchmarks for EventBus publishing and dispatch.
+"""
+
+import asyncio
+
+import pytest
+
+from torematrix.core.events import Event, EventBus
+
+from tests.fixtures.document_fixtures import BENCHMARK_SCALES, benchmark_scales
+
+
+def make_events(count: int):
+    return [
+        Event(event_type="element_updated", payload={"element_id": f"elem-{i:07d}", "index": i})
+        for i in range(count)
+    ]
+
+
+async def start_bus(expected: int):
+    """Started bus with a subscriber that signals once ``expected`` events arrived."""
+    bus = EventBus()
+    done = asyncio.Event()
+    received = 0
+
+    def handler(event):
+        nonlocal received
+        received += 1
+        if received == expected:
+            done.set()
+
+    bus.subscribe("element_updated", handler)
+    await bus.start()
+    return bus, done
+
+
+async def stop_bus(state):
+    bus, _ = state
+    await bus.stop()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_event_bus_publish(bench, scale):
+    """Publish one event at a time and wait until all were dispatched."""
+    events = make_events(BENCHMARK_SCALES[scale])
+
+    async def run(state):
+        bus, done = state
+        for event in events:
+            await bus.publish(event)
+        await asyncio.wait_for(done.wait(), timeout=60)
+
+    bench.measure_async("publish", run, group="event_bus", scale=scale, items=len(events),
+                        setup=lambda: start_bus(len(events)), teardown=stop_bus)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_event_bus_publish_many(bench, scale):
+    """Publish all events in one call and wait until all were dispatched."""
+    events = make_events(BENCHMARK_SCALES[scale])
+
+    async def run(state):
+        bus, done = state
+        await bus.publish_many(events)
+        await asyncio.wait_for(done.wait(), timeout=60)
+
+    bench.measure_async("publish_many", run, group="event_bus", scale=scale, items=len(events),
+                        setup=lambda: start_bus(len(events)), teardown=stop_bus)
@@ -0,0 +1,59 @@
+"""
+Benchmarks for OCREngine page throughput.
+"""
+
+import shutil
+
+import pytest
+
+from tests.fixtures.document_fixtures import (
+    BENCHMARK_SCALES, benchmark_scales, generate_page_images, page_count
+)
+
+pytest.importorskip("pytesseract")
+if shutil.which("tesseract") is None:
+    pytest.skip("tesseract binary not installed", allow_module_level=True)
+
+from torematrix.core.processing.parsers.advanced.ocr_engine import OCREngine
+
+
+def record_pages_per_minute(record):
+    record.extra["pages_per_minute"] = record.throughput * 60
+    print(f"  {record.extra['pages_per_minute']:,.1f} pages/min")
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales("small", "medium"))
+def test_ocr_throughput(bench, scale):
+    pages = page_count(BENCHMARK_SCALES[scale])
+    images = generate_page_images(pages)
+    config = {"engine": "tesseract", "preprocess": False}
+
+    async def setup():
+        return OCREngine(config)
+
+    async def teardown(engine):
+        engine.close()
+
+    async def run_sequential(engine):
+        for image in images:
+            await engine.extract_text(image)
+
+    async def run_batch(engine):
+        results = await engine.extract_text_many(images)
+        assert len(results) == pages
+
+    cached = OCREngine(config)
+
+    async def run_cached():
+        results = await cached.extract_text_many(images)
+        assert len(results) == pages
+
+    for name, func in (("sequential", run_sequential), ("batch", run_batch)):
+        record = bench.measure_async(name, func, group="ocr", scale=scale, items=pages,
+                                     rounds=3, setup=setup, teardown=teardown)
+        record_pages_per_minute(record)
+
+    record = bench.measure_async("batch_cached", run_cached, group="ocr", scale=scale, items=pages, rounds=3)
+    record_pages_per_minute(record)
+    cached.close()
@@ -0,0 +1,88 @@
+"""
+Benchmarks for structural element parsers.
+"""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from torematrix.core.processing.parsers.integration.manager import ParserManager
+from torematrix.core.processing.parsers.table import TableParser
+
+from tests.fixtures.document_fixtures import BENCHMARK_SCALES, benchmark_scales
+
+
+def make_table_text(rows: int, delimiter: str = " | ", seed: int = 42) -> str:
+    """Text table with integer, text, currency, boolean and date columns."""
+    rng = random.Random(seed)
+    lines = [delimiter.join(["ID", "Product", "Price", "Available", "Launch Date"])]
+    for index in range(rows):
+        lines.append(delimiter.join([
+            str(index + 1),
+            f"Product {rng.randint(1, 500)}",
+            f"${rng.randint(1, 2000)}.{rng.randint(0, 99):02d}",
+            rng.choice(["Yes", "No"]),
+            f"2023-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        ]))
+    return "\n".join(lines)
+
+
+def make_mixed_elements(count: int, seed: int = 42) -> list:
+    """Tables, code, lists and formulas in turn, with some repeats of each."""
+    rng = random.Random(seed)
+    elements = []
+    for index in range(count):
+        variant = rng.randint(1, max(count // 8, 1))
+        kind = index % 4
+        if kind == 0:
+            elements.append(SimpleNamespace(type="Table", text=make_table_text(3, seed=variant), metadata={}))
+        elif kind == 1:
+            elements.append(SimpleNamespace(type="CodeBlock", text=f"def step_{variant}(x):\n    return x * {variant}",
+                                            metadata={}))
+        elif kind == 2:
+            elements.append(SimpleNamespace(type="List", text=f"1. First {variant}\n2. Second\n3. Third",
+                                            metadata={}))
+        else:
+            elements.append(SimpleNamespace(type="Formula", text=f"x^{variant} + y = z", metadata={}))
+    return elements
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+@pytest.mark.parametrize("delimiter", [" | ", "\t", ","])
+def test_table_parse(bench, scale, delimiter):
+    """Parse a text table of one row per scale item."""
+    rows = BENCHMARK_SCALES[scale]
+    element = SimpleNamespace(text=make_table_text(rows, delimiter), type="Table", metadata={})
+    parser = TableParser()
+
+    async def run():
+        result = await parser.parse(element)
+        assert result.success and result.data["rows"] == rows + 1
+
+    bench.measure_async(f"table_parse[{delimiter.strip() or 'tab'}]", run, group="parsers", scale=scale,
+                        items=rows, rounds=3)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_manager_parse_batch(bench, scale):
+    """Parse a mixed batch through the manager, cold cache then warm cache."""
+    count = BENCHMARK_SCALES[scale]
+    elements = make_mixed_elements(count)
+
+    async def setup():
+        return ParserManager({'enable_monitoring': True})
+
+    async def teardown(manager):
+        await manager.shutdown()
+
+    async def run(manager):
+        responses = await manager.parse_batch(elements)
+        assert all(response.success for response in responses)
+        responses = await manager.parse_batch(elements)
+        assert all(response.cache_hit for response in responses)
+
+    bench.measure_async("manager_parse_batch", run, group="parsers", scale=scale, items=count, rounds=3,
+                        setup=setup, teardown=teardown)
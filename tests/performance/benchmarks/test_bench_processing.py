@@ -0,0 +1,118 @@
+"""
+Benchmarks for the processing pipeline and worker pool.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from torematrix.core.events import EventBus
+from torematrix.processing.pipeline.config import PipelineConfig, StageConfig, StageType
+from torematrix.processing.pipeline.manager import PipelineContext, PipelineManager
+from torematrix.processing.pipeline.stages import Stage, StageResult, StageStatus
+from torematrix.processing.workers.config import WorkerConfig
+from torematrix.processing.workers.pool import WorkerPool
+
+from tests.fixtures.document_fixtures import BENCHMARK_SCALES, benchmark_scales, generate_elements
+
+
+class WordCountStage(Stage):
+    """Stage doing real per-element work on the document in the context."""
+
+    async def _initialize(self) -> None:
+        pass
+
+    async def execute(self, context: PipelineContext) -> StageResult:
+        started = datetime.utcnow()
+        words = sum(len(element.text.split()) for element in context.metadata["elements"])
+        context.user_data[self.name] = words
+        return StageResult(
+            stage_name=self.name,
+            status=StageStatus.COMPLETED,
+            start_time=started,
+            end_time=datetime.utcnow(),
+            data={"words": words},
+        )
+
+
+class BenchmarkPipelineManager(PipelineManager):
+    def _create_stage(self, config: StageConfig) -> Stage:
+        return WordCountStage(config)
+
+
+def diamond_pipeline() -> PipelineConfig:
+    """extract -> (layout, text) -> aggregate"""
+    return PipelineConfig(
+        name="benchmark-pipeline",
+        checkpoint_enabled=False,
+        stages=[
+            StageConfig(name="extract", type=StageType.PROCESSOR, processor="bench.Extract"),
+            StageConfig(name="layout", type=StageType.PROCESSOR, processor="bench.Layout",
+                        dependencies=["extract"]),
+            StageConfig(name="text", type=StageType.PROCESSOR, processor="bench.Text",
+                        dependencies=["extract"]),
+            StageConfig(name="aggregate", type=StageType.AGGREGATOR, processor="bench.Aggregate",
+                        dependencies=["layout", "text"]),
+        ],
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_pipeline_execute(bench, scale):
+    """PipelineManager.execute over a diamond DAG, one document per scale."""
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+
+    async def setup():
+        bus = EventBus()
+        await bus.start()
+        return bus, BenchmarkPipelineManager(diamond_pipeline(), bus)
+
+    async def run(state):
+        _, manager = state
+        context = await manager.execute(
+            document_id=f"bench-{scale}", metadata={"elements": elements}, checkpoint=False
+        )
+        assert len(context.stage_results) == 4
+
+    async def teardown(state):
+        bus, manager = state
+        await manager.cleanup()
+        await bus.stop()
+
+    bench.measure_async("execute", run, group="pipeline", scale=scale,
+                        items=len(elements), setup=setup, teardown=teardown)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales("small"))
+def test_worker_pool_throughput(bench, scale):
+    """Submit one small task per element and wait for the pool to drain.
+
+    Limited to the small scale: idle workers poll the priority queue with a
+    100 ms timeout before every task, which caps throughput at ~10 tasks/s
+    per async worker.
+    """
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+
+    def count_words(element):
+        return len(element.text.split())
+
+    async def setup():
+        pool = WorkerPool(WorkerConfig(
+            async_workers=4, thread_workers=2, max_queue_size=len(elements) + 10
+        ))
+        await pool.start()
+        return pool
+
+    async def run(pool):
+        for element in elements:
+            await pool.submit_task("count_words", element, count_words)
+        assert await pool.wait_for_completion(timeout=120)
+
+    async def teardown(pool):
+        await pool.stop(timeout=5)
+
+    bench.measure_async("submit_and_drain", run, group="worker_pool", scale=scale,
+                        items=len(elements), rounds=3, setup=setup, teardown=teardown)
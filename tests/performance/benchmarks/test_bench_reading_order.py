@@ -0,0 +1,38 @@
+"""
+Benchmarks for reading order extraction, page by page.
+"""
+
+import pytest
+
+pytest.importorskip("torematrix.core.processing.metadata.models.relationship")
+
+from torematrix.core.processing.metadata.extractors.reading_order import (
+    PageLayout, ReadingOrderConfig, ReadingOrderExtractor
+)
+
+from tests.fixtures.document_fixtures import (
+    BENCHMARK_SCALES, ELEMENTS_PER_PAGE, PAGE_HEIGHT, PAGE_WIDTH, benchmark_scales,
+    generate_unified_elements
+)
+
+
+def make_pages(count: int):
+    """Generated elements split into pages."""
+    elements = generate_unified_elements(count)
+    return [elements[start:start + ELEMENTS_PER_PAGE] for start in range(0, len(elements), ELEMENTS_PER_PAGE)]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_reading_order_per_page(bench, scale):
+    pages = make_pages(BENCHMARK_SCALES[scale])
+    layout = PageLayout(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+
+    async def run():
+        extractor = ReadingOrderExtractor(ReadingOrderConfig())
+        for page in pages:
+            order = await extractor.extract_reading_order(page, layout)
+            assert order.ordered_elements
+
+    bench.measure_async("extract_reading_order", run, group="reading_order", scale=scale,
+                        items=len(pages), rounds=3)
@@ -0,0 +1,30 @@
+"""
+Benchmarks for relationship detection between document elements.
+"""
+
+import pytest
+
+pytest.importorskip("torematrix.core.processing.metadata.models.relationship")
+
+from torematrix.core.processing.metadata.relationships import (
+    DocumentContext, RelationshipConfig, RelationshipDetectionEngine
+)
+
+from tests.fixtures.document_fixtures import (
+    BENCHMARK_SCALES, benchmark_scales, generate_unified_elements
+)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales("small", "medium"))
+def test_detect_relationships(bench, scale):
+    """Full detection pass (spatial, content, hierarchy, reading order)."""
+    elements = generate_unified_elements(BENCHMARK_SCALES[scale])
+    context = DocumentContext(document_id=f"bench-{scale}")
+
+    async def run():
+        engine = RelationshipDetectionEngine(RelationshipConfig())
+        await engine.detect_relationships(elements, context)
+
+    bench.measure_async("detect_relationships", run, group="relationships", scale=scale,
+                        items=len(elements), rounds=3)
@@ -0,0 +1,172 @@
+"""
+Benchmarks for SearchIndex indexing and text queries.
+"""
+
+import sys
+
+import pytest
+
+try:
+    from torematrix.ui.components.search.indexer import SearchIndex
+    from torematrix.ui.components.search.segments import SegmentedSearchIndex
+except ImportError as e:
+    # The search package __init__ pulls in UI modules with broken imports
+    pytest.skip(f"search components unavailable: {e}", allow_module_level=True)
+
+from tests.fixtures.document_fixtures import BENCHMARK_SCALES, benchmark_scales, generate_elements
+
+QUERIES = [
+    "invoice", "payment schedule", "revenue growth", "table", "customer account",
+    "appendix", "quarter report summary", "signature", "method result", "policy",
+]
+FUZZY_QUERIES = [
+    "invoce", "paymnt schedle", "revenu", "tabel", "custmer accont",
+    "apendix", "quartr", "signatur", "metod", "polcy",
+]
+PREFIX_QUERIES = ["inv", "pay", "rev", "ta", "cust", "app", "qua", "sig", "me", "po"]
+WILDCARD_QUERIES = ["inv*", "*ment", "pay*ule", "t?ble", "*port*", "sig*re", "??"]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_search_index_build(bench, scale):
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+
+    def run():
+        index = SearchIndex()
+        for element in elements:
+            index.add_element(element)
+        assert index.get_element_count() == len(elements)
+
+    bench.measure("add_element", run, group="search_index", scale=scale,
+                  items=len(elements), rounds=3)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_search_index_bulk_load(bench, scale, workers):
+    """Bulk build throughput against the number of worker processes."""
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+
+    def run():
+        index = SearchIndex()
+        index.bulk_load(elements, workers=workers)
+        assert index.get_element_count() == len(elements)
+
+    bench.measure(f"bulk_load_{workers}_workers", run, group="search_index", scale=scale,
+                  items=len(elements), rounds=3, workers=workers)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_search_index_query(bench, scale):
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+    index = SearchIndex()
+    for element in elements:
+        index.add_element(element)
+
+    def exact():
+        for query in QUERIES:
+            index.search_text(query)
+
+    def fuzzy():
+        for query in FUZZY_QUERIES:
+            index.search_text(query, fuzzy=True)
+
+    def ranked():
+        for query in QUERIES:
+            index.search_ranked(query, k=50)
+
+    def ranked_any():
+        for query in QUERIES:
+            index.search_ranked(query, k=50, match_all=False)
+
+    bench.measure("search_text", exact, group="search_index", scale=scale,
+                  items=len(QUERIES), elements=len(elements))
+    bench.measure("search_ranked_top50", ranked, group="search_index", scale=scale,
+                  items=len(QUERIES), elements=len(elements))
+    bench.measure("search_ranked_top50_any", ranked_any, group="search_index", scale=scale,
+                  items=len(QUERIES), elements=len(elements))
+    bench.measure("search_text_fuzzy", fuzzy, group="search_index", scale=scale,
+                  items=len(FUZZY_QUERIES), elements=len(elements))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_term_dictionary_lookup(bench, scale):
+    """Latency of candidate-term resolution by dictionary size."""
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+    index = SearchIndex()
+    for element in elements:
+        index.add_element(element)
+    dictionary = index.term_dictionary
+
+    def prefix():
+        for query in PREFIX_QUERIES:
+            index.search_prefix(query)
+
+    def wildcard():
+        for pattern in WILDCARD_QUERIES:
+            index.search_wildcard(pattern)
+
+    def fuzzy():
+        for query in FUZZY_QUERIES:
+            for distance in (1, 2):
+                dictionary.fuzzy(query, distance)
+
+    bench.measure("prefix", prefix, group="term_dictionary", scale=scale,
+                  items=len(PREFIX_QUERIES), terms=len(dictionary))
+    bench.measure("wildcard", wildcard, group="term_dictionary", scale=scale,
+                  items=len(WILDCARD_QUERIES), terms=len(dictionary))
+    bench.measure("fuzzy", fuzzy, group="term_dictionary", scale=scale,
+                  items=len(FUZZY_QUERIES) * 2, terms=len(dictionary))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_search_index_memory(bench, scale):
+    """Posting list footprint against the equivalent ``Set[str]`` term index."""
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+    index = SearchIndex()
+    for element in elements:
+        index.add_element(element)
+
+    postings_bytes = index.get_statistics().index_size_bytes
+    # Element id strings are shared with the entries, so only the sets count
+    set_bytes = sum(sys.getsizeof(set(element_ids)) for element_ids in index.term_index.values())
+
+    def decode_all():
+        for postings in index.postings.values():
+            for _ in postings:
+                pass
+
+    bench.measure("decode_postings", decode_all, group="search_index", scale=scale,
+                  items=sum(len(postings) for postings in index.postings.values()),
+                  postings_bytes=postings_bytes, set_index_bytes=set_bytes,
+                  ratio=round(postings_bytes / set_bytes, 3))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_segmented_index_open(bench, scale, tmp_path):
+    """Reopening a persisted index and answering the first query."""
+    elements = generate_elements(BENCHMARK_SCALES[scale])
+    index = SegmentedSearchIndex(tmp_path, max_buffered_docs=max(len(elements) // 4, 1),
+                                 background_merge=False)
+    for element in elements:
+        index.add_element(element)
+    index.close()
+
+    def open_index():
+        SegmentedSearchIndex(tmp_path, background_merge=False).close(commit=False)
+
+    def open_and_query():
+        reopened = SegmentedSearchIndex(tmp_path, background_merge=False)
+        reopened.search_ranked(QUERIES[0], k=50)
+        reopened.close(commit=False)
+
+    bench.measure("segmented_open", open_index, group="search_index", scale=scale,
+                  items=1, elements=len(elements))
+    bench.measure("segmented_open_first_query", open_and_query, group="search_index", scale=scale,
+                  items=1, elements=len(elements))
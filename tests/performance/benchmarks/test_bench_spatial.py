@@ -0,0 +1,100 @@
+"""
+Benchmarks for RTreeSpatialIndex inserts and queries.
+"""
+
+import random
+
+import pytest
+
+from torematrix.ui.viewer.coordinates import Point
+from torematrix.ui.viewer.spatial import RTreeSpatialIndex, SpatialBounds, SpatialElement
+
+from tests.fixtures.document_fixtures import (
+    BENCHMARK_SCALES, PAGE_HEIGHT, PAGE_WIDTH, benchmark_scales, generate_elements, page_count
+)
+
+
+def make_spatial_elements(count: int):
+    """Spatial elements with pages stacked vertically, as in continuous scrolling."""
+    spatial = []
+    for element in generate_elements(count):
+        x0, y0, x1, y1 = element.metadata.coordinates.layout_bbox
+        offset = (element.metadata.page_number - 1) * PAGE_HEIGHT
+        spatial.append(SpatialElement(
+            element_id=element.element_id,
+            bounds=SpatialBounds(x0, y0 + offset, x1 - x0, y1 - y0),
+            element=element,
+        ))
+    return spatial
+
+
+def document_bounds(count: int) -> SpatialBounds:
+    return SpatialBounds(0, 0, PAGE_WIDTH, page_count(count) * PAGE_HEIGHT)
+
+
+def build_index(elements, bounds: SpatialBounds) -> RTreeSpatialIndex:
+    index = RTreeSpatialIndex(bounds)
+    for element in elements:
+        index.insert(element)
+    return index
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_spatial_insert(bench, scale):
+    count = BENCHMARK_SCALES[scale]
+    elements = make_spatial_elements(count)
+    bounds = document_bounds(count)
+
+    def run():
+        index = build_index(elements, bounds)
+        assert len(index.element_lookup) == count
+
+    def run_bulk():
+        index = RTreeSpatialIndex(bounds)
+        assert index.insert_many(elements) == count
+
+    bench.measure("insert", run, group="spatial", scale=scale, items=count)
+    bench.measure("bulk_load", run_bulk, group="spatial", scale=scale, items=count)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_spatial_queries(bench, scale):
+    count = BENCHMARK_SCALES[scale]
+    bounds = document_bounds(count)
+    index = RTreeSpatialIndex(bounds)
+    index.insert_many(make_spatial_elements(count))
+
+    rng = random.Random(7)
+    queries = 1_000
+    # Viewport-sized windows and click points spread over the whole document
+    viewports = [
+        SpatialBounds(0, rng.uniform(0, bounds.height - PAGE_HEIGHT), PAGE_WIDTH, PAGE_HEIGHT)
+        for _ in range(queries)
+    ]
+    points = [Point(rng.uniform(0, PAGE_WIDTH), rng.uniform(0, bounds.height))
+              for _ in range(queries)]
+
+    def query_viewports():
+        assert sum(len(index.query(viewport)) for viewport in viewports) > 0
+
+    def query_viewports_batched():
+        assert sum(len(found) for found in index.query_many(viewports)) > 0
+
+    def query_points():
+        for point in points:
+            index.query_point(point)
+
+    def query_nearest():
+        for point in points:
+            index.query_nearest(point, max_results=5)
+
+    bench.measure("query_viewport", query_viewports, group="spatial", scale=scale,
+                  items=queries, elements=count)
+    bench.measure("query_viewport_batch", query_viewports_batched, group="spatial", scale=scale,
+                  items=queries, elements=count)
+    bench.measure("query_point", query_points, group="spatial", scale=scale,
+                  items=queries, elements=count)
+    bench.measure("query_nearest", query_nearest, group="spatial", scale=scale,
+                  items=queries, elements=count)
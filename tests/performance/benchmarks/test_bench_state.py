@@ -0,0 +1,58 @@
+"""
+Benchmarks for Store.dispatch.
+"""
+
+import pytest
+
+from torematrix.core.state import (
+    Store, StoreConfig, add_element, create_root_reducer, update_element
+)
+
+from tests.fixtures.document_fixtures import (
+    BENCHMARK_SCALES, benchmark_scales, generate_element_dicts
+)
+
+
+def make_store() -> Store:
+    return Store(StoreConfig(initial_state={}, reducer=create_root_reducer()))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_store_dispatch_add(bench, scale):
+    """Dispatch one ADD_ELEMENT action per element into an empty store."""
+    elements = generate_element_dicts(BENCHMARK_SCALES[scale])
+    actions = [
+        add_element(e["element_id"], e["element_type"], e, e["metadata"]["page_number"])
+        for e in elements
+    ]
+
+    def run(store):
+        for action in actions:
+            store.dispatch(action)
+        assert len(store.get_state()["elements"]["allIds"]) == len(actions)
+
+    bench.measure("dispatch_add", run, group="store", scale=scale, items=len(actions),
+                  rounds=3, setup=make_store)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_store_dispatch_update(bench, scale):
+    """Dispatch one UPDATE_ELEMENT action per element into a populated store."""
+    elements = generate_element_dicts(BENCHMARK_SCALES[scale])
+    actions = [update_element(e["element_id"], {"text": e["text"].upper()}) for e in elements]
+
+    def setup():
+        store = make_store()
+        for e in elements:
+            store.dispatch(add_element(e["element_id"], e["element_type"], e,
+                                       e["metadata"]["page_number"]))
+        return store
+
+    def run(store):
+        for action in actions:
+            store.dispatch(action)
+
+    bench.measure("dispatch_update", run, group="store", scale=scale, items=len(actions),
+                  rounds=3, setup=setup)
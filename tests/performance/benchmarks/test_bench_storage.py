@@ -0,0 +1,139 @@
+"""
+Benchmarks for SQLite repository CRUD and the multi-level cache.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from torematrix.core.cache.cache_config import CacheConfig
+from torematrix.core.storage import SQLiteConfig, SQLiteRepository
+
+from tests.fixtures.document_fixtures import (
+    BENCHMARK_SCALES, benchmark_scales, generate_element_dicts
+)
+
+
+@dataclass
+class StoredElement:
+    """Repository entity wrapping a serialized element."""
+    id: Optional[str] = None
+    element_type: str = ""
+    text: str = ""
+    page_number: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_element_dict(cls, data: Dict[str, Any]) -> "StoredElement":
+        metadata = data.get("metadata") or {}
+        return cls(
+            id=data["element_id"],
+            element_type=data["element_type"],
+            text=data["text"],
+            page_number=metadata.get("page_number"),
+            metadata=metadata,
+        )
+
+
+def make_entities(count: int) -> List[StoredElement]:
+    return [StoredElement.from_element_dict(d) for d in generate_element_dicts(count)]
+
+
+def make_repository(tmp_path) -> SQLiteRepository:
+    config = SQLiteConfig(database_path=str(tmp_path / "bench.db"))
+    return SQLiteRepository(config, StoredElement, "elements")
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_sqlite_bulk_create(bench, tmp_path, scale):
+    entities = make_entities(BENCHMARK_SCALES[scale])
+
+    def setup():
+        for path in tmp_path.glob("bench.db*"):
+            path.unlink()
+        return make_repository(tmp_path)
+
+    def run(repository):
+        repository.bulk_create(entities)
+
+    bench.measure("bulk_create", run, group="sqlite", scale=scale, items=len(entities),
+                  setup=setup, teardown=lambda repository: repository.disconnect())
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales("small", "medium"))
+def test_sqlite_single_create(bench, tmp_path, scale):
+    entities = make_entities(BENCHMARK_SCALES[scale])
+
+    def setup():
+        for path in tmp_path.glob("bench.db*"):
+            path.unlink()
+        return make_repository(tmp_path)
+
+    def run(repository):
+        for entity in entities:
+            repository.create(entity)
+
+    bench.measure("create", run, group="sqlite", scale=scale, items=len(entities),
+                  rounds=3, setup=setup, teardown=lambda repository: repository.disconnect())
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_sqlite_read_update(bench, tmp_path, scale):
+    entities = make_entities(BENCHMARK_SCALES[scale])
+    repository = make_repository(tmp_path)
+    repository.bulk_create(entities)
+    ids = [entity.id for entity in entities]
+
+    def get_all():
+        for entity_id in ids:
+            assert repository.get(entity_id) is not None
+
+    def list_all():
+        assert repository.count() == len(ids)
+        repository.list()
+
+    def update_all():
+        repository.bulk_update(entities)
+
+    try:
+        bench.measure("get", get_all, group="sqlite", scale=scale, items=len(ids))
+        bench.measure("list", list_all, group="sqlite", scale=scale, items=len(ids))
+        bench.measure("bulk_update", update_all, group="sqlite", scale=scale, items=len(ids))
+    finally:
+        repository.disconnect()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("scale", benchmark_scales())
+def test_multi_level_cache(bench, tmp_path, scale):
+    # cachetools backs the cache but is not a declared dependency
+    pytest.importorskip("cachetools")
+    from torematrix.core.cache.multi_level_cache import MultiLevelCache
+
+    payloads = generate_element_dicts(BENCHMARK_SCALES[scale])
+    keys = [f"element:{payload['element_id']}" for payload in payloads]
+    cache = MultiLevelCache(CacheConfig(
+        memory_cache_size=len(keys) // 2 or 1,
+        disk_cache_path=tmp_path / "cache",
+    ))
+
+    def set_all():
+        for key, payload in zip(keys, payloads):
+            cache.set(key, payload)
+
+    def get_all():
+        # Half of the keys only live on disk and get promoted on hit
+        hits = sum(1 for key in keys if cache.get(key) is not None)
+        assert hits == len(keys)
+
+    try:
+        bench.measure("set", set_all, group="cache", scale=scale, items=len(keys))
+        bench.measure("get", get_all, group="cache", scale=scale, items=len(keys))
+    finally:
+        cache.disk_cache.close()
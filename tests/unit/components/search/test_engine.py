@@ -222,6 +222,17 @@ class TestIndexedSearchEngine:
         assert "elem-1" in element_ids  # Title element
         assert "elem-2" not in element_ids  # Narrative text element
     
+    def test_wildcard_and_fuzzy_search(self, search_engine):
+        """Test wildcard and fuzzy terms resolve through the term dictionary."""
+        state = search_engine.state_store.get_state()
+        for element in state['elements'].values():
+            search_engine.indexer.add_element(element)
+        
+        assert search_engine.search("narr*").get_element_ids() == ["elem-2"]
+        assert search_engine.search("co*mn").get_element_ids() == ["elem-3"]
+        assert search_engine.search("tabel~2").get_element_ids() == ["elem-3"]
+        assert search_engine.search("tabel~1").total_count == 0
+    
     def test_boolean_search(self, search_engine):
         """Test boolean search operations."""
         # Add elements
@@ -219,6 +219,129 @@ class TestSearchIndex:
         suggestions = search_index.get_suggestions("xyz")
         assert len(suggestions) == 0
     
+    def test_search_text_fuzzy_distance(self, search_index, sample_elements):
+        """Test fuzzy search honours the edit distance."""
+        for element in sample_elements:
+            search_index.add_element(element)
+        
+        assert search_index.search_text("tabel", fuzzy=True, max_distance=2) == {"elem-3"}
+        assert search_index.search_text("tabel", fuzzy=True, max_distance=1) == set()
+    
+    def test_search_prefix(self, search_index, sample_elements):
+        """Test prefix search."""
+        for element in sample_elements:
+            search_index.add_element(element)
+        
+        assert search_index.search_prefix("doc") == {"elem-1"}
+        assert search_index.search_prefix("T") == {"elem-1", "elem-2", "elem-3"}
+        assert search_index.search_prefix("xyz") == set()
+    
+    def test_search_wildcard(self, search_index, sample_elements):
+        """Test wildcard search."""
+        for element in sample_elements:
+            search_index.add_element(element)
+        
+        assert search_index.search_wildcard("narr*") == {"elem-2"}
+        assert search_index.search_wildcard("*port*") == {"elem-2"}
+        assert search_index.search_wildcard("t?xt") == {"elem-2"}
+        assert search_index.search_wildcard("*") == set()
+    
+    def test_term_dictionary_follows_index(self, search_index, sample_elements):
+        """Test the term dictionary tracks added and removed terms."""
+        search_index.add_element(sample_elements[0])
+        assert "document" in search_index.term_dictionary
+        
+        search_index.remove_element("elem-1")
+        assert "document" not in search_index.term_dictionary
+        assert len(search_index.term_dictionary) == 0
+    
+    def test_search_ranked(self, search_index):
+        """Test BM25 top-k retrieval."""
+        texts = {
+            "a": "invoice invoice invoice total",
+            "b": "invoice total due",
+            "c": "payment total",
+            "d": "invoice",
+        }
+        for element_id, text in texts.items():
+            search_index.add_element(Element(
+                element_id=element_id, element_type=ElementType.NARRATIVE_TEXT, text=text
+            ))
+        
+        ranked = search_index.search_ranked("invoice", k=2)
+        assert ranked.total_count == 3
+        assert len(ranked.hits) == 2
+        assert ranked.hits[0][0] == "a"  # highest term frequency
+        assert ranked.hits[0][1] == pytest.approx(search_index.score_element("a", "invoice"))
+        
+        ranked = search_index.search_ranked("invoice total", k=10)
+        assert {element_id for element_id, _ in ranked.hits} == {"a", "b"}
+        
+        ranked = search_index.search_ranked("invoice payment", k=10, match_all=False)
+        assert {element_id for element_id, _ in ranked.hits} == {"a", "b", "c", "d"}
+        
+        ranked = search_index.search_ranked("invoice", k=10,
+                                            prior=lambda entry: 10.0 if entry.element_id == "d" else 0.0,
+                                            prior_bound=10.0)
+        assert ranked.hits[0][0] == "d"
+    
+    def test_doc_id_compaction(self, search_index):
+        """Test removed elements are purged from postings."""
+        search_index.COMPACT_MIN_DEAD_DOCS = 4
+        for i in range(10):
+            search_index.add_element(Element(
+                element_id=f"e{i}", element_type=ElementType.NARRATIVE_TEXT, text=f"common word{i}"
+            ))
+        for i in range(5):
+            search_index.remove_element(f"e{i}")
+        
+        # Half of the doc ids were dead, so live documents got renumbered
+        assert [entry.doc_id for entry in search_index._docs] == [0, 1, 2, 3, 4]
+        remaining = {"e5", "e6", "e7", "e8", "e9"}
+        assert search_index.search_text("common") == remaining
+        assert search_index.term_index["common"] == remaining
+        assert "word0" not in search_index.term_index
+        
+        search_index.add_element(Element(
+            element_id="e0", element_type=ElementType.NARRATIVE_TEXT, text="common"
+        ))
+        assert search_index.search_ranked("common", k=10).total_count == 6
+    
+    def test_add_elements_batch(self, search_index, sample_elements):
+        """Test batch insertion matches adding one by one."""
+        reference = SearchIndex(IndexStrategy.BALANCED)
+        for element in sample_elements:
+            reference.add_element(element)
+        
+        assert search_index.add_elements(sample_elements) == len(sample_elements)
+        assert dict(search_index.term_index) == dict(reference.term_index)
+        assert search_index.search_by_page({1}) == reference.search_by_page({1})
+        assert search_index.statistics.update_count == 1
+    
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_bulk_load(self, search_index, workers):
+        """Test parallel bulk builds equal a serial build, later duplicates winning."""
+        elements = [
+            Element(element_id=f"e{i % 150}", element_type=ElementType.NARRATIVE_TEXT,
+                    text=f"common word{i % 7} version{i}")
+            for i in range(200)
+        ]
+        search_index.add_element(Element(
+            element_id="e3", element_type=ElementType.TITLE, text="stale title"
+        ))
+        reference = SearchIndex(IndexStrategy.BALANCED)
+        reference.add_elements(elements)
+        
+        assert search_index.bulk_load(elements, workers=workers, chunk_size=64) == 200
+        assert search_index.get_element_count() == 150
+        assert dict(search_index.term_index) == dict(reference.term_index)
+        assert search_index.search_text("stale") == set()
+        assert search_index.search_text("version199") == {"e49"}
+        assert search_index.get_suggestions("vers") == reference.get_suggestions("vers")
+        
+        expected = reference.search_ranked("common word3", k=5)
+        assert search_index.search_ranked("common word3", k=5).hits == pytest.approx(expected.hits)
+    
     def test_statistics_update(self, search_index, sample_elements):
         """Test statistics tracking."""
         initial_stats = search_index.get_statistics()
@@ -234,6 +357,8 @@ class TestSearchIndex:
         assert stats.total_terms > 0
         assert stats.update_count > 0
         assert stats.average_terms_per_element > 0
+        assert stats.index_size_bytes > 0
+        assert stats.most_common_terms[0][1] == 3  # type/detection terms shared by all
     
     def test_clear_index(self, search_index, sample_elements):
         """Test clearing the index."""
@@ -0,0 +1,85 @@
+"""
+Unit tests for compressed posting lists.
+"""
+
+import pytest
+
+from src.torematrix.ui.components.search.postings import (
+    NO_MORE_DOCS, SKIP_INTERVAL, PostingList
+)
+
+
+class TestPostingList:
+    """Test PostingList encoding and cursors."""
+
+    @pytest.fixture
+    def postings(self):
+        """Create a list spanning several skip blocks."""
+        return PostingList.from_pairs([(doc_id, doc_id % 7 + 1) for doc_id in range(0, 3000, 3)])
+
+    def test_round_trip(self, postings):
+        """Test postings decode to what was appended."""
+        assert list(postings) == [(doc_id, doc_id % 7 + 1) for doc_id in range(0, 3000, 3)]
+        assert len(postings) == 1000
+        assert postings.live == 1000
+        assert postings.max_tf == 7
+        assert postings.last_doc == 2997
+
+    def test_compact_encoding(self):
+        """Test small deltas and frequencies take one byte each."""
+        postings = PostingList.from_pairs([(doc_id, 1) for doc_id in range(SKIP_INTERVAL)])
+        assert postings.nbytes == 2 * SKIP_INTERVAL + 3 * 8
+
+        postings.append(1_000_000, 300)
+        assert list(postings)[-1] == (1_000_000, 300)
+
+    def test_append_out_of_order(self, postings):
+        """Test doc ids must increase."""
+        with pytest.raises(ValueError):
+            postings.append(10)
+
+    def test_cursor_advance(self, postings):
+        """Test skipping ahead lands on the first doc id >= target."""
+        cursor = postings.cursor()
+        assert cursor.doc == 0
+        assert cursor.advance(1500) == 1500
+        assert cursor.tf == 1500 % 7 + 1
+        assert cursor.advance(1501) == 1503
+        assert cursor.advance(100) == 1503  # never moves backwards
+        assert cursor.next() == 1506
+        assert cursor.advance(2998) == NO_MORE_DOCS
+        assert cursor.next() == NO_MORE_DOCS
+
+    def test_cursor_skips_dead_docs(self, postings):
+        """Test cursors ignore postings rejected by the liveness check."""
+        cursor = postings.cursor(lambda doc_id: doc_id % 2 == 0)
+        assert cursor.doc == 0
+        assert cursor.next() == 6
+        assert cursor.advance(1501) == 1506
+
+    def test_frequency(self, postings):
+        """Test term frequency lookup."""
+        assert postings.frequency(2997) == 2997 % 7 + 1
+        assert postings.frequency(1000) == 0
+
+    def test_remapped(self, postings):
+        """Test rebuilding drops and renumbers postings."""
+        remapped = postings.remapped(lambda doc_id: doc_id // 3 if doc_id < 30 else None)
+        assert list(remapped) == [(doc_id // 3, doc_id % 7 + 1) for doc_id in range(0, 30, 3)]
+        assert remapped.live == 10
+
+    @pytest.mark.parametrize("head_size", [SKIP_INTERVAL * 2, 100])
+    def test_extend(self, postings, head_size):
+        """Test appending a shifted list on and off a block boundary."""
+        head = PostingList.from_pairs([(doc_id, 2) for doc_id in range(head_size)])
+        head.extend(postings, offset=head_size)
+
+        expected = [(doc_id, 2) for doc_id in range(head_size)]
+        expected += [(doc_id + head_size, tf) for doc_id, tf in postings]
+        assert list(head) == expected
+        assert head.live == len(expected)
+        assert head.max_tf == 7
+        assert head.cursor().advance(head_size + 1500) == head_size + 1500
+
+        with pytest.raises(ValueError):
+            head.extend(postings)
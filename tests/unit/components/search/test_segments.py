@@ -0,0 +1,220 @@
+"""
+Unit tests for the persistent segmented search index.
+"""
+
+import pytest
+
+from src.torematrix.core.models.element import Element, ElementType
+from src.torematrix.core.models.metadata import ElementMetadata
+from src.torematrix.ui.components.search.indexer import SearchIndex
+from src.torematrix.ui.components.search.segments import (
+    MANIFEST_NAME, Segment, SegmentedSearchIndex, write_segment
+)
+
+
+def make_element(element_id, text, element_type=ElementType.NARRATIVE_TEXT, page=None, confidence=None):
+    metadata = None
+    if page is not None or confidence is not None:
+        metadata = ElementMetadata(page_number=page, confidence=confidence if confidence is not None else 1.0)
+    return Element(element_id=element_id, element_type=element_type, text=text, metadata=metadata)
+
+
+TEXTS = {
+    "a": "invoice invoice invoice total",
+    "b": "invoice total due",
+    "c": "payment total",
+    "d": "invoice",
+    "e": "quarterly report summary",
+}
+
+
+class TestSegment:
+    """Test writing and reading a single segment file."""
+
+    @pytest.fixture
+    def segment(self, tmp_path):
+        """Write a segment from an in-memory index."""
+        index = SearchIndex()
+        for element_id, text in TEXTS.items():
+            index.add_element(make_element(element_id, text, page=int(element_id, 16) % 3, confidence=0.75))
+        index.remove_element("c")
+
+        entries, postings = index.doc_snapshot()
+        write_segment(tmp_path / "seg_000001.seg", entries, postings)
+        segment = Segment(tmp_path / "seg_000001.seg")
+        yield segment
+        segment.close()
+
+    def test_documents(self, segment):
+        """Test documents are stored densely with their attributes."""
+        assert segment.doc_count == 4
+        doc_id = segment.find_element("e")
+        entry = segment.entry(doc_id)
+        assert entry.element_id == "e"
+        assert entry.element_type == ElementType.NARRATIVE_TEXT
+        assert entry.page_number == 0xe % 3
+        assert entry.confidence == 0.75
+        assert segment.find_element("c") is None
+
+    def test_postings(self, segment):
+        """Test posting lookup by term."""
+        postings = segment.postings("invoice")
+        assert len(postings) == 3
+        assert sorted(segment.element_id(doc_id) for doc_id, _ in postings) == ["a", "b", "d"]
+        assert postings.frequency(segment.find_element("a")) == 3
+        assert segment.postings("payment") is None
+        assert segment.postings("zzz") is None
+
+    def test_terms_with_prefix(self, segment):
+        """Test sorted term table prefix scan."""
+        assert list(segment.terms_with_prefix("in")) == ["invoice"]
+        assert "total" in set(segment.iter_terms())
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test opening a file that is not a segment."""
+        path = tmp_path / "bogus.seg"
+        path.write_bytes(b"x" * 128)
+        with pytest.raises(ValueError):
+            Segment(path)
+
+
+class TestSegmentedSearchIndex:
+    """Test SegmentedSearchIndex updates, persistence and merging."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create index that merges synchronously."""
+        index = SegmentedSearchIndex(tmp_path, merge_factor=3, background_merge=False)
+        yield index
+        index.close(commit=False)
+
+    def test_search_before_and_after_commit(self, index):
+        """Test buffered and committed elements are both searchable."""
+        for element_id in ("a", "b", "c"):
+            index.add_element(make_element(element_id, TEXTS[element_id]))
+        assert index.search_text("invoice total") == {"a", "b"}
+
+        index.commit()
+        assert index.get_segment_count() == 1
+        index.add_element(make_element("d", TEXTS["d"]))
+        assert index.search_text("invoice") == {"a", "b", "d"}
+        assert index.get_element_count() == 4
+
+    def test_reopen(self, tmp_path):
+        """Test committed state and user data survive reopening."""
+        index = SegmentedSearchIndex(tmp_path, background_merge=False)
+        for element_id, text in TEXTS.items():
+            index.add_element(make_element(element_id, text, page=1))
+        index.commit({'processed_elements': 5})
+        index.add_element(make_element("lost", "uncommitted invoice"))
+        index.close(commit=False)
+
+        reopened = SegmentedSearchIndex(tmp_path, background_merge=False)
+        try:
+            assert reopened.user_data == {'processed_elements': 5}
+            assert reopened.get_element_count() == 5
+            assert reopened.search_text("invoice") == {"a", "b", "d"}
+            assert reopened.search_by_page({1}) == set(TEXTS)
+            assert reopened.search_by_type({ElementType.NARRATIVE_TEXT}) == set(TEXTS)
+        finally:
+            reopened.close()
+
+    def test_updates_and_deletes_tombstone_segments(self, tmp_path):
+        """Test changes to committed elements are recorded as tombstones."""
+        index = SegmentedSearchIndex(tmp_path, background_merge=False)
+        for element_id, text in TEXTS.items():
+            index.add_element(make_element(element_id, text))
+        index.commit()
+
+        assert index.remove_element("a")
+        assert not index.remove_element("missing")
+        index.add_element(make_element("b", "payment received"))
+        assert index.search_text("invoice") == {"d"}
+        assert index.search_text("payment") == {"b", "c"}
+        index.close()
+
+        reopened = SegmentedSearchIndex(tmp_path, background_merge=False)
+        try:
+            assert reopened.get_element_count() == 4
+            assert reopened.search_text("invoice") == {"d"}
+            assert reopened.search_text("payment") == {"b", "c"}
+            assert len(list(tmp_path.glob("*.del"))) == 1
+        finally:
+            reopened.close()
+
+    def test_merge(self, index, tmp_path):
+        """Test segments are merged once there are more than merge_factor."""
+        for round_number in range(4):
+            for element_id, text in TEXTS.items():
+                index.add_element(make_element(f"{element_id}{round_number}", text))
+            index.commit()
+        index.remove_element("a0")
+
+        assert index.get_segment_count() <= 3
+        index.merge()
+        assert index.get_segment_count() == 1
+        assert index.get_element_count() == 19
+        assert len(index.search_text("invoice")) == 11
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["seg_000006.seg", MANIFEST_NAME]
+
+    def test_ranked_matches_single_index(self, index):
+        """Test BM25 over several segments equals scoring one in-memory index."""
+        reference = SearchIndex()
+        for position, (element_id, text) in enumerate(TEXTS.items()):
+            element = make_element(element_id, text)
+            index.add_element(element)
+            reference.add_element(element)
+            if position % 2:
+                index.commit()
+
+        for match_all in (True, False):
+            expected = reference.search_ranked("invoice total", k=3, match_all=match_all)
+            ranked = index.search_ranked("invoice total", k=3, match_all=match_all)
+            assert [hit[0] for hit in ranked.hits] == [hit[0] for hit in expected.hits]
+            assert [hit[1] for hit in ranked.hits] == pytest.approx([hit[1] for hit in expected.hits])
+        assert index.score_element("a", "invoice") == pytest.approx(reference.score_element("a", "invoice"))
+
+    def test_score_element_matches_ranked_after_delete(self, index):
+        """Test single-element scores ignore deleted documents like ranked search."""
+        index.add_element(make_element("e", TEXTS["e"]))
+        index.commit()
+        for element_id in "abcd":
+            index.add_element(make_element(element_id, TEXTS[element_id]))
+        # Deleted buffered postings stay in place until they outnumber live ones
+        index.remove_element("d")
+
+        ranked = dict(index.search_ranked("invoice", k=5).hits)
+        assert index.score_element("a", "invoice") == pytest.approx(ranked["a"])
+
+    def test_term_lookups_across_segments(self, index):
+        """Test prefix, wildcard, fuzzy and suggestion lookups."""
+        index.add_element(make_element("a", TEXTS["a"]))
+        index.commit()
+        index.add_element(make_element("c", TEXTS["c"]))
+
+        assert index.search_prefix("inv") == {"a"}
+        assert index.search_wildcard("*ment") == {"c"}
+        assert index.search_wildcard("to?al") == {"a", "c"}
+        assert index.search_text("invoce", fuzzy=True) == {"a"}
+        assert index.get_suggestions("to") == ["total"]
+
+    def test_bulk_load(self, index):
+        """Test bulk loads become one committed segment replacing older copies."""
+        index.add_element(make_element("a", "stale"))
+        index.commit()
+        index.add_element(make_element("b", "buffered"))
+
+        index.bulk_load([make_element(element_id, text) for element_id, text in TEXTS.items()], workers=1)
+        assert index.get_segment_count() == 2
+        assert index.get_element_count() == 5
+        assert index.search_text("stale") == set()
+        assert index.search_text("buffered") == set()
+        assert index.search_text("invoice") == {"a", "b", "d"}
+
+    def test_clear(self, index, tmp_path):
+        """Test clearing removes every segment."""
+        index.add_element(make_element("a", TEXTS["a"]))
+        index.commit()
+        index.clear()
+        assert index.get_element_count() == 0
+        assert [path.name for path in tmp_path.iterdir()] == [MANIFEST_NAME]
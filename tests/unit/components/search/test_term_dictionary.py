@@ -0,0 +1,101 @@
+"""
+Unit tests for the search term dictionary.
+"""
+
+import pytest
+
+from src.torematrix.ui.components.search.term_dictionary import TermDictionary
+
+
+def levenshtein(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(current[j - 1] + 1, previous[j] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+class TestTermDictionary:
+    """Test TermDictionary lookups."""
+
+    @pytest.fixture
+    def dictionary(self):
+        """Create dictionary with a few related terms."""
+        dictionary = TermDictionary()
+        for term in ["document", "documents", "documentation", "docs", "dock",
+                     "table", "tablet", "cable", "text", "test", "tests", "a"]:
+            dictionary.add(term)
+        return dictionary
+
+    def test_add_and_remove(self, dictionary):
+        """Test membership tracking."""
+        assert len(dictionary) == 12
+        assert not dictionary.add("table")
+        assert "table" in dictionary
+
+        assert dictionary.remove("table")
+        assert not dictionary.remove("table")
+        assert "table" not in dictionary
+        assert "tablet" in dictionary
+        assert dictionary.fuzzy("table", 0) == {}
+        assert dictionary.wildcard("tabl?") == []
+
+    def test_prefix(self, dictionary):
+        """Test prefix lookup returns sorted terms."""
+        assert list(dictionary.prefix("doc")) == [
+            "dock", "docs", "document", "documentation", "documents"
+        ]
+        assert list(dictionary.prefix("doc", limit=2)) == ["dock", "docs"]
+        assert list(dictionary.prefix("xyz")) == []
+
+    def test_wildcard(self, dictionary):
+        """Test wildcard patterns."""
+        assert dictionary.wildcard("te*") == ["test", "tests", "text"]
+        assert dictionary.wildcard("te?t") == ["test", "text"]
+        assert dictionary.wildcard("*able") == ["cable", "table"]
+        assert dictionary.wildcard("doc*ion") == ["documentation"]
+        assert dictionary.wildcard("*ment*") == ["document", "documentation", "documents"]
+        assert dictionary.wildcard("?") == ["a"]
+        assert dictionary.wildcard("text") == ["text"]
+        assert dictionary.wildcard("missing") == []
+
+    def test_fuzzy(self, dictionary):
+        """Test fuzzy lookup reports edit distances."""
+        assert dictionary.fuzzy("documnt", 1) == {"document": 1}
+        assert dictionary.fuzzy("documnt", 2) == {"document": 1, "documents": 2}
+        assert dictionary.fuzzy("tabel", 2) == {"table": 2, "tablet": 2}
+        assert dictionary.fuzzy("text", 0) == {"text": 0}
+
+    def test_fuzzy_matches_brute_force(self):
+        """Test pruned trie walk against a full scan."""
+        words = ["search", "sea", "seat", "starch", "reach", "research", "searches",
+                 "march", "arch", "searching", "each", "beach", "se"]
+        dictionary = TermDictionary()
+        for word in words:
+            dictionary.add(word)
+
+        for query in ["serch", "sear", "arch", "x", "researching"]:
+            for distance in (1, 2, 3):
+                expected = {
+                    word: levenshtein(query, word) for word in words
+                    if levenshtein(query, word) <= distance
+                }
+                assert dictionary.fuzzy(query, distance) == expected
+
+    def test_update(self, dictionary):
+        """Test bulk insertion keeps every lookup structure in sync."""
+        assert dictionary.update(["tablets", "table", "docket"]) == 2
+        assert len(dictionary) == 14
+        assert list(dictionary.prefix("dock")) == ["dock", "docket"]
+        assert dictionary.wildcard("tab*s") == ["tablets"]
+        assert dictionary.fuzzy("tablet", 1) == {"table": 1, "tablet": 0, "tablets": 1}
+
+    def test_clear(self, dictionary):
+        """Test clearing the dictionary."""
+        dictionary.clear()
+        assert len(dictionary) == 0
+        assert list(dictionary.prefix("")) == []
+        assert dictionary.fuzzy("text") == {}
@@ -0,0 +1,136 @@
+import asyncio
+import pytest
+from typing import List
+
+from torematrix.core.events.backpressure import (
+    BoundedEventQueue, OverflowPolicy, QueueConfig
+)
+from torematrix.core.events.event_bus import EventBus
+from torematrix.core.events.event_types import Event, EventPriority
+from torematrix.core.events.monitoring import PerformanceMonitor
+
+def make_event(index: int, priority: EventPriority = EventPriority.NORMAL) -> Event:
+    return Event(event_type="test_event", payload={"index": index}, priority=priority)
+
+async def drain(queue: BoundedEventQueue) -> List[int]:
+    indices = []
+    while queue.qsize():
+        event = await queue.get()
+        indices.append(event.payload["index"])
+    return indices
+
+def test_queue_config_validation():
+    with pytest.raises(ValueError):
+        QueueConfig(max_total_size=-1)
+    config = QueueConfig.bounded(5)
+    assert set(config.max_sizes.values()) == {5}
+
+@pytest.mark.asyncio
+async def test_priority_order():
+    queue = BoundedEventQueue()
+    await queue.put(make_event(1, EventPriority.DEFERRED))
+    await queue.put(make_event(2, EventPriority.NORMAL))
+    await queue.put(make_event(3, EventPriority.IMMEDIATE))
+    await queue.put(make_event(4, EventPriority.NORMAL))
+
+    assert await drain(queue) == [3, 2, 4, 1]
+
+@pytest.mark.asyncio
+async def test_sentinel_is_served_after_events():
+    queue = BoundedEventQueue()
+    await queue.put(make_event(1))
+    await queue.put(None)
+
+    assert (await queue.get()).payload["index"] == 1
+    assert await queue.get() is None
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    monitor = PerformanceMonitor()
+    queue = BoundedEventQueue(QueueConfig.bounded(2, OverflowPolicy.BLOCK), monitor)
+    await queue.put(make_event(1))
+    await queue.put(make_event(2))
+
+    blocked_put = asyncio.create_task(queue.put(make_event(3)))
+    await asyncio.sleep(0.05)
+    assert not blocked_put.done()
+
+    await queue.get()
+    assert await asyncio.wait_for(blocked_put, 1.0) is True
+    assert await drain(queue) == [2, 3]
+    assert monitor.get_queue_metrics("normal")["normal"].blocked_count == 1
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy():
+    monitor = PerformanceMonitor()
+    queue = BoundedEventQueue(QueueConfig.bounded(2, OverflowPolicy.DROP_OLDEST), monitor)
+    for i in range(5):
+        assert await queue.put(make_event(i)) is True
+
+    assert await drain(queue) == [3, 4]
+    assert monitor.get_queue_metrics()["normal"].dropped == 3
+
+@pytest.mark.asyncio
+async def test_drop_low_priority_policy():
+    config = QueueConfig(max_total_size=2, policy=OverflowPolicy.DROP_LOW_PRIORITY)
+    queue = BoundedEventQueue(config)
+    await queue.put(make_event(1, EventPriority.DEFERRED))
+    await queue.put(make_event(2, EventPriority.NORMAL))
+
+    # Evicts the deferred event to make room
+    assert await queue.put(make_event(3, EventPriority.IMMEDIATE)) is True
+    # Nothing lower than deferred to evict, so the new event is rejected
+    assert await queue.put(make_event(4, EventPriority.DEFERRED)) is False
+
+    assert await drain(queue) == [3, 2]
+
+@pytest.mark.asyncio
+async def test_spill_to_disk_preserves_order(tmp_path):
+    monitor = PerformanceMonitor()
+    config = QueueConfig.bounded(3, OverflowPolicy.SPILL_TO_DISK, spill_directory=tmp_path)
+    queue = BoundedEventQueue(config, monitor)
+    for i in range(10):
+        assert await queue.put(make_event(i)) is True
+
+    assert queue.qsize() == 10
+    assert queue.spilled_count() == 7
+    assert list(tmp_path.iterdir())
+
+    assert await drain(queue) == list(range(10))
+    assert monitor.get_queue_metrics()["normal"].spilled == 7
+
+    queue.close()
+    assert not list(tmp_path.iterdir())
+
+@pytest.mark.asyncio
+async def test_queue_lag_metrics():
+    monitor = PerformanceMonitor()
+    queue = BoundedEventQueue(monitor=monitor)
+    await queue.put(make_event(1))
+    await asyncio.sleep(0.05)
+    await queue.get()
+
+    metrics = monitor.get_queue_metrics()["normal"]
+    assert metrics.enqueued == 1
+    assert metrics.dequeued == 1
+    assert metrics.max_lag >= 0.04
+    assert metrics.average_lag == metrics.total_lag
+
+@pytest.mark.asyncio
+async def test_event_bus_with_bounded_queue():
+    received: List[Event] = []
+    bus = EventBus(queue_config=QueueConfig.bounded(2, OverflowPolicy.DROP_OLDEST))
+    bus.subscribe("test_event", received.append)
+
+    # Publish before starting the consumer so the bound is hit
+    for i in range(5):
+        await bus.publish(make_event(i))
+
+    await bus.start()
+    await asyncio.sleep(0.1)
+    await bus.stop()
+
+    assert [e.payload["index"] for e in received] == [3, 4]
+    metrics = bus.get_metrics()
+    assert metrics["queues"]["normal"].dropped == 3
+    assert metrics["total"]["total_events"] == 5
@@ -0,0 +1,184 @@
+import asyncio
+import pytest
+import pytest_asyncio
+from typing import List
+
+from torematrix.core.events.batching import BatchConfig, default_coalesce_key
+from torematrix.core.events.event_bus import EventBus
+from torematrix.core.events.event_types import Event, ProcessingEvent
+from torematrix.core.events.middleware import BaseMiddleware, LoggingMiddleware
+
+@pytest_asyncio.fixture
+async def event_bus():
+    bus = EventBus()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+def test_batch_config_validation():
+    with pytest.raises(ValueError):
+        BatchConfig(max_batch_size=0)
+    with pytest.raises(ValueError):
+        BatchConfig(max_wait_time=-1)
+
+def test_default_coalesce_key():
+    event = ProcessingEvent(event_type="progress_updated", payload={}, file_id="f1")
+    assert default_coalesce_key(event) == ("progress_updated", "f1")
+
+    event = Event(event_type="selection", payload={"element_id": "e1"})
+    assert default_coalesce_key(event) == ("selection", "e1")
+
+    event = Event(event_type="viewport", payload={})
+    assert default_coalesce_key(event) == ("viewport", None)
+
+@pytest.mark.asyncio
+async def test_size_windowed_batches(event_bus: EventBus):
+    batches: List[List[Event]] = []
+
+    def batch_handler(events: List[Event]):
+        batches.append(events)
+
+    event_bus.subscribe_batch(
+        "test_event", batch_handler, BatchConfig(max_batch_size=3, max_wait_time=10)
+    )
+
+    for i in range(6):
+        await event_bus.publish(Event(event_type="test_event", payload={"index": i}))
+
+    await asyncio.sleep(0.1)
+    assert [len(batch) for batch in batches] == [3, 3]
+    assert [e.payload["index"] for e in batches[1]] == [3, 4, 5]
+
+@pytest.mark.asyncio
+async def test_time_windowed_batches(event_bus: EventBus):
+    batches: List[List[Event]] = []
+
+    async def batch_handler(events: List[Event]):
+        batches.append(events)
+
+    event_bus.subscribe_batch(
+        "test_event", batch_handler, BatchConfig(max_batch_size=100, max_wait_time=0.05)
+    )
+
+    await event_bus.publish(Event(event_type="test_event", payload={}))
+    await event_bus.publish(Event(event_type="test_event", payload={}))
+
+    await asyncio.sleep(0.01)
+    assert batches == []
+
+    await asyncio.sleep(0.15)
+    assert len(batches) == 1
+    assert len(batches[0]) == 2
+
+@pytest.mark.asyncio
+async def test_latest_value_coalescing(event_bus: EventBus):
+    batches: List[List[Event]] = []
+
+    def batch_handler(events: List[Event]):
+        batches.append(events)
+
+    event_bus.subscribe_batch(
+        "progress_updated", batch_handler, BatchConfig(max_wait_time=0.05, coalesce=True)
+    )
+
+    for progress in (0.1, 0.5, 0.9):
+        for file_id in ("a", "b"):
+            await event_bus.publish(ProcessingEvent(
+                event_type="progress_updated", payload={}, file_id=file_id, progress=progress
+            ))
+
+    await asyncio.sleep(0.2)
+    assert len(batches) == 1
+    assert [(e.file_id, e.progress) for e in batches[0]] == [("a", 0.9), ("b", 0.9)]
+
+    metrics = event_bus.get_metrics()["batches"]["progress_updated"][0]
+    assert metrics.events_received == 6
+    assert metrics.events_coalesced == 4
+    assert metrics.events_delivered == 2
+
+@pytest.mark.asyncio
+async def test_batch_and_single_subscribers_coexist(event_bus: EventBus):
+    singles: List[Event] = []
+    batches: List[List[Event]] = []
+
+    event_bus.subscribe("test_event", singles.append)
+    event_bus.subscribe_batch("test_event", batches.append, BatchConfig(max_batch_size=2))
+
+    await event_bus.publish(Event(event_type="test_event", payload={}))
+    await event_bus.publish(Event(event_type="test_event", payload={}))
+
+    await asyncio.sleep(0.1)
+    assert len(singles) == 2
+    assert len(batches) == 1
+
+@pytest.mark.asyncio
+async def test_unsubscribe_batch(event_bus: EventBus):
+    batches: List[List[Event]] = []
+
+    event_bus.subscribe_batch("test_event", batches.append, BatchConfig(max_batch_size=1))
+    event_bus.unsubscribe_batch("test_event", batches.append)
+
+    await event_bus.publish(Event(event_type="test_event", payload={}))
+
+    await asyncio.sleep(0.1)
+    assert batches == []
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_batches():
+    batches: List[List[Event]] = []
+
+    bus = EventBus()
+    await bus.start()
+    bus.subscribe_batch("test_event", batches.append, BatchConfig(max_wait_time=60))
+    await bus.publish(Event(event_type="test_event", payload={}))
+    await asyncio.sleep(0.05)
+    assert batches == []
+
+    await bus.stop()
+    assert len(batches) == 1
+
+@pytest.mark.asyncio
+async def test_publish_many_runs_middleware_once_per_batch(event_bus: EventBus):
+    received: List[Event] = []
+
+    class CountingMiddleware(BaseMiddleware):
+        def __init__(self):
+            self.batch_calls = 0
+
+        async def process(self, event: Event) -> Event:
+            return event
+
+        async def process_batch(self, events: List[Event]) -> List[Event]:
+            self.batch_calls += 1
+            return [e for e in events if e.payload.get("keep")]
+
+    middleware = CountingMiddleware()
+    event_bus.add_middleware(middleware)
+    event_bus.add_middleware(LoggingMiddleware())
+    event_bus.subscribe("test_event", received.append)
+
+    await event_bus.publish_many([
+        Event(event_type="test_event", payload={"keep": i % 2 == 0}) for i in range(10)
+    ])
+
+    await asyncio.sleep(0.1)
+    assert middleware.batch_calls == 1
+    assert len(received) == 5
+    assert event_bus.get_metrics()["total"]["total_events"] == 10
+
+@pytest.mark.asyncio
+async def test_publish_many_with_plain_middleware(event_bus: EventBus):
+    received: List[Event] = []
+
+    async def drop_odd(event: Event):
+        return event if event.payload["index"] % 2 == 0 else None
+
+    event_bus.add_middleware(drop_odd)
+    event_bus.subscribe("test_event", received.append)
+
+    await event_bus.publish_many([
+        Event(event_type="test_event", payload={"index": i}) for i in range(4)
+    ])
+
+    await asyncio.sleep(0.1)
+    assert [e.payload["index"] for e in received] == [0, 2]
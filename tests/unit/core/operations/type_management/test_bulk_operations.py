@@ -18,7 +18,7 @@ from typing import Dict, List, Any
 
 from torematrix.core.operations.type_management.bulk_operations import (
     BulkTypeOperationEngine, BulkOperationOptions, BulkOperationResult,
-    BulkChangePreview, ElementChange, OperationStatus, ConflictResolution
+    BulkChangePreview, ElementChange, TypeChangeSet, OperationStatus, ConflictResolution
 )
 from torematrix.core.operations.type_management.conversions import (
     TypeConversionEngine, ConversionResult, ConversionAnalysis
@@ -544,6 +544,185 @@ class TestThreadSafety:
         assert all(results.values())
 
 
+class InMemoryBulkEngine(BulkTypeOperationEngine):
+    """Bulk engine backed by an in-memory type map, counting bulk updates"""
+    
+    def __init__(self, element_types: Dict[str, str], **kwargs):
+        super().__init__(**kwargs)
+        self.element_types = element_types
+        self.bulk_updates = []
+        self.validated_conversions = []
+    
+    def _get_element_types(self, element_ids):
+        return {element_id: self.element_types[element_id] for element_id in element_ids}
+    
+    def _is_conversion_valid(self, from_type, to_type):
+        self.validated_conversions.append((from_type, to_type))
+        return from_type != 'image'
+    
+    def _perform_bulk_type_change(self, element_ids, from_type, to_type, options):
+        self.bulk_updates.append((from_type, to_type, len(element_ids)))
+        for element_id in element_ids:
+            self.element_types[element_id] = to_type
+        return True
+
+
+class TestSetBasedExecution:
+    """Test grouped, set-based bulk type changes"""
+    
+    @pytest.fixture
+    def registry(self):
+        registry = Mock(spec=TypeRegistry)
+        registry.has_type.return_value = True
+        return registry
+    
+    @pytest.fixture
+    def element_types(self):
+        types = {f'text_{i}': 'text' for i in range(250)}
+        types.update({f'title_{i}': 'title' for i in range(50)})
+        types.update({f'image_{i}': 'image' for i in range(10)})
+        types.update({f'list_{i}': 'list' for i in range(5)})
+        return types
+    
+    @pytest.fixture
+    def engine(self, registry, element_types):
+        return InMemoryBulkEngine(element_types, registry=registry,
+                                  validator=Mock(spec=TypeValidationEngine), max_workers=2)
+    
+    def test_groups_by_conversion(self, engine, element_types):
+        """Each conversion is validated once and applied in bulk per batch"""
+        result = engine.bulk_change_types(
+            list(element_types), 'list',
+            BulkOperationOptions(batch_size=100, validate_before=False)
+        )
+        
+        assert result.status == OperationStatus.PARTIAL
+        assert sorted(engine.validated_conversions) == [
+            ('image', 'list'), ('text', 'list'), ('title', 'list')
+        ]
+        assert sorted(engine.bulk_updates) == [
+            ('text', 'list', 50), ('text', 'list', 100), ('text', 'list', 100),
+            ('title', 'list', 50)
+        ]
+        assert result.successful_changes == 300
+        assert result.failed_changes == 10
+        assert result.skipped_elements == 5
+        assert result.processed_elements == result.total_elements
+        assert len(result.errors) == 1
+    
+    def test_compact_change_log(self, engine, element_types):
+        """Changes are recorded per group and expand to element changes on demand"""
+        element_ids = [f'text_{i}' for i in range(250)]
+        result = engine.bulk_change_types(element_ids, 'title',
+                                          BulkOperationOptions(batch_size=1000))
+        
+        assert result.changes == []
+        assert len(result.change_sets) == 1
+        change_set = result.change_sets[0]
+        assert isinstance(change_set, TypeChangeSet)
+        assert (change_set.old_type, change_set.new_type) == ('text', 'title')
+        
+        changes = list(result.iter_changes())
+        assert [c.element_id for c in changes] == element_ids
+        assert all(c.old_type == 'text' and c.new_type == 'title' for c in changes)
+    
+    def test_rollback_change_sets(self, engine, element_types):
+        """Rollback reverts each change set with a single bulk update"""
+        result = engine.bulk_change_types(
+            [f'text_{i}' for i in range(250)], 'title', BulkOperationOptions(batch_size=100)
+        )
+        engine.bulk_updates.clear()
+        
+        engine._rollback_change_sets(result.change_sets)
+        
+        assert all(element_types[f'text_{i}'] == 'text' for i in range(250))
+        assert sorted(engine.bulk_updates) == [
+            ('title', 'text', 50), ('title', 'text', 100), ('title', 'text', 100)
+        ]
+    
+    def test_per_element_path_still_available(self, registry):
+        """set_based=False keeps the per-element execution path"""
+        engine = BulkTypeOperationEngine(registry=registry,
+                                         validator=Mock(spec=TypeValidationEngine))
+        result = engine.bulk_change_types(
+            ['elem1', 'elem2'], 'title', BulkOperationOptions(set_based=False)
+        )
+        
+        assert result.status == OperationStatus.COMPLETED
+        assert len(result.changes) == 2
+        assert result.change_sets == []
+    
+    def test_submit_runs_in_background(self, engine):
+        """Submitted operations complete on the background executor"""
+        operation_id, future = engine.submit_bulk_change_types(
+            [f'text_{i}' for i in range(10)], 'title'
+        )
+        
+        result = future.result(timeout=5)
+        assert result.operation_id == operation_id
+        assert result.status == OperationStatus.COMPLETED
+        assert result.successful_changes == 10
+        engine.shutdown()
+    
+    def test_cancel_background_operation(self, engine):
+        """Cancelling stops remaining batches from being applied"""
+        started = threading.Event()
+        release = threading.Event()
+        perform = engine._perform_bulk_type_change
+        
+        def slow_bulk_change(*args):
+            started.set()
+            release.wait(timeout=5)
+            return perform(*args)
+        
+        engine._perform_bulk_type_change = slow_bulk_change
+        operation_id, future = engine.submit_bulk_change_types(
+            [f'text_{i}' for i in range(250)], 'title',
+            BulkOperationOptions(batch_size=10, max_workers=1)
+        )
+        
+        assert started.wait(timeout=5)
+        assert engine.cancel_operation(operation_id)
+        release.set()
+        
+        result = future.result(timeout=5)
+        assert result.status == OperationStatus.CANCELLED
+        assert len(engine.bulk_updates) < 25
+        engine.shutdown()
+    
+    def test_cancel_records_applied_batches(self, engine, element_types):
+        """Batches applied while cancelling are counted and can be rolled back"""
+        started = threading.Event()
+        release = threading.Event()
+        perform = engine._perform_bulk_type_change
+        
+        def slow_bulk_change(*args):
+            started.set()
+            release.wait(timeout=5)
+            return perform(*args)
+        
+        engine._perform_bulk_type_change = slow_bulk_change
+        operation_id, future = engine.submit_bulk_change_types(
+            [f'text_{i}' for i in range(250)], 'title',
+            BulkOperationOptions(batch_size=10, max_workers=2)
+        )
+        
+        assert started.wait(timeout=5)
+        assert engine.cancel_operation(operation_id)
+        release.set()
+        
+        result = future.result(timeout=5)
+        applied = sum(count for _, _, count in engine.bulk_updates)
+        assert result.status == OperationStatus.CANCELLED
+        assert applied > 0
+        assert result.successful_changes == applied
+        assert sum(len(change_set) for change_set in result.change_sets) == applied
+        
+        engine._rollback_change_sets(result.change_sets)
+        assert all(element_types[f'text_{i}'] == 'text' for i in range(250))
+        engine.shutdown()
+
+
 class TestPerformance:
     """Performance tests for bulk operations"""
     
@@ -0,0 +1,165 @@
+"""Tests for content relationship algorithms."""
+
+import random
+from collections import Counter
+
+import pytest
+from unittest.mock import Mock
+
+from src.torematrix.core.processing.metadata.algorithms.content import ContentAnalyzer, _cosine
+from src.torematrix.core.processing.metadata.models.relationship import RelationshipType
+from src.torematrix.core.models.element import Element as UnifiedElement
+from src.torematrix.core.models.metadata import ElementMetadata
+from src.torematrix.core.models.coordinates import Coordinates
+
+
+@pytest.fixture
+def content_config():
+    """Create test content configuration."""
+    config = Mock()
+    config.content_similarity_threshold = 0.5
+    config.content_use_idf = False
+    return config
+
+
+def make_element(element_id: str, element_type: str, text: str) -> UnifiedElement:
+    """Create an element with the given text."""
+    return UnifiedElement(
+        id=element_id,
+        type=element_type,
+        text=text,
+        metadata=ElementMetadata(
+            coordinates=Coordinates(layout_bbox=[0, 0, 100, 20]),
+            confidence=0.9,
+            page_number=1
+        )
+    )
+
+
+def random_elements(seed: int, count: int):
+    """Create elements with overlapping vocabulary."""
+    rng = random.Random(seed)
+    words = "matrix vector tensor graph node edge kernel layer weight model".split()
+    elements = []
+    for index in range(count):
+        text = " ".join(rng.choice(words[:rng.randint(3, len(words))]) for _ in range(rng.randint(0, 10)))
+        if rng.random() < 0.2:
+            text += " see figure 2"
+        elements.append(make_element(f"elem_{index}", rng.choice(["Text", "Text", "Figure", "Table"]), text))
+    return elements
+
+
+def cosine(analyzer: ContentAnalyzer, text1: str, text2: str) -> float:
+    """Cosine similarity of two texts computed pair by pair."""
+    return _cosine(Counter(analyzer._tokenize_text(text1)), Counter(analyzer._tokenize_text(text2)))
+
+
+def summarize(relationships):
+    return [
+        (r.source_id, r.target_id, r.relationship_type, round(r.confidence, 12))
+        for r in relationships
+    ]
+
+
+class TestContentAnalyzer:
+    """Test cases for ContentAnalyzer."""
+    
+    def test_cosine_similarity(self, content_config):
+        """Test term frequency cosine similarity."""
+        analyzer = ContentAnalyzer(content_config)
+        
+        assert cosine(analyzer, "matrix vector", "matrix vector") == pytest.approx(1.0)
+        assert cosine(analyzer, "matrix matrix vector", "matrix tensor") == \
+            pytest.approx(2 / (5 ** 0.5 * 2 ** 0.5))
+        assert cosine(analyzer, "matrix", "tensor") == 0.0
+        assert cosine(analyzer, "the and", "matrix") == 0.0
+    
+    def test_prepare_profiles_once(self, content_config):
+        """Test that prepare() profiles every element with text."""
+        analyzer = ContentAnalyzer(content_config)
+        elements = [
+            make_element("elem_1", "Text", "matrix vector matrix"),
+            make_element("elem_2", "Figure", ""),
+            make_element("elem_3", "Text", "matrix vector")
+        ]
+        
+        profiles = analyzer.prepare(elements)
+        
+        assert profiles[1] is None
+        assert profiles[0].term_counts == {"matrix": 2, "vector": 1}
+        assert analyzer._get_profile(elements[0], "matrix vector matrix") is profiles[0]
+        assert (0, 1) in analyzer._similarities
+        
+        analyzer.release()
+        assert analyzer._profiles == {}
+        assert analyzer._similarities == {}
+    
+    @pytest.mark.asyncio
+    async def test_unprepared_analysis_is_not_cached(self, content_config):
+        """Test that pairs analyzed without prepare() leave no profiles behind."""
+        analyzer = ContentAnalyzer(content_config)
+        elements = random_elements(0, 10)
+        
+        for element1, element2 in zip(elements, elements[1:]):
+            await analyzer.analyze_relationship(element1, element2)
+        
+        assert analyzer._profiles == {}
+    
+    @pytest.mark.asyncio
+    async def test_prepared_similarity(self, content_config):
+        """Test that prepared similarities match pairwise computation."""
+        analyzer = ContentAnalyzer(content_config)
+        elements = [
+            make_element("elem_1", "Text", "matrix vector tensor"),
+            make_element("elem_2", "Text", "matrix vector graph")
+        ]
+        analyzer.prepare(elements)
+        
+        relationships = await analyzer.analyze_relationship(*elements)
+        similar = [r for r in relationships if r.relationship_type == RelationshipType.CONTENT_SIMILAR]
+        
+        assert len(similar) == 1
+        assert similar[0].confidence == cosine(analyzer, elements[0].text, elements[1].text)
+        assert similar[0].metadata["common_words"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_candidate_pairs_match_all_pairs(self, content_config):
+        """Test that skipped pairs would not have produced relationships."""
+        for seed in range(5):
+            elements = random_elements(seed, 25)
+            
+            expected = []
+            reference = ContentAnalyzer(content_config)
+            for i, element1 in enumerate(elements):
+                for element2 in elements[i + 1:]:
+                    expected.extend(summarize(await reference.analyze_relationship(element1, element2)))
+            
+            analyzer = ContentAnalyzer(content_config)
+            found = []
+            for i, j in analyzer.candidate_pairs(elements):
+                found.extend(summarize(await analyzer.analyze_relationship(elements[i], elements[j])))
+            
+            assert found == expected
+    
+    def test_candidate_pairs_small_documents(self, content_config):
+        """Test documents with fewer than two text elements."""
+        analyzer = ContentAnalyzer(content_config)
+        
+        assert analyzer.candidate_pairs([]) == []
+        assert analyzer.candidate_pairs([make_element("elem_1", "Text", "matrix")]) == []
+    
+    def test_idf_weighting(self, content_config):
+        """Test that shared common terms count less with IDF weighting."""
+        content_config.content_use_idf = True
+        content_config.content_similarity_threshold = 0.0
+        analyzer = ContentAnalyzer(content_config)
+        elements = [
+            make_element("elem_1", "Text", "matrix kernel"),
+            make_element("elem_2", "Text", "matrix layer"),
+            make_element("elem_3", "Text", "matrix kernel weight")
+        ]
+        
+        analyzer.prepare(elements)
+        
+        assert analyzer._similarities[(0, 2)] > analyzer._similarities[(0, 1)]
+        assert analyzer._similarities[(0, 1)] < 0.5
@@ -0,0 +1,175 @@
+"""Tests for reading order extraction."""
+
+import math
+import random
+
+import pytest
+
+from src.torematrix.core.processing.metadata.extractors.reading_order import (
+    ColumnDetector, PageBoxes, PageLayout, ReadingDirection, ReadingOrderConfig, ReadingOrderExtractor
+)
+from src.torematrix.core.models.element import Element as UnifiedElement
+from src.torematrix.core.models.metadata import ElementMetadata
+from src.torematrix.core.models.coordinates import Coordinates
+
+
+def make_element(element_id: str, bbox=None, element_type: str = "Text") -> UnifiedElement:
+    """Create an element with an optional layout bbox."""
+    return UnifiedElement(
+        id=element_id,
+        type=element_type,
+        text=element_id,
+        metadata=ElementMetadata(
+            coordinates=Coordinates(layout_bbox=list(bbox)) if bbox else None,
+            confidence=0.9,
+            page_number=1
+        )
+    )
+
+
+def reference_order(elements, direction):
+    """Order elements with plain sorted(), as a reference for the array path."""
+    keys = {
+        ReadingDirection.LEFT_TO_RIGHT: lambda b: (b[1], b[0]),
+        ReadingDirection.RIGHT_TO_LEFT: lambda b: (b[1], -b[2]),
+        ReadingDirection.TOP_TO_BOTTOM: lambda b: (b[0], b[1]),
+        ReadingDirection.BOTTOM_TO_TOP: lambda b: (b[0], -b[3]),
+    }
+    with_bbox = [e for e in elements if e.metadata.coordinates]
+    ordered = sorted(with_bbox, key=lambda e: keys[direction](e.metadata.coordinates.layout_bbox))
+    return ordered + [e for e in elements if not e.metadata.coordinates]
+
+
+@pytest.fixture
+def extractor():
+    """Create a reading order extractor with default configuration."""
+    return ReadingOrderExtractor(ReadingOrderConfig())
+
+
+class TestPageBoxes:
+    """Test cases for PageBoxes."""
+    
+    def test_from_elements(self):
+        """Test that missing or short bboxes are marked invalid."""
+        elements = [
+            make_element("elem_1", [10, 20, 110, 40]),
+            make_element("elem_2"),
+            UnifiedElement(id="elem_3", type="Text", text="", metadata=ElementMetadata(
+                coordinates=Coordinates(layout_bbox=[1, 2]), confidence=0.9, page_number=1
+            ))
+        ]
+        
+        boxes = PageBoxes.from_elements(elements)
+        
+        assert len(boxes) == 3
+        assert boxes.ids == ["elem_1", "elem_2", "elem_3"]
+        assert boxes.valid.tolist() == [True, False, False]
+        assert (boxes.left[0], boxes.top[0], boxes.right[0], boxes.bottom[0]) == (10, 20, 110, 40)
+        assert math.isnan(boxes.left[1])
+
+
+class TestColumnDetector:
+    """Test cases for ColumnDetector."""
+    
+    def test_cluster_coordinates(self):
+        """Test gap-based clustering of left edges."""
+        detector = ColumnDetector(ReadingOrderConfig(column_gap_threshold=20.0))
+        
+        assert detector._cluster_coordinates([]) == []
+        assert detector._cluster_coordinates([36, 36, 40, 300, 310]) == [38, 305]
+        assert detector._cluster_coordinates([50.0]) == [50.0]
+    
+    def test_two_columns(self):
+        """Test detection of a two column layout."""
+        detector = ColumnDetector(ReadingOrderConfig())
+        elements = [
+            make_element("left_1", [36, 0, 290, 20]),
+            make_element("right_1", [320, 0, 580, 20]),
+            make_element("left_2", [38, 30, 290, 50]),
+            make_element("figure", [36, 60, 580, 200], element_type="Figure"),
+            make_element("right_2", [320, 30, 580, 50])
+        ]
+        
+        columns = detector.detect_columns(elements)
+        
+        assert [column.elements for column in columns] == [["left_1", "left_2"], ["right_1", "right_2"]]
+        assert (columns[0].left, columns[0].right) == (36, 290)
+        assert columns[1].confidence == detector._calculate_column_confidence(
+            [detector._get_bounding_box(elements[1]), detector._get_bounding_box(elements[4])]
+        )
+    
+    def test_narrow_columns_skipped(self):
+        """Test that columns below the minimum width are dropped."""
+        detector = ColumnDetector(ReadingOrderConfig(min_column_width=50.0))
+        
+        assert detector.detect_columns([make_element("elem_1", [36, 0, 60, 20])]) == []
+
+
+class TestReadingOrderExtractor:
+    """Test cases for ReadingOrderExtractor."""
+    
+    @pytest.mark.asyncio
+    async def test_columns_read_in_sequence(self, extractor):
+        """Test that a column is read completely before the next one."""
+        elements = [
+            make_element("right_2", [320, 30, 580, 50]),
+            make_element("left_2", [36, 30, 290, 50]),
+            make_element("right_1", [320, 0, 580, 20]),
+            make_element("left_1", [36, 0, 290, 20])
+        ]
+        
+        order = await extractor.extract_reading_order(elements, PageLayout(width=612, height=792))
+        
+        assert order.ordered_elements == ["left_1", "left_2", "right_1", "right_2"]
+        assert order.metadata["num_columns"] == 2
+        assert order.metadata["validation"]["column_score"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_single_column_keeps_elements_without_coordinates(self, extractor):
+        """Test that elements without coordinates are ordered last."""
+        elements = [
+            make_element("no_bbox"),
+            make_element("second", [36, 40, 60, 50]),
+            make_element("first", [36, 10, 60, 20])
+        ]
+        
+        order = await extractor.extract_reading_order(elements, PageLayout(width=612, height=792))
+        
+        assert order.columns == []
+        assert order.ordered_elements == ["first", "second", "no_bbox"]
+        assert order.metadata["validation"]["is_valid"]
+    
+    @pytest.mark.parametrize("direction", list(ReadingDirection))
+    def test_order_within_column_matches_sort(self, extractor, direction):
+        """Test the lexsort ordering against sorted() with tuple keys."""
+        rng = random.Random(7)
+        elements = []
+        for index in range(60):
+            if rng.random() < 0.1:
+                elements.append(make_element(f"elem_{index}"))
+                continue
+            left, top = rng.choice([36, 40, 300]), rng.randint(0, 20) * 10
+            elements.append(make_element(f"elem_{index}", [left, top, left + rng.randint(1, 3) * 50, top + 8]))
+        
+        ordered = extractor.order_within_column(elements, direction)
+        
+        assert [e.id for e in ordered] == [e.id for e in reference_order(elements, direction)]
+    
+    def test_order_within_column_without_coordinates(self, extractor):
+        """Test that elements are returned unchanged when none has coordinates."""
+        elements = [make_element("elem_1"), make_element("elem_2")]
+        
+        assert extractor.order_within_column(elements, ReadingDirection.LEFT_TO_RIGHT) is elements
+        assert extractor.order_within_column([], ReadingDirection.LEFT_TO_RIGHT) == []
+    
+    def test_spatial_consistency(self, extractor):
+        """Test counting of backwards jumps between consecutive elements."""
+        elements = [
+            make_element("elem_1", [300, 300, 400, 320]),
+            make_element("elem_2", [36, 10, 100, 20]),
+            make_element("elem_3", [36, 30, 100, 40]),
+            make_element("elem_4")
+        ]
+        
+        assert extractor._check_spatial_consistency(elements) == 0.5
+        assert extractor._check_spatial_consistency(elements[:1]) == 1.0
@@ -0,0 +1,202 @@
+"""Tests for the array-backed relationship graph."""
+
+import random
+
+import pytest
+
+from src.torematrix.core.processing.metadata.compact_graph import CompactRelationshipGraph
+from src.torematrix.core.processing.metadata.graph import ElementRelationshipGraph
+from src.torematrix.core.processing.metadata.models.relationship import (
+    Relationship,
+    RelationshipType
+)
+from src.torematrix.core.models.element import Element as UnifiedElement
+from src.torematrix.core.models.metadata import ElementMetadata
+from src.torematrix.core.models.coordinates import Coordinates
+
+
+def make_element(index: int) -> UnifiedElement:
+    """Create a text element."""
+    return UnifiedElement(
+        id=f"elem_{index}",
+        type="Text",
+        text=f"Element {index}",
+        metadata=ElementMetadata(
+            coordinates=Coordinates(layout_bbox=[0, index * 20, 100, index * 20 + 15]),
+            confidence=0.9,
+            page_number=1
+        )
+    )
+
+
+def make_relationship(source: int, target: int, relationship_type=RelationshipType.READING_ORDER) -> Relationship:
+    return Relationship(
+        source_id=f"elem_{source}",
+        target_id=f"elem_{target}",
+        relationship_type=relationship_type,
+        confidence=0.8,
+        metadata={"order_index": source}
+    )
+
+
+def build_pair(element_count: int, edges):
+    """Build the same graph with both backends."""
+    reference = ElementRelationshipGraph()
+    compact = CompactRelationshipGraph()
+    for index in range(element_count):
+        element = make_element(index)
+        reference.add_element(element)
+        compact.add_element(element)
+    
+    for source, target, relationship_type in edges:
+        relationship = make_relationship(source, target, relationship_type)
+        reference.add_relationship(relationship.source_id, relationship.target_id, relationship)
+        compact.add_relationship(relationship.source_id, relationship.target_id, relationship)
+    return reference, compact
+
+
+@pytest.fixture
+def chain():
+    """Two components: a reading-order chain 0-1-2-3 plus a 4-5 spatial edge; 6 is isolated."""
+    return build_pair(7, [
+        (0, 1, RelationshipType.READING_ORDER),
+        (1, 2, RelationshipType.READING_ORDER),
+        (2, 3, RelationshipType.READING_ORDER),
+        (4, 5, RelationshipType.SPATIAL_ADJACENT)
+    ])
+
+
+def ids(relationships):
+    return sorted(relationship.id for relationship in relationships)
+
+
+class TestCompactRelationshipGraph:
+    """Test cases for CompactRelationshipGraph."""
+    
+    def test_add_relationship_requires_elements(self):
+        graph = CompactRelationshipGraph()
+        graph.add_element(make_element(0))
+        
+        with pytest.raises(ValueError):
+            graph.add_relationship("elem_0", "elem_9", make_relationship(0, 9))
+    
+    def test_relationship_round_trip(self, chain):
+        reference, compact = chain
+        
+        original = reference.get_outgoing_relationships("elem_0")[0]
+        restored = compact.get_outgoing_relationships("elem_0")[0]
+        assert restored == original
+    
+    def test_relationship_queries_match_reference(self, chain):
+        reference, compact = chain
+        
+        for element_id in reference.element_index:
+            for relationship_type in (None, RelationshipType.READING_ORDER, RelationshipType.SPATIAL_ADJACENT):
+                assert ids(compact.get_relationships(element_id, relationship_type)) == \
+                    ids(reference.get_relationships(element_id, relationship_type))
+                assert ids(compact.get_outgoing_relationships(element_id, relationship_type)) == \
+                    ids(reference.get_outgoing_relationships(element_id, relationship_type))
+                assert ids(compact.get_incoming_relationships(element_id, relationship_type)) == \
+                    ids(reference.get_incoming_relationships(element_id, relationship_type))
+                assert sorted(compact.get_neighbors(element_id, relationship_type)) == \
+                    sorted(reference.get_neighbors(element_id, relationship_type))
+    
+    def test_unknown_element(self, chain):
+        _, compact = chain
+        
+        assert compact.get_relationships("missing") == []
+        assert compact.get_neighbors("missing") == []
+        assert compact.find_path("missing", "elem_0") is None
+    
+    def test_find_path(self, chain):
+        _, compact = chain
+        
+        assert compact.find_path("elem_0", "elem_3") == ["elem_0", "elem_1", "elem_2", "elem_3"]
+        # Paths ignore edge direction
+        assert compact.find_path("elem_3", "elem_1") == ["elem_3", "elem_2", "elem_1"]
+        assert compact.find_path("elem_0", "elem_3", max_length=2) is None
+        assert compact.find_path("elem_0", "elem_5") is None
+        assert compact.find_path("elem_2", "elem_2") == ["elem_2"]
+    
+    def test_connected_components(self, chain):
+        _, compact = chain
+        
+        components = sorted(compact.get_connected_components(), key=len, reverse=True)
+        assert components == [
+            {"elem_0", "elem_1", "elem_2", "elem_3"},
+            {"elem_4", "elem_5"},
+            {"elem_6"}
+        ]
+    
+    def test_statistics_match_reference(self, chain):
+        reference, compact = chain
+        
+        assert compact.get_statistics() == reference.get_statistics()
+    
+    def test_cycle_is_not_dag(self):
+        _, compact = build_pair(3, [
+            (0, 1, RelationshipType.READING_ORDER),
+            (1, 2, RelationshipType.READING_ORDER),
+            (2, 0, RelationshipType.READING_ORDER)
+        ])
+        
+        assert compact.get_statistics()["is_dag"] is False
+    
+    def test_subgraph_and_filter(self, chain):
+        reference, compact = chain
+        
+        subgraph = compact.get_subgraph(["elem_1", "elem_2", "elem_3", "elem_5"])
+        assert isinstance(subgraph, CompactRelationshipGraph)
+        assert len(subgraph) == 4
+        assert ids(subgraph.iter_relationships()) == \
+            ids(reference.get_subgraph(["elem_1", "elem_2", "elem_3", "elem_5"]).iter_relationships())
+        
+        filtered = compact.filter_by_relationship_type(RelationshipType.SPATIAL_ADJACENT)
+        assert len(filtered) == 7
+        assert [r.source_id for r in filtered.iter_relationships()] == ["elem_4"]
+    
+    def test_compatibility_views(self, chain):
+        reference, compact = chain
+        
+        assert compact.graph.number_of_edges() == reference.graph.number_of_edges()
+        assert {k: ids(v) for k, v in compact.relationship_index.items()} == \
+            {k: ids(v) for k, v in reference.relationship_index.items()}
+    
+    def test_conversion_and_serialization(self, chain):
+        reference, compact = chain
+        
+        converted = CompactRelationshipGraph.from_graph(reference)
+        assert ids(converted.iter_relationships()) == ids(reference.iter_relationships())
+        
+        restored = CompactRelationshipGraph.from_dict(compact.to_dict())
+        assert len(restored) == len(compact)
+        assert ids(restored.iter_relationships()) == ids(compact.iter_relationships())
+    
+    def test_random_graphs_match_reference(self):
+        rng = random.Random(7)
+        types = [RelationshipType.READING_ORDER, RelationshipType.SPATIAL_ADJACENT]
+        
+        for _ in range(10):
+            count = rng.randint(2, 30)
+            edges = [
+                (rng.randrange(count), rng.randrange(count), rng.choice(types))
+                for _ in range(rng.randint(0, 45))
+            ]
+            reference, compact = build_pair(count, edges)
+            
+            assert sorted(map(sorted, compact.get_connected_components())) == \
+                sorted(map(sorted, reference.get_connected_components()))
+            assert compact.get_statistics()["is_dag"] == reference.get_statistics()["is_dag"]
+            for target in range(count):
+                expected = reference.find_path("elem_0", f"elem_{target}")
+                path = compact.find_path("elem_0", f"elem_{target}")
+                assert (path is None) == (expected is None)
+                if path:
+                    assert len(path) == len(expected)
+    
+    def test_clear(self, chain):
+        _, compact = chain
+        
+        compact.clear()
+        assert len(compact) == 0
+        assert compact.get_statistics()["num_relationships"] == 0
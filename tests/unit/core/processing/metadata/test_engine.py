@@ -444,4 +444,160 @@ class TestMetadataExtractionEngine:
         
         # Verify that not all extractions ran simultaneously
         # (with max_workers=2, we shouldn't have more than 2 concurrent)
-        assert len(extraction_times) == 4
\ No newline at end of file
+        assert len(extraction_times) == 4
+
+
+def make_paged_document(page_count: int, width: float = 612.0):
+    """Create a picklable document with simple pages."""
+    from types import SimpleNamespace
+    
+    return SimpleNamespace(
+        document_id="paged_doc",
+        pages=[SimpleNamespace(width=width + i, height=792.0, elements=[]) for i in range(page_count)],
+        elements=[],
+        metadata={"title": "Paged Document"}
+    )
+
+
+class TestPageShardedExtraction:
+    """Test suite for page-sharded extraction."""
+    
+    def make_engine(self, **config):
+        engine = MetadataExtractionEngine(MetadataConfig(cache_enabled=False, **config))
+        engine.register_extractor("page", PageMetadataExtractor(ExtractorConfig()))
+        engine.register_extractor("document", DocumentMetadataExtractor(ExtractorConfig()))
+        return engine
+    
+    @pytest.mark.asyncio
+    async def test_extracts_every_page(self):
+        """Test that page-scoped extractors run once per page."""
+        engine = self.make_engine(page_workers=0)
+        
+        result = await engine.extract_metadata(make_paged_document(3))
+        
+        assert [page.page_number for page in result.page_metadata] == [1, 2, 3]
+        assert [page.width for page in result.page_metadata] == [612.0, 613.0, 614.0]
+        assert result.document_metadata is not None
+    
+    @pytest.mark.asyncio
+    async def test_worker_processes_match_event_loop(self):
+        """Test that shards extracted in worker processes give the same pages."""
+        in_loop = self.make_engine(page_workers=0)
+        pooled = self.make_engine(page_workers=2, page_shard_min_pages=2)
+        
+        try:
+            expected = await in_loop.extract_metadata(make_paged_document(4))
+            result = await pooled.extract_metadata(make_paged_document(4))
+        finally:
+            pooled.close()
+        
+        assert pooled._page_executor is None
+        assert [(p.page_number, p.width) for p in result.page_metadata] == \
+            [(p.page_number, p.width) for p in expected.page_metadata]
+        
+        # Statistics recorded in the workers are merged back
+        stats = pooled.extractors.get_extractor("page").get_extraction_statistics()
+        assert stats["total_extractions"] == 4
+        assert stats["successful_extractions"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_worker_processes_are_opt_in(self):
+        """Test that the default configuration never starts worker processes."""
+        engine = self.make_engine()
+        
+        with patch("src.torematrix.core.processing.metadata.engine.ProcessPoolExecutor") as pool, \
+                patch("src.torematrix.core.processing.metadata.engine.os.cpu_count", return_value=4):
+            result = await engine.extract_metadata(make_paged_document(10))
+        
+        assert len(result.page_metadata) == 10
+        assert not pool.called
+    
+    @pytest.mark.asyncio
+    async def test_unavailable_process_pool_keeps_config(self):
+        """Test that a failing process pool falls back without changing the config."""
+        engine = self.make_engine(page_workers=2, page_shard_min_pages=1)
+        
+        with patch("src.torematrix.core.processing.metadata.engine.ProcessPoolExecutor",
+                   side_effect=OSError("no processes")) as pool:
+            await engine.extract_metadata(make_paged_document(2))
+            result = await engine.extract_metadata(make_paged_document(2, width=700.0))
+        
+        assert [page.page_number for page in result.page_metadata] == [1, 2]
+        assert engine.config.page_workers == 2
+        assert pool.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_unpicklable_pages_fall_back_to_event_loop(self):
+        """Test that pages that cannot be sent to workers are extracted in place."""
+        engine = self.make_engine(page_workers=2, page_shard_min_pages=1)
+        document = make_paged_document(2)
+        for page in document.pages:
+            page.callback = lambda: None
+        
+        try:
+            result = await engine.extract_metadata(document)
+        finally:
+            engine.close()
+        
+        assert [page.page_number for page in result.page_metadata] == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_cross_page_extractors_run_after_shards(self):
+        """Test that document-level extractors run as the reduce step."""
+        engine = self.make_engine(page_workers=0)
+        calls = []
+        
+        page_extractor = engine.extractors.get_extractor("page")
+        document_extractor = engine.extractors.get_extractor("document")
+        extract_page = page_extractor.extract_page_with_validation
+        extract_document = document_extractor.extract_with_validation
+        
+        async def record_page(page, page_number, context):
+            calls.append(f"page {page_number}")
+            return await extract_page(page, page_number, context)
+        
+        async def record_document(document, context):
+            calls.append("document")
+            return await extract_document(document, context)
+        
+        page_extractor.extract_page_with_validation = record_page
+        document_extractor.extract_with_validation = record_document
+        
+        await engine.extract_metadata(make_paged_document(2))
+        
+        assert calls == ["page 1", "page 2", "document"]
+    
+    @pytest.mark.asyncio
+    async def test_incremental_reruns_changed_pages(self):
+        """Test that incremental extraction only re-extracts changed pages."""
+        engine = self.make_engine(page_workers=0)
+        previous = await engine.extract_metadata(make_paged_document(3))
+        
+        page_extractor = engine.extractors.get_extractor("page")
+        extracted_pages = []
+        extract_page = page_extractor.extract_page_with_validation
+        
+        async def record_page(page, page_number, context):
+            extracted_pages.append(page_number)
+            return await extract_page(page, page_number, context)
+        
+        page_extractor.extract_page_with_validation = record_page
+        
+        result = await engine.extract_incremental(
+            make_paged_document(3, width=700.0),
+            previous,
+            changes={"pages": [2]}
+        )
+        
+        assert extracted_pages == [2]
+        assert [(p.page_number, p.width) for p in result.page_metadata] == \
+            [(1, 612.0), (2, 701.0), (3, 614.0)]
+    
+    def test_changed_pages(self):
+        """Test parsing of changed page numbers."""
+        engine = MetadataExtractionEngine(MetadataConfig())
+        
+        assert engine._changed_pages({"pages": [1, 3]}) == {1, 3}
+        assert engine._changed_pages({"pages": ["modified"]}) is None
+        assert engine._changed_pages({"elements": ["e1"]}) is None
+        assert engine._changed_pages(None) is None
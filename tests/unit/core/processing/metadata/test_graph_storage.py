@@ -0,0 +1,179 @@
+"""Tests for incremental relationship graph storage."""
+
+import sqlite3
+
+import pytest
+
+from src.torematrix.core.processing.metadata.graph import ElementRelationshipGraph
+from src.torematrix.core.processing.metadata.models.relationship import (
+    Relationship,
+    RelationshipType
+)
+from src.torematrix.core.processing.metadata.storage.graph_storage import (
+    GraphStorage,
+    RelationshipQuery
+)
+from src.torematrix.core.models.element import Element as UnifiedElement
+from src.torematrix.core.models.metadata import ElementMetadata
+from src.torematrix.core.models.coordinates import Coordinates
+
+
+def make_element(index: int, page: int, text: str = None) -> UnifiedElement:
+    """Create a text element on a page."""
+    return UnifiedElement(
+        id=f"elem_{index}",
+        type="Text",
+        text=text or f"Element {index}",
+        metadata=ElementMetadata(
+            coordinates=Coordinates(layout_bbox=[0, index * 20, 100, index * 20 + 15]),
+            confidence=0.9,
+            page_number=page
+        )
+    )
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Create storage without snapshot files so loads hit the database."""
+    return GraphStorage(tmp_path, write_snapshots=False)
+
+
+@pytest.fixture
+def graph():
+    """Create a reading order chain of six elements over three pages."""
+    graph = ElementRelationshipGraph()
+    for index in range(6):
+        graph.add_element(make_element(index, page=index // 2 + 1))
+    
+    for index in range(5):
+        relationship = Relationship(
+            source_id=f"elem_{index}",
+            target_id=f"elem_{index + 1}",
+            relationship_type=RelationshipType.READING_ORDER,
+            confidence=0.5 + index / 10
+        )
+        graph.add_relationship(relationship.source_id, relationship.target_id, relationship)
+    
+    return graph
+
+
+class TestGraphStorage:
+    """Test cases for GraphStorage."""
+    
+    @pytest.mark.asyncio
+    async def test_save_writes_only_changes(self, storage, graph):
+        """Test repeated saves only write the difference."""
+        result = await storage.save_graph("doc", graph)
+        assert (result.elements_written, result.relationships_written) == (6, 5)
+        
+        assert (await storage.save_graph("doc", graph)).unchanged
+        
+        # Change one element and drop one relationship
+        graph.clear()
+        for index in range(6):
+            graph.add_element(make_element(index, page=index // 2 + 1, text="Changed" if index == 0 else None))
+        
+        result = await storage.save_graph("doc", graph)
+        assert result.elements_written == 1
+        assert result.relationships_deleted == 5
+        assert storage.get_statistics("doc")['relationships'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_load_from_database(self, storage, graph):
+        """Test the full graph is reconstructed from the database."""
+        await storage.save_graph("doc", graph)
+        
+        loaded = await storage.load_graph("doc")
+        assert len(loaded) == 6
+        assert loaded.graph.number_of_edges() == 5
+        assert loaded.get_element("elem_3").text == "Element 3"
+        
+        assert await storage.load_graph("missing") is None
+    
+    @pytest.mark.asyncio
+    async def test_load_pages(self, storage, graph):
+        """Test page-scoped loads reconstruct only the requested subgraph."""
+        await storage.save_graph("doc", graph)
+        
+        page = await storage.load_graph("doc", pages=[2])
+        assert set(page.element_index) == {"elem_2", "elem_3"}
+        assert page.graph.number_of_edges() == 1
+        
+        boundary = await storage.load_subgraph("doc", pages=[2], include_boundary=True)
+        assert set(boundary.element_index) == {"elem_1", "elem_2", "elem_3", "elem_4"}
+        assert boundary.graph.number_of_edges() == 3
+        
+        selected = await storage.load_subgraph("doc", element_ids=["elem_0", "elem_5"])
+        assert len(selected) == 2
+        assert selected.graph.number_of_edges() == 0
+    
+    @pytest.mark.asyncio
+    async def test_query_relationships(self, storage, graph):
+        """Test filtered, ordered and paged relationship queries."""
+        await storage.save_graph("doc", graph)
+        
+        results = storage.query_relationships(RelationshipQuery(limit=2, offset=1), document_id="doc")
+        assert [r.source_id for r in results] == ["elem_3", "elem_2"]
+        
+        results = storage.query_relationships(RelationshipQuery(source_id="elem_1"))
+        assert [r.target_id for r in results] == ["elem_2"]
+        
+        results = storage.query_relationships(RelationshipQuery(min_confidence=0.75, offset=1))
+        assert len(results) == 1
+    
+    @pytest.mark.asyncio
+    async def test_update_relationships(self, storage, graph):
+        """Test updated relationships are stored and snapshots dropped."""
+        storage.write_snapshots = True
+        await storage.save_graph("doc", graph)
+        assert any(storage.graphs_path.iterdir())
+        
+        relationship = Relationship(
+            source_id="elem_0",
+            target_id="elem_5",
+            relationship_type=RelationshipType.CONTENT_RELATED,
+            confidence=0.95
+        )
+        await storage.update_relationships("doc", [relationship])
+        
+        assert not any(storage.graphs_path.iterdir())
+        loaded = await storage.load_graph("doc")
+        assert loaded.graph.number_of_edges() == 6
+    
+    @pytest.mark.asyncio
+    async def test_disabled_snapshots_are_dropped(self, storage, graph):
+        """Test saving without snapshots removes stale ones so loads see the database."""
+        storage.write_snapshots = True
+        await storage.save_graph("doc", graph)
+        assert any(storage.graphs_path.iterdir())
+        
+        storage.write_snapshots = False
+        graph.add_element(make_element(6, page=4))
+        await storage.save_graph("doc", graph)
+        
+        assert not any(storage.graphs_path.iterdir())
+        assert len(await storage.load_graph("doc")) == 7
+    
+    @pytest.mark.asyncio
+    async def test_missing_created_at_is_stable(self, storage, graph):
+        """Test relationships without a creation time are not rewritten on every save."""
+        for relationship in graph.iter_relationships():
+            relationship.created_at = None
+        
+        await storage.save_graph("doc", graph)
+        assert (await storage.save_graph("doc", graph)).unchanged
+        
+        loaded = await storage.load_graph("doc")
+        assert (await storage.save_graph("doc", loaded)).unchanged
+    
+    def test_database_setup(self, storage):
+        """Test WAL mode and the covering index used by relationship queries."""
+        with sqlite3.connect(storage.db_path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM relationships "
+                "WHERE source_id = ? AND relationship_type = ? ORDER BY confidence DESC",
+                ("elem_1", "reading_order")
+            ).fetchall()
+        
+        assert "COVERING INDEX idx_rel_source_cover" in " ".join(row[-1] for row in plan)
@@ -183,6 +183,8 @@ class TestRelationshipDetectionEngine:
         # Should find caption relationship
         caption_rels = [r for r in relationships if r.relationship_type == RelationshipType.CAPTION_TARGET]
         assert len(caption_rels) > 0
+        # Document profiles are dropped once the pairs are analyzed
+        assert engine.content_analyzer._profiles == {}
     
     @pytest.mark.asyncio
     async def test_detect_hierarchical_relationships(self, relationship_config, sample_elements):
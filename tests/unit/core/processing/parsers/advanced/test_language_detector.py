@@ -0,0 +1,124 @@
+"""Tests for language detection."""
+
+import pytest
+from unittest.mock import patch
+
+from torematrix.core.processing.parsers.advanced.language_detector import (
+    DocumentLanguageProfile, LanguageDetector
+)
+
+
+ENGLISH = [
+    "The quarterly report shows that revenue from the new product line has grown with the market.",
+    "This section describes the method that they used for the analysis of customer accounts.",
+    "The results of the survey have been summarised for the board and they are not final.",
+]
+SPANISH = "El informe trimestral muestra que los ingresos de la nueva línea de productos han crecido con el mercado."
+CHINESE = "这是一个关于公司年度报告的摘要，我们的收入在这个季度有了很大的增长。"
+
+
+@pytest.fixture
+def detector():
+    """Create a language detector with a small prior sample."""
+    return LanguageDetector({'prior_sample_size': 8})
+
+
+@pytest.fixture
+def document():
+    """Create the texts of a mostly English document."""
+    texts = [ENGLISH[i % len(ENGLISH)] for i in range(60)]
+    texts[10] = SPANISH
+    texts[20] = CHINESE
+    texts[30] = ""
+    return texts
+
+
+class TestLanguageDetector:
+    """Test single text detection."""
+    
+    def test_detect_language(self, detector):
+        """Test detection of English and Chinese text."""
+        assert detector.detect_language(ENGLISH[0]).primary_language == 'en'
+        
+        result = detector.detect_language(CHINESE)
+        assert result.primary_language == 'zh'
+        assert result.script_type == 'chinese'
+    
+    def test_detect_empty_text(self, detector):
+        """Test that empty text is unknown."""
+        result = detector.detect_language("  ")
+        
+        assert result.primary_language == 'unknown'
+        assert result.detection_method == 'none'
+
+
+class TestBatchDetection:
+    """Test document level batch detection."""
+    
+    def test_document_profile(self, detector, document):
+        """Test that the dominant language and script come from the sample."""
+        profile = detector.detect_document_languages(document)
+        
+        assert profile.primary_language == 'en'
+        assert profile.script_type == 'latin'
+        assert list(profile.languages) == ['en']
+        assert 0 < profile.confidences['en'] <= 1
+        assert profile.sample_size == 8
+    
+    def test_no_profile_without_long_texts(self, detector):
+        """Test that short texts alone give no profile."""
+        assert detector.detect_document_languages(["Table 3", "", "Appendix"]) is None
+    
+    def test_detect_many_uses_prior(self, detector, document):
+        """Test that agreeing texts skip full detection."""
+        with patch.object(detector, 'detect_language', wraps=detector.detect_language) as full_detection:
+            results = detector.detect_many(document)
+        
+        assert len(results) == len(document)
+        assert [r.primary_language for i, r in enumerate(results) if i not in (10, 20, 30)] == ['en'] * 57
+        assert sum(r.detection_method == 'document_prior' for r in results) == 57
+        # Sample plus the texts that disagree with the profile
+        assert full_detection.call_count == 8 + 3
+    
+    def test_detect_many_full_detection_on_disagreement(self, detector, document):
+        """Test that other scripts, other stopwords and empty texts get full detection."""
+        results = detector.detect_many(document)
+        
+        assert results[10].primary_language == 'es'
+        assert results[20].primary_language == 'zh'
+        assert results[30].primary_language == 'unknown'
+        assert all(results[i].detection_method != 'document_prior' for i in (10, 20, 30))
+    
+    def test_detect_many_with_profile(self, detector):
+        """Test that a given profile is used without sampling."""
+        profile = DocumentLanguageProfile(
+            primary_language='en', languages={'en': 0.7, 'es': 0.3},
+            confidences={'en': 0.9, 'es': 0.8}, script_type='latin', sample_size=10
+        )
+        
+        results = detector.detect_many(["Payment schedule", SPANISH], profile)
+        
+        assert [r.primary_language for r in results] == ['en', 'es']
+        assert [r.confidence for r in results] == [0.9, 0.8]
+        assert results[0].all_languages == {'en': 0.7, 'es': 0.3}
+        assert results[0].text_statistics['word_count'] == 2
+    
+    def test_short_text_cache(self, detector):
+        """Test that repeated short texts are detected once."""
+        texts = ["Tabla de resultados"] * 5 + ENGLISH * 3
+        
+        with patch.object(detector, 'detect_language', wraps=detector.detect_language) as full_detection:
+            results = detector.detect_many(texts)
+        
+        assert len({id(r) for r in results[:5]}) == 1
+        assert full_detection.call_args_list.count(((texts[0],),)) == 1
+        assert detector.get_cache_stats()['hits'] >= 4
+    
+    def test_cache_eviction(self):
+        """Test that the cache keeps the most recently used texts."""
+        detector = LanguageDetector({'cache_size': 2})
+        
+        for text in ("Table one", "Table two", "Table one", "Table three"):
+            detector._detect_cached(text)
+        
+        assert list(detector._cache) == ["Table one", "Table three"]
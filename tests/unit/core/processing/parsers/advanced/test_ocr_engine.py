@@ -7,7 +7,7 @@ from PIL import Image
 import io
 
 from torematrix.core.processing.parsers.advanced.ocr_engine import (
-    OCREngine, OCRResult, OCRConfiguration
+    OCREngine, OCRResult, OCRConfiguration, _tesseract_text
 )
 
 
@@ -144,18 +144,18 @@ class TestOCREngine:
         # Should be resized
         assert processed_image.width >= 600 or processed_image.height >= 600
     
-    @pytest.mark.skipif(True, reason="Requires tesseract installation")
     @pytest.mark.asyncio
-    async def test_extract_with_tesseract(self, ocr_engine, sample_image):
-        """Test OCR extraction with Tesseract (requires installation)."""
-        if 'tesseract' not in ocr_engine.available_engines:
-            pytest.skip("Tesseract not available")
+    async def test_extract_with_tesseract(self, ocr_config, sample_image):
+        """Test Tesseract extraction uses a single image_to_data pass."""
+        engine = OCREngine({**ocr_config, 'max_workers': 1})  # mocks can't cross processes
         
-        # Mock pytesseract functions
-        with patch('torematrix.core.processing.parsers.advanced.ocr_engine.pytesseract') as mock_tess:
-            mock_tess.image_to_string.return_value = "Sample text"
+        module = 'torematrix.core.processing.parsers.advanced.ocr_engine'
+        with patch(f'{module}.pytesseract', create=True) as mock_tess, \
+                patch(f'{module}.TESSERACT_AVAILABLE', True):
             mock_tess.image_to_data.return_value = {
-                'conf': [85, 90, 80],
+                'text': ['Sample', 'text', ''],
+                'line_num': [1, 1, 0],
+                'conf': [85, '90.5', -1],
                 'left': [10, 50, 90],
                 'top': [10, 10, 10],
                 'width': [30, 35, 40],
@@ -163,13 +163,61 @@ class TestOCREngine:
             }
             mock_tess.Output.DICT = 'dict'
             
-            result = await ocr_engine._extract_with_tesseract(sample_image)
+            result = await engine._extract_with_tesseract(sample_image)
             
             assert isinstance(result, OCRResult)
             assert result.text == "Sample text"
-            assert result.confidence > 0
-            assert len(result.word_confidences) == 3
-            assert len(result.bounding_boxes) == 3
+            assert result.confidence == pytest.approx(0.8775)
+            assert len(result.word_confidences) == 2
+            assert len(result.bounding_boxes) == 2
+            mock_tess.image_to_data.assert_called_once()
+            mock_tess.image_to_string.assert_not_called()
+    
+    def test_tesseract_text_layout(self):
+        """Test page text is rebuilt from words, lines and paragraphs."""
+        data = {
+            'text': ['', 'Hello', 'world', 'again', '', 'Next', 'block'],
+            'page_num': [1, 1, 1, 1, 1, 1, 1],
+            'block_num': [1, 1, 1, 1, 2, 2, 2],
+            'par_num': [1, 1, 1, 1, 1, 1, 1],
+            'line_num': [0, 1, 1, 2, 0, 1, 1],
+        }
+        assert _tesseract_text(data) == "Hello world\nagain\n\nNext block"
+    
+    @pytest.mark.asyncio
+    async def test_page_cache(self, ocr_engine, sample_image):
+        """Test identical pages are OCRed once and served from the cache."""
+        result = OCRResult("Cached text", 0.9, "en", [0.9], [(0, 0, 10, 10)])
+        with patch.object(ocr_engine, '_extract_with_engine', return_value=result) as mock_extract:
+            ocr_engine.available_engines = ['tesseract']
+            
+            first = await ocr_engine.extract_text(sample_image)
+            second = await ocr_engine.extract_text(sample_image.copy())
+            other = await ocr_engine.extract_text(Image.new('RGB', (200, 100), color='black'))
+            
+            assert first.text == second.text == other.text == "Cached text"
+            assert mock_extract.call_count == 2
+            assert ocr_engine.get_cache_stats()['hits'] == 1
+            
+            ocr_engine.clear_cache()
+            await ocr_engine.extract_text(sample_image)
+            assert mock_extract.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_extract_text_many(self, ocr_engine):
+        """Test batch extraction keeps page order and deduplicates pages."""
+        pages = [Image.new('RGB', (200, 100), color=color) for color in ('white', 'black', 'white')]
+        
+        async def fake_extract(image, engine):
+            await asyncio.sleep(0.01)
+            return OCRResult(f"page {image.getpixel((0, 0))}", 0.9, "en", [0.9], [])
+        
+        with patch.object(ocr_engine, '_extract_with_engine', side_effect=fake_extract) as mock_extract:
+            ocr_engine.available_engines = ['tesseract']
+            results = await ocr_engine.extract_text_many(pages)
+        
+        assert [r.text for r in results] == ["page 255", "page 0", "page 255"]
+        assert mock_extract.call_count == 2
     
     @pytest.mark.asyncio
     async def test_extract_text_no_engines(self, ocr_config):
@@ -234,6 +282,61 @@ class TestOCREngine:
                 assert 'confidence' in results['tesseract']
                 assert 'success' in results['tesseract']
 
+    
+    @pytest.mark.asyncio
+    async def test_extract_text_layout(self, ocr_config):
+        """Test layout mode OCRs scaled region crops and maps boxes back."""
+        from PIL import ImageDraw
+        
+        engine = OCREngine({**ocr_config, 'target_line_height': 20})
+        engine.region_detector.padding = 0
+        engine.available_engines = ['tesseract']
+        
+        page = Image.new('L', (600, 400), color=255)
+        draw = ImageDraw.Draw(page)
+        for top in (20, 36, 52):  # 10px lines
+            draw.rectangle((20, top, 219, top + 9), fill=0)
+        draw.rectangle((400, 20, 549, 39), fill=0)  # one 20px line
+        
+        crops = []
+        
+        async def fake_extract(image, engine_name):
+            crops.append(image.size)
+            return OCRResult(f"text {len(crops)}", 0.9, "en", [0.9], [(0, 0, 40, 20)])
+        
+        with patch.object(engine, '_extract_with_engine', side_effect=fake_extract):
+            result = await engine.extract_text_layout(page)
+            
+            assert sorted(crops) == [(150, 20), (400, 84)]  # first block scaled 2x
+            assert result.regions == [(20, 20, 220, 62), (400, 20, 550, 40)]
+            assert result.text.count("text") == 2
+            assert (20, 20, 40, 30) in result.bounding_boxes
+            assert (400, 20, 440, 40) in result.bounding_boxes
+            
+            # Only the requested area, minus text that is already known
+            crops.clear()
+            result = await engine.extract_text_layout(
+                page, regions=[(0, 0, 300, 400)], text_layer_boxes=[(0, 0, 600, 40)]
+            )
+            assert result.regions == [(20, 40, 220, 62)]
+            assert len(crops) == 1
+            
+            # Blank areas are not OCRed at all
+            crops.clear()
+            result = await engine.extract_text_layout(page, regions=[(0, 200, 600, 400)])
+            assert result.text == "" and crops == []
+    
+    @pytest.mark.asyncio
+    async def test_layout_analysis_config(self, ocr_config, sample_image):
+        """Test extract_text routes through layout mode when configured."""
+        engine = OCREngine({**ocr_config, 'layout_analysis': True})
+        with patch.object(engine, '_extract_layout') as mock_layout:
+            mock_layout.return_value = OCRResult("layout", 0.9, "en", [0.9], [])
+            result = await engine.extract_text(sample_image)
+        
+        assert result.text == "layout"
+        mock_layout.assert_called_once()
+
 
 class TestOCRResult:
     """Test OCR result data structure."""
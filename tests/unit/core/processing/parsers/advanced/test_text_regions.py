@@ -0,0 +1,82 @@
+"""Tests for text region detection."""
+
+import random
+
+import pytest
+from PIL import Image, ImageDraw
+
+from torematrix.core.processing.parsers.advanced.text_regions import (
+    TextRegionDetector, contrast_range, speckle_ratio
+)
+
+
+def draw_block(draw, x, y, lines=3, line_height=10, line_gap=6, width=200):
+    """Draw a paragraph-like block of solid text lines."""
+    for i in range(lines):
+        top = y + i * (line_height + line_gap)
+        draw.rectangle((x, top, x + width - 1, top + line_height - 1), fill=0)
+
+
+@pytest.fixture
+def page():
+    """Create a page with two paragraphs and a sidebar column."""
+    image = Image.new('L', (600, 400), color=255)
+    draw = ImageDraw.Draw(image)
+    draw_block(draw, 20, 20)
+    draw_block(draw, 20, 150, lines=2)
+    draw_block(draw, 400, 20, lines=5, line_height=20, width=150)
+    return image
+
+
+class TestTextRegionDetector:
+    """Test projection profile segmentation."""
+    
+    def test_detect_blocks(self, page):
+        """Test blocks are found in reading order with their line heights."""
+        regions = TextRegionDetector(padding=0).detect(page)
+        
+        assert [region.bbox for region in regions] == [
+            (20, 20, 220, 62), (20, 150, 220, 176), (400, 20, 550, 144)
+        ]
+        assert regions[0].line_height == 10
+        assert regions[2].line_height == 20
+        assert all(region.ink_ratio > 0.5 for region in regions)
+    
+    def test_downscaled_detection(self, page):
+        """Test boxes are mapped back when detection runs on a smaller copy."""
+        regions = TextRegionDetector(working_width=300, row_gap=6, column_gap=10, padding=0).detect(page)
+        
+        assert len(regions) == 3
+        x0, y0, x1, y1 = regions[0].bbox
+        assert abs(x0 - 20) <= 2 and abs(x1 - 220) <= 2
+    
+    def test_exclude_and_blank(self, page):
+        """Test excluded areas and blank pages yield no regions."""
+        detector = TextRegionDetector()
+        
+        regions = detector.detect(page, exclude=[(0, 0, 300, 400)])
+        assert len(regions) == 1
+        assert regions[0].bbox[0] >= 390
+        
+        blank = Image.new('L', (300, 300), color=255)
+        assert detector.detect(blank) == []
+
+
+class TestImageStatistics:
+    """Test the cheap statistics used to adapt preprocessing."""
+    
+    def test_contrast_range(self, page):
+        """Test washed out images have a small contrast range."""
+        assert contrast_range(page) == 255
+        assert contrast_range(Image.new('L', (50, 50), color=128)) == 0
+    
+    def test_speckle_ratio(self, page):
+        """Test isolated noise pixels are told apart from text strokes."""
+        assert speckle_ratio(page) == 0.0
+        
+        noisy = Image.new('L', (400, 300), color=255)
+        draw_block(ImageDraw.Draw(noisy), 20, 20)
+        rng = random.Random(1)
+        for _ in range(1000):
+            noisy.putpixel((rng.randrange(0, 400), rng.randrange(100, 300)), 0)
+        assert speckle_ratio(noisy) > 0.05
@@ -2,17 +2,47 @@
 
 import pytest
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import Mock, AsyncMock, patch
 
 from src.torematrix.core.processing.parsers.integration.manager import (
     ParserManager, ParseRequest, ParseResponse
 )
-from src.torematrix.core.processing.parsers.base import ParserResult, ParserMetadata
+from src.torematrix.core.processing.parsers.base import BaseParser, ParserResult, ParserMetadata
+from src.torematrix.core.processing.parsers.types import ElementType, ParserCapabilities
 from src.torematrix.core.processing.parsers.code import CodeParser
 from src.torematrix.core.processing.parsers.table import TableParser
 from src.torematrix.core.processing.parsers.image import ImageParser
 
 
+class SleepParser(BaseParser):
+    """Parser that waits for the number of seconds in the element text."""
+    
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.max_running = 0
+    
+    @property
+    def capabilities(self) -> ParserCapabilities:
+        return ParserCapabilities(supported_types=[ElementType.IMAGE])
+    
+    def can_parse(self, element) -> bool:
+        return element.type == "Image"
+    
+    async def parse(self, element, hints=None) -> ParserResult:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(float(element.text))
+        finally:
+            self.running -= 1
+        return self._create_success_result({"delay": float(element.text)})
+    
+    def validate(self, result: ParserResult) -> list:
+        return []
+
+
 class TestParserManager:
     """Test parser manager functionality."""
     
@@ -215,6 +245,126 @@ class TestParserManager:
         # Should have been processed in batches
         assert len(parse_times) == 10
     
+    @pytest.mark.asyncio
+    async def test_batch_groups_elements_by_parser(self):
+        """Test batch parsing calls parse_many once per parser and shares repeated work."""
+        table_parser = TableParser()
+        table = "Name,Age\nJohn,25\nJane,30"
+        elements = [
+            SimpleNamespace(type="Table", text=table, metadata={}),
+            self.create_mock_element("CodeBlock", "def func1(): pass"),
+            SimpleNamespace(type="Table", text="A|B\n1|2", metadata={}),
+            SimpleNamespace(type="Table", text=table, metadata={})
+        ]
+        code_parser = Mock()
+        code_parser.__class__.__name__ = "CodeParser"
+        code_parser.parse_with_monitoring = AsyncMock(return_value=self.create_mock_parser_result())
+        
+        def get_parser_side_effect(element, hints=None):
+            return table_parser if element.type == "Table" else code_parser
+        
+        with patch.object(self.manager.factory, 'get_parser', side_effect=get_parser_side_effect):
+            with patch.object(table_parser, 'parse_many', wraps=table_parser.parse_many) as parse_many:
+                with patch.object(table_parser, 'parse', wraps=table_parser.parse) as parse:
+                    responses = await self.manager.parse_batch(elements)
+        
+        assert [response.parser_used for response in responses] == [
+            "TableParser", "CodeParser", "TableParser", "TableParser"
+        ]
+        assert all(response.success for response in responses)
+        parse_many.assert_called_once()
+        assert len(parse_many.call_args.args[0]) == 3
+        assert parse.call_count == 2  # Repeated table parsed once
+        assert responses[0].result is not responses[3].result
+        assert responses[0].result.data["table_data"] == responses[3].result.data["table_data"]
+        assert responses[2].result.data["table_data"] == [["A", "B"], ["1", "2"]]
+        
+        stats = self.manager.get_statistics()
+        assert stats['total_requests'] == 4
+        assert stats['parser_usage'] == {"TableParser": 3, "CodeParser": 1}
+        assert stats['parser_throughput']["TableParser"]['batches'] == 1
+        assert stats['parser_throughput']["TableParser"]['elements'] == 3
+        assert stats['parser_throughput']["TableParser"]['elements_per_second'] > 0
+        
+        performance = await self.manager.monitor.get_parser_performance("TableParser")
+        assert performance['total_requests'] == 3
+        assert performance['throughput']['batches'] == 1
+        assert performance['throughput']['avg_batch_size'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_batch_uses_single_cache_query(self):
+        """Test batch parsing looks up and stores cache entries in batches."""
+        elements = [
+            self.create_mock_element("CodeBlock", "def cached(): pass"),
+            self.create_mock_element("CodeBlock", "def fresh(): pass")
+        ]
+        cached_result = self.create_mock_parser_result()
+        
+        with patch.object(self.manager.factory, 'get_parser') as mock_get_parser:
+            mock_parser = Mock()
+            mock_parser.__class__.__name__ = "CodeParser"
+            mock_parser.parse_with_monitoring = AsyncMock(return_value=self.create_mock_parser_result())
+            mock_get_parser.return_value = mock_parser
+            
+            with patch.object(self.manager.cache, 'get', side_effect=AssertionError("per-element lookup")):
+                with patch.object(self.manager.cache, 'get_many', AsyncMock(return_value=[cached_result, None])) as get_many:
+                    responses = await self.manager.parse_batch(elements)
+        
+        get_many.assert_awaited_once()
+        assert responses[0].cache_hit and responses[0].result is cached_result
+        assert not responses[1].cache_hit
+        assert mock_get_parser.call_count == 1
+        
+        # The freshly parsed result was stored and is served on the next batch
+        cached = await self.manager.cache.get_many(elements)
+        assert cached[0] is None
+        assert cached[1] is responses[1].result
+        assert self.manager._stats['cache_hits'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_isolates_element_errors(self):
+        """Test one failing element does not fail the rest of its batch."""
+        elements = [
+            self.create_mock_element("CodeBlock", f"def func{i}(): pass")
+            for i in range(3)
+        ]
+        
+        async def parse_side_effect(element, hints=None):
+            if element is elements[1]:
+                raise ValueError("Parser error")
+            return self.create_mock_parser_result()
+        
+        with patch.object(self.manager.factory, 'get_parser') as mock_get_parser:
+            mock_parser = Mock()
+            mock_parser.__class__.__name__ = "CodeParser"
+            mock_parser.parse_with_monitoring = AsyncMock(side_effect=parse_side_effect)
+            mock_get_parser.return_value = mock_parser
+            
+            with patch.object(self.manager.fallback, 'handle_error', AsyncMock(return_value=None)):
+                responses = await self.manager.parse_batch(elements)
+        
+        assert [response.success for response in responses] == [True, False, True]
+        assert "Parser error" in responses[1].error
+        assert self.manager._stats['errors'] == 1
+        assert self.manager._stats['successful_parses'] == 2
+    
+    @pytest.mark.asyncio
+    async def test_batch_parses_concurrently_with_per_element_timeouts(self):
+        """Test default parse_many runs elements concurrently and times out each on its own."""
+        parser = SleepParser()
+        elements = [SimpleNamespace(type="Image", text=str(delay), metadata={}) for delay in (0.05, 0.05, 5.0, 0.05)]
+        
+        with patch.object(self.manager.factory, 'get_parser', return_value=parser):
+            start = asyncio.get_running_loop().time()
+            responses = await self.manager.parse_batch(elements, timeout=0.3)
+            elapsed = asyncio.get_running_loop().time() - start
+        
+        assert [response.success for response in responses] == [True, True, False, True]
+        assert "timeout" in responses[2].error.lower()
+        assert responses[0].result.data == {"delay": 0.05}
+        assert parser.max_running == 4
+        assert elapsed < 1.0
+    
     def test_statistics(self):
         """Test statistics collection."""
         # Simulate some requests
@@ -8,6 +8,7 @@ from src.torematrix.core.processing.parsers.code import (
     CodeParser, LanguageDetector, SyntaxAnalyzer, CodeLanguage
 )
 from src.torematrix.core.processing.parsers.types import ProcessingHints, ParserConfig
+from src.torematrix.core.processing.parsers.exceptions import UnsupportedElementError
 
 
 class TestLanguageDetector:
@@ -393,6 +394,29 @@ class Test:
         assert len(validation_errors) > 0
         assert "failed" in validation_errors[0].lower()
     
+    @pytest.mark.asyncio
+    async def test_parse_many(self):
+        """Test batch parsing shares repeated snippets and isolates unsupported elements."""
+        snippet = "def hello():\n    return 'world'"
+        elements = [
+            self.create_mock_element(snippet),
+            self.create_mock_element("Just plain text", "Text"),
+            self.create_mock_element(f"```python\n{snippet}\n```"),
+            self.create_mock_element("import json\n\ndef load(path):\n    return json.load(open(path))")
+        ]
+        
+        with patch.object(self.parser, 'parse', wraps=self.parser.parse) as parse:
+            results = await self.parser.parse_many(elements)
+        
+        assert len(results) == 4
+        assert results[0].success and results[3].success
+        assert isinstance(results[1], UnsupportedElementError)
+        # Same code once the fence is removed: parsed once, copied for the repeat
+        assert results[2] is not results[0]
+        assert results[2].data["language"] == results[0].data["language"]
+        assert parse.call_count == 2
+        assert results[0].metadata.parser_name == "CodeParser"
+    
     def test_get_supported_types(self):
         """Test supported element types."""
         supported_types = self.parser.get_supported_types()
@@ -376,4 +376,101 @@ Keyboard,79.99,25"""
             headers=[], column_types=[]
         )
         density = parser._calculate_data_density(low_density)
-        assert density == 0.5
\ No newline at end of file
+        assert density == 0.5
+
+class TestTableTokenizer:
+    """Test suite for delimiter detection, type inference and exports."""
+    
+    @pytest.fixture
+    def parser(self):
+        """Create parser instance."""
+        return TableParser(ParserConfig())
+    
+    @pytest.mark.parametrize("lines,expected", [
+        (["a | b", "|---|---|", "c | d"], "|"),
+        (["a\tb", "c\td"], "\t"),
+        (["a,b", "c,d"], ","),
+        (["1,000 | 2", "3 | 4,5"], "|"),
+        (["Name   Age", "John   25"], None),
+    ])
+    def test_detect_delimiter(self, parser, lines, expected):
+        """Test delimiter detection from a sample of lines."""
+        assert parser._detect_delimiter(lines) == expected
+    
+    @pytest.mark.asyncio
+    async def test_extract_aligned_columns(self, parser):
+        """Test that text without delimiters is read as aligned columns."""
+        structure = await parser._extract_from_text("Name   Age  City\nJohn   25   Paris\nJane   31   Rome")
+        
+        assert (structure.rows, structure.cols) == (3, 3)
+        assert [cell.content for cell in structure.cells if cell.row == 1] == ["John", "25", "Paris"]
+    
+    def test_detect_column_positions(self, parser):
+        """Test column starts where all lines have whitespace."""
+        assert parser._detect_column_positions(["ab  cd", "a   c  e"]) == [0, 4, 7, 8]
+        assert parser._detect_column_positions(["abc"]) == [0, 3]
+    
+    @pytest.mark.parametrize("value,expected", [
+        ("1,234", "integer"),
+        ("-42", "integer"),
+        ("1_000", "integer"),
+        ("3.14", "float"),
+        ("1.5e3", "float"),
+        (".5", "float"),
+        ("1e5", "text"),
+        ("2023-01-15", "date"),
+        ("Jan 5, 2023", "date"),
+        ("yes", "boolean"),
+        ("$1,299.99", "currency"),
+        ("12.5%", "percentage"),
+        ("12%", "text"),
+        ("٣", "integer"),
+        ("New York", "text"),
+    ])
+    def test_value_types(self, parser, value, expected):
+        """Test single value classification."""
+        assert parser._infer_type_from_values([value]) == expected
+    
+    @pytest.mark.asyncio
+    async def test_infer_column_types(self, parser):
+        """Test that each column gets its most common non-text type."""
+        structure = await parser._extract_from_text("ID,Price,Note\n1,2.5,a\n2,3.0,\n3,n/a,b")
+        await parser._infer_column_types(structure)
+        
+        assert structure.column_types == ["integer", "float", "text"]
+    
+    def test_exports_render_lazily(self, parser):
+        """Test that export formats are rendered on first access only."""
+        structure = TableStructure(
+            rows=2, cols=2,
+            cells=[
+                TableCell("Name", 0, 0), TableCell("Age", 0, 1),
+                TableCell("John", 1, 0), TableCell("25", 1, 1)
+            ],
+            headers=["Name", "Age"],
+            column_types=["text", "integer"],
+            has_header=True
+        )
+        
+        formats = parser._generate_export_formats(structure)
+        
+        assert set(formats) == {"csv", "json", "html", "markdown"}
+        assert not formats._rendered
+        assert formats["csv"] == "Name,Age\r\nJohn,25\r\n"
+        assert formats["markdown"] == "| Name | Age |\n| --- | --- |\n| John | 25 |"
+        assert "<th>Name</th>" in formats["html"]
+        assert set(formats._rendered) == {"csv", "markdown", "html"}
+    
+    def test_exports_stream(self, parser):
+        """Test that streamed exports match the rendered strings."""
+        data = [[str(row), f"item {row}"] for row in range(2500)]
+        structure = parser._parse_list_table(data)
+        formats = parser._generate_export_formats(structure)
+        
+        chunks = list(formats.iter_format("csv"))
+        
+        assert len(chunks) == 3
+        assert "".join(chunks) == formats["csv"]
+        assert "".join(formats.iter_format("json")) == formats["json"]
+        with pytest.raises(KeyError):
+            formats["xlsx"]
@@ -0,0 +1,185 @@
+"""Tests for priority task scheduling."""
+
+import pytest
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import patch
+
+from torematrix.processing.workers.pool import WorkerPool, WorkerTask, ProcessorPriority
+from torematrix.processing.workers.config import WorkerConfig
+from torematrix.processing.workers.scheduler import TaskScheduler, percentiles
+
+
+def make_task(name: str, priority: ProcessorPriority = ProcessorPriority.NORMAL,
+              tenant: str = "default", processor: str = "parser") -> WorkerTask:
+    """Create a queued task."""
+    return WorkerTask(
+        task_id=name,
+        processor_name=processor,
+        context=None,
+        processor_func=lambda context: None,
+        priority=priority,
+        timeout=30.0,
+        submitted_at=datetime.utcnow(),
+        tenant=tenant
+    )
+
+
+def drain(scheduler: TaskScheduler, group: str = "thread"):
+    """Pop every task of a group in order."""
+    order = []
+    while (scheduled := scheduler.pop(group)) is not None:
+        order.append(scheduled[0].task_id)
+    return order
+
+
+class TestTaskScheduler:
+    """Test TaskScheduler ordering."""
+    
+    @pytest.fixture
+    def clock(self):
+        """Control the scheduler's clock."""
+        with patch("torematrix.processing.workers.scheduler.time.monotonic", return_value=100.0) as mock:
+            yield mock
+    
+    def test_priority_order(self, clock):
+        """Test higher priorities run first."""
+        scheduler = TaskScheduler(aging_interval=5.0)
+        scheduler.put(make_task("low", ProcessorPriority.LOW), "thread")
+        scheduler.put(make_task("critical", ProcessorPriority.CRITICAL), "thread")
+        scheduler.put(make_task("normal"), "thread")
+        
+        assert drain(scheduler) == ["critical", "normal", "low"]
+        assert scheduler.qsize() == 0
+    
+    def test_aging_prevents_starvation(self, clock):
+        """Test a long-waiting low priority task overtakes new high priority ones."""
+        scheduler = TaskScheduler(aging_interval=5.0)
+        scheduler.put(make_task("old_low", ProcessorPriority.LOW), "thread")
+        
+        clock.return_value = 120.0
+        scheduler.put(make_task("new_high", ProcessorPriority.HIGH), "thread")
+        
+        assert drain(scheduler) == ["old_low", "new_high"]
+    
+    def test_short_tasks_preferred(self, clock):
+        """Test tasks of faster processors go first within a priority."""
+        scheduler = TaskScheduler(aging_interval=5.0)
+        scheduler.record_completion(make_task("x", processor="large_pdf"), 4.0)
+        scheduler.record_completion(make_task("y", processor="reparse"), 0.1)
+        
+        scheduler.put(make_task("large", processor="large_pdf"), "thread")
+        scheduler.put(make_task("short", processor="reparse"), "thread")
+        
+        assert drain(scheduler) == ["short", "large"]
+        
+        scheduler.record_completion(make_task("z", processor="reparse"), 1.1)
+        assert scheduler.estimate("reparse") == pytest.approx(0.7 * 0.1 + 0.3 * 1.1)
+    
+    def test_tenant_fair_share(self, clock):
+        """Test a tenant that used more than its share waits behind others."""
+        scheduler = TaskScheduler(aging_interval=5.0)
+        scheduler.record_completion(make_task("done", tenant="heavy"), 3.0)
+        
+        scheduler.put(make_task("heavy_1", tenant="heavy"), "thread")
+        scheduler.put(make_task("light_1", tenant="light"), "thread")
+        assert drain(scheduler) == ["light_1", "heavy_1"]
+        
+        # 3s at share 10 is less than light's 1s at share 1
+        scheduler.set_tenant_share("heavy", 10.0)
+        scheduler.record_completion(make_task("done", tenant="light"), 1.0)
+        scheduler.put(make_task("heavy_2", tenant="heavy"), "thread")
+        scheduler.put(make_task("light_2", tenant="light"), "thread")
+        assert drain(scheduler) == ["heavy_2", "light_2"]
+    
+    def test_tenant_lag_is_capped(self, clock):
+        """Test a tenant's past service delays it by at most max_tenant_lag."""
+        scheduler = TaskScheduler(aging_interval=5.0)
+        scheduler.record_completion(make_task("done", tenant="heavy"), 1000.0)
+        
+        scheduler.put(make_task("heavy_1", tenant="heavy"), "thread")
+        clock.return_value = 106.0
+        scheduler.put(make_task("light_1", tenant="light"), "thread")
+        clock.return_value = 104.0
+        scheduler.put(make_task("light_2", tenant="light"), "thread")
+        
+        # heavy_1 is 5s behind (the cap), light_1 was queued 6s later
+        assert drain(scheduler) == ["light_2", "heavy_1", "light_1"]
+    
+    def test_work_stealing(self, clock):
+        """Test idle groups steal runnable tasks from other groups."""
+        scheduler = TaskScheduler()
+        scheduler.put(make_task("cpu_bound"), "process")
+        
+        task, group = scheduler.pop("thread", steal_from=("process",))
+        assert (task.task_id, group) == ("cpu_bound", "process")
+        
+        scheduler.put(make_task("local_func"), "thread")
+        assert scheduler.pop("process", steal_from=("thread",), can_steal=lambda t: False) is None
+        assert scheduler.get_stats()["steals"] == 1
+    
+    def test_queue_limit(self, clock):
+        """Test put refuses tasks beyond max_size."""
+        scheduler = TaskScheduler(max_size=1)
+        assert scheduler.put(make_task("a"), "thread")
+        assert not scheduler.put(make_task("b"), "thread")
+    
+    def test_percentiles(self):
+        """Test nearest-rank percentiles."""
+        result = percentiles([float(i) for i in range(1, 101)])
+        assert result == {"p50": 50.0, "p90": 90.0, "p99": 99.0}
+        assert percentiles([]) == {"p50": 0.0, "p90": 0.0, "p99": 0.0}
+
+
+@pytest.mark.asyncio
+class TestWorkerPoolScheduling:
+    """Test WorkerPool scheduling behaviour."""
+    
+    async def test_interactive_task_jumps_batch_backlog(self):
+        """Test an interactive task runs before queued batch work."""
+        pool = WorkerPool(WorkerConfig(async_workers=1, thread_workers=0))
+        order = []
+        
+        async def processor(context):
+            order.append(context)
+            await asyncio.sleep(0.01)
+        
+        await pool.start()
+        try:
+            for i in range(4):
+                await pool.submit_task("batch", f"batch-{i}", processor, priority=ProcessorPriority.LOW)
+            await pool.submit_task("reparse", "interactive", processor, priority=ProcessorPriority.HIGH)
+            
+            assert await pool.wait_for_completion(timeout=5.0)
+            assert order.index("interactive") <= 1
+            
+            latency = pool.get_stats()["latency"]
+            assert latency["interactive"]["p50"] > 0
+            assert latency["batch"]["p99"] >= latency["batch"]["p50"]
+        finally:
+            await pool.stop()
+    
+    async def test_process_workers_do_not_steal_thread_tasks(self):
+        """Test thread tasks keep running in-process when process workers are idle."""
+        pool = WorkerPool(WorkerConfig(async_workers=1, thread_workers=1, process_workers=1))
+        
+        class Recorder:
+            def __init__(self):
+                self.seen = []
+            
+            def record(self, context):
+                self.seen.append(context)
+                time.sleep(0.01)
+        
+        recorder = Recorder()
+        await pool.start()
+        try:
+            for i in range(6):
+                await pool.submit_task("sync", i, recorder.record)
+            
+            assert await pool.wait_for_completion(timeout=10.0)
+            assert sorted(recorder.seen) == list(range(6))
+            assert pool.scheduler.get_stats()["steals"] == 0
+        finally:
+            await pool.stop()
@@ -0,0 +1,142 @@
+"""
+Unit tests for streaming batch parsing in UnstructuredClient.
+"""
+
+import pytest
+import asyncio
+from unittest.mock import Mock
+
+from torematrix.integrations.unstructured.client import UnstructuredClient
+from torematrix.integrations.unstructured.exceptions import UnstructuredParsingError, UnstructuredTimeoutError
+
+
+class FakeParser:
+    """Replaces parse_document with per-file delays and failures."""
+    
+    def __init__(self, delays, failures=()):
+        self.delays = delays
+        self.failures = set(failures)
+        self.running = 0
+        self.max_running = 0
+        self.started = []
+    
+    async def __call__(self, file_path, **kwargs):
+        name = file_path.name
+        self.started.append(name)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.0))
+            if name in self.failures:
+                raise UnstructuredParsingError(f"Cannot parse {name}")
+            return [f"element-{name}"]
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def client():
+    """Create client with a short default timeout."""
+    client = UnstructuredClient()
+    client.config.performance.max_concurrent = 2
+    client.config.performance.timeout_seconds = 5
+    return client
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_iter_parse_yields_as_completed(client):
+    """Test unordered mode yields fast files first within the window."""
+    parser = FakeParser({"a.pdf": 0.2, "b.pdf": 0.01, "c.pdf": 0.01})
+    client.parse_document = parser
+    
+    results = await collect(client.iter_parse(["a.pdf", "b.pdf", "c.pdf"]))
+    
+    assert [path for path, _ in results] == ["b.pdf", "c.pdf", "a.pdf"]
+    assert dict(results)["a.pdf"] == ["element-a.pdf"]
+    assert parser.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_parse_ordered(client):
+    """Test ordered mode keeps input order and bounds buffered results."""
+    parser = FakeParser({"a.pdf": 0.1})
+    client.parse_document = parser
+    
+    results = await collect(client.iter_parse(["a.pdf", "b.pdf", "c.pdf", "d.pdf"], ordered=True))
+    
+    assert [path for path, _ in results] == ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]
+    # b.pdf finishes first but holds its slot until a.pdf is yielded
+    assert parser.started[:2] == ["a.pdf", "b.pdf"]
+    assert parser.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_parse_lazy_input(client):
+    """Test paths are pulled from the input only as slots free up."""
+    client.parse_document = FakeParser({})
+    pulled = []
+    
+    def paths():
+        for i in range(10):
+            pulled.append(i)
+            yield f"{i}.pdf"
+    
+    iterator = client.iter_parse(paths(), max_concurrency=3)
+    await iterator.__anext__()
+    assert len(pulled) <= 4
+    await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_parse_failures_do_not_cancel_batch(client):
+    """Test timeouts and errors only affect their own file."""
+    client.parse_document = FakeParser({"slow.pdf": 1.0}, failures={"bad.pdf"})
+    
+    results = dict(await collect(client.iter_parse(
+        ["slow.pdf", "bad.pdf", "ok.pdf"], timeout_per_file=0.05, return_exceptions=True
+    )))
+    
+    assert isinstance(results["slow.pdf"], UnstructuredTimeoutError)
+    assert isinstance(results["bad.pdf"], UnstructuredParsingError)
+    assert results["ok.pdf"] == ["element-ok.pdf"]
+    
+    results = dict(await collect(client.iter_parse(["bad.pdf", "ok.pdf"])))
+    assert results == {"bad.pdf": [], "ok.pdf": ["element-ok.pdf"]}
+
+
+@pytest.mark.asyncio
+async def test_iter_parse_memory_admission(client, tmp_path):
+    """Test refused allocations hold back new parses but never stall the batch."""
+    files = []
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        path = tmp_path / name
+        path.write_bytes(b"x" * 1024 * 1024)
+        files.append(path)
+    
+    memory_manager = Mock()
+    memory_manager.check_can_allocate.return_value = False
+    client.memory_manager = memory_manager
+    parser = FakeParser({"a.pdf": 0.01, "b.pdf": 0.01, "c.pdf": 0.01})
+    client.parse_document = parser
+    
+    results = await collect(client.iter_parse(files))
+    
+    assert len(results) == 3
+    assert parser.max_running == 1
+    memory_manager.check_can_allocate.assert_called_with(pytest.approx(4.0))
+
+
+@pytest.mark.asyncio
+async def test_parse_multiple_reports_progress(client):
+    """Test parse_multiple collects every result and reports progress."""
+    client.parse_document = FakeParser({}, failures={"b.pdf"})
+    progress = []
+    
+    results = await client.parse_multiple(["a.pdf", "b.pdf"], progress_callback=progress.append)
+    
+    assert results == {"a.pdf": ["element-a.pdf"], "b.pdf": []}
+    assert progress == [0.5, 1.0]
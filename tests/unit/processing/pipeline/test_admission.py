@@ -0,0 +1,127 @@
+"""
+Unit tests for resource admission control.
+"""
+
+import pytest
+import asyncio
+
+from torematrix.processing.pipeline.admission import ResourceAdmissionController
+from torematrix.processing.pipeline.config import ResourceRequirements
+from torematrix.processing.pipeline.exceptions import ResourceError
+
+
+def cores(n: float) -> ResourceRequirements:
+    """Requirements for ``n`` CPU cores and minimal memory."""
+    return ResourceRequirements(cpu_cores=n, memory_mb=128)
+
+
+class TestResourceAdmissionController:
+    """Test cases for ResourceAdmissionController."""
+    
+    @pytest.fixture
+    def controller(self):
+        """Create controller with two cores."""
+        return ResourceAdmissionController(cpu_cores=2, memory_mb=1024, gpu_slots=1)
+    
+    @pytest.mark.asyncio
+    async def test_immediate_admission(self, controller):
+        """Test free resources are granted without queueing."""
+        grant = await controller.acquire("stage1", cores(1.5))
+        
+        assert controller.available["cpu_cores"] == 0.5
+        assert controller.available["memory_mb"] == 896
+        assert controller.get_stats()["active_grants"] == 1
+        
+        controller.release(grant)
+        assert controller.available == controller.capacity
+    
+    @pytest.mark.asyncio
+    async def test_release_wakes_waiter(self, controller):
+        """Test a waiter is admitted as soon as resources are released."""
+        grant = await controller.acquire("big", cores(2))
+        waiter = asyncio.create_task(controller.acquire("next", cores(1)))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        
+        controller.release(grant)
+        next_grant = await asyncio.wait_for(waiter, timeout=0.5)
+        
+        assert next_grant.stage_name == "next"
+        assert controller.get_queue_wait_metrics()["next"]["admissions"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_priority_order(self, controller):
+        """Test higher priority waiters are admitted first."""
+        grant = await controller.acquire("blocker", cores(2))
+        admitted = []
+        
+        async def run(name, priority):
+            granted = await controller.acquire(name, cores(2), priority=priority)
+            admitted.append(name)
+            controller.release(granted)
+        
+        tasks = [asyncio.create_task(run("low", 0)), asyncio.create_task(run("high", 5))]
+        await asyncio.sleep(0)
+        controller.release(grant)
+        await asyncio.gather(*tasks)
+        
+        assert admitted == ["high", "low"]
+    
+    @pytest.mark.asyncio
+    async def test_fairness_between_pipelines(self, controller):
+        """Test the pipeline holding fewer grants is admitted first."""
+        held = await controller.acquire("a1", cores(1), pipeline_id="a")
+        blocker = await controller.acquire("b0", cores(1), pipeline_id="b")
+        
+        second_a = asyncio.create_task(controller.acquire("a2", cores(1), pipeline_id="a"))
+        first_c = asyncio.create_task(controller.acquire("c1", cores(1), pipeline_id="c"))
+        await asyncio.sleep(0)
+        
+        controller.release(blocker)
+        granted = await asyncio.wait_for(first_c, timeout=0.5)
+        
+        assert granted.pipeline_id == "c"
+        assert not second_a.done()
+        
+        controller.release(held)
+        await asyncio.wait_for(second_a, timeout=0.5)
+    
+    @pytest.mark.asyncio
+    async def test_timeout_raises_and_unblocks_queue(self, controller):
+        """Test timed out waiters leave the queue."""
+        grant = await controller.acquire("holder", cores(1.5))
+        
+        with pytest.raises(ResourceError):
+            await controller.acquire("too_big", cores(2), timeout=0.05)
+        
+        assert controller.get_stats()["waiting"] == 0
+        assert controller.get_queue_wait_metrics()["too_big"]["timeouts"] == 1
+        
+        small = await asyncio.wait_for(controller.acquire("small", cores(0.5)), timeout=0.5)
+        controller.release(small)
+        controller.release(grant)
+    
+    @pytest.mark.asyncio
+    async def test_oversized_requests_are_capped(self, controller):
+        """Test requests beyond capacity take the whole pool."""
+        grant = await controller.acquire("huge", cores(8))
+        
+        assert grant.amounts["cpu_cores"] == 2
+        controller.release(grant)
+    
+    @pytest.mark.asyncio
+    async def test_gpu_slots(self):
+        """Test GPU stages need a configured GPU slot."""
+        controller = ResourceAdmissionController(cpu_cores=4, memory_mb=4096)
+        requirements = ResourceRequirements(gpu_required=True, gpu_memory_mb=1024)
+        
+        with pytest.raises(ResourceError):
+            await controller.acquire("ocr", requirements)
+    
+    def test_from_system(self):
+        """Test sizing from the machine."""
+        controller = ResourceAdmissionController.from_system(max_cpu_percent=50.0)
+        
+        assert controller.capacity["cpu_cores"] >= 1.0
+        assert controller.capacity["memory_mb"] > 0
+        assert controller.capacity["gpu_slots"] == 0
@@ -428,6 +428,27 @@ class TestPipelineManager:
         with pytest.raises(ResourceError):
             await manager.execute(document_id="doc123")
     
+    @pytest.mark.asyncio
+    async def test_admission_controller(self, pipeline_config, event_bus, state_store):
+        """Test stages are admitted through the admission controller."""
+        from torematrix.processing.pipeline.admission import ResourceAdmissionController
+        
+        controller = ResourceAdmissionController(cpu_cores=1, memory_mb=1024)
+        
+        with patch.object(PipelineManager, '_create_stage', side_effect=lambda c: MockStage(c)):
+            manager = PipelineManager(
+                pipeline_config,
+                event_bus,
+                state_store,
+                admission_controller=controller
+            )
+        
+        context = await manager.execute(document_id="doc123")
+        
+        assert all(r.status == StageStatus.COMPLETED for r in context.stage_results.values())
+        assert controller.available == controller.capacity
+        assert sum(m["admissions"] for m in controller.get_queue_wait_metrics().values()) == 4
+    
     @pytest.mark.asyncio
     async def test_stage_timeout(self, event_bus, state_store):
         """Test stage timeout handling."""
@@ -6,6 +6,7 @@ import pytest
 import json
 import csv
 import xml.etree.ElementTree as ET
+from datetime import datetime
 from unittest.mock import Mock, MagicMock, patch, mock_open
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
@@ -199,6 +200,172 @@ class TestExportEngine:
         assert element.find("text") is not None
         assert element.find("coordinates") is not None
     
+    def test_export_xml_golden_output(self):
+        """Test streamed XML matches the full-document serialization byte for byte."""
+        elements = [
+            Element(
+                id='elem1',
+                element_type=ElementType.TITLE,
+                text='Say "hi" & <bye>',
+                bounds=Rect(10.0, 20.0, 100.0, 30.0),
+                parent_id=None,
+                children=['elem2'],
+                metadata={}
+            ),
+            Element(
+                id='elem2',
+                element_type=ElementType.NARRATIVE_TEXT,
+                text='Plain text',
+                bounds=Rect(10.0, 60.0, 100.0, 40.0),
+                parent_id='elem1',
+                children=[],
+                metadata={}
+            )
+        ]
+        header = (
+            '<export_info>\n'
+            '    <format>xml</format>\n'
+            '    <timestamp>2024-01-01T12:00:00</timestamp>\n'
+            '    <element_count>{count}</element_count>\n'
+            '  </export_info>\n'
+        )
+        pretty = (
+            '<?xml version="1.0" ?>\n'
+            '<document>\n'
+            '  ' + header.format(count=2) +
+            '  <elements>\n'
+            '    <element id="elem1" type="Title">\n'
+            '      <text>Say &quot;hi&quot; &amp; &lt;bye&gt;</text>\n'
+            '      <coordinates x="10.0" y="20.0" width="100.0" height="30.0"/>\n'
+            '      <children>\n'
+            '        <child id="elem2"/>\n'
+            '      </children>\n'
+            '    </element>\n'
+            '    <element id="elem2" type="NarrativeText">\n'
+            '      <text>Plain text</text>\n'
+            '      <coordinates x="10.0" y="60.0" width="100.0" height="40.0"/>\n'
+            '      <hierarchy parent_id="elem1"/>\n'
+            '    </element>\n'
+            '  </elements>\n'
+            '</document>\n'
+        )
+        pretty_empty = (
+            '<?xml version="1.0" ?>\n'
+            '<document>\n'
+            '  ' + header.format(count=0) +
+            '  <elements/>\n'
+            '</document>\n'
+        )
+        compact = (
+            '<document><export_info><format>xml</format>'
+            '<timestamp>2024-01-01T12:00:00</timestamp><element_count>2</element_count>'
+            '</export_info><elements>'
+            '<element id="elem1" type="Title"><text>Say "hi" &amp; &lt;bye&gt;</text>'
+            '<coordinates x="10.0" y="20.0" width="100.0" height="30.0" />'
+            '<children><child id="elem2" /></children></element>'
+            '<element id="elem2" type="NarrativeText"><text>Plain text</text>'
+            '<coordinates x="10.0" y="60.0" width="100.0" height="40.0" />'
+            '<hierarchy parent_id="elem1" /></element>'
+            '</elements></document>'
+        )
+        compact_empty = (
+            '<document><export_info><format>xml</format>'
+            '<timestamp>2024-01-01T12:00:00</timestamp><element_count>0</element_count>'
+            '</export_info><elements /></document>'
+        )
+        
+        engine = ExportEngine()
+        with patch('torematrix.ui.tools.validation.export_system.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0)
+            for pretty_print, expected, expected_empty in [
+                (True, pretty, pretty_empty), (False, compact, compact_empty)
+            ]:
+                options = ExportOptions(
+                    format=ExportFormat.XML,
+                    include_coordinates=True,
+                    include_hierarchy=True,
+                    pretty_print=pretty_print,
+                    chunk_size=1
+                )
+                assert engine._export_xml(elements, options) == expected
+                assert engine._export_xml([], options) == expected_empty
+    
+    def test_export_yaml_golden_output(self):
+        """Test streamed YAML matches yaml.dump of the full document."""
+        yaml = pytest.importorskip("yaml")
+        elements = [
+            Element(
+                id='elem1',
+                element_type=ElementType.TITLE,
+                text='Title: "quoted"',
+                bounds=Rect(10.0, 20.0, 100.0, 30.0),
+                parent_id=None,
+                children=['elem2'],
+                metadata={'source': 'page 1'}
+            ),
+            Element(
+                id='elem2',
+                element_type=ElementType.NARRATIVE_TEXT,
+                text='Plain text\nover two lines',
+                bounds=Rect(10.0, 60.0, 100.0, 40.0),
+                parent_id='elem1',
+                children=[],
+                metadata={}
+            )
+        ]
+        
+        def full_document(elements):
+            records = []
+            for element in elements:
+                record = {
+                    "id": element.id,
+                    "type": element.element_type.value,
+                    "text": element.text,
+                    "coordinates": {
+                        "x": element.bounds.x,
+                        "y": element.bounds.y,
+                        "width": element.bounds.width,
+                        "height": element.bounds.height
+                    }
+                }
+                if element.parent_id:
+                    record["parent_id"] = element.parent_id
+                if element.children:
+                    record["children"] = element.children
+                if element.metadata:
+                    record["metadata"] = element.metadata
+                records.append(record)
+            
+            data = {
+                "export_info": {
+                    "format": "yaml",
+                    "timestamp": "2024-01-01T12:00:00",
+                    "element_count": len(elements),
+                    "options": {
+                        "include_metadata": True,
+                        "include_coordinates": True,
+                        "include_hierarchy": True,
+                        "include_relationships": False,
+                    }
+                },
+                "elements": records
+            }
+            return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        
+        engine = ExportEngine()
+        options = ExportOptions(
+            format=ExportFormat.YAML,
+            include_metadata=True,
+            include_coordinates=True,
+            include_hierarchy=True,
+            include_relationships=False,
+            chunk_size=1
+        )
+        with patch('torematrix.ui.tools.validation.export_system.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 1, 12, 0)
+            assert engine._export_yaml(elements, options) == full_document(elements)
+            assert engine._export_yaml([], options) == full_document([])
+    
     def test_export_csv(self, sample_elements, export_options):
         """Test CSV export."""
         engine = ExportEngine()
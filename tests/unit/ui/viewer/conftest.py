@@ -0,0 +1,9 @@
+"""Fixtures shared by the viewer tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def viewer_qapp(qapp):
+    """Viewer widgets, pixmaps and fonts need a QApplication."""
+    return qapp
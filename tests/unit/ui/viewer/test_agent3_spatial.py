@@ -9,7 +9,7 @@ from unittest.mock import Mock
 
 from src.torematrix.ui.viewer.spatial import SpatialBounds, SpatialElement, QuadTreeSpatialIndex, SpatialIndexManager
 from src.torematrix.ui.viewer.culling import ViewportCuller, ViewportBounds, CullingStrategy
-from src.torematrix.ui.viewer.clustering import ElementClusterer, ClusteringStrategy
+from src.torematrix.ui.viewer.clustering import ElementClusterer, ClusteringStrategy, ElementPyramid
 from src.torematrix.ui.viewer.optimization import PerformanceOptimizer, OptimizationMode
 from src.torematrix.ui.viewer.profiling import PerformanceProfiler, ProfilingConfiguration
 from src.torematrix.ui.viewer.coordinates import Rectangle, Point
@@ -29,6 +29,19 @@ def mock_overlay_element():
     return element
 
 
+def make_overlay_element(element_id, bounds, layer_name="test_layer"):
+    """Create a mock overlay element with the given bounds."""
+    element = Mock()
+    element.element_id = element_id
+    element.layer_name = layer_name
+    element.element_type = "test_type"
+    element.bounds = bounds
+    element.get_z_index.return_value = 0
+    element.get_bounds.return_value = bounds
+    element.is_visible.return_value = True
+    return element
+
+
 @pytest.fixture
 def spatial_bounds():
     """Create test spatial bounds."""
@@ -136,6 +149,26 @@ class TestQuadTreeSpatialIndex:
         
         assert len(results) >= 0  # May be 0 or more
         assert len(results) <= 3
+    
+    def test_query_nearest(self, spatial_index):
+        """Test nearest queries return elements by center distance."""
+        for i in range(20):
+            bounds = SpatialBounds(i * 40, 0, 20, 20)
+            spatial_index.insert(SpatialElement(element_id=f"e{i}", bounds=bounds, element=None))
+        
+        results = spatial_index.query_nearest(Point(130, 10), max_distance=100, max_results=3)
+        assert [element.element_id for element, _ in results] == ["e3", "e2", "e4"]
+        assert results[0][1] == pytest.approx(0.0)
+        assert len(spatial_index.query_nearest(Point(130, 10), max_distance=39)) == 1
+    
+    def test_update_moves_element(self, spatial_index):
+        """Test reinserting an element moves it instead of duplicating it."""
+        spatial_index.insert(SpatialElement("a", SpatialBounds(0, 0, 10, 10), None))
+        spatial_index.insert(SpatialElement("a", SpatialBounds(500, 500, 10, 10), None))
+        
+        assert spatial_index.get_element_count() == 1
+        assert spatial_index.query_point(Point(5, 5)) == []
+        assert [e.element_id for e in spatial_index.query_point(Point(505, 505))] == ["a"]
 
 
 class TestSpatialIndexManager:
@@ -201,6 +234,52 @@ class TestViewportCuller:
         assert result.total_elements >= 0
         assert len(result.visible_elements) <= result.total_elements
         assert result.culled_count >= 0
+    
+    def test_cull_many_matches_single_viewports(self, spatial_bounds):
+        """Test batched culling gives the same result as culling each viewport."""
+        manager = SpatialIndexManager(spatial_bounds)
+        manager.add_elements([
+            make_overlay_element(f"element_{i}", Rectangle((i % 10) * 100, (i // 10) * 100, 50, 50))
+            for i in range(100)
+        ])
+        viewports = [ViewportBounds(Rectangle(x, y, 200, 200), zoom_level=2.0)
+                     for x, y in [(0, 0), (300, 300), (800, 100)]]
+        
+        culler = ViewportCuller(manager, CullingStrategy.BASIC)
+        culler.enable_caching = False
+        batched = culler.cull_many(viewports)
+        
+        for viewport, result in zip(viewports, batched):
+            single = culler.cull_elements(viewport)
+            assert ({e.element_id for e in result.visible_elements} ==
+                    {e.element_id for e in single.visible_elements})
+            assert result.total_elements == single.total_elements
+    
+    def test_dense_low_zoom_views_are_aggregated(self, spatial_bounds):
+        """Test LOD aggregation bounds the output of dense low-zoom views."""
+        manager = SpatialIndexManager(spatial_bounds)
+        manager.add_elements([
+            make_overlay_element(f"element_{i}", Rectangle((i % 40) * 25, (i // 40) * 25, 20, 20))
+            for i in range(1600)
+        ])
+        culler = ViewportCuller(manager, CullingStrategy.HIERARCHICAL)
+        culler.enable_lod_aggregation(max_primitives=50)
+        
+        result = culler.cull_elements(ViewportBounds(Rectangle(0, 0, 1000, 1000), zoom_level=0.1))
+        assert result.visible_elements == []
+        assert 0 < len(result.aggregates) <= 50
+        assert result.total_elements == 1600
+        
+        detailed = culler.cull_elements(ViewportBounds(Rectangle(0, 0, 100, 100), zoom_level=2.0))
+        assert detailed.aggregates == []
+        
+        manager.add_element(make_overlay_element("extra", Rectangle(2000, 2000, 20, 20)))
+        assert "extra" in culler.lod_pyramid
+        manager.remove_element("element_0")
+        assert "element_0" not in culler.lod_pyramid
+        
+        culler.enable_lod_aggregation(False)
+        assert manager.change_listeners == []
 
 
 class TestElementClusterer:
@@ -233,8 +312,102 @@ class TestElementClusterer:
         # At high zoom (should not cluster)
         clusters_high = clusterer.cluster_elements(elements, zoom_level=2.0)
         assert isinstance(clusters_high, list)
+    
+    def test_clusters_follow_proximity(self, spatial_bounds):
+        """Test nearby elements group together and distant ones stay apart."""
+        manager = SpatialIndexManager(spatial_bounds)
+        elements = [make_overlay_element(f"left_{i}", Rectangle(0, i * 30, 20, 20)) for i in range(4)]
+        elements += [make_overlay_element(f"right_{i}", Rectangle(600, i * 30, 20, 20)) for i in range(3)]
+        elements.append(make_overlay_element("alone", Rectangle(300, 900, 20, 20)))
+        
+        clusterer = ElementClusterer(manager)
+        clusters = clusterer.cluster_elements(elements, zoom_level=0.5)
+        
+        members = sorted(sorted(e.element_id for e in cluster.elements) for cluster in clusters)
+        assert members == [[f"left_{i}" for i in range(4)], [f"right_{i}" for i in range(3)]]
+        left = next(c for c in clusters if len(c.elements) == 4)
+        assert (left.bounds.x, left.bounds.y, left.bounds.width, left.bounds.height) == (0, 0, 20, 110)
+    
+    def test_page_pyramid_is_reused_and_edited(self, spatial_bounds):
+        """Test page clusters come from a pyramid that is updated in place."""
+        clusterer = ElementClusterer(SpatialIndexManager(spatial_bounds))
+        elements = [make_overlay_element(f"element_{i}", Rectangle((i % 10) * 10, (i // 10) * 10, 8, 8))
+                    for i in range(100)]
+        
+        clusters = clusterer.cluster_elements(elements, zoom_level=0.25, page_key="page_1")
+        assert sum(len(c.elements) for c in clusters) == 100
+        pyramid = clusterer.pyramids["page_1"]
+        
+        clusterer.add_page_element("page_1", make_overlay_element("new", Rectangle(500, 500, 8, 8)))
+        clusterer.cluster_elements(elements, zoom_level=0.25, page_key="page_1")
+        assert clusterer.pyramids["page_1"] is pyramid
+        assert len(pyramid) == 101
+        
+        assert clusterer.remove_page_element("page_1", "new")
+        clusterer.invalidate_page("page_1")
+        assert clusterer.get_statistics()['pyramid_pages'] == 0
 
 
+class TestElementPyramid:
+    """Test the level-of-detail pyramid."""
+    
+    @pytest.fixture
+    def elements(self):
+        """Create a dense 50 x 50 grid of small elements."""
+        return [make_overlay_element(f"element_{i}", Rectangle((i % 50) * 20, (i // 50) * 20, 10, 10))
+                for i in range(2500)]
+    
+    def test_levels_follow_zoom(self):
+        """Test coarser levels are picked as the view zooms out."""
+        pyramid = ElementPyramid(base_cell_size=8.0, levels=12, cell_pixels=24.0)
+        assert pyramid.level_for_zoom(4.0) == 0
+        assert pyramid.level_for_zoom(1.0) == 2
+        assert pyramid.level_for_zoom(0.25) == 4
+        assert pyramid.level_for_zoom(1e-9) == 11
+    
+    def test_query_is_bounded(self, elements):
+        """Test the aggregate count stays bounded at any density."""
+        pyramid = ElementPyramid()
+        pyramid.add_many(elements)
+        region = Rectangle(0, 0, 1000, 1000)
+        
+        for zoom_level in (0.05, 0.2, 0.5, 1.0):
+            clusters = pyramid.query(region, zoom_level, max_primitives=100)
+            assert len(clusters) <= 100
+            assert sum(len(c.elements) for c in clusters) == 2500
+        
+        clusters = pyramid.query(Rectangle(0, 0, 95, 95), 4.0)
+        assert sorted(len(c.elements) for c in clusters) == [1] * 25
+    
+    def test_visited_cells_are_bounded(self, elements):
+        """Test the level choice counts the border cells the query scans."""
+        pyramid = ElementPyramid()
+        pyramid.add_many(elements)
+        
+        pyramid.query(Rectangle(100, 100, 95, 95), 4.0, max_primitives=20)
+        assert pyramid.get_statistics()['cluster_builds'] <= 20
+    
+    def test_edits_only_rebuild_touched_cells(self, elements):
+        """Test cached aggregates survive edits elsewhere on the page."""
+        pyramid = ElementPyramid()
+        pyramid.add_many(elements)
+        region = Rectangle(0, 0, 1000, 1000)
+        before = {c.cluster_id: c for c in pyramid.query(region, 0.2, max_primitives=100)}
+        builds = pyramid.get_statistics()['cluster_builds']
+        
+        moved = make_overlay_element("element_0", Rectangle(985, 985, 10, 10))
+        pyramid.update(moved)
+        after = {c.cluster_id: c for c in pyramid.query(region, 0.2, max_primitives=100)}
+        
+        assert pyramid.get_statistics()['cluster_builds'] - builds == 2
+        assert sum(1 for key, cluster in after.items() if before.get(key) is not cluster) == 2
+        assert sum(len(c.elements) for c in after.values()) == 2500
+        
+        assert pyramid.remove("element_0")
+        assert not pyramid.remove("element_0")
+        assert len(pyramid) == 2499
+        assert sum(len(c.elements) for c in pyramid.query(region, 0.2, max_primitives=100)) == 2499
+
 class TestPerformanceOptimizer:
     """Test performance optimization functionality."""
     
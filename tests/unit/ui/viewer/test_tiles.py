@@ -0,0 +1,251 @@
+"""
+Unit tests for the tiled overlay cache.
+"""
+import pytest
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage, QPainter
+from PyQt6.QtWidgets import QWidget
+
+from src.torematrix.ui.viewer.coordinates import Rectangle
+from src.torematrix.ui.viewer.overlay import OverlayEngine
+from src.torematrix.ui.viewer.pipeline import DirtyRegionTracker
+from src.torematrix.ui.viewer.renderer import RenderingPerformanceProfiler
+from src.torematrix.ui.viewer.tiles import OverlayTileCache
+
+
+class BoxPainter:
+    """Paints filled boxes and records which regions were painted."""
+    
+    def __init__(self, boxes):
+        self.boxes = boxes
+        self.regions = []
+    
+    def __call__(self, painter, region):
+        self.regions.append(region)
+        count = 0
+        for box in self.boxes:
+            if box.intersects(region):
+                painter.fillRect(int(box.x), int(box.y), int(box.width), int(box.height), QColor(255, 0, 0))
+                count += 1
+        return count
+
+
+def composite(cache, region, zoom=1.0):
+    """Composite onto an image the size of the region at the given zoom."""
+    image = QImage(int(region.width * zoom), int(region.height * zoom), QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.scale(zoom, zoom)
+    painter.translate(-region.x, -region.y)
+    result = cache.composite(painter, region, zoom)
+    painter.end()
+    return image, result
+
+
+class TestOverlayTileCache:
+    """Test tile layout, caching and invalidation."""
+    
+    @pytest.fixture
+    def boxes(self):
+        """Create boxes on both sides of a tile border."""
+        return [Rectangle(10, 10, 20, 20), Rectangle(120, 40, 30, 30)]
+    
+    @pytest.fixture
+    def tracker(self):
+        """Create a document-space dirty tracker."""
+        return DirtyRegionTracker(Rectangle(0, 0, 1000, 1000))
+    
+    @pytest.fixture
+    def cache(self, boxes, tracker):
+        """Create cache with 100px tiles."""
+        return OverlayTileCache(BoxPainter(boxes), tile_size=100, dirty_tracker=tracker,
+                                profiler=RenderingPerformanceProfiler(), bleed=0.0)
+    
+    def test_tile_layout(self, cache):
+        """Test zoom buckets and tile grids."""
+        assert cache.zoom_bucket(1.0) == 0
+        assert cache.zoom_bucket(1.3) == 0
+        assert cache.zoom_bucket(1.6) == 1
+        assert cache.zoom_bucket(0.3) == -2
+        assert cache.zoom_bucket(1000) == cache.max_bucket
+        
+        assert cache.tile_span(1) == 50
+        assert cache.tile_keys(Rectangle(0, 0, 200, 100), 0) == [(0, 0, 0), (0, 1, 0)]
+        assert cache.tile_keys(Rectangle(-10, 50, 20, 0), 0) == [(0, -1, 0), (0, 0, 0)]
+        bounds = cache.tile_bounds((1, 3, 2))
+        assert (bounds.x, bounds.y, bounds.width) == (150, 100, 50)
+    
+    def test_composite_draws_tiles(self, cache):
+        """Test composited output matches the painted content."""
+        image, result = composite(cache, Rectangle(0, 0, 200, 100))
+        
+        assert result == {'tiles': 2, 'rebuilt': 2, 'primitive_count': 2}
+        assert image.pixelColor(15, 15) == QColor(255, 0, 0)
+        assert image.pixelColor(130, 50) == QColor(255, 0, 0)
+        assert image.pixelColor(60, 60).alpha() == 0
+    
+    def test_pan_reuses_tiles(self, cache):
+        """Test panning only renders newly exposed tiles."""
+        composite(cache, Rectangle(0, 0, 200, 100))
+        image, result = composite(cache, Rectangle(50, 0, 200, 100))
+        
+        assert result['tiles'] == 3
+        assert result['rebuilt'] == 1
+        assert image.pixelColor(80, 50) == QColor(255, 0, 0)  # box at x=120 after panning by 50
+        assert cache.get_statistics()['hits'] == 2
+    
+    def test_zoom_within_bucket_rescales(self, cache):
+        """Test nearby zoom levels reuse the same tiles."""
+        composite(cache, Rectangle(0, 0, 200, 100))
+        image, result = composite(cache, Rectangle(0, 0, 200, 100), zoom=1.25)
+        
+        assert result['rebuilt'] == 0
+        assert image.pixelColor(25, 25) == QColor(255, 0, 0)
+        
+        _, result = composite(cache, Rectangle(0, 0, 200, 100), zoom=2.0)
+        assert result['rebuilt'] == 8  # 50px tiles in bucket 1
+        assert cache.current_bucket == 1
+    
+    def test_dirty_regions_invalidate_overlapping_tiles(self, cache, tracker):
+        """Test only tiles touched by dirty regions are repainted."""
+        composite(cache, Rectangle(0, 0, 200, 100))
+        tracker.mark_dirty(Rectangle(130, 50, 10, 10))
+        
+        _, result = composite(cache, Rectangle(0, 0, 200, 100))
+        assert result['rebuilt'] == 1
+        assert cache.paint_region.regions[-1].x == 100
+        assert tracker.get_dirty_regions() == []
+    
+    def test_offscreen_rebuilds_are_deferred(self, cache, tracker):
+        """Test dirty tiles outside the viewport wait for rebuild_deferred."""
+        composite(cache, Rectangle(0, 0, 200, 100))
+        composite(cache, Rectangle(200, 0, 200, 100))
+        tracker.mark_dirty(Rectangle(10, 10, 200, 20))
+        
+        _, result = composite(cache, Rectangle(200, 0, 200, 100))
+        assert result['rebuilt'] == 1  # only the visible tile at x=200
+        assert cache.has_deferred_work()
+        assert cache.get_statistics()['deferred_tiles'] == 2
+        
+        assert cache.rebuild_deferred(max_tiles=1) == 1
+        assert cache.rebuild_deferred() == 1
+        assert not cache.has_deferred_work()
+        
+        _, result = composite(cache, Rectangle(0, 0, 200, 100))
+        assert result['rebuilt'] == 0
+    
+    def test_full_redraw_invalidates_everything(self, cache, tracker):
+        """Test large dirty areas fall back to invalidating every tile."""
+        composite(cache, Rectangle(0, 0, 200, 100))
+        tracker.mark_dirty(Rectangle(0, 0, 900, 900))
+        
+        _, result = composite(cache, Rectangle(0, 0, 200, 100))
+        assert result['rebuilt'] == 2
+    
+    def test_unbounded_tracker_does_not_clip(self, boxes):
+        """Test a tracker without known bounds keeps dirty regions whole."""
+        tracker = DirtyRegionTracker(None)
+        cache = OverlayTileCache(BoxPainter(boxes), tile_size=100, dirty_tracker=tracker,
+                                 bleed=0.0)
+        composite(cache, Rectangle(0, 0, 200, 100))
+        
+        region = Rectangle(130, 50, 5000, 10)
+        tracker.mark_dirty(region)
+        assert tracker.get_dirty_regions() == [region]
+        
+        _, result = composite(cache, Rectangle(0, 0, 200, 100))
+        assert result['rebuilt'] == 1
+        
+        tracker.mark_full_redraw()
+        assert tracker.get_dirty_regions() == [None]
+        _, result = composite(cache, Rectangle(0, 0, 200, 100))
+        assert result['rebuilt'] == 2
+    
+    def test_eviction_keeps_visible_tiles(self, boxes):
+        """Test the LRU bound never evicts tiles on screen."""
+        cache = OverlayTileCache(BoxPainter(boxes), tile_size=100, max_tiles=3)
+        composite(cache, Rectangle(0, 0, 200, 100))
+        composite(cache, Rectangle(200, 0, 200, 100))
+        
+        assert len(cache.tiles) == 3
+        assert {(0, 2, 0), (0, 3, 0)} <= set(cache.tiles)
+        assert cache.get_statistics()['evictions'] == 1
+    
+    def test_profiler_records_frames(self, cache):
+        """Test frame times are reported to the profiler."""
+        composite(cache, Rectangle(0, 0, 200, 100))
+        composite(cache, Rectangle(0, 0, 200, 100))
+        
+        assert cache.profiler.metrics['primitive_counts'] == [2, 0]
+        assert len(cache.profiler.metrics['render_times']) == 2
+
+
+class FakeElement:
+    """Overlay element with fixed bounds."""
+    
+    def __init__(self, bounds):
+        self.bounds = bounds
+    
+    def get_bounds(self):
+        return self.bounds
+    
+    def get_style(self):
+        return {'fill_color': '#ff0000', 'stroke_width': 0}
+    
+    def is_visible(self):
+        return True
+    
+    def get_z_index(self):
+        return 0
+
+
+class TestOverlayEngineTiles:
+    """Test OverlayEngine rendering through the tile cache."""
+    
+    @pytest.fixture
+    def engine(self):
+        """Create engine with tile cache enabled."""
+        widget = QWidget()
+        widget.resize(400, 300)
+        engine = OverlayEngine(widget)
+        engine.set_viewport(Rectangle(0, 0, 400, 300))
+        engine.enable_tile_cache(tile_size=128)
+        yield engine
+        engine.cleanup()
+    
+    def test_render_uses_tiles(self, engine):
+        """Test frames composite tiles and repaint only dirty ones."""
+        engine.create_layer("boxes")
+        element = FakeElement(Rectangle(10, 10, 50, 50))
+        engine.add_element("boxes", element)
+        engine.render_now()
+        
+        stats = engine.get_render_statistics()['tile_cache']
+        assert stats['tile_count'] == 12
+        assert stats['misses'] == 12
+        assert engine.renderer_backend.get_performance_metrics()['primitive_count'] == 1
+        
+        engine.add_element("boxes", FakeElement(Rectangle(300, 200, 20, 20)))
+        engine.render_now()
+        stats = engine.get_render_statistics()['tile_cache']
+        assert stats['rebuilds'] == 13
+        assert stats['hits'] == 11
+        
+        engine.get_layer("boxes").set_visible(False)
+        engine.render_now()
+        assert engine.get_render_statistics()['tile_cache']['rebuilds'] > 13
+        assert engine.frame_profiler.get_average_metrics()['avg_render_time'] >= 0
+    
+    def test_dirty_regions_outside_viewport_are_kept(self, engine):
+        """Test dirty regions are not clipped while document bounds are unknown."""
+        region = Rectangle(1000, 1000, 50, 50)
+        engine.invalidate_element(FakeElement(region))
+        
+        assert engine.tile_cache.dirty_tracker.get_dirty_regions() == [region]
+    
+    def test_disable_tile_cache(self, engine):
+        """Test disabling returns to per-element rendering."""
+        engine.enable_tile_cache(False)
+        assert engine.tile_cache is None
+        assert 'tile_cache' not in engine.get_render_statistics()
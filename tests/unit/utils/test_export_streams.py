@@ -0,0 +1,81 @@
+"""
+Tests for streaming export helpers.
+"""
+
+import gzip
+import io
+
+import pytest
+
+from torematrix.utils.export_streams import (
+    ThrottledProgress, batched, serialize_batches, stream_to_file, write_chunks
+)
+
+
+class TestBatching:
+    """Test batch iteration and ordered serialization."""
+
+    def test_batched(self):
+        assert list(batched(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(batched([], 3)) == []
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_serialize_batches_preserves_order(self, workers):
+        items = list(range(1000))
+        chunks = serialize_batches(
+            items, lambda batch: ",".join(map(str, batch)) + ",",
+            batch_size=37, max_workers=workers
+        )
+        assert "".join(chunks) == ",".join(map(str, items)) + ","
+
+    def test_serialize_batches_reports_progress(self):
+        progress = []
+        list(serialize_batches(
+            list(range(10)), str, batch_size=4,
+            progress_callback=lambda done, total: progress.append((done, total))
+        ))
+        assert progress == [(4, 10), (8, 10), (10, 10)]
+
+    def test_serialize_batches_is_lazy(self):
+        calls = []
+
+        def serializer(batch):
+            calls.append(batch)
+            return ""
+
+        chunks = serialize_batches(list(range(100)), serializer, batch_size=10)
+        next(chunks)
+        assert len(calls) == 1
+
+
+class TestWriting:
+    """Test chunk writing to streams and files."""
+
+    def test_write_chunks(self):
+        buffer = io.StringIO()
+        assert write_chunks(["ab", "", "cde"], buffer, flush_every=1) == 5
+        assert buffer.getvalue() == "abcde"
+
+    def test_stream_to_file(self, tmp_path):
+        path = tmp_path / "out.txt"
+        size = stream_to_file(iter(["héllo ", "world"]), str(path))
+        assert path.read_text(encoding="utf-8") == "héllo world"
+        assert size == len("héllo world".encode("utf-8"))
+
+    def test_stream_to_file_compressed(self, tmp_path):
+        path = tmp_path / "out.txt.gz"
+        stream_to_file(("line %d\n" % i for i in range(1000)), str(path), compress=True)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            assert f.read().count("\n") == 1000
+
+
+class TestThrottledProgress:
+    """Test progress throttling."""
+
+    def test_final_update_always_forwarded(self):
+        calls = []
+        progress = ThrottledProgress(lambda done, total: calls.append(done), interval=60)
+        progress(1, 10)
+        progress(2, 10)
+        progress(10, 10)
+        assert calls == [1, 10]
@@ -0,0 +1,122 @@
+"""
+Tests for the packed R-tree.
+"""
+
+import math
+import random
+
+import pytest
+
+from torematrix.utils.rtree import PackedRTree
+
+
+def brute_force(items, box):
+    x0, y0, x1, y1 = box
+    return sorted(key for key, (a, b, c, d) in items.items()
+                  if a <= x1 and c >= x0 and b <= y1 and d >= y0)
+
+
+def random_box(rng):
+    x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+    return (x, y, x + rng.uniform(0, 60), y + rng.uniform(0, 60))
+
+
+@pytest.fixture
+def items():
+    rng = random.Random(5)
+    return {key: random_box(rng) for key in range(500)}
+
+
+@pytest.fixture
+def tree(items):
+    tree = PackedRTree(node_size=8)
+    tree.load(list(items), list(items.values()))
+    return tree
+
+
+class TestPackedRTree:
+    """Test bulk loading, updates and queries."""
+
+    def test_load(self, tree, items):
+        assert len(tree) == 500
+        assert 7 in tree
+        assert tree.get(7) == pytest.approx(items[7])
+        assert tree.height == 4
+        stats = tree.get_statistics()
+        assert stats['leaf_count'] == math.ceil(500 / 6)
+        assert stats['overflow'] == 0
+
+    def test_load_duplicate_keys_keeps_last(self):
+        tree = PackedRTree()
+        tree.load(["a", "b", "a"], [(0, 0, 1, 1), (5, 5, 6, 6), (10, 10, 11, 11)])
+        assert len(tree) == 2
+        assert tree.get("a") == (10, 10, 11, 11)
+
+    def test_search(self, tree, items):
+        rng = random.Random(9)
+        for _ in range(50):
+            box = random_box(rng)
+            assert sorted(tree.search(box)) == brute_force(items, box)
+
+    def test_closed_intervals(self):
+        tree = PackedRTree()
+        tree.load(["a"], [(0, 0, 10, 10)])
+        assert tree.search((10, 10, 20, 20)) == ["a"]
+        assert tree.search_point(0, 5) == ["a"]
+        assert tree.search_point(10.5, 5) == []
+
+    def test_search_many(self, tree, items):
+        rng = random.Random(11)
+        boxes = [random_box(rng) for _ in range(40)]
+        for box, found in zip(boxes, tree.search_many(boxes)):
+            assert sorted(found) == brute_force(items, box)
+        assert tree.search_many([]) == []
+
+    def test_updates_match_brute_force(self, tree, items):
+        rng = random.Random(13)
+        for step in range(2000):
+            key = rng.randrange(800)
+            if rng.random() < 0.6:
+                items[key] = random_box(rng)
+                tree.insert(key, items[key])
+            else:
+                assert tree.remove(key) == (items.pop(key, None) is not None)
+            if step % 100 == 0:
+                box = random_box(rng)
+                assert sorted(tree.search(box)) == brute_force(items, box)
+        assert len(tree) == len(items)
+        assert sorted(tree.keys()) == sorted(items)
+
+    def test_insert_into_empty_tree(self):
+        tree = PackedRTree(node_size=4)
+        for key in range(100):
+            tree.insert(key, (key, 0, key + 1, 1))
+        assert sorted(tree.search((10, 0, 12, 0))) == [9, 10, 11, 12]
+        assert tree.get_statistics()['rebuilds'] >= 1
+
+    @pytest.mark.parametrize("metric", ["center", "box"])
+    def test_nearest(self, tree, items, metric):
+        def distance(box, x, y):
+            if metric == "center":
+                return math.hypot((box[0] + box[2]) / 2 - x, (box[1] + box[3]) / 2 - y)
+            return math.hypot(max(box[0] - x, x - box[2], 0), max(box[1] - y, y - box[3], 0))
+
+        expected = sorted(distance(box, 400, 600) for box in items.values())
+        nearest = tree.nearest(400, 600, k=10, metric=metric)
+        assert [d for _, d in nearest] == pytest.approx(expected[:10])
+        for key, d in nearest:
+            assert distance(items[key], 400, 600) == pytest.approx(d)
+
+        limited = tree.nearest(400, 600, k=1000, max_distance=50, metric=metric)
+        assert len(limited) == sum(1 for d in expected if d <= 50)
+
+    def test_nearest_rejects_unknown_metric(self, tree):
+        with pytest.raises(ValueError):
+            tree.nearest(0, 0, metric="manhattan")
+
+    def test_clear(self, tree):
+        tree.clear()
+        assert len(tree) == 0
+        assert tree.search((0, 0, 1000, 1000)) == []
+        assert tree.nearest(0, 0) == []
+        assert tree.bounds() is None